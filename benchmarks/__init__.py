@@ -0,0 +1 @@
+# Bu dosya benchmarks modülünü paket olarak tanımlar
\ No newline at end of file
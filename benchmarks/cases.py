@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Performans ölçümü yapılan sıcak yollar ve sentetik girdileri
+
+Her ölçüm bir el sayısı (boyut) için hazırlık yapar ve ölçülecek çağrıyı
+döndürür; hazırlık süresi ölçüme girmez.
+"""
+
+import random
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+
+from core.game import MatrixAnalyzer, GameAnalyzer
+from core.history import History
+from models.pattern_ai import PatternAI
+from models.deep_baccarat import DeepBaccarat
+
+# Gerçek sabot dağılımına yakın sonuç ağırlıkları (Player, Banker, Tie)
+RESULT_WEIGHTS = (44.62, 45.86, 9.52)
+
+DEFAULT_SEED = 1234
+
+
+def synthetic_history(size, seed=DEFAULT_SEED):
+    """
+    Tekrarlanabilir sentetik oyun geçmişi oluştur
+    
+    Args:
+        size (int): El sayısı
+        seed (int): Rastgelelik tohumu
+        
+    Returns:
+        list: 'P', 'B', 'T' sonuçları
+    """
+    return random.Random(seed).choices('PBT', weights=RESULT_WEIGHTS, k=size)
+
+
+def synthetic_session(size, seed=DEFAULT_SEED):
+    """
+    History.session_history biçiminde sentetik oturum oluştur
+    
+    Args:
+        size (int): El sayısı
+        seed (int): Rastgelelik tohumu
+        
+    Returns:
+        list: Oturum girdileri
+    """
+    rng = random.Random(seed + 1)
+    start = datetime(2024, 1, 1, 12, 0, 0)
+    session = []
+    for index, result in enumerate(synthetic_history(size, seed)):
+        prediction = rng.choice('PB')
+        session.append({
+            'timestamp': start + timedelta(seconds=index * 30),
+            'result': result,
+            'prediction': prediction,
+            'correct': result == prediction
+        })
+    return session
+
+
+class Benchmark:
+    """Bir ölçümün adı, açıklaması ve hazırlık fonksiyonu"""
+    
+    def __init__(self, name, description, setup):
+        """
+        Inicializasyon
+        
+        Args:
+            name (str): Ölçüm adı (sonuç dosyasında ve eşik ayarlarında kullanılır)
+            description (str): Kısa açıklama
+            setup (callable): Boyutla çağrılır; (çağrı, temizlik veya None) döndürür
+        """
+        self.name = name
+        self.description = description
+        self.setup = setup
+
+
+def _setup_matrix(size):
+    history = synthetic_history(size)
+    
+    def run():
+        matrix = MatrixAnalyzer.matrix_from_history(history)
+        MatrixAnalyzer.extract_patterns(matrix)
+        MatrixAnalyzer.count_sequences(matrix)
+    return run, None
+
+
+def _setup_trends(size):
+    history = synthetic_history(size)
+    
+    def run():
+        GameAnalyzer.analyze_trends(history, window_size=size)
+    return run, None
+
+
+def _setup_model(model_class):
+    def setup(size):
+        history = synthetic_history(size)
+        matrix = MatrixAnalyzer.matrix_from_history(history)
+        model = model_class()
+        
+        def run():
+            model.predict(matrix, history)
+        return run, None
+    return setup
+
+
+def _setup_history_save(size):
+    directory = tempfile.mkdtemp(prefix='baccarat_bench_')
+    history = History(directory)
+    history.session_history = synthetic_session(size)
+    
+    def run():
+        history.save_session('oturum.json')
+    return run, lambda: shutil.rmtree(directory, ignore_errors=True)
+
+
+def _setup_history_load(size):
+    directory = tempfile.mkdtemp(prefix='baccarat_bench_')
+    history = History(directory)
+    history.session_history = synthetic_session(size)
+    path = history.save_session('oturum.json')
+    history.session_history = []
+    
+    def run():
+        history.load_session(path)
+    return run, lambda: shutil.rmtree(directory, ignore_errors=True)
+
+
+BENCHMARKS = [
+    Benchmark('matrix_analyzer', "matrix_from_history + extract_patterns + count_sequences",
+              _setup_matrix),
+    Benchmark('analyze_trends', "GameAnalyzer.analyze_trends (pencere = boyut)", _setup_trends),
+    Benchmark('pattern_ai.predict', "PatternAI.predict", _setup_model(PatternAI)),
+    Benchmark('deep_baccarat.predict', "DeepBaccarat.predict", _setup_model(DeepBaccarat)),
+    Benchmark('history.save_session', "History.save_session (JSON)", _setup_history_save),
+    Benchmark('history.load_session', "History.load_session (JSON)", _setup_history_load),
+]
+
+
+def get_benchmarks(names=None):
+    """
+    Ölçümleri ada göre süz
+    
+    Args:
+        names (list, optional): Ölçüm adları veya ad önekleri (ör. 'history')
+        
+    Returns:
+        list: Benchmark nesneleri
+    """
+    if not names:
+        return list(BENCHMARKS)
+    return [benchmark for benchmark in BENCHMARKS
+            if any(benchmark.name.startswith(name) for name in names)]
\ No newline at end of file
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Analizörler, modeller ve geçmiş dosya işlemleri için performans ölçümü
+
+Her ölçüm sentetik girdilerle birkaç boyutta (el sayısı) çalıştırılır; saniye
+başına çağrı sayısı ve çağrı başına en yüksek bellek ayırımı JSON dosyasına
+yazılır. Bir temel (baseline) sonuç dosyası verilirse sonuçlar onunla
+karşılaştırılır ve eşiği aşan yavaşlama veya bellek artışı varsa çıkış kodu
+1 olur (sürekli entegrasyonda kullanılabilir).
+
+Örnekler:
+    python -m benchmarks.run --save-baseline benchmarks/baseline.json
+    python -m benchmarks.run --baseline benchmarks/baseline.json --threshold 15
+    python -m benchmarks.run --sizes 10,1000 --only history --threshold history=30
+"""
+
+import gc
+import sys
+import json
+import time
+import platform
+import argparse
+import tracemalloc
+from datetime import datetime
+
+from benchmarks.cases import DEFAULT_SEED, get_benchmarks, BENCHMARKS
+
+DEFAULT_SIZES = (10, 1000, 100000, 1000000)
+DEFAULT_OUTPUT = 'benchmark_results.json'
+
+# Her ölçüm en az bu kadar süre tekrarlanır (saniye)
+DEFAULT_MIN_TIME = 0.5
+
+# Varsayılan gerileme eşikleri (yüzde)
+DEFAULT_THRESHOLD = 10.0         # En hızlı çağrı süresindeki artış
+DEFAULT_MEMORY_THRESHOLD = 20.0  # Çağrı başına en yüksek bellek artışı
+
+# Çok küçük bellek değerlerindeki dalgalanmalar gerileme sayılmaz (KB)
+MEMORY_NOISE_KB = 4.0
+
+FORMAT_VERSION = 1
+
+
+def measure(run, min_time=DEFAULT_MIN_TIME, memory=True):
+    """
+    Bir çağrının hızını ve bellek kullanımını ölç
+    
+    Çağrı, toplam süre min_time'ı geçene kadar tekrarlanır (en az bir kez).
+    Ölçüm sırasında çöp toplayıcı kapatılır. Bellek ayrı bir çağrıda
+    tracemalloc ile ölçülür, böylece izleme maliyeti hız ölçümüne girmez.
+    
+    Args:
+        run (callable): Ölçülecek çağrı
+        min_time (float): En kısa ölçüm süresi (saniye)
+        memory (bool): Bellek ölçümü yap
+        
+    Returns:
+        dict: calls, seconds, ops_per_sec, mean_ms, min_ms, peak_memory_kb
+    """
+    run()  # Isınma (önbellekler, ilk çağrı maliyetleri)
+    
+    calls = 0
+    fastest = None
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        elapsed = 0.0
+        while calls == 0 or elapsed < min_time:
+            before = time.perf_counter()
+            run()
+            after = time.perf_counter()
+            calls += 1
+            elapsed = after - start
+            if fastest is None or after - before < fastest:
+                fastest = after - before
+    finally:
+        if gc_enabled:
+            gc.enable()
+            
+    peak_kb = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            baseline, _ = tracemalloc.get_traced_memory()
+            run()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        peak_kb = (peak - baseline) / 1024.0
+        
+    return {
+        'calls': calls,
+        'seconds': elapsed,
+        'ops_per_sec': calls / elapsed if elapsed > 0 else 0.0,
+        'mean_ms': elapsed / calls * 1000.0,
+        'min_ms': fastest * 1000.0,
+        'peak_memory_kb': peak_kb
+    }
+
+
+def run_benchmarks(benchmarks, sizes, min_time=DEFAULT_MIN_TIME, memory=True, report=None):
+    """
+    Ölçümleri tüm boyutlarda çalıştır
+    
+    Args:
+        benchmarks (list): Benchmark nesneleri
+        sizes (list): El sayıları
+        min_time (float): Ölçüm başına en kısa süre (saniye)
+        memory (bool): Bellek ölçümü yap
+        report (callable, optional): Her sonuç için çağrılır
+        
+    Returns:
+        list: Sonuç sözlükleri (name, size ve measure() alanları)
+    """
+    results = []
+    for benchmark in benchmarks:
+        for size in sizes:
+            run, cleanup = benchmark.setup(size)
+            try:
+                result = {'name': benchmark.name, 'size': size}
+                result.update(measure(run, min_time, memory))
+            finally:
+                del run
+                if cleanup is not None:
+                    cleanup()
+            results.append(result)
+            if report is not None:
+                report(result)
+    return results
+
+
+def compare(results, baseline, thresholds, memory_threshold=DEFAULT_MEMORY_THRESHOLD):
+    """
+    Sonuçları temel sonuçlarla karşılaştır
+    
+    Args:
+        results (list): run_benchmarks() sonuçları
+        baseline (dict): Daha önce kaydedilmiş sonuç dosyası içeriği
+        thresholds (dict): Ölçüm adı -> izin verilen yavaşlama yüzdesi
+                           (None anahtarı varsayılan eşiktir)
+        memory_threshold (float): İzin verilen bellek artışı yüzdesi
+        
+    Returns:
+        list: Karşılaştırmalar (speed_change_pct en hızlı çağrı süresindeki
+              değişimdir, pozitifse yavaşlama)
+    """
+    previous = {(entry['name'], entry['size']): entry for entry in baseline.get('results', [])}
+    comparisons = []
+    
+    for result in results:
+        base = previous.get((result['name'], result['size']))
+        if base is None:
+            continue
+            
+        threshold = thresholds.get(result['name'], thresholds.get(None, DEFAULT_THRESHOLD))
+        # En hızlı çağrı süresi ortalamaya göre arka plan yükünden daha az etkilenir
+        speed_change = None
+        if base['min_ms'] > 0:
+            speed_change = (result['min_ms'] - base['min_ms']) / base['min_ms'] * 100.0
+            
+        memory_change = None
+        memory_regressed = False
+        if result.get('peak_memory_kb') is not None and base.get('peak_memory_kb') is not None:
+            grown = result['peak_memory_kb'] - base['peak_memory_kb']
+            if base['peak_memory_kb'] > 0:
+                memory_change = grown / base['peak_memory_kb'] * 100.0
+            memory_regressed = (grown > MEMORY_NOISE_KB and
+                                (memory_change is None or memory_change > memory_threshold))
+                                
+        comparisons.append({
+            'name': result['name'],
+            'size': result['size'],
+            'threshold_pct': threshold,
+            'speed_change_pct': speed_change,
+            'memory_change_pct': memory_change,
+            'speed_regressed': speed_change is not None and speed_change > threshold,
+            'memory_regressed': memory_regressed
+        })
+    return comparisons
+
+
+def parse_sizes(value):
+    """--sizes argümanını doğrula (ör. '10,1k,100k,1m')"""
+    multipliers = {'k': 1000, 'm': 1000000}
+    sizes = []
+    for part in value.split(','):
+        part = part.strip().lower()
+        if not part:
+            continue
+        try:
+            if part[-1] in multipliers:
+                size = int(float(part[:-1]) * multipliers[part[-1]])
+            else:
+                size = int(part)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"geçersiz boyut: {part}")
+        if size < 1:
+            raise argparse.ArgumentTypeError(f"boyut pozitif olmalı: {part}")
+        sizes.append(size)
+    if not sizes:
+        raise argparse.ArgumentTypeError("en az bir boyut verilmeli")
+    return sizes
+
+
+def parse_threshold(value):
+    """--threshold argümanını (YÜZDE veya AD=YÜZDE) çöz"""
+    name, _, percent = value.rpartition('=')
+    try:
+        percent = float(percent)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"geçersiz eşik: {value}")
+    if percent < 0:
+        raise argparse.ArgumentTypeError(f"eşik negatif olamaz: {value}")
+    if name and name not in {benchmark.name for benchmark in BENCHMARKS}:
+        raise argparse.ArgumentTypeError(f"bilinmeyen ölçüm: {name}")
+    return name or None, percent
+
+
+def _format_size(size):
+    for suffix, unit in (('M', 1000000), ('k', 1000)):
+        if size >= unit and size % unit == 0:
+            return f"{size // unit}{suffix}"
+    return str(size)
+
+
+def _report(result):
+    memory = result['peak_memory_kb']
+    memory = f"{memory:12.1f} KB" if memory is not None else ' ' * 15
+    sys.stdout.write(f"{result['name']:<24} {_format_size(result['size']):>6} "
+                     f"{result['ops_per_sec']:14.1f} çağrı/sn {result['mean_ms']:12.4f} ms{memory}\n")
+    sys.stdout.flush()
+
+
+def _report_comparison(comparison):
+    def percent(value):
+        return f"{value:+7.1f}%" if value is not None else '      -'
+        
+    flags = []
+    if comparison['speed_regressed']:
+        flags.append(f"YAVAŞLADI (eşik {comparison['threshold_pct']:g}%)")
+    if comparison['memory_regressed']:
+        flags.append("BELLEK ARTTI")
+    sys.stdout.write(f"{comparison['name']:<24} {_format_size(comparison['size']):>6} "
+                     f"hız {percent(comparison['speed_change_pct'])}  "
+                     f"bellek {percent(comparison['memory_change_pct'])}  {', '.join(flags)}\n")
+
+
+def build_parser():
+    """Komut satırı ayrıştırıcısını oluştur"""
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.run',
+        description="Analizör, model ve geçmiş dosya işlemlerinin performansını ölç")
+    parser.add_argument('--sizes', type=parse_sizes, default=list(DEFAULT_SIZES),
+                        help="virgülle ayrılmış el sayıları, k/m ekleri kullanılabilir "
+                             "(varsayılan: 10,1k,100k,1m)")
+    parser.add_argument('--only', action='append', metavar='AD',
+                        help="yalnızca bu adla başlayan ölçümleri çalıştır (birden fazla verilebilir)")
+    parser.add_argument('--min-time', type=float, default=DEFAULT_MIN_TIME, metavar='SN',
+                        help=f"ölçüm başına en kısa süre (varsayılan: {DEFAULT_MIN_TIME} sn)")
+    parser.add_argument('--no-memory', action='store_true', help="bellek ölçümünü atla")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, metavar='DOSYA',
+                        help=f"sonuç dosyası (varsayılan: {DEFAULT_OUTPUT})")
+    parser.add_argument('--baseline', metavar='DOSYA',
+                        help="sonuçları bu temel sonuç dosyasıyla karşılaştır")
+    parser.add_argument('--save-baseline', metavar='DOSYA',
+                        help="sonuçları temel olarak bu dosyaya da kaydet")
+    parser.add_argument('--threshold', type=parse_threshold, action='append', default=[],
+                        metavar='[AD=]YÜZDE',
+                        help=f"izin verilen yavaşlama yüzdesi (varsayılan: {DEFAULT_THRESHOLD:g}); "
+                             "AD=YÜZDE yalnızca o ölçümün eşiğini değiştirir")
+    parser.add_argument('--memory-threshold', type=float, default=DEFAULT_MEMORY_THRESHOLD,
+                        metavar='YÜZDE',
+                        help=f"izin verilen bellek artışı yüzdesi (varsayılan: {DEFAULT_MEMORY_THRESHOLD:g})")
+    parser.add_argument('--list', action='store_true', help="ölçümleri listele ve çık")
+    return parser
+
+
+def _write_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    benchmarks = get_benchmarks(args.only)
+    
+    if args.list:
+        for benchmark in benchmarks:
+            sys.stdout.write(f"{benchmark.name:<24} {benchmark.description}\n")
+        return 0
+    if not benchmarks:
+        sys.stderr.write("Hata: eşleşen ölçüm yok\n")
+        return 2
+        
+    baseline = None
+    if args.baseline:
+        try:
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            sys.stderr.write(f"Hata: temel sonuçlar okunamadı: {e}\n")
+            return 2
+            
+    results = run_benchmarks(benchmarks, args.sizes, args.min_time, not args.no_memory, _report)
+    output = {
+        'version': FORMAT_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'seed': DEFAULT_SEED,
+        'min_time': args.min_time,
+        'results': results
+    }
+    
+    regressions = 0
+    if baseline is not None:
+        thresholds = dict(args.threshold)
+        comparisons = compare(results, baseline, thresholds, args.memory_threshold)
+        output['baseline'] = {'path': args.baseline, 'created': baseline.get('created'),
+                              'comparisons': comparisons}
+        sys.stdout.write(f"\nTemel sonuçlarla karşılaştırma ({args.baseline}):\n")
+        for comparison in comparisons:
+            _report_comparison(comparison)
+        regressions = sum(1 for comparison in comparisons
+                          if comparison['speed_regressed'] or comparison['memory_regressed'])
+        if len(comparisons) < len(results):
+            sys.stdout.write(f"{len(results) - len(comparisons)} sonuç temel dosyada yok\n")
+        sys.stdout.write(f"Gerileme: {regressions}\n")
+        
+    try:
+        _write_json(args.output, output)
+        if args.save_baseline:
+            _write_json(args.save_baseline, output)
+    except OSError as e:
+        sys.stderr.write(f"Hata: sonuçlar yazılamadı: {e}\n")
+        return 2
+        
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
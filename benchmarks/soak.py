@@ -0,0 +1,608 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Uzun oturum bellek dayanıklılık testi (soak)
+
+Oyun, geçmiş, modeller ve ekransız ana pencere ayrı ayrı milyonlarca sentetik
+elle beslenir. Belirli aralıklarla çöp toplandıktan sonra süreç belleği (RSS)
+ve tracemalloc ile izlenen Python belleği örneklenir. Isınma bölümünden
+(önbellekler ve halka tamponlar dolana kadar) sonraki örneklere doğru
+uydurulur; el başına bellek artışı (eğim) eşiği aşan hedef varsa çıkış kodu
+1 olur. Aşan hedefler için en çok büyüyen bellek ayırım yerleri yazılır.
+Tasarım gereği her eli saklayan hedefler (Game.history, History oturum kaydı,
+yol tabloları) için aynı eller önce yalnızca saklanması beklenen veriyi tutan
+bir karşılaştırma (baseline) hazırlığına verilir; eşikler hedefin eğiminin
+bunu aşan kısmına uygulanır.
+tracemalloc açıkken RSS izlenen her blok için ek kayıt da içerir; yalnızca
+RSS'e bakmak için --no-tracemalloc kullanılır.
+
+Sınırsız büyüyen bir yapı 12 saatlik bir vardiyada birkaç milyon elde
+belirginleşir; bu test aynı büyümeyi birkaç dakikada gösterir.
+
+Örnekler:
+    python -m benchmarks.soak
+    python -m benchmarks.soak --only game --only history --hands 5m
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.soak --only window --hands window=200k
+"""
+
+import gc
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+import tracemalloc
+from collections import deque
+from datetime import datetime
+
+from benchmarks.cases import DEFAULT_SEED, synthetic_history
+from benchmarks.run import parse_sizes, _format_size
+
+DEFAULT_OUTPUT = 'soak_results.json'
+
+# Hedef başına örnek sayısı ve eğim hesabına girmeyen ısınma oranı
+DEFAULT_SAMPLES = 20
+WARMUP_FRACTION = 0.2
+
+# Varsayılan eğim eşikleri (el başına bayt); karşılaştırma hazırlığı olan hedeflerde
+# bilinen büyüme çıkarıldıktan sonra kalan artışa uygulanır
+DEFAULT_MAX_SLOPE = 1.0       # tracemalloc ile izlenen Python belleği
+DEFAULT_MAX_RSS_SLOPE = 4.0   # Süreç belleği (ayırıcı ve Qt dalgalanmalarına pay bırakılır)
+
+# Eşiği aşan hedefler için yazılan en çok büyüyen ayırım yeri sayısı
+DEFAULT_TOP = 5
+
+# Ana pencerede olay döngüsü her bu kadar elde bir işlenir (~1 kare)
+WINDOW_EVENT_EVERY = 16
+
+FORMAT_VERSION = 2
+
+
+class SoakTarget:
+    """Bir dayanıklılık hedefinin adı, açıklaması, hazırlık fonksiyonu, varsayılan el sayısı ve eşikleri"""
+    
+    def __init__(self, name, description, setup, hands,
+                 max_slope=DEFAULT_MAX_SLOPE, max_rss_slope=DEFAULT_MAX_RSS_SLOPE, baseline=None):
+        """
+        Inicializasyon
+        
+        Args:
+            name (str): Hedef adı (sonuç dosyasında ve eşik ayarlarında kullanılır)
+            description (str): Kısa açıklama
+            setup (callable): (sonuç başına çağrı, temizlik veya None, bilinen
+                yapıların o anki bayt boyutunu döndüren fonksiyon veya None) döndürür
+            hands (int): Varsayılan el sayısı
+            max_slope (float): Varsayılan Python belleği eşiği (bayt/el)
+            max_rss_slope (float): Varsayılan RSS eşiği (bayt/el)
+            baseline (callable, optional): Yalnızca tasarım gereği saklanan veriyi
+                tutan hazırlık fonksiyonu ((sonuç başına çağrı, temizlik veya None)
+                döndürür); eğimi hedefin eğiminden çıkarılır
+        """
+        self.name = name
+        self.description = description
+        self.setup = setup
+        self.hands = hands
+        self.max_slope = max_slope
+        self.max_rss_slope = max_rss_slope
+        self.baseline = baseline
+
+
+def _setup_game():
+    from core.game import Game
+    game = Game()
+    return game.add_result, None, None
+
+
+def _setup_history():
+    from core.history import History
+    directory = tempfile.mkdtemp(prefix='baccarat_soak_')
+    history = History(directory)
+    predictions = 'PB'
+    count = [0]
+    
+    def step(result):
+        count[0] += 1
+        history.add_result(result, predictions[count[0] & 1])
+    return step, lambda: shutil.rmtree(directory, ignore_errors=True), None
+
+
+def _baseline_game():
+    # Game.history: sonuç başına bir liste elemanı
+    results = []
+    return results.append, None
+
+
+def _baseline_history():
+    # History oturum kaydı: sonuç başına zaman damgalı bir sözlük
+    entries = []
+    predictions = 'PB'
+    
+    def step(result):
+        prediction = predictions[(len(entries) + 1) & 1]
+        entries.append({'timestamp': datetime.now(), 'result': result,
+                        'prediction': prediction, 'correct': result == prediction})
+    return step, None
+
+
+def _baseline_window():
+    # Ana pencerenin tasarım gereği büyüyen yapıları: oyun geçmişi, oturum kaydı ve yollar
+    from core.game import Game
+    from core.history import History
+    from core.roads import Roads
+    directory = tempfile.mkdtemp(prefix='baccarat_soak_')
+    game = Game()
+    history = History(directory)
+    roads = Roads()
+    
+    def step(result):
+        game.add_result(result)
+        history.add_result(result, 'P')
+        roads.add_result(result)
+    return step, lambda: shutil.rmtree(directory, ignore_errors=True)
+
+
+def _setup_models():
+    from core.game import MatrixAnalyzer
+    from models.ensemble import Ensemble
+    from models.registry import available_models, create_models
+    from cli import CONTEXT_SIZE
+    
+    # Bağlam sabit boyda tutulur; yalnızca modellerin kendi durumu ölçülür
+    ensemble = Ensemble(create_models(available_models()))
+    context = deque(maxlen=CONTEXT_SIZE)
+    
+    def step(result):
+        history = list(context)
+        ensemble.predict(MatrixAnalyzer.matrix_from_history(history), history)
+        ensemble.add_result(result)
+        history.append(result)
+        ensemble.observe(history, len(history) - 1)
+        context.append(result)
+    return step, None, None
+
+
+def _series_bytes(samples):
+    """IncrementalLTTB serisinin değerleri ve seçilen noktalarının boyutu"""
+    # indices() kesinleşmiş seçimlerin kopyasıdır; 256'ya kadar tamsayılar paylaşılır
+    indices = samples.indices()
+    return (sys.getsizeof(samples.values) + 2 * sys.getsizeof(indices) +
+            sum(sys.getsizeof(index) for index in indices if index > 256))
+
+
+def _setup_window():
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    
+    from core.history import History
+    from core.snapshot import Snapshot
+    from ui.main_window import MainWindow
+    directory = tempfile.mkdtemp(prefix='baccarat_soak_')
+    window = MainWindow(snapshot=Snapshot(os.path.join(directory, 'snapshot.bin')),
+                        history=History(directory))
+    window.show()
+    
+    # Açılışın ilk çizimden sonraki kısmı tamamlanana kadar bekle
+    deadline = time.monotonic() + 10.0
+    while not window.started and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.001)
+    count = [0]
+    
+    def step(result):
+        window.queueResult(result, 'soak')
+        window.flushPending()
+        window.dispatchEvents()
+        count[0] += 1
+        if count[0] % WINDOW_EVENT_EVERY == 0:
+            app.processEvents()
+    
+    def cleanup():
+        window.close()
+        app.processEvents()
+        window.deleteLater()
+        shutil.rmtree(directory, ignore_errors=True)
+    
+    def chart_bytes():
+        # Başarı grafiği her skorlanan tahmin için model başına iki değer saklar ve
+        # seçilen nokta listesi çizim genişliğine kadar dolar; sayıları tahminlerin
+        # ne zaman tamamlandığına bağlı olduğundan karşılaştırmayla değil ayrıca ölçülür
+        return sum(_series_bytes(samples)
+                   for series in window.stats_widget.accuracy_chart.chart.series
+                   for samples in (series.accuracy, series.confidence))
+    return step, cleanup, chart_bytes
+
+
+# Ana pencerede saklanan kayıtlar geçici nesnelerle aynı ayırıcı havuzlarını
+# paylaştığından RSS karşılaştırma hazırlığından 12-26 B/el fazla büyür (ayırıcı
+# dağınıklığı); Python belleği eşiği tüm hedeflerde 1 B/el kalır
+TARGETS = [
+    SoakTarget('game', "Game.add_result", _setup_game, 2000000,
+               baseline=_baseline_game),
+    SoakTarget('history', "History.add_result", _setup_history, 1000000,
+               baseline=_baseline_history),
+    SoakTarget('models', "Ensemble.predict + add_result (tüm modeller, 50 ellik bağlam)",
+               _setup_models, 50000),
+    SoakTarget('window', "MainWindow.queueResult + flushPending (ekransız)", _setup_window, 50000,
+               max_rss_slope=32.0, baseline=_baseline_window),
+]
+
+
+def get_targets(names=None):
+    """
+    Hedefleri ada göre süz
+    
+    Args:
+        names (list, optional): Hedef adları
+        
+    Returns:
+        list: SoakTarget nesneleri
+    """
+    if not names:
+        return list(TARGETS)
+    return [target for target in TARGETS if target.name in names]
+
+
+def rss_bytes():
+    """
+    Sürecin güncel bellek kullanımı (RSS)
+    
+    Returns:
+        int: Bayt (ölçülemiyorsa None)
+    """
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # /proc olmayan sistemlerde yalnızca en yüksek değer okunabilir (macOS: bayt, diğerleri: KB)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def fit_slope(points):
+    """
+    Noktalara uyan doğrunun eğimi (Theil-Sen: ikili eğimlerin medyanı)
+    
+    En küçük kareler yerine medyan kullanıldığından ayırıcı arenalarının veya
+    önbelleklerin bir kez büyümesi gibi tek seferlik sıçramalar eğimi
+    saptırmaz; sürekli büyüme ise tüm ikili eğimlere yansır.
+    
+    Args:
+        points (list): (el sayısı, bayt) çiftleri
+        
+    Returns:
+        float: El başına bayt (en az iki nokta yoksa None)
+    """
+    points = [(x, y) for x, y in points if y is not None]
+    slopes = sorted((y2 - y1) / (x2 - x1)
+                    for index, (x1, y1) in enumerate(points)
+                    for x2, y2 in points[index + 1:] if x2 != x1)
+    if not slopes:
+        return None
+    middle = len(slopes) // 2
+    if len(slopes) % 2:
+        return slopes[middle]
+    return (slopes[middle - 1] + slopes[middle]) / 2.0
+
+
+def _growth_sites(before, after, limit):
+    """İki tracemalloc anlık görüntüsü arasında en çok büyüyen ayırım yerleri"""
+    ignored = (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__))
+    before = before.filter_traces(ignored)
+    after = after.filter_traces(ignored)
+    sites = []
+    for stat in after.compare_to(before, 'lineno')[:limit]:
+        if stat.size_diff <= 0:
+            break
+        frame = stat.traceback[0]
+        sites.append({'location': f"{frame.filename}:{frame.lineno}",
+                      'size_diff_kb': stat.size_diff / 1024.0, 'count_diff': stat.count_diff})
+    return sites
+
+
+def _feed(step, results, samples, trace, top, report=None, known=None):
+    """
+    Adım fonksiyonunu sonuçlarla besle ve bellek kullanımını örnekle
+    
+    Örneklerde bellekten known() ile ölçülen bilinen yapıların boyutu
+    (known_bytes) ayrıca kaydedilir.
+    
+    Returns:
+        tuple: (örnekler, süre sn, büyüyen ayırım yerleri veya None)
+    """
+    hands = len(results)
+    interval = max(1, hands // samples)
+    warmup = int(hands * WARMUP_FRACTION)
+    points = []
+    first_snapshot = None
+    sites = None
+    
+    def sample(count):
+        gc.collect()
+        point = {'hands': count, 'rss_bytes': rss_bytes(),
+                 'traced_bytes': tracemalloc.get_traced_memory()[0] if trace else None}
+        # Bellek okunduktan sonra ölçülür (ölçümün geçici nesneleri örneğe girmez)
+        point['known_bytes'] = known() if known is not None else 0
+        points.append(point)
+        if report is not None:
+            report(point)
+            
+    gc.collect()
+    if trace:
+        tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        sample(0)
+        for count, result in enumerate(results, 1):
+            step(result)
+            if count % interval == 0 or count == hands:
+                sample(count)
+                if trace and top and first_snapshot is None and count >= warmup:
+                    first_snapshot = tracemalloc.take_snapshot()
+        elapsed = time.perf_counter() - start
+        
+        if first_snapshot is not None:
+            sites = _growth_sites(first_snapshot, tracemalloc.take_snapshot(), top)
+    finally:
+        if trace:
+            tracemalloc.stop()
+    return points, elapsed, sites
+
+
+def _slopes(points, hands):
+    """Isınmadan sonraki örneklere uyan (RSS, Python) eğimleri, bilinen yapılar hariç"""
+    measured = [point for point in points if point['hands'] >= int(hands * WARMUP_FRACTION)]
+    
+    def excluding_known(key):
+        return [(point['hands'],
+                 point[key] - point['known_bytes'] if point[key] is not None else None)
+                for point in measured]
+    return fit_slope(excluding_known('rss_bytes')), fit_slope(excluding_known('traced_bytes'))
+
+
+def _excess(slope, baseline):
+    if slope is None or baseline is None:
+        return slope
+    return slope - baseline
+
+
+def soak(target, hands, samples=DEFAULT_SAMPLES, trace=True, top=DEFAULT_TOP, report=None):
+    """
+    Bir hedefi sentetik ellerle besle ve bellek kullanımını örnekle
+    
+    Hedefin karşılaştırma hazırlığı varsa aynı eller önce ona verilir;
+    döndürülen eğimler bu bilinen büyümenin üzerindeki kısımdır. Karşılaştırma
+    yapıları hedef ölçülürken bellekte tutulur (bıraktıkları bellek hedefin
+    büyümesini gizlemesin). tracemalloc açıkken karşılaştırmanın bıraktığı
+    tracemalloc kayıtları hedefte yeniden kullanıldığından bu hedeflerde RSS
+    karşılaştırılmaz (None); RSS --no-tracemalloc ile denetlenir.
+    
+    Args:
+        target (SoakTarget): Hedef
+        hands (int): El sayısı
+        samples (int): Örnek sayısı (ısınma dahil)
+        trace (bool): tracemalloc ile Python belleğini de izle (2-3 kat yavaşlatır)
+        top (int): Büyüyen ayırım yerleri için alınacak en fazla kayıt (0: alma)
+        report (callable, optional): Her örnek için (hedef adı, örnek) ile çağrılır
+        
+    Returns:
+        dict: name, hands, seconds, samples, eğimler (bayt/el, bilinen büyüme
+            çıkarılmış) ve karşılaştırma eğimleri (yoksa None)
+    """
+    results = synthetic_history(hands, DEFAULT_SEED)
+    baseline_rss_slope = baseline_traced_slope = None
+    step = baseline_step = None
+    cleanups = []
+    try:
+        if target.baseline is not None:
+            baseline_step, cleanup = target.baseline()
+            cleanups.append(cleanup)
+            baseline_points, _, _ = _feed(baseline_step, results, samples, trace, 0)
+            baseline_rss_slope, baseline_traced_slope = _slopes(baseline_points, hands)
+            
+        step, cleanup, known = target.setup()
+        cleanups.insert(0, cleanup)
+        on_sample = (lambda point: report(target.name, point)) if report is not None else None
+        points, elapsed, sites = _feed(step, results, samples, trace, top, on_sample, known)
+    finally:
+        step = baseline_step = known = None
+        for cleanup in cleanups:
+            if cleanup is not None:
+                cleanup()
+        gc.collect()
+        
+    rss_slope, traced_slope = _slopes(points, hands)
+    if trace and target.baseline is not None:
+        rss_slope = baseline_rss_slope = None
+    return {
+        'name': target.name,
+        'hands': hands,
+        'seconds': elapsed,
+        'hands_per_sec': hands / elapsed if elapsed > 0 else 0.0,
+        'samples': points,
+        'rss_slope': _excess(rss_slope, baseline_rss_slope),
+        'traced_slope': _excess(traced_slope, baseline_traced_slope),
+        'baseline_rss_slope': baseline_rss_slope,
+        'baseline_traced_slope': baseline_traced_slope,
+        'growth_sites': sites
+    }
+
+
+def check(result, max_slope, max_rss_slope):
+    """
+    Eğimleri eşiklerle karşılaştır
+    
+    Args:
+        result (dict): soak() sonucu
+        max_slope (float): İzin verilen tracemalloc eğimi (bayt/el)
+        max_rss_slope (float): İzin verilen RSS eğimi (bayt/el)
+        
+    Returns:
+        list: Aşılan eşiklerin açıklamaları (boşsa hedef geçti)
+    """
+    failures = []
+    if result['traced_slope'] is not None and result['traced_slope'] > max_slope:
+        failures.append(f"Python belleği {result['traced_slope']:.2f} B/el > {max_slope:g}")
+    if result['rss_slope'] is not None and result['rss_slope'] > max_rss_slope:
+        failures.append(f"RSS {result['rss_slope']:.2f} B/el > {max_rss_slope:g}")
+    return failures
+
+
+def _parse_named(value, parse):
+    name, _, number = value.rpartition('=')
+    if name and name not in {target.name for target in TARGETS}:
+        raise argparse.ArgumentTypeError(f"bilinmeyen hedef: {name}")
+    return name or None, parse(number)
+
+
+def parse_hands(value):
+    """--hands argümanını (SAYI veya AD=SAYI, k/m ekleriyle) çöz"""
+    def count(number):
+        sizes = parse_sizes(number)
+        if len(sizes) != 1:
+            raise argparse.ArgumentTypeError(f"tek bir el sayısı verilmeli: {number}")
+        return sizes[0]
+    return _parse_named(value, count)
+
+
+def parse_slope(value):
+    """--max-slope / --max-rss-slope argümanını (BAYT veya AD=BAYT) çöz"""
+    def slope(number):
+        try:
+            number = float(number)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"geçersiz eşik: {value}")
+        if number < 0:
+            raise argparse.ArgumentTypeError(f"eşik negatif olamaz: {value}")
+        return number
+    return _parse_named(value, slope)
+
+
+def _format_bytes(value):
+    if value is None:
+        return '-'
+    return f"{value / (1024 * 1024):.1f} MB"
+
+
+def _format_slope(value):
+    return f"{value:+.2f} B/el" if value is not None else '-'
+
+
+def _report_sample(name, point):
+    sys.stdout.write(f"  {name:<8} {_format_size(point['hands']):>6} el  "
+                     f"RSS {_format_bytes(point['rss_bytes']):>10}  "
+                     f"Python {_format_bytes(point['traced_bytes']):>10}\n")
+    sys.stdout.flush()
+
+
+def build_parser():
+    """Komut satırı ayrıştırıcısını oluştur"""
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.soak',
+        description="Oyun, geçmiş, modeller ve ana pencereyi uzun oturumla besleyip "
+                    "el başına bellek artışını ölç")
+    parser.add_argument('--only', action='append', metavar='AD',
+                        choices=[target.name for target in TARGETS],
+                        help="yalnızca bu hedefi çalıştır (birden fazla verilebilir)")
+    parser.add_argument('--hands', type=parse_hands, action='append', default=[],
+                        metavar='[AD=]SAYI',
+                        help="el sayısı, k/m ekleri kullanılabilir; AD=SAYI yalnızca o hedefi "
+                             "değiştirir (varsayılan: " +
+                             ', '.join(f"{target.name}={_format_size(target.hands)}"
+                                       for target in TARGETS) + ")")
+    parser.add_argument('--samples', type=int, default=DEFAULT_SAMPLES, metavar='N',
+                        help=f"hedef başına bellek örneği sayısı (varsayılan: {DEFAULT_SAMPLES})")
+    parser.add_argument('--max-slope', type=parse_slope, action='append', default=[],
+                        metavar='[AD=]BAYT',
+                        help="izin verilen Python belleği artışı, bayt/el; AD=BAYT yalnızca o "
+                             "hedefi değiştirir (varsayılan: " +
+                             ', '.join(f"{target.name}={target.max_slope:g}"
+                                       for target in TARGETS) + ")")
+    parser.add_argument('--max-rss-slope', type=parse_slope, action='append', default=[],
+                        metavar='[AD=]BAYT',
+                        help="izin verilen RSS artışı, bayt/el (varsayılan: " +
+                             ', '.join(f"{target.name}={target.max_rss_slope:g}"
+                                       for target in TARGETS) + ")")
+    parser.add_argument('--no-tracemalloc', action='store_true',
+                        help="yalnızca RSS ölç (daha hızlı, büyüyen ayırım yerleri yazılmaz)")
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP, metavar='N',
+                        help=f"eşiği aşan hedef için yazılacak büyüyen ayırım yeri sayısı "
+                             f"(varsayılan: {DEFAULT_TOP}, 0: kapalı)")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, metavar='DOSYA',
+                        help=f"sonuç dosyası (varsayılan: {DEFAULT_OUTPUT})")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.samples < 3:
+        sys.stderr.write("Hata: en az 3 örnek gerekli\n")
+        return 2
+        
+    hands = dict(args.hands)
+    max_slopes = dict(args.max_slope)
+    max_rss_slopes = dict(args.max_rss_slope)
+    trace = not args.no_tracemalloc
+    
+    results = []
+    failed = 0
+    for target in get_targets(args.only):
+        count = hands.get(target.name, hands.get(None, target.hands))
+        sys.stdout.write(f"{target.name}: {target.description}, {_format_size(count)} el\n")
+        result = soak(target, count, args.samples, trace, args.top, _report_sample)
+        
+        max_slope = max_slopes.get(target.name, max_slopes.get(None, target.max_slope))
+        max_rss_slope = max_rss_slopes.get(target.name,
+                                           max_rss_slopes.get(None, target.max_rss_slope))
+        failures = check(result, max_slope, max_rss_slope)
+        result.update({'max_slope': max_slope, 'max_rss_slope': max_rss_slope,
+                       'failures': failures})
+        results.append(result)
+        
+        sys.stdout.write(f"  {result['hands_per_sec']:.0f} el/sn, eğim: "
+                         f"Python {_format_slope(result['traced_slope'])}, "
+                         f"RSS {_format_slope(result['rss_slope'])}")
+        if result['baseline_rss_slope'] is not None or result['baseline_traced_slope'] is not None:
+            sys.stdout.write(f" (bilinen büyüme hariç: Python "
+                             f"{_format_slope(result['baseline_traced_slope'])}, "
+                             f"RSS {_format_slope(result['baseline_rss_slope'])})")
+        sys.stdout.write('\n')
+        if failures:
+            failed += 1
+            sys.stdout.write(f"  BELLEK BÜYÜYOR: {'; '.join(failures)}\n")
+            for site in result['growth_sites'] or []:
+                sys.stdout.write(f"    {site['size_diff_kb']:+12.1f} KB {site['count_diff']:+10d} "
+                                 f"blok  {site['location']}\n")
+        sys.stdout.write('\n')
+        
+    output = {
+        'version': FORMAT_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': DEFAULT_SEED,
+        'warmup_fraction': WARMUP_FRACTION,
+        'tracemalloc': trace,
+        'results': results
+    }
+    try:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(output, f, ensure_ascii=False, indent=2)
+    except OSError as e:
+        sys.stderr.write(f"Hata: sonuçlar yazılamadı: {e}\n")
+        return 2
+        
+    sys.stdout.write(f"Eşiği aşan hedef: {failed}\n")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
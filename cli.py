@@ -0,0 +1,474 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Arayüz olmadan çalışan komut satırı giriş noktası
+
+Yalnızca core ve models paketlerini kullanır (PyQt5 yüklenmez); çıktılar
+JSON olduğu için kabuk boru hatlarında kullanılabilir.
+
+Örnekler:
+    python cli.py predict matris.json
+    echo "PBBPBTPB" | python cli.py predict -
+    python cli.py replay oturum.json --steps
+    python cli.py stats oturum.json
+    python cli.py simulate oturum.json --predictors ensemble,markov,banker
+    python cli.py simulate --generate 1000 --runs 500 --predictors banker,follow
+"""
+
+import os
+import sys
+import json
+import argparse
+
+from core.game import Game, MatrixAnalyzer, GameAnalyzer
+from core.strategies import (STRATEGIES, DEFAULT_PARAMS, DEFAULT_BANKROLL, DEFAULT_COMMISSION,
+                             DEFAULT_MIN_BET, DEFAULT_MAX_BET)
+from models.ensemble import Ensemble
+from models.registry import MODEL_REGISTRY, DEFAULT_MODELS, create_models
+
+# Tekrar oynatmada modellere verilen son sonuç sayısı
+# (matris için son 25 P/B sonuç ve trend penceresi yeterlidir, Tie'lar için pay bırakılır)
+CONTEXT_SIZE = 50
+
+RESULTS = ('P', 'B', 'T')
+
+# Simülasyonda model yerine kullanılabilen basit tahmin kuralları
+PREDICTION_RULES = ('banker', 'player', 'follow', 'opposite')
+
+
+class InputError(Exception):
+    """Girdi dosyası okunamadığında veya geçersiz olduğunda fırlatılan hata"""
+
+
+def read_input(path):
+    """
+    Matris, oturum veya sonuç dizisi dosyasını oku
+    
+    Desteklenen biçimler:
+        - Kaydet butonuyla kaydedilmiş 5x5 matris (JSON 2D liste)
+        - History.save_session() oturum dosyası (JSON, 'result' alanlı girdiler)
+        - JSON sonuç listesi (["P", "B", ...]) veya {"history": "PBT..."}
+        - Düz metin sonuç dizisi ("PBBPT", boşluk ve virgüller yok sayılır)
+        
+    Args:
+        path (str): Dosya yolu ('-' ise standart girdi)
+        
+    Returns:
+        tuple: (matris veya None, sonuç listesi)
+    """
+    try:
+        if path == '-':
+            text = sys.stdin.read()
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                text = f.read()
+    except OSError as e:
+        raise InputError(f"Dosya okunamadı: {e}")
+        
+    text = text.strip()
+    if text[:1] in ('[', '{'):
+        try:
+            data = json.loads(text)
+        except ValueError as e:
+            raise InputError(f"JSON okunamadı: {e}")
+        return _parse_json(data)
+        
+    results = [char for char in text.upper() if not char.isspace() and char != ',']
+    return None, _validate_results(results)
+
+
+def _parse_json(data):
+    """JSON içeriğini (matris, sonuç listesi) olarak çöz"""
+    if isinstance(data, dict):
+        if 'history' not in data:
+            raise InputError("JSON nesnesinde 'history' alanı yok")
+        return None, _validate_results(list(data['history']))
+        
+    if not isinstance(data, list):
+        raise InputError("Desteklenmeyen JSON içeriği")
+        
+    if data and all(isinstance(row, list) for row in data):
+        # Matris: hücreler satır satır geçmiş oyun sonuçlarıdır
+        if len(data) != 5 or any(len(row) != 5 for row in data):
+            raise InputError("Matris 5x5 olmalı")
+        if any(cell not in ('P', 'B', None) for row in data for cell in row):
+            raise InputError("Matris hücreleri 'P', 'B' veya null olmalı")
+        history = [cell for row in data for cell in row if cell is not None]
+        return data, history
+        
+    if data and all(isinstance(entry, dict) for entry in data):
+        try:
+            return None, _validate_results([entry['result'] for entry in data])
+        except KeyError:
+            raise InputError("Oturum girdilerinde 'result' alanı yok")
+            
+    return None, _validate_results(data)
+
+
+def _validate_results(results):
+    """Sonuç listesini doğrula"""
+    for index, result in enumerate(results):
+        if result not in RESULTS:
+            raise InputError(f"Geçersiz sonuç ({index + 1}. el): {result!r}")
+    return results
+
+
+def replay(ensemble, history, on_step=None):
+    """
+    Sonuçları sırayla modellere oynat
+    
+    Her el için önce o ana kadarki geçmişle tahmin yapılır, ardından
+    modeller gerçek sonuçla değerlendirilir ve sonuç modellere öğretilir.
+    
+    Args:
+        ensemble (Ensemble): Model topluluğu
+        history (list): Oyun sonuçları
+        on_step (callable, optional): Her el için (el no, tahmin sonucu, gerçek sonuç)
+        
+    Returns:
+        dict: Topluluğun tahmin sayısı ve başarı oranı
+    """
+    recent = []
+    valid = 0
+    correct = 0
+    
+    for hand, result in enumerate(history, 1):
+        matrix = MatrixAnalyzer.matrix_from_history(recent)
+        output = ensemble.predict(matrix, recent)
+        ensemble.add_result(result)
+        recent.append(result)
+        ensemble.observe(recent, len(recent) - 1)
+        
+        # Tie sonuçları tahmin doğruluğunu etkilemez
+        if result != 'T':
+            valid += 1
+            if output['prediction'] == result:
+                correct += 1
+                
+        if on_step is not None:
+            on_step(hand, output, result)
+            
+        if len(recent) > CONTEXT_SIZE * 2:
+            del recent[:-CONTEXT_SIZE]
+            
+    return {
+        'hands': len(history),
+        'valid_predictions': valid,
+        'accuracy': (correct / valid * 100) if valid else 0.0
+    }
+
+
+def format_prediction(output):
+    """Topluluk tahminini JSON'a uygun sözlüğe çevir"""
+    return {
+        'prediction': output['prediction'],
+        'confidence': round(output['confidence'], 2),
+        'banker_probability': round(output['banker_probability'], 4),
+        'models': [
+            {'name': name, 'prediction': prediction, 'confidence': round(confidence, 2),
+             'accuracy': round(accuracy, 2)}
+            for name, prediction, confidence, accuracy in output['models']
+        ]
+    }
+
+
+def cmd_predict(args):
+    """Bir sonraki el için tahmin yap"""
+    matrix, history = read_input(args.input)
+    ensemble = Ensemble(create_models(args.models))
+    
+    # Öğrenen modeller (ör. Markov Chain) önce geçmişle ısıtılır
+    replay(ensemble, history)
+    
+    recent = history[-CONTEXT_SIZE:]
+    if matrix is None:
+        matrix = MatrixAnalyzer.matrix_from_history(recent)
+        
+    output = format_prediction(ensemble.predict(matrix, recent))
+    output['hands'] = len(history)
+    return output
+
+
+def cmd_replay(args):
+    """Oturumu el el tekrar oynat"""
+    _, history = read_input(args.input)
+    ensemble = Ensemble(create_models(args.models))
+    
+    on_step = None
+    if args.steps:
+        def on_step(hand, output, result):
+            step = {'hand': hand, 'result': result}
+            step.update(format_prediction(output))
+            del step['models']
+            _write(step, None)
+            
+    summary = replay(ensemble, history, on_step)
+    summary['models'] = [model.get_stats(args.window) for model in ensemble.models]
+    return summary
+
+
+def cmd_stats(args):
+    """Oyun istatistiklerini ve trend analizini döndür"""
+    _, history = read_input(args.input)
+    
+    game = Game()
+    for result in history:
+        game.add_result(result)
+        
+    return {
+        'game': game.get_stats(),
+        'trends': GameAnalyzer.analyze_trends(history, args.window)
+    }
+
+
+def replay_predictions(history, model_keys):
+    """
+    Sonuçları modellere oynatıp her el için model başına tahmin ve Banker olasılığını topla
+    
+    Args:
+        history (list): Oyun sonuçları
+        model_keys (list): Model kısa adları
+        
+    Returns:
+        tuple: (model başına tahmin kodları, model başına Banker olasılıkları) dizileri
+    """
+    import numpy as np
+    from core.betting import encode
+    
+    predictions = [[] for _ in model_keys]
+    probabilities = [[] for _ in model_keys]
+    
+    def on_step(hand, output, result):
+        for index, (_, prediction, confidence, _) in enumerate(output['models']):
+            probability = confidence / 100.0
+            predictions[index].append(prediction)
+            probabilities[index].append(probability if prediction == 'B' else 1.0 - probability)
+            
+    replay(Ensemble(create_models(model_keys)), history, on_step)
+    return (np.array([encode(row) for row in predictions]),
+            np.array(probabilities, dtype=np.float32))
+
+
+def _replay_codes(task):
+    """Kodlanmış bir sonuç serisini modellere oynat (işçi süreçte çalışır)"""
+    outcomes, model_keys = task
+    return replay_predictions([RESULTS[code] for code in outcomes], model_keys)
+
+
+def cmd_simulate(args):
+    """Tahminleri takip eden bahis stratejilerinin kasa seyrini simüle et"""
+    # NumPy ve süreç havuzu yalnızca simülasyonda yüklenir (diğer komutların açılışı hızlı kalır)
+    from concurrent.futures import ProcessPoolExecutor
+    import numpy as np
+    from core.betting import (StrategyGrid, BANKER, PLAYER, encode, generate_outcomes,
+                              rule_predictions, simulate, summarize)
+    
+    if args.generate:
+        outcomes = generate_outcomes(args.generate, args.runs, args.seed)
+    else:
+        _, history = read_input(args.input)
+        if not history:
+            raise InputError("Girdide sonuç yok")
+        outcomes = encode(history)[None]
+    runs, hands = outcomes.shape
+    
+    # Topluluk ve tahmin kaynağı olarak istenen modeller tek seferde oynatılır
+    model_keys = []
+    if 'ensemble' in args.predictors:
+        model_keys.extend(args.models)
+    model_keys.extend(key for key in args.predictors if key in MODEL_REGISTRY and key not in model_keys)
+    
+    if model_keys:
+        tasks = [(row, model_keys) for row in outcomes]
+        if args.workers != 1 and runs > 1:
+            with ProcessPoolExecutor(max_workers=args.workers) as executor:
+                replays = list(executor.map(_replay_codes, tasks))
+        else:
+            replays = [_replay_codes(task) for task in tasks]
+        model_predictions = np.stack([codes for codes, _ in replays], axis=1)
+        model_probabilities = np.stack([probabilities for _, probabilities in replays], axis=1)
+        
+    predictions = []
+    probabilities = []
+    for source in args.predictors:
+        if source == 'ensemble':
+            # Ensemble.predict ile aynı birleştirme: Banker olasılıklarının ortalaması
+            probability = model_probabilities[:len(args.models)].mean(axis=0)
+            predictions.append(np.where(probability >= 0.5, BANKER, PLAYER).astype(np.int8))
+            probabilities.append(probability)
+        elif source in MODEL_REGISTRY:
+            index = model_keys.index(source)
+            predictions.append(model_predictions[index])
+            probabilities.append(model_probabilities[index])
+        else:
+            codes, probability = rule_predictions(outcomes, source)
+            predictions.append(codes)
+            probabilities.append(probability)
+            
+    params = {'martingale': args.martingale_steps, 'paroli': args.paroli_steps,
+              'kelly': args.kelly_fractions}
+    try:
+        grid = StrategyGrid(args.strategies, args.base_bets, params, range(len(args.predictors)))
+        result = simulate(outcomes, np.stack(predictions), grid, np.stack(probabilities),
+                          bankroll=args.bankroll, commission=args.commission,
+                          min_bet=args.min_bet, max_bet=args.max_bet, workers=args.workers)
+    except ValueError as e:
+        raise InputError(str(e))
+        
+    rules = dict(result['rules'])
+    del rules['path_every']
+    return {
+        'hands': hands,
+        'runs': runs,
+        'combinations': len(grid) * runs,
+        'rules': rules,
+        'results': summarize(result, grid, args.predictors)
+    }
+
+
+def _write(data, indent):
+    """JSON çıktısını standart çıktıya yaz"""
+    sys.stdout.write(json.dumps(data, ensure_ascii=False, indent=indent))
+    sys.stdout.write('\n')
+
+
+def parse_model_list(value):
+    """--models argümanını doğrula"""
+    keys = [key.strip() for key in value.split(',') if key.strip()]
+    unknown = [key for key in keys if key not in MODEL_REGISTRY]
+    if not keys or unknown:
+        raise argparse.ArgumentTypeError(
+            f"geçersiz model: {', '.join(unknown) or value} (seçenekler: {', '.join(MODEL_REGISTRY)})")
+    return keys
+
+
+def parse_predictor_list(value):
+    """--predictors argümanını doğrula"""
+    choices = ('ensemble',) + tuple(MODEL_REGISTRY) + PREDICTION_RULES
+    keys = [key.strip() for key in value.split(',') if key.strip()]
+    unknown = [key for key in keys if key not in choices]
+    if not keys or unknown:
+        raise argparse.ArgumentTypeError(
+            f"geçersiz tahmin kaynağı: {', '.join(unknown) or value} (seçenekler: {', '.join(choices)})")
+    return list(dict.fromkeys(keys))
+
+
+def parse_strategy_list(value):
+    """--strategies argümanını doğrula"""
+    keys = [key.strip() for key in value.split(',') if key.strip()]
+    unknown = [key for key in keys if key not in STRATEGIES]
+    if not keys or unknown:
+        raise argparse.ArgumentTypeError(
+            f"geçersiz strateji: {', '.join(unknown) or value} (seçenekler: {', '.join(STRATEGIES)})")
+    return keys
+
+
+def parse_number_list(value):
+    """Virgülle ayrılmış sayı listesini çöz (tam sayılar int olarak döner)"""
+    numbers = []
+    for part in value.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            number = float(part)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"geçersiz sayı: {part}")
+        numbers.append(int(number) if number.is_integer() else number)
+    if not numbers:
+        raise argparse.ArgumentTypeError("en az bir değer verilmeli")
+    return numbers
+
+
+def build_parser():
+    """Komut satırı ayrıştırıcısını oluştur"""
+    parser = argparse.ArgumentParser(
+        prog='cli.py',
+        description="Baccarat tahmin modellerini arayüz olmadan çalıştır (JSON çıktı)")
+    parser.add_argument('--indent', type=int, default=None,
+                        help="JSON girinti genişliği (varsayılan: tek satır)")
+    subparsers = parser.add_subparsers(dest='command', metavar='KOMUT')
+    subparsers.required = True
+    
+    predict = subparsers.add_parser('predict', help="matris veya geçmişten bir sonraki eli tahmin et")
+    predict.set_defaults(handler=cmd_predict)
+    
+    replay_parser = subparsers.add_parser('replay', help="oturumu el el tekrar oynat")
+    replay_parser.add_argument('--steps', action='store_true',
+                               help="her el için bir JSON satırı yaz")
+    replay_parser.add_argument('--window', type=int, default=None,
+                               help="model pencere istatistikleri için son tahmin sayısı")
+    replay_parser.set_defaults(handler=cmd_replay)
+    
+    stats = subparsers.add_parser('stats', help="oyun istatistiklerini ve trendleri döndür")
+    stats.add_argument('--window', type=int, default=10, help="trend analizi pencere boyutu")
+    stats.set_defaults(handler=cmd_stats)
+    
+    simulate_parser = subparsers.add_parser(
+        'simulate', help="tahminleri takip eden bahis stratejilerinin kasa seyrini simüle et")
+    simulate_parser.add_argument('--generate', type=int, default=None, metavar='EL',
+                                 help="girdi yerine bu uzunlukta rastgele sonuç serileri üret")
+    simulate_parser.add_argument('--runs', type=int, default=100, metavar='N',
+                                 help="--generate ile üretilecek seri sayısı (varsayılan: 100)")
+    simulate_parser.add_argument('--seed', type=int, default=None, help="üretim için rastgelelik tohumu")
+    simulate_parser.add_argument('--predictors', type=parse_predictor_list, default=['ensemble', 'banker'],
+                                 help="takip edilecek tahmin kaynakları: ensemble, model adları veya "
+                                      f"{', '.join(PREDICTION_RULES)} (varsayılan: ensemble,banker)")
+    simulate_parser.add_argument('--strategies', type=parse_strategy_list, default=list(STRATEGIES),
+                                 help=f"virgülle ayrılmış stratejiler (varsayılan: {','.join(STRATEGIES)})")
+    simulate_parser.add_argument('--base-bets', type=parse_number_list, default=[DEFAULT_MIN_BET],
+                                 metavar='LİSTE',
+                                 help=f"taban bahisler (varsayılan: {DEFAULT_MIN_BET:g})")
+    simulate_parser.add_argument('--martingale-steps', type=parse_number_list,
+                                 default=list(DEFAULT_PARAMS['martingale']), metavar='LİSTE',
+                                 help="Martingale'de en fazla ikiye katlama sayıları "
+                                      f"(varsayılan: {DEFAULT_PARAMS['martingale'][0]})")
+    simulate_parser.add_argument('--paroli-steps', type=parse_number_list,
+                                 default=list(DEFAULT_PARAMS['paroli']), metavar='LİSTE',
+                                 help=f"Paroli adım sayıları (varsayılan: {DEFAULT_PARAMS['paroli'][0]})")
+    simulate_parser.add_argument('--kelly-fractions', type=parse_number_list,
+                                 default=list(DEFAULT_PARAMS['kelly']), metavar='LİSTE',
+                                 help=f"Kelly kesirleri (varsayılan: {DEFAULT_PARAMS['kelly'][0]:g})")
+    simulate_parser.add_argument('--bankroll', type=float, default=DEFAULT_BANKROLL,
+                                 help=f"başlangıç kasası (varsayılan: {DEFAULT_BANKROLL:g})")
+    simulate_parser.add_argument('--commission', type=float, default=DEFAULT_COMMISSION,
+                                 help=f"Banker komisyonu (varsayılan: {DEFAULT_COMMISSION:g})")
+    simulate_parser.add_argument('--min-bet', type=float, default=DEFAULT_MIN_BET,
+                                 help=f"masa alt sınırı (varsayılan: {DEFAULT_MIN_BET:g})")
+    simulate_parser.add_argument('--max-bet', type=float, default=DEFAULT_MAX_BET,
+                                 help=f"masa üst sınırı (varsayılan: {DEFAULT_MAX_BET:g})")
+    simulate_parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, metavar='N',
+                                 help="işçi süreç sayısı (varsayılan: işlemci sayısı)")
+    simulate_parser.set_defaults(handler=cmd_simulate)
+    
+    for subparser in (predict, replay_parser, simulate_parser):
+        subparser.add_argument('--models', type=parse_model_list, default=list(DEFAULT_MODELS),
+                               help=f"virgülle ayrılmış modeller (varsayılan: {','.join(DEFAULT_MODELS)})")
+    for subparser in (predict, replay_parser, stats, simulate_parser):
+        subparser.add_argument('input', nargs='?', default='-',
+                               help="girdi dosyası ('-' veya boş: standart girdi)")
+                               
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    
+    try:
+        output = args.handler(args)
+    except InputError as e:
+        sys.stderr.write(f"Hata: {e}\n")
+        return 1
+        
+    _write(output, args.indent)
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except BrokenPipeError:
+        # Çıktı okuyan süreç erken kapandıysa (ör. head) sessizce çık
+        sys.stderr.close()
+        sys.exit(0)
\ No newline at end of file
@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Bahis stratejisi ve kasa (bankroll) simülasyonu
+
+Kaydedilmiş veya üretilmiş sonuç dizileri üzerinde model tahminlerini takip
+eden sabit (flat), Martingale, Paroli ve Kelly bahis stratejilerinin kasa
+seyrini hesaplar. Banker kazançlarından komisyon kesilir, Tie sonuçlarında
+P/B bahisleri iade edilir, bahisler masa alt ve üst sınırlarına uyar. Kasa
+masa alt sınırının altına düştüğünde strateji iflas etmiş sayılır ve bahis
+yapmayı bırakır.
+
+Eller sırayla işlenir (stratejilerin bahsi önceki ellere bağlıdır), ancak her
+elde binlerce strateji/parametre/tahmin kaynağı/seri birleşimi NumPy dizileri
+üzerinde birlikte güncellenir. Birleşimler işlemci çekirdeklerine bölünür.
+
+Örnek:
+    outcomes = generate_outcomes(1000, runs=200, seed=1)
+    predictions, probabilities = rule_predictions(outcomes, 'banker')
+    grid = StrategyGrid(['flat', 'martingale'], base_bets=[10, 25], params={'martingale': [4, 6]})
+    result = simulate(outcomes, predictions[None], grid, probabilities[None])
+    rows = summarize(result, grid)
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+
+import numpy as np
+
+from core.shoe import Shoe
+from core.strategies import (MARTINGALE, PAROLI, KELLY, STRATEGIES, DEFAULT_PARAMS,
+                             DEFAULT_BANKROLL, DEFAULT_COMMISSION, DEFAULT_MIN_BET,
+                             DEFAULT_MAX_BET)
+
+# Sonuç ve tahmin kodları (NO_BET: tahmin yok, bahis yapılmaz)
+PLAYER, BANKER, TIE, NO_BET = 0, 1, 2, 3
+CODES = {'P': PLAYER, 'B': BANKER, 'T': TIE, None: NO_BET}
+
+# Eller bu boyda bloklar halinde birleşim başına sıralanır (bellek / hız dengesi)
+BLOCK_HANDS = 256
+
+# Bir işçiye verilen en az birleşim sayısı (daha azında süreç maliyeti baskın gelir)
+MIN_CHUNK = 256
+
+
+def encode(results):
+    """
+    'P'/'B'/'T' (ve tahminlerde None) dizisini kod dizisine çevir
+    
+    Args:
+        results (iterable): Sonuçlar veya tahminler
+        
+    Returns:
+        numpy.ndarray: int8 kodlar
+    """
+    try:
+        return np.fromiter((CODES[result] for result in results), dtype=np.int8)
+    except KeyError as e:
+        raise ValueError(f"Geçersiz sonuç: {e.args[0]!r}")
+
+
+def generate_outcomes(hands, runs=1, seed=None, decks=8):
+    """
+    Dolu sabotun kesin olasılıklarıyla bağımsız sonuç serileri üret
+    
+    Args:
+        hands (int): Seri başına el sayısı
+        runs (int): Seri sayısı
+        seed (int, optional): Rastgelelik tohumu
+        decks (int): Deste sayısı
+        
+    Returns:
+        numpy.ndarray: (runs, hands) int8 sonuç kodları
+    """
+    probabilities = Shoe(decks).get_probabilities()
+    rng = np.random.default_rng(seed)
+    return rng.choice(3, size=(runs, hands), p=probabilities).astype(np.int8)
+
+
+def rule_predictions(outcomes, rule):
+    """
+    Model yerine basit bir kuralla tahmin dizisi oluştur (karşılaştırma için)
+    
+    Kurallar: 'banker' (hep Banker), 'player' (hep Player), 'follow' (son
+    P/B sonucunu izle), 'opposite' (son P/B sonucunun tersi). Olasılık olarak
+    dolu sabotun Tie hariç Banker olasılığı döner; bu olasılıkla Kelly hiçbir
+    zaman bahis yapmaz.
+    
+    Args:
+        outcomes (numpy.ndarray): (runs, hands) veya (hands,) sonuç kodları
+        rule (str): Kural adı
+        
+    Returns:
+        tuple: (tahmin kodları, Banker olasılıkları) sonuçlarla aynı boyutta
+    """
+    outcomes = np.asarray(outcomes, dtype=np.int8)
+    player, banker, _ = Shoe().get_probabilities()
+    probabilities = np.full(outcomes.shape, banker / (player + banker), dtype=np.float32)
+    
+    if rule in ('banker', 'player'):
+        return np.full(outcomes.shape, BANKER if rule == 'banker' else PLAYER, dtype=np.int8), probabilities
+    if rule not in ('follow', 'opposite'):
+        raise ValueError(f"Bilinmeyen kural: {rule}")
+        
+    # Her el için kendinden önceki son P/B sonucu (ileriye doğru doldurma)
+    previous = np.empty_like(outcomes)
+    previous[..., 0] = NO_BET
+    previous[..., 1:] = outcomes[..., :-1]
+    decided = previous < TIE
+    index = np.where(decided, np.arange(outcomes.shape[-1]), 0)
+    np.maximum.accumulate(index, axis=-1, out=index)
+    # İlk P/B sonucundan önce index 0'da kalır; previous[..., 0] NO_BET olduğundan bahis yapılmaz
+    last = np.take_along_axis(previous, index, axis=-1)
+    if rule == 'opposite':
+        last = np.where(last < TIE, 1 - last, NO_BET).astype(np.int8)
+    return last, probabilities
+
+
+class StrategyGrid:
+    """Simüle edilecek strateji, taban bahis, parametre ve tahmin kaynağı birleşimleri"""
+    
+    def __init__(self, strategies=tuple(STRATEGIES), base_bets=(DEFAULT_MIN_BET,), params=None,
+                 sources=(0,)):
+        """
+        Inicializasyon
+        
+        Args:
+            strategies (iterable): Strateji adları ('flat', 'martingale', 'paroli', 'kelly')
+            base_bets (iterable): Taban bahisler (Kelly'de kullanılmaz)
+            params (dict, optional): Strateji adı -> parametre değerleri (bkz. DEFAULT_PARAMS)
+            sources (iterable): Tahmin kaynağı indeksleri (tahmin dizisinin ilk boyutu)
+        """
+        params = dict(params or {})
+        self.configs = []  # (strateji adı, taban bahis, parametre, kaynak)
+        for strategy in strategies:
+            if strategy not in STRATEGIES:
+                raise ValueError(f"Bilinmeyen strateji: {strategy} (seçenekler: {', '.join(STRATEGIES)})")
+            values = params.get(strategy, DEFAULT_PARAMS[strategy])
+            # Kelly bahsi kasanın oranıdır; taban bahis birleşimleri çoğaltılmaz
+            bets = base_bets if strategy != 'kelly' else (0.0,)
+            for base_bet, param, source in product(bets, values, sources):
+                self._validate(strategy, param)
+                self.configs.append((strategy, float(base_bet), param, int(source)))
+    
+    @staticmethod
+    def _validate(strategy, param):
+        if strategy in ('martingale', 'paroli') and (int(param) != param or param < 1):
+            raise ValueError(f"{strategy} adım sayısı pozitif bir tam sayı olmalı: {param}")
+        if strategy == 'kelly' and not 0 < param <= 1:
+            raise ValueError(f"Kelly kesri (0, 1] aralığında olmalı: {param}")
+    
+    def __len__(self):
+        return len(self.configs)
+    
+    def arrays(self, runs=1):
+        """
+        Birleşimleri seri sayısı kadar çoğaltıp sütun dizilerine çevir
+        
+        Birleşim sırası: yapılandırma başına tüm seriler ardışık (c = yapılandırma * runs + seri).
+        
+        Args:
+            runs (int): Sonuç serisi sayısı
+            
+        Returns:
+            dict: kind, base_bet, param, source, run dizileri
+        """
+        configs = self.configs
+        return {
+            'kind': np.repeat(np.array([STRATEGIES[config[0]] for config in configs], dtype=np.int8), runs),
+            'base_bet': np.repeat(np.array([config[1] for config in configs], dtype=np.float64), runs),
+            'param': np.repeat(np.array([config[2] for config in configs], dtype=np.float64), runs),
+            'source': np.repeat(np.array([config[3] for config in configs], dtype=np.intp), runs),
+            'run': np.tile(np.arange(runs, dtype=np.intp), len(configs))
+        }
+
+
+def _normalize(outcomes, predictions, probabilities):
+    """Dizileri (runs, hands), (kaynak, runs, hands) biçimine getir"""
+    outcomes = np.asarray(outcomes, dtype=np.int8)
+    if outcomes.ndim == 1:
+        outcomes = outcomes[None]
+    runs, hands = outcomes.shape
+    
+    def expand(array, dtype):
+        array = np.asarray(array, dtype=dtype)
+        if array.ndim == 1:
+            array = array[None]
+        if array.ndim == 2:
+            # (kaynak, hands): tek serili sonuçlar için
+            array = array[:, None]
+        if array.shape[1:] != (runs, hands):
+            raise ValueError(f"Tahmin dizisi boyutu {array.shape} sonuçlarla ({runs}, {hands}) uyuşmuyor")
+        return array
+        
+    predictions = expand(predictions, np.int8)
+    if probabilities is not None:
+        probabilities = expand(probabilities, np.float32)
+        if probabilities.shape != predictions.shape:
+            raise ValueError("Olasılık dizisi tahmin dizisiyle aynı boyutta olmalı")
+    return outcomes, predictions, probabilities
+
+
+def simulate(outcomes, predictions, grid, probabilities=None, bankroll=DEFAULT_BANKROLL,
+             commission=DEFAULT_COMMISSION, min_bet=DEFAULT_MIN_BET, max_bet=DEFAULT_MAX_BET,
+             path_every=None, workers=None):
+    """
+    Tüm birleşimlerin kasa seyrini hesapla
+    
+    Args:
+        outcomes (array-like): (runs, hands) veya (hands,) sonuç kodları
+        predictions (array-like): (kaynak, runs, hands), (kaynak, hands) veya (hands,) tahmin kodları
+        grid (StrategyGrid): Birleşimler
+        probabilities (array-like, optional): Tahminlerle aynı boyutta Banker olasılıkları
+            (Tie hariç; Kelly için gerekli)
+        bankroll (float): Başlangıç kasası
+        commission (float): Banker kazancından kesilen komisyon oranı
+        min_bet (float): Masa alt sınırı (kasa bunun altına düşünce iflas)
+        max_bet (float): Masa üst sınırı
+        path_every (int, optional): Kasa seyrini her bu kadar elde bir kaydet
+        workers (int, optional): İşçi süreç sayısı (varsayılan: işlemci sayısı, 1: aynı süreçte)
+        
+    Returns:
+        dict: Birleşim başına sonuç dizileri, 'runs', 'hands' ve kurallar
+    """
+    outcomes, predictions, probabilities = _normalize(outcomes, predictions, probabilities)
+    runs, hands = outcomes.shape
+    if not 0 <= commission < 1:
+        raise ValueError("Komisyon [0, 1) aralığında olmalı")
+    if not 0 < min_bet <= max_bet:
+        raise ValueError("Masa sınırları 0 < alt sınır <= üst sınır olmalı")
+    if bankroll < min_bet:
+        raise ValueError("Başlangıç kasası masa alt sınırından küçük")
+    for strategy, base_bet, _, source in grid.configs:
+        if strategy != 'kelly' and not min_bet <= base_bet <= max_bet:
+            raise ValueError(f"Taban bahis masa sınırları dışında: {base_bet}")
+        if not 0 <= source < len(predictions):
+            raise ValueError(f"Geçersiz tahmin kaynağı: {source}")
+    if probabilities is None and any(config[0] == 'kelly' for config in grid.configs):
+        raise ValueError("Kelly stratejisi için Banker olasılıkları gerekli")
+        
+    columns = grid.arrays(runs)
+    count = len(columns['kind'])
+    rules = {'bankroll': float(bankroll), 'commission': float(commission),
+             'min_bet': float(min_bet), 'max_bet': float(max_bet), 'path_every': path_every}
+             
+    if workers is None:
+        workers = os.cpu_count() or 1
+    chunks = max(1, min(workers, count // MIN_CHUNK))
+    bounds = np.linspace(0, count, chunks + 1).astype(int)
+    tasks = [({name: values[start:stop] for name, values in columns.items()},
+              outcomes, predictions, probabilities, rules)
+             for start, stop in zip(bounds[:-1], bounds[1:])]
+             
+    if chunks == 1:
+        parts = [_simulate_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=chunks) as executor:
+            parts = list(executor.map(_simulate_chunk, tasks))
+            
+    result = {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+    result.update(columns)
+    result.update({'runs': runs, 'hands': hands, 'rules': rules})
+    return result
+
+
+def _simulate_chunk(task):
+    """Bir birleşim diliminin kasa seyrini hesapla (işçi süreçte çalışır)"""
+    columns, outcomes, predictions, probabilities, rules = task
+    kind = columns['kind']
+    base = columns['base_bet']
+    param = columns['param']
+    source = columns['source']
+    run = columns['run']
+    count = len(kind)
+    hands = outcomes.shape[1]
+    
+    commission = rules['commission']
+    min_bet = rules['min_bet']
+    max_bet = rules['max_bet']
+    path_every = rules['path_every']
+    
+    balance = np.full(count, rules['bankroll'])
+    peak = balance.copy()
+    low = balance.copy()
+    max_drawdown = np.zeros(count)
+    max_drawdown_pct = np.zeros(count)
+    wagered = np.zeros(count)
+    commission_paid = np.zeros(count)
+    bets = np.zeros(count, dtype=np.int64)
+    wins = np.zeros(count, dtype=np.int64)
+    losses = np.zeros(count, dtype=np.int64)
+    ruined = np.zeros(count, dtype=bool)
+    ruin_hand = np.full(count, -1, dtype=np.int64)
+    streak = np.zeros(count, dtype=np.int64)  # İkiye katlama sayısı
+    
+    is_martingale = kind == MARTINGALE
+    is_paroli = kind == PAROLI
+    is_kelly = kind == KELLY
+    has_progression = bool(is_martingale.any() or is_paroli.any())
+    has_kelly = bool(is_kelly.any())
+    # Martingale parametre kadar katlar; Paroli parametre kadar kazançta başa döner
+    limit = np.where(is_martingale, param, param - 1).astype(np.int64)
+    kelly_fraction = np.where(is_kelly, param, 0.0)
+    
+    paths = None
+    if path_every:
+        paths = np.empty((count, hands // path_every + 1), dtype=np.float32)
+        paths[:, 0] = balance
+        
+    for start in range(0, hands, BLOCK_HANDS):
+        stop = min(start + BLOCK_HANDS, hands)
+        # Elin birleşim başına sonucu ve tahmini (el, birleşim) düzeninde
+        outcome_block = np.ascontiguousarray(outcomes[run, start:stop].T)
+        prediction_block = np.ascontiguousarray(predictions[source, run, start:stop].T)
+        if has_kelly:
+            probability_block = np.ascontiguousarray(probabilities[source, run, start:stop].T)
+            
+        for offset in range(stop - start):
+            outcome = outcome_block[offset]
+            prediction = prediction_block[offset]
+            banker = prediction == BANKER
+            odds = np.where(banker, 1.0 - commission, 1.0)
+            
+            stake = np.ldexp(base, streak) if has_progression else base.copy()
+            if has_kelly:
+                # Tie iade edildiğinden Tie hariç kazanma olasılığıyla Kelly oranı
+                win_probability = np.where(banker, probability_block[offset],
+                                           1.0 - probability_block[offset])
+                edge = (win_probability * odds - (1.0 - win_probability)) / odds
+                stake = np.where(is_kelly, np.maximum(edge, 0.0) * kelly_fraction * balance, stake)
+            np.minimum(stake, max_bet, out=stake)
+            np.minimum(stake, balance, out=stake)
+            
+            bet = (prediction < TIE) & ~ruined & (stake >= min_bet)
+            win = bet & (outcome == prediction)
+            loss = bet & (outcome != prediction) & (outcome != TIE)
+            stake = np.where(bet, stake, 0.0)
+            
+            balance += np.where(win, stake * odds, 0.0) - np.where(loss, stake, 0.0)
+            commission_paid += np.where(win & banker, stake * commission, 0.0)
+            wagered += stake
+            bets += bet
+            wins += win
+            losses += loss
+            
+            if has_progression:
+                streak = np.where(is_martingale & loss, streak + 1, streak)
+                streak = np.where(is_paroli & win, streak + 1, streak)
+                streak[(is_martingale & win) | (is_paroli & loss) | (streak > limit)] = 0
+                
+            np.maximum(peak, balance, out=peak)
+            np.minimum(low, balance, out=low)
+            drawdown = peak - balance
+            np.maximum(max_drawdown, drawdown, out=max_drawdown)
+            np.maximum(max_drawdown_pct, drawdown / peak, out=max_drawdown_pct)
+            
+            broke = ~ruined & (balance < min_bet)
+            if broke.any():
+                ruin_hand[broke] = start + offset + 1
+                ruined |= broke
+                
+            hand = start + offset + 1
+            if paths is not None and hand % path_every == 0:
+                paths[:, hand // path_every] = balance
+                
+    result = {
+        'final': balance,
+        'peak': peak,
+        'low': low,
+        'max_drawdown': max_drawdown,
+        'max_drawdown_pct': max_drawdown_pct * 100.0,
+        'wagered': wagered,
+        'commission_paid': commission_paid,
+        'bets': bets,
+        'wins': wins,
+        'losses': losses,
+        'ruined': ruined,
+        'ruin_hand': ruin_hand
+    }
+    if paths is not None:
+        result['paths'] = paths
+    return result
+
+
+def summarize(result, grid, source_names=None):
+    """
+    Sonuçları yapılandırma başına (tüm seriler üzerinden) özetle
+    
+    Args:
+        result (dict): simulate() sonucu
+        grid (StrategyGrid): simulate()'e verilen birleşimler
+        source_names (list, optional): Tahmin kaynağı adları
+        
+    Returns:
+        list: Yapılandırma başına iflas olasılığı, kasa ve düşüş (drawdown) istatistikleri
+    """
+    runs = result['runs']
+    bankroll = result['rules']['bankroll']
+    
+    def grouped(name):
+        return result[name].reshape(len(grid), runs)
+        
+    final = grouped('final')
+    drawdown_pct = grouped('max_drawdown_pct')
+    drawdown = grouped('max_drawdown')
+    ruined = grouped('ruined')
+    ruin_hand = grouped('ruin_hand')
+    bets = grouped('bets')
+    wins = grouped('wins')
+    losses = grouped('losses')
+    wagered = grouped('wagered')
+    commission_paid = grouped('commission_paid')
+    
+    rows = []
+    for index, (strategy, base_bet, param, source) in enumerate(grid.configs):
+        ruin_hands = ruin_hand[index][ruined[index]]
+        decided = wins[index].sum() + losses[index].sum()
+        total_wagered = wagered[index].sum()
+        rows.append({
+            'strategy': strategy,
+            'base_bet': base_bet if strategy != 'kelly' else None,
+            'param': param if strategy != 'flat' else None,
+            'source': source_names[source] if source_names else source,
+            'runs': runs,
+            'ruin_probability': float(ruined[index].mean()),
+            'median_ruin_hand': float(np.median(ruin_hands)) if len(ruin_hands) else None,
+            'mean_final': float(final[index].mean()),
+            'median_final': float(np.median(final[index])),
+            'p5_final': float(np.percentile(final[index], 5)),
+            'p95_final': float(np.percentile(final[index], 95)),
+            'mean_return_pct': float((final[index].mean() - bankroll) / bankroll * 100.0),
+            'median_max_drawdown_pct': float(np.median(drawdown_pct[index])),
+            'p95_max_drawdown_pct': float(np.percentile(drawdown_pct[index], 95)),
+            'mean_max_drawdown': float(drawdown[index].mean()),
+            'mean_bets': float(bets[index].mean()),
+            'win_rate': float(wins[index].sum() / decided * 100.0) if decided else 0.0,
+            'mean_wagered': float(wagered[index].mean()),
+            # Bahis başına ortalama kâr/zarar oranı (kasa değişimi / toplam bahis)
+            'yield_pct': float((final[index].sum() - bankroll * runs) / total_wagered * 100.0)
+                         if total_wagered else 0.0,
+            'mean_commission': float(commission_paid[index].mean())
+        })
+    return rows
\ No newline at end of file
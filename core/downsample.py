@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Uzun zaman serilerini çizim için azaltan LTTB (Largest-Triangle-Three-Buckets) örneklemesi
+
+Seride x ekseni örnek sırasıdır (0, 1, 2, ...); yalnızca y değerleri saklanır.
+"""
+
+from array import array
+
+# Varsayılan hedef nokta sayısı (yaklaşık çizim genişliği, piksel)
+DEFAULT_THRESHOLD = 400
+
+
+def _pick(values, start, end, ax, ay, cx, cy):
+    """
+    [start, end) aralığında a ve c noktalarıyla en büyük üçgeni oluşturan
+    noktanın sırasını döndür
+    """
+    best = start
+    best_area = -1.0
+    for i in range(start, end):
+        area = abs((ax - cx) * (values[i] - ay) - (ax - i) * (cy - ay))
+        if area > best_area:
+            best_area = area
+            best = i
+    return best
+
+
+def lttb(values, threshold=DEFAULT_THRESHOLD):
+    """
+    Seriyi en fazla threshold noktaya azalt
+    
+    İlk ve son nokta korunur; aradaki noktalar eşit kovalara bölünür ve her
+    kovadan bir önceki seçilen nokta ile sonraki kovanın ortalamasıyla en
+    büyük üçgeni oluşturan nokta seçilir.
+    
+    Args:
+        values (sequence): Y değerleri
+        threshold (int): Hedef nokta sayısı (en az 3)
+        
+    Returns:
+        list: Seçilen noktaların sıraları (artan)
+    """
+    n = len(values)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+        
+    bucket_width = (n - 2) / (threshold - 2)
+    selected = [0]
+    a = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_width) + 1
+        end = int((bucket + 1) * bucket_width) + 1
+        
+        # Sonraki kovanın ortalaması (son kova için son nokta)
+        next_start = end
+        next_end = min(n, int((bucket + 2) * bucket_width) + 1)
+        if bucket == threshold - 3:
+            next_start, next_end = n - 1, n
+        count = next_end - next_start
+        cx = (next_start + next_end - 1) / 2.0
+        cy = sum(values[next_start:next_end]) / count
+        
+        a = _pick(values, start, end, a, values[a], cx, cy)
+        selected.append(a)
+        
+    selected.append(n - 1)
+    return selected
+
+
+class IncrementalLTTB:
+    """
+    Yeni değerler eklendikçe güncellenen LTTB örneklemesi
+    
+    Noktalar sabit boyutlu kovalara bölünür. Bir kovanın seçimi, sonraki kova
+    tamamlandığında kesinleşir ve bir daha hesaplanmaz; kova sayısı hedefi
+    aşınca kova boyu ikiye katlanıp seçim baştan yapılır. Böylece ekleme başına
+    iş amortize sabittir ve seçilen nokta sayısı threshold/2 ile threshold
+    arasında kalır.
+    """
+    
+    def __init__(self, threshold=DEFAULT_THRESHOLD, typecode='f'):
+        """
+        Inicializasyon
+        
+        Args:
+            threshold (int): Hedef nokta sayısı
+            typecode (str): Değerlerin saklandığı array tipi
+        """
+        self.values = array(typecode)
+        self.threshold = max(3, int(threshold))
+        self.bucket_size = 1
+        self._selected = []     # Kesinleşmiş seçimler (ilk nokta dahil)
+        self._next_bucket = 0   # Henüz kesinleşmemiş ilk kova
+        self._indices = None    # indices() önbelleği
+    
+    def __len__(self):
+        """Serideki toplam nokta sayısı"""
+        return len(self.values)
+    
+    def clear(self):
+        """Seriyi boşalt"""
+        del self.values[:]
+        self.bucket_size = 1
+        self._selected = []
+        self._next_bucket = 0
+        self._indices = None
+    
+    def append(self, value):
+        """
+        Seriye yeni değer ekle
+        
+        Args:
+            value (float): Y değeri
+        """
+        self.values.append(value)
+        self._indices = None
+        
+        n = len(self.values)
+        if n == 1:
+            self._selected.append(0)
+        elif n - 1 > self.threshold * self.bucket_size:
+            self.bucket_size *= 2
+            self._rebuild()
+        else:
+            self._finalize()
+    
+    def set_threshold(self, threshold):
+        """
+        Hedef nokta sayısını değiştir (ör. çizim genişliği değiştiğinde)
+        
+        Kova boyu değişmiyorsa mevcut seçimler korunur.
+        
+        Args:
+            threshold (int): Yeni hedef nokta sayısı
+        """
+        self.threshold = max(3, int(threshold))
+        bucket_size = 1
+        while len(self.values) - 1 > self.threshold * bucket_size:
+            bucket_size *= 2
+        if bucket_size != self.bucket_size:
+            self.bucket_size = bucket_size
+            self._rebuild()
+    
+    def _rebuild(self):
+        """Tüm kovaları mevcut kova boyuyla yeniden seç"""
+        self._selected = [0] if self.values else []
+        self._next_bucket = 0
+        self._indices = None
+        self._finalize()
+    
+    def _finalize(self):
+        """Sonraki kovası tamamlanmış kovaların seçimini kesinleştir"""
+        values = self.values
+        size = self.bucket_size
+        n = len(values)
+        
+        while 1 + (self._next_bucket + 2) * size <= n:
+            start = 1 + self._next_bucket * size
+            next_start = start + size
+            cx = next_start + (size - 1) / 2.0
+            cy = sum(values[next_start:next_start + size]) / size
+            
+            a = self._selected[-1]
+            self._selected.append(_pick(values, start, next_start, a, values[a], cx, cy))
+            self._next_bucket += 1
+    
+    def indices(self):
+        """
+        Çizilecek noktaların sıralarını döndür
+        
+        Kesinleşmiş seçimlere ek olarak tamamlanmış son kova geçici olarak
+        (sonraki kısmi kovanın ortalamasıyla) seçilir ve son nokta eklenir.
+        
+        Returns:
+            list: Seçilen noktaların sıraları (artan)
+        """
+        if self._indices is not None:
+            return self._indices
+            
+        values = self.values
+        n = len(values)
+        indices = list(self._selected)
+        if n:
+            start = 1 + self._next_bucket * self.bucket_size
+            next_start = start + self.bucket_size
+            if next_start < n:
+                a = indices[-1]
+                cx = (next_start + n - 1) / 2.0
+                cy = sum(values[next_start:n]) / (n - next_start)
+                indices.append(_pick(values, start, next_start, a, values[a], cx, cy))
+            if indices[-1] != n - 1:
+                indices.append(n - 1)
+                
+        self._indices = indices
+        return indices
+    
+    def points(self):
+        """
+        Çizilecek noktaları döndür
+        
+        Returns:
+            list: (sıra, değer) listesi
+        """
+        values = self.values
+        return [(i, values[i]) for i in self.indices()]
\ No newline at end of file
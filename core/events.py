@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Oyun durumu, modeller, geçmiş ve arayüz arasında tipli yayınla / abone ol olay yolu
+"""
+
+import sys
+import time
+import traceback
+
+from core.latency import LatencyHistogram
+
+# Teslim biçimleri
+SYNC = 'sync'      # publish() içinde hemen çağrılır
+QUEUED = 'queued'  # dispatch() çağrılana kadar biriktirilir
+
+
+class Event:
+    """Olayların temel sınıfı (bu tipe abone olan her olayı alır)"""
+    
+    __slots__ = ()
+
+
+class ResultAdded(Event):
+    """Yeni bir el sonucu girildi (klavye, akış vb.)"""
+    
+    __slots__ = ('result', 'source')
+    
+    def __init__(self, result, source=None):
+        """
+        Inicializasyon
+        
+        Args:
+            result (str): 'P', 'B' veya 'T'
+            source (str, optional): Sonucun geldiği giriş (ör. 'klavye', 'akış')
+        """
+        self.result = result
+        self.source = source
+
+
+class MatrixChanged(Event):
+    """Matris hücreleri elle düzenlendi veya girilen sonuçlarla güncellendi"""
+    
+    __slots__ = ('changes', 'results')
+    
+    def __init__(self, changes, results=0):
+        """
+        Inicializasyon
+        
+        Args:
+            changes (list): (satır, sütun, eski değer, yeni değer) listesi
+            results (int): Değişikliğe yol açan girilen sonuç sayısı (0: elle düzenleme)
+        """
+        self.changes = changes
+        self.results = results
+
+
+class PredictionReady(Event):
+    """Arka planda yapılan tahmin tamamlandı"""
+    
+    __slots__ = ('result',)
+    
+    def __init__(self, result):
+        """
+        Inicializasyon
+        
+        Args:
+            result (dict): Ensemble.predict() sonucu
+        """
+        self.result = result
+
+
+class Subscription:
+    """Bir abonenin ayarları, bekleyen olayları ve çağrı süresi ölçümleri"""
+    
+    def __init__(self, event_type, handler, mode, batch, name):
+        self.event_type = event_type
+        self.handler = handler
+        self.mode = mode
+        self.batch = batch
+        self.name = name
+        self.pending = []   # Teslim edilmeyi bekleyen olaylar (QUEUED)
+        self.timing = LatencyHistogram()
+        self.events = 0     # Teslim edilen olay sayısı
+        self.errors = 0
+        self.last_error = None
+    
+    def get_stats(self):
+        """
+        Abone istatistiklerini döndür
+        
+        Returns:
+            dict: Teslim sayıları, bekleyen olaylar ve çağrı süreleri
+        """
+        return {
+            'name': self.name,
+            'event': self.event_type.__name__,
+            'mode': self.mode,
+            'batch': self.batch,
+            'events': self.events,
+            'pending': len(self.pending),
+            'errors': self.errors,
+            'last_error': self.last_error,
+            'timing': self.timing.get_stats()
+        }
+
+
+class EventBus:
+    """
+    Olay tipine göre abonelere teslim yapan olay yolu
+    
+    SYNC aboneler publish() içinde çağrılır ve yalnızca ucuz işler (ör. sayaç
+    güncelleme) için kullanılmalıdır. QUEUED abonelerin olayları biriktirilir
+    ve dispatch() ile teslim edilir; ilk olay biriktiğinde wakeup çağrılır
+    (arayüzde bir sonraki olay döngüsü turunda dispatch() çalıştırmak için).
+    batch=True olan aboneler her dispatch'te biriken olayların listesini tek
+    çağrıda alır; böylece sık gelen olaylar tek bir güncellemeye indirgenir.
+    
+    Abone hataları yayıncıya yansımaz; sayılır ve standart hataya yazılır.
+    """
+    
+    def __init__(self, wakeup=None):
+        """
+        Inicializasyon
+        
+        Args:
+            wakeup (callable, optional): QUEUED olay biriktiğinde çağrılır
+        """
+        self.wakeup = wakeup
+        self.subscriptions = []
+        self._routes = {}     # Olay tipi -> abone listesi (üst tipler dahil, önbellek)
+        self._ready = []      # Bekleyen olayı olan QUEUED aboneler
+        self._scheduled = False
+        self.published = 0
+    
+    def subscribe(self, event_type, handler, mode=SYNC, batch=False, name=None):
+        """
+        Olay tipine abone ol
+        
+        Args:
+            event_type (type): Event alt sınıfı (alt tipler de teslim edilir)
+            handler (callable): Olayla (batch ise olay listesiyle) çağrılır
+            mode (str): SYNC veya QUEUED
+            batch (bool): Biriken olayları liste halinde teslim et (yalnızca QUEUED)
+            name (str, optional): İstatistiklerde gösterilecek ad
+            
+        Returns:
+            Subscription: Abonelik (unsubscribe için)
+        """
+        if mode not in (SYNC, QUEUED):
+            raise ValueError(f"Geçersiz teslim biçimi: {mode}")
+        if batch and mode != QUEUED:
+            raise ValueError("Toplu teslim yalnızca QUEUED abonelerde kullanılabilir")
+            
+        subscription = Subscription(event_type, handler, mode, batch,
+                                    name or getattr(handler, '__name__', repr(handler)))
+        self.subscriptions.append(subscription)
+        self._routes.clear()
+        return subscription
+    
+    def unsubscribe(self, subscription):
+        """
+        Aboneliği kaldır (bekleyen olayları atılır)
+        
+        Args:
+            subscription (Subscription): subscribe() ile alınan abonelik
+        """
+        if subscription in self.subscriptions:
+            self.subscriptions.remove(subscription)
+            subscription.pending = []
+            self._routes.clear()
+    
+    def _route(self, event_type):
+        """Olay tipini alan aboneleri (abonelik sırasıyla) döndür"""
+        route = self._routes.get(event_type)
+        if route is None:
+            route = [subscription for subscription in self.subscriptions
+                     if issubclass(event_type, subscription.event_type)]
+            self._routes[event_type] = route
+        return route
+    
+    def publish(self, event):
+        """
+        Olayı abonelere gönder
+        
+        Args:
+            event (Event): Olay
+        """
+        self.published += 1
+        for subscription in self._route(type(event)):
+            if subscription.mode == SYNC:
+                self._deliver(subscription, event, 1)
+                continue
+                
+            if not subscription.pending:
+                self._ready.append(subscription)
+            subscription.pending.append(event)
+            
+        if self._ready and not self._scheduled:
+            self._scheduled = True
+            if self.wakeup is not None:
+                self.wakeup()
+    
+    def has_pending(self):
+        """Teslim edilmeyi bekleyen olay varsa True"""
+        return bool(self._ready)
+    
+    def dispatch(self):
+        """
+        Biriken QUEUED olayları teslim et
+        
+        Teslim sırasında yayınlanan olaylar bir sonraki dispatch'e kalır.
+        
+        Returns:
+            int: Teslim edilen olay sayısı
+        """
+        self._scheduled = False
+        ready, self._ready = self._ready, []
+        delivered = 0
+        
+        for subscription in ready:
+            events, subscription.pending = subscription.pending, []
+            if not events:
+                continue  # Bu arada abonelikten çıkarıldı
+            if subscription.batch:
+                self._deliver(subscription, events, len(events))
+            else:
+                for event in events:
+                    self._deliver(subscription, event, 1)
+            delivered += len(events)
+            
+        if self._ready and not self._scheduled:
+            self._scheduled = True
+            if self.wakeup is not None:
+                self.wakeup()
+        return delivered
+    
+    def _deliver(self, subscription, payload, count):
+        """Aboneyi çağır ve süresini ölç"""
+        start = time.perf_counter_ns()
+        try:
+            subscription.handler(payload)
+        except Exception as e:
+            subscription.errors += 1
+            subscription.last_error = f"{type(e).__name__}: {e}"
+            sys.stderr.write(f"Olay abonesi hata verdi ({subscription.name}):\n")
+            traceback.print_exc()
+        subscription.timing.record(time.perf_counter_ns() - start)
+        subscription.events += count
+    
+    def get_stats(self):
+        """
+        Abone başına teslim ve süre istatistiklerini döndür
+        
+        Returns:
+            list: Abone istatistikleri (abonelik sırasıyla)
+        """
+        return [subscription.get_stats() for subscription in self.subscriptions]
\ No newline at end of file
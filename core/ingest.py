@@ -0,0 +1,671 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Satır tabanlı sonuç akışlarını (dosya, standart girdi, yerel soket) okuyan alım katmanı
+
+Her satır bir kayıttır:
+    B                        tek sonuç
+    PBBT                     sırayla birden fazla sonuç
+    masa3:B                  masa adıyla
+    masa3:B@1729280000.25    olay zamanıyla (Unix saniyesi, gecikme ölçümü için)
+    {"table": "masa3", "result": "B", "ts": 1729280000.25}
+
+Sonuçlar P/B/T harfleri veya PLAYER/BANKER/TIE kelimeleriyle yazılabilir. Boş
+satırlar ve '#' ile başlayan satırlar yok sayılır.
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import socket
+import selectors
+import threading
+
+from core.latency import LatencyHistogram
+from core.metrics import REGISTRY
+
+RESULT_WORDS = {'PLAYER': 'P', 'BANKER': 'B', 'TIE': 'T'}
+
+DEFAULT_QUEUE_SIZE = 10000   # Kuyruk dolunca kaynaklar okumayı bekletir
+BATCH_SIZE = 512             # poll() başına en fazla kayıt
+MAX_RECORD_BYTES = 4096      # Daha uzun satırlar hatalı sayılıp atılır
+
+POLL_INTERVAL = 0.1          # Dosya sonunda ve soket beklemesinde bekleme (saniye)
+RECONNECT_DELAY = 0.5        # İlk yeniden bağlanma beklemesi (saniye)
+MAX_RECONNECT_DELAY = 5.0
+
+
+class IngestError(Exception):
+    """Kayıt çözülemediğinde veya kaynak tanımı geçersiz olduğunda fırlatılan hata"""
+
+
+class Record:
+    """Akıştan okunan tek bir kayıt"""
+    
+    __slots__ = ('table', 'results', 'event_time', 'received_ns', 'source')
+    
+    def __init__(self, table, results, event_time=None):
+        """
+        Inicializasyon
+        
+        Args:
+            table (str): Masa adı (belirtilmediyse None)
+            results (list): Sonuçlar ('P', 'B' veya 'T')
+            event_time (float, optional): Olay zamanı (Unix saniyesi)
+        """
+        self.table = table
+        self.results = results
+        self.event_time = event_time
+        self.received_ns = 0   # Kuyruğa girdiği an (time.monotonic_ns)
+        self.source = None     # Kaynak adı
+
+
+def parse_record(line):
+    """
+    Tek bir satırı kayda çevir
+    
+    Args:
+        line (str): Kayıt satırı
+        
+    Returns:
+        Record: Kayıt (boş veya yorum satırıysa None)
+    """
+    text = line.strip()
+    if not text or text.startswith('#'):
+        return None
+        
+    if text.startswith('{'):
+        return _parse_json_record(text)
+        
+    event_time = None
+    if '@' in text:
+        text, stamp = text.rsplit('@', 1)
+        event_time = _parse_time(stamp)
+        
+    table = None
+    if ':' in text:
+        table, text = text.split(':', 1)
+        table = table.strip() or None
+        
+    return Record(table, _parse_results(text), event_time)
+
+
+def _parse_json_record(text):
+    """JSON kaydını çöz"""
+    try:
+        data = json.loads(text)
+    except ValueError as e:
+        raise IngestError(f"JSON okunamadı: {e}")
+    if not isinstance(data, dict):
+        raise IngestError("JSON kaydı bir nesne olmalı")
+        
+    results = data.get('result', data.get('results'))
+    if not isinstance(results, str):
+        raise IngestError("'result' alanı metin olmalı")
+        
+    table = data.get('table')
+    event_time = data.get('ts')
+    return Record(None if table is None else str(table), _parse_results(results),
+                  None if event_time is None else _parse_time(event_time))
+
+
+def _parse_results(text):
+    """Sonuç harflerini veya kelimesini listeye çevir"""
+    text = text.strip().upper()
+    if text in RESULT_WORDS:
+        return [RESULT_WORDS[text]]
+        
+    results = [char for char in text if not char.isspace() and char != ',']
+    if not results:
+        raise IngestError("kayıtta sonuç yok")
+    for char in results:
+        if char not in ('P', 'B', 'T'):
+            raise IngestError(f"geçersiz sonuç: {char!r}")
+    return results
+
+
+def _parse_time(value):
+    """Olay zamanını (Unix saniyesi) çöz"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise IngestError(f"geçersiz zaman damgası: {value!r}")
+
+
+class Source:
+    """Satırları okuyup Ingestor'a ileten kaynakların temel sınıfı (kendi iş parçacığında çalışır)"""
+    
+    def __init__(self, name):
+        """
+        Inicializasyon
+        
+        Args:
+            name (str): Kaynak adı (metriklerde gösterilir)
+        """
+        self.name = name
+        self.lines = 0          # Okunan satır sayısı
+        self.connects = 0       # Açılan dosya / kabul edilen bağlantı sayısı
+        self.connected = 0      # Şu an açık dosya / bağlantı sayısı
+        self.last_error = None
+    
+    def run(self, ingestor):
+        """
+        Ingestor durdurulana veya kaynak bitene kadar oku
+        
+        Args:
+            ingestor (Ingestor): Satırların iletileceği alıcı
+        """
+        raise NotImplementedError("Alt sınıflar run metodunu uygulamalıdır")
+    
+    def close(self):
+        """Bekleyen okumaları sonlandır (durdurma sırasında çağrılır)"""
+    
+    def get_stats(self):
+        """
+        Kaynak metriklerini döndür
+        
+        Returns:
+            dict: Kaynak metrikleri
+        """
+        return {
+            'name': self.name,
+            'lines': self.lines,
+            'connects': self.connects,
+            'connected': self.connected,
+            'last_error': self.last_error
+        }
+
+
+class StreamSource(Source):
+    """Açık bir metin akışını (ör. standart girdi) sonuna kadar okuyan kaynak"""
+    
+    def __init__(self, stream, name='stdin'):
+        """
+        Inicializasyon
+        
+        Args:
+            stream (file): Satır satır okunacak akış
+            name (str): Kaynak adı
+        """
+        super().__init__(name)
+        self.stream = stream
+    
+    def run(self, ingestor):
+        self.connects = self.connected = 1
+        try:
+            for line in iter(self.stream.readline, ''):
+                if ingestor.stopped:
+                    break
+                ingestor.feed(self, line)
+        except (OSError, ValueError) as e:
+            self.last_error = str(e)
+        finally:
+            self.connected = 0
+
+
+class FileTailSource(Source):
+    """
+    Dosyanın sonuna eklenen satırları izleyen kaynak (tail -F gibi)
+    
+    Dosya yoksa belirip belirmediği artan aralıklarla denenir. Dosya
+    döndürülürse (aynı yolda yeni dosya) yeni dosya baştan okunur, kesilirse
+    (boyutu küçülürse) okuma başa alınır.
+    """
+    
+    def __init__(self, path, from_start=False, poll_interval=POLL_INTERVAL):
+        """
+        Inicializasyon
+        
+        Args:
+            path (str): İzlenecek dosya
+            from_start (bool): İlk açılışta mevcut satırları da oku
+            poll_interval (float): Dosya sonunda bekleme süresi (saniye)
+        """
+        super().__init__(f"file:{path}")
+        self.path = path
+        self.from_start = from_start
+        self.poll_interval = poll_interval
+    
+    def run(self, ingestor):
+        # Yalnızca başlangıçta var olan dosyanın eski satırları atlanır; sonradan
+        # oluşan veya döndürülen dosyalar baştan okunur
+        skip_existing = not self.from_start
+        delay = RECONNECT_DELAY
+        while not ingestor.stopped:
+            try:
+                f = open(self.path, 'rb')
+            except OSError as e:
+                self.last_error = str(e)
+                skip_existing = False
+                ingestor.sleep(delay)
+                delay = min(delay * 2, MAX_RECONNECT_DELAY)
+                continue
+                
+            delay = RECONNECT_DELAY
+            self.last_error = None
+            with f:
+                self.connects += 1
+                self.connected = 1
+                if skip_existing:
+                    f.seek(0, os.SEEK_END)
+                    skip_existing = False
+                self._follow(f, ingestor)
+                self.connected = 0
+    
+    def _follow(self, f, ingestor):
+        """Açık dosyayı döndürülene veya durdurulana kadar izle"""
+        opened = os.fstat(f.fileno())
+        partial = b''
+        
+        while not ingestor.stopped:
+            chunk = f.readline()
+            if chunk:
+                partial += chunk
+                if partial.endswith(b'\n'):
+                    ingestor.feed(self, partial)
+                    partial = b''
+                elif len(partial) > MAX_RECORD_BYTES:
+                    ingestor.reject(self, "kayıt çok uzun")
+                    partial = b''
+                continue
+                
+            # Dosya sonu: döndürme veya kesilme var mı?
+            try:
+                current = os.stat(self.path)
+            except OSError:
+                current = None  # Yeni dosya henüz oluşturulmadı; eski dosyayı izlemeye devam et
+            if current is not None:
+                if (current.st_ino, current.st_dev) != (opened.st_ino, opened.st_dev):
+                    return
+                if current.st_size < f.tell():
+                    f.seek(0)
+                    partial = b''
+                    continue
+            ingestor.sleep(self.poll_interval)
+
+
+class SocketSource(Source):
+    """
+    Yerel bir TCP veya Unix soketini dinleyen kaynak
+    
+    Aynı anda birden fazla besleyici bağlanabilir; bağlantısı kopan
+    besleyici yeniden bağlandığında okuma kaldığı yerden sürer.
+    """
+    
+    def __init__(self, address, family=socket.AF_INET):
+        """
+        Inicializasyon
+        
+        Args:
+            address: (host, port) veya Unix soketi yolu
+            family (int): socket.AF_INET veya socket.AF_UNIX
+        """
+        if family == socket.AF_INET:
+            name = 'tcp:{}:{}'.format(*address)
+        else:
+            name = f"unix:{address}"
+        super().__init__(name)
+        self.address = address
+        self.family = family
+        self.port = None  # Dinlenen port (TCP, port 0 verildiyse seçilen port)
+        self._server = None
+        self._ready = threading.Event()
+    
+    def listen(self):
+        """Dinleyen soketi oluştur (run'dan önce çağrılabilir)"""
+        if self._server is not None:
+            return
+        if self.family != socket.AF_INET and os.path.exists(self.address):
+            os.unlink(self.address)
+        server = socket.socket(self.family, socket.SOCK_STREAM)
+        try:
+            if self.family == socket.AF_INET:
+                server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            server.bind(self.address)
+            server.listen()
+        except OSError:
+            server.close()
+            raise
+        server.setblocking(False)
+        if self.family == socket.AF_INET:
+            self.port = server.getsockname()[1]
+            self.name = f"tcp:{self.address[0]}:{self.port}"
+        self._server = server
+    
+    def wait_ready(self, timeout=None):
+        """
+        Soket dinlemeye başlayana kadar bekle
+        
+        Returns:
+            bool: Soket dinliyorsa True
+        """
+        return self._ready.wait(timeout)
+    
+    def run(self, ingestor):
+        delay = RECONNECT_DELAY
+        while self._server is None and not ingestor.stopped:
+            try:
+                self.listen()
+            except OSError as e:
+                self.last_error = str(e)
+                ingestor.sleep(delay)
+                delay = min(delay * 2, MAX_RECONNECT_DELAY)
+        if self._server is None:
+            return
+        self._ready.set()
+        
+        selector = selectors.DefaultSelector()
+        selector.register(self._server, selectors.EVENT_READ, None)
+        try:
+            while not ingestor.stopped:
+                for key, _ in selector.select(POLL_INTERVAL):
+                    if key.data is None:
+                        self._accept(selector)
+                    else:
+                        self._read(selector, key, ingestor)
+        finally:
+            for key in list(selector.get_map().values()):
+                key.fileobj.close()
+            selector.close()
+            self._server = None
+            self.connected = 0
+            if self.family != socket.AF_INET and os.path.exists(self.address):
+                os.unlink(self.address)
+    
+    def _accept(self, selector):
+        """Yeni besleyici bağlantısını kabul et"""
+        try:
+            connection, _ = self._server.accept()
+        except OSError:
+            return
+        connection.setblocking(False)
+        selector.register(connection, selectors.EVENT_READ, bytearray())
+        self.connects += 1
+        self.connected += 1
+    
+    def _read(self, selector, key, ingestor):
+        """Bağlantıdan gelen verideki tam satırları ilet"""
+        connection = key.fileobj
+        buffer = key.data
+        try:
+            data = connection.recv(65536)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            self.last_error = str(e)
+            data = b''
+            
+        if not data:
+            # Besleyici bağlantıyı kapattı; tamamlanmamış son satır atılır
+            selector.unregister(connection)
+            connection.close()
+            self.connected -= 1
+            return
+            
+        buffer += data
+        start = 0
+        while True:
+            end = buffer.find(b'\n', start)
+            if end < 0:
+                break
+            ingestor.feed(self, bytes(buffer[start:end + 1]))
+            start = end + 1
+        del buffer[:start]
+        if len(buffer) > MAX_RECORD_BYTES:
+            ingestor.reject(self, "kayıt çok uzun")
+            del buffer[:]
+
+
+def open_source(spec, from_start=False):
+    """
+    Kaynak tanımından kaynak oluştur
+    
+    Tanımlar:
+        -                 standart girdi
+        tcp:PORT          127.0.0.1 üzerinde TCP soketi
+        tcp:HOST:PORT     verilen adreste TCP soketi
+        unix:YOL          Unix soketi
+        file:YOL veya YOL dosya izleme
+        
+    Args:
+        spec (str): Kaynak tanımı
+        from_start (bool): İzlenen dosyalarda mevcut satırları da oku
+        
+    Returns:
+        Source: Kaynak
+    """
+    if spec in ('-', 'stdin'):
+        return StreamSource(sys.stdin)
+        
+    kind, _, rest = spec.partition(':')
+    if kind == 'tcp':
+        host, _, port = rest.rpartition(':')
+        try:
+            port = int(port)
+        except ValueError:
+            raise IngestError(f"geçersiz port: {spec}")
+        return SocketSource((host or '127.0.0.1', port), socket.AF_INET)
+    if kind == 'unix':
+        if not hasattr(socket, 'AF_UNIX'):
+            raise IngestError("Unix soketleri bu sistemde desteklenmiyor")
+        return SocketSource(rest, socket.AF_UNIX)
+    if kind == 'file':
+        return FileTailSource(rest, from_start)
+    return FileTailSource(spec, from_start)
+
+
+class Ingestor:
+    """
+    Kaynaklardan gelen kayıtları sınırlı bir kuyrukta toplayan alıcı
+    
+    Her kaynak kendi iş parçacığında okur ve çözülen kayıtları kuyruğa ekler;
+    tüketici (arayüz zamanlayıcısı veya servis) poll() ile biriken kayıtları
+    toplu olarak alır. Kuyruk dolunca kaynaklar yer açılana kadar bekler, soket
+    besleyicileri de TCP akış denetimiyle yavaşlar.
+    
+    Gecikme metrikleri:
+        lag        Alınmış ama tüketilmemiş sonuç sayısı
+        oldest_ms  Kuyruktaki en eski kaydın bekleme süresi
+        delivery   Kuyruğa girişten tüketime kadar geçen süre histogramı
+        event_lag  Olay zamanı verilmiş kayıtlarda olaydan tüketime kadar geçen süre
+    """
+    
+    def __init__(self, sources, max_queue=DEFAULT_QUEUE_SIZE):
+        """
+        Inicializasyon
+        
+        Args:
+            sources (list): Source örnekleri
+            max_queue (int): Kuyruktaki en fazla kayıt sayısı
+        """
+        self.sources = list(sources)
+        self._queue = queue.Queue(max_queue)
+        self._stop = threading.Event()
+        self._threads = []
+        self._lock = threading.Lock()  # Kaynak iş parçacıklarının sayaçları için
+        
+        self.received = 0   # Kuyruğa eklenen sonuç sayısı
+        self.consumed = 0   # Tüketilen sonuç sayısı
+        self.errors = 0     # Çözülemeyen kayıt sayısı
+        self.last_error = None
+        
+        # Yalnızca tüketici tarafında güncellenir
+        self.delivery = LatencyHistogram()
+        self.event_lag = LatencyHistogram()
+    
+    @property
+    def stopped(self):
+        """Durdurma istendiyse True"""
+        return self._stop.is_set()
+    
+    @property
+    def lag(self):
+        """Alınmış ama henüz tüketilmemiş sonuç sayısı"""
+        return self.received - self.consumed
+    
+    def start(self):
+        """Her kaynak için okuma iş parçacığını başlat"""
+        REGISTRY.counter('baccarat_ingest_results_total', "Akıştan alınan sonuç sayısı",
+                         function=lambda: self.received)
+        REGISTRY.counter('baccarat_ingest_errors_total', "Akışta çözülemeyen kayıt sayısı",
+                         function=lambda: self.errors)
+        REGISTRY.gauge('baccarat_ingest_queue_depth', "Alınmış ama tüketilmemiş sonuç sayısı",
+                       function=lambda: self.lag)
+        for source in self.sources:
+            thread = threading.Thread(target=source.run, args=(self,),
+                                      name=f"ingest-{source.name}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+    
+    def stop(self, timeout=1.0):
+        """
+        Kaynakları durdur
+        
+        Standart girdi gibi engelleyen okumalar daemon iş parçacığında kalır
+        ve süreç çıkarken sonlanır.
+        
+        Args:
+            timeout (float): Kaynak başına bekleme süresi (saniye)
+        """
+        self._stop.set()
+        for source in self.sources:
+            source.close()
+        for thread in self._threads:
+            thread.join(timeout)
+    
+    def is_finished(self):
+        """
+        Tüm kaynaklar bitti ve kuyruk boşsa True (ör. standart girdi kapandı)
+        
+        Returns:
+            bool: Okunacak kayıt kalmadıysa True
+        """
+        return (bool(self._threads) and not any(thread.is_alive() for thread in self._threads)
+                and self._queue.empty())
+    
+    def sleep(self, seconds):
+        """Durdurma istenene kadar en fazla verilen süre bekle (kaynaklar için)"""
+        self._stop.wait(seconds)
+    
+    def feed(self, source, line):
+        """
+        Kaynaktan okunan satırı çöz ve kuyruğa ekle (kaynak iş parçacığında çağrılır)
+        
+        Args:
+            source (Source): Satırın geldiği kaynak
+            line (bytes|str): Kayıt satırı
+        """
+        source.lines += 1
+        if isinstance(line, bytes):
+            line = line.decode('utf-8', errors='replace')
+        try:
+            record = parse_record(line)
+        except IngestError as e:
+            self.reject(source, str(e))
+            return
+        if record is None:
+            return
+            
+        record.source = source.name
+        record.received_ns = time.monotonic_ns()
+        while not self._stop.is_set():
+            try:
+                self._queue.put(record, timeout=POLL_INTERVAL)
+            except queue.Full:
+                continue
+            with self._lock:
+                self.received += len(record.results)
+            return
+    
+    def reject(self, source, message):
+        """Hatalı kaydı say"""
+        with self._lock:
+            self.errors += 1
+            self.last_error = f"{source.name}: {message}"
+    
+    def poll(self, max_records=BATCH_SIZE):
+        """
+        Biriken kayıtları beklemeden al
+        
+        Args:
+            max_records (int): En fazla kayıt sayısı
+            
+        Returns:
+            list: Record listesi (geliş sırasıyla)
+        """
+        batch = []
+        try:
+            while len(batch) < max_records:
+                batch.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        if batch:
+            self._consumed(batch)
+        return batch
+    
+    def wait(self, timeout=None, max_records=BATCH_SIZE):
+        """
+        En az bir kayıt gelene kadar bekle ve biriken kayıtları al
+        
+        Args:
+            timeout (float, optional): En uzun bekleme (saniye)
+            max_records (int): En fazla kayıt sayısı
+            
+        Returns:
+            list: Record listesi (süre dolduysa boş)
+        """
+        try:
+            first = self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return []
+        self._consumed([first])
+        return [first] + self.poll(max_records - 1)
+    
+    def _consumed(self, batch):
+        """Tüketilen kayıtların gecikmelerini kaydet"""
+        now_ns = time.monotonic_ns()
+        wall = time.time()
+        count = 0
+        for record in batch:
+            count += len(record.results)
+            self.delivery.record(max(0, now_ns - record.received_ns))
+            if record.event_time is not None:
+                self.event_lag.record(max(0, int((wall - record.event_time) * 1e9)))
+        with self._lock:
+            self.consumed += count
+    
+    def oldest_age_ms(self):
+        """
+        Kuyruktaki en eski kaydın bekleme süresi
+        
+        Returns:
+            float: Süre (milisaniye), kuyruk boşsa 0
+        """
+        with self._queue.mutex:
+            head = self._queue.queue[0] if self._queue.queue else None
+        if head is None:
+            return 0.0
+        return (time.monotonic_ns() - head.received_ns) / 1e6
+    
+    def metrics(self):
+        """
+        Alım ve tüketici gecikmesi metriklerini döndür
+        
+        Returns:
+            dict: Sayaçlar, gecikme özetleri ve kaynak başına metrikler
+        """
+        return {
+            'received': self.received,
+            'consumed': self.consumed,
+            'lag': self.lag,
+            'queued_records': self._queue.qsize(),
+            'oldest_ms': self.oldest_age_ms(),
+            'errors': self.errors,
+            'last_error': self.last_error,
+            'delivery': self.delivery.get_stats(),
+            'event_lag': self.event_lag.get_stats(),
+            'sources': [source.get_stats() for source in self.sources]
+        }
\ No newline at end of file
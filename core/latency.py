@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Logaritmik kovalı gecikme histogramı
+"""
+
+from array import array
+
+# Her ikinin kuvveti aralığı 4 alt kovaya bölünür (~%19 çözünürlük)
+SUB_BUCKET_BITS = 2
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+# 2^40 ns (~18 dakika) üzerindeki süreler son kovaya yazılır
+MAX_EXPONENT = 40
+BUCKET_COUNT = (MAX_EXPONENT + 1) * SUB_BUCKETS
+
+
+class LatencyHistogram:
+    """Nanosaniye cinsinden süreleri sabit boyutlu log-kovalarda tutan histogram"""
+    
+    def __init__(self):
+        """Inicializasyon"""
+        self.buckets = array('Q', bytes(8 * BUCKET_COUNT))
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+    
+    def record(self, duration_ns):
+        """
+        Bir süre ölçümünü histograma ekle
+        
+        Args:
+            duration_ns (int): Süre (nanosaniye)
+        """
+        self.buckets[_bucket_index(duration_ns)] += 1
+        self.count += 1
+        self.total_ns += duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+    
+    def percentile(self, percent):
+        """
+        Yüzdelik değeri kova üst sınırı olarak tahmin et
+        
+        Args:
+            percent (float): Yüzdelik (0-100)
+            
+        Returns:
+            int: Süre (nanosaniye), ölçüm yoksa 0
+        """
+        if self.count == 0:
+            return 0
+            
+        target = max(1, int(self.count * percent / 100.0 + 0.5))
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= target:
+                return min(_bucket_upper_bound(index), self.max_ns)
+        return self.max_ns
+    
+    def get_stats(self):
+        """
+        Histogram özetini döndür
+        
+        Returns:
+            dict: Çağrı sayısı, ortalama ve p50/p95/p99 (mikrosaniye)
+        """
+        mean_us = (self.total_ns / self.count / 1000.0) if self.count else 0.0
+        return {
+            'count': self.count,
+            'mean_us': mean_us,
+            'p50_us': self.percentile(50) / 1000.0,
+            'p95_us': self.percentile(95) / 1000.0,
+            'p99_us': self.percentile(99) / 1000.0,
+            'max_us': self.max_ns / 1000.0
+        }
+    
+    def reset(self):
+        """Histogramı sıfırla"""
+        for i in range(BUCKET_COUNT):
+            self.buckets[i] = 0
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+
+def _bucket_index(duration_ns):
+    """Süreye karşılık gelen kova indeksini hesapla"""
+    if duration_ns < SUB_BUCKETS:
+        return max(0, duration_ns)
+        
+    exponent = duration_ns.bit_length() - 1
+    if exponent > MAX_EXPONENT:
+        return BUCKET_COUNT - 1
+        
+    # Üst bitin altındaki iki bit alt kovayı belirler
+    sub_bucket = (duration_ns >> (exponent - SUB_BUCKET_BITS)) & (SUB_BUCKETS - 1)
+    return exponent * SUB_BUCKETS + sub_bucket
+
+
+def _bucket_upper_bound(index):
+    """Kovanın kapsadığı en büyük süreyi hesapla"""
+    exponent, sub_bucket = divmod(index, SUB_BUCKETS)
+    if exponent < SUB_BUCKET_BITS:
+        return index
+        
+    step = 1 << (exponent - SUB_BUCKET_BITS)
+    return (1 << exponent) + (sub_bucket + 1) * step - 1
\ No newline at end of file
@@ -0,0 +1,483 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Sayaç, gösterge ve histogram kaydı ile Prometheus metin biçiminde dışa aktarım
+
+Ölçümler süreç genelindeki REGISTRY kaydında tutulur. Sıcak yoldaki
+güncellemeler (sayaç artırma, histogram gözlemi) kilitsizdir ve birkaç yüz
+nanosaniye sürer; iş parçacıkları arasında nadiren bir artış kaybolabilir,
+izleme amaçlı ölçümler için bu kabul edilir. Kuyruk derinliği gibi değerler
+güncelleme gerektirmeyen fonksiyonlu göstergelerle yalnızca okunurken
+hesaplanır.
+
+Dışa aktarım:
+    MetricsExporter(REGISTRY, port=9464).start()          # http://127.0.0.1:9464/metrics
+    MetricsExporter(REGISTRY, path='metrics.prom').start()  # dosya periyodik olarak yenilenir
+"""
+
+import os
+import sys
+import time
+import threading
+from bisect import bisect_left
+from functools import wraps
+
+COUNTER = 'counter'
+GAUGE = 'gauge'
+HISTOGRAM = 'histogram'
+
+# Varsayılan süre kovaları (saniye): 50 µs - 5 sn
+DEFAULT_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+                   0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_INTERVAL = 15.0  # Dosya dışa aktarımında yenileme aralığı (saniye)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class Counter:
+    """Yalnızca artan sayaç"""
+    
+    __slots__ = ('value',)
+    
+    def __init__(self):
+        self.value = 0
+    
+    def inc(self, amount=1):
+        """Sayacı artır"""
+        self.value += amount
+
+
+class Gauge:
+    """Artıp azalabilen gösterge"""
+    
+    __slots__ = ('value',)
+    
+    def __init__(self):
+        self.value = 0
+    
+    def set(self, value):
+        """Değeri ayarla"""
+        self.value = value
+    
+    def inc(self, amount=1):
+        """Değeri artır"""
+        self.value += amount
+    
+    def dec(self, amount=1):
+        """Değeri azalt"""
+        self.value -= amount
+
+
+class Histogram:
+    """
+    Sabit kovalı histogram
+    
+    Süreler nanosaniye olarak gözlemlenir (observe_ns), böylece sıcak yolda
+    kayan nokta dönüşümü yapılmaz; dışa aktarımda saniyeye çevrilir.
+    """
+    
+    __slots__ = ('bounds', '_bounds_ns', 'counts', 'sum_ns', 'count')
+    
+    def __init__(self, bounds=DEFAULT_BUCKETS):
+        """
+        Inicializasyon
+        
+        Args:
+            bounds (tuple): Artan sırada kova üst sınırları (saniye)
+        """
+        self.bounds = tuple(bounds)
+        self._bounds_ns = [int(bound * 1e9) for bound in self.bounds]
+        self.counts = [0] * (len(self.bounds) + 1)  # Son kova: +Inf
+        self.sum_ns = 0
+        self.count = 0
+    
+    def observe_ns(self, duration_ns):
+        """
+        Süre gözlemle
+        
+        Args:
+            duration_ns (int): Süre (nanosaniye)
+        """
+        self.counts[bisect_left(self._bounds_ns, duration_ns)] += 1
+        self.sum_ns += duration_ns
+        self.count += 1
+    
+    def observe(self, seconds):
+        """
+        Süre gözlemle
+        
+        Args:
+            seconds (float): Süre (saniye)
+        """
+        self.observe_ns(int(seconds * 1e9))
+
+
+_TYPES = {COUNTER: Counter, GAUGE: Gauge, HISTOGRAM: Histogram}
+
+
+class MetricFamily:
+    """Aynı ada sahip, etiket değerlerine göre ayrılan ölçümler"""
+    
+    def __init__(self, name, help_text, metric_type, labelnames=(), buckets=DEFAULT_BUCKETS,
+                 function=None):
+        """
+        Inicializasyon
+        
+        Args:
+            name (str): Ölçüm adı
+            help_text (str): Açıklama
+            metric_type (str): COUNTER, GAUGE veya HISTOGRAM
+            labelnames (tuple): Etiket adları
+            buckets (tuple): Histogram kova sınırları (saniye)
+            function (callable, optional): Değeri okuma anında hesaplayan fonksiyon
+                (etiketsizse sayı, etiketliyse (etiket değerleri, sayı) çiftleri döndürür)
+        """
+        self.name = name
+        self.help = help_text
+        self.type = metric_type
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self.function = function
+        self._children = {}
+        self._lock = threading.Lock()
+    
+    def labels(self, *values):
+        """
+        Etiket değerlerine ait ölçümü döndür (yoksa oluştur)
+        
+        Sıcak yolda her çağrıda aramak yerine dönen nesne saklanmalıdır.
+        
+        Args:
+            *values: Etiket değerleri (labelnames sırasıyla)
+            
+        Returns:
+            Counter, Gauge veya Histogram: Ölçüm
+        """
+        child = self._children.get(values)
+        if child is not None:
+            return child
+            
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name}: {len(self.labelnames)} etiket değeri bekleniyor")
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = Histogram(self.buckets) if self.type == HISTOGRAM else _TYPES[self.type]()
+                    self._children[key] = child
+        return child
+    
+    def samples(self):
+        """
+        Dışa aktarılacak (etiket değerleri, ölçüm veya sayı) çiftlerini döndür
+        
+        Returns:
+            list: Örnekler
+        """
+        if self.function is None:
+            return list(self._children.items())
+        try:
+            value = self.function()
+        except Exception as e:
+            # Okuma hatası dışa aktarımı durdurmaz
+            sys.stderr.write(f"Ölçüm okunamadı ({self.name}): {e}\n")
+            return []
+        if self.labelnames:
+            return [(tuple(str(label) for label in labels), number) for labels, number in value]
+        return [((), value)]
+
+
+class MetricsRegistry:
+    """Ölçüm ailelerini adlarıyla tutan kayıt"""
+    
+    def __init__(self):
+        self._families = {}
+        self._lock = threading.Lock()
+    
+    def _register(self, name, help_text, metric_type, labelnames, buckets=DEFAULT_BUCKETS,
+                  function=None):
+        """Aileyi döndür (yoksa oluştur); aynı adla farklı tip kaydedilemez"""
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = MetricFamily(name, help_text, metric_type, labelnames, buckets, function)
+                self._families[name] = family
+            elif family.type != metric_type or family.labelnames != tuple(labelnames):
+                raise ValueError(f"Ölçüm farklı tip veya etiketlerle kayıtlı: {name}")
+            elif function is not None:
+                # Fonksiyonlu ölçüm yeniden kaydedilirse son kaynak okunur (ör. yeni pencere)
+                family.function = function
+            return family
+    
+    def counter(self, name, help_text, labelnames=(), function=None):
+        """
+        Sayaç ailesi kaydet
+        
+        Args:
+            name (str): Ölçüm adı ('_total' ile bitmesi önerilir)
+            help_text (str): Açıklama
+            labelnames (tuple): Etiket adları
+            function (callable, optional): Değeri okuma anında döndüren fonksiyon
+            
+        Returns:
+            MetricFamily: Aile (labels() ile ölçüm alınır)
+        """
+        return self._register(name, help_text, COUNTER, labelnames, function=function)
+    
+    def gauge(self, name, help_text, labelnames=(), function=None):
+        """
+        Gösterge ailesi kaydet
+        
+        Args:
+            name (str): Ölçüm adı
+            help_text (str): Açıklama
+            labelnames (tuple): Etiket adları
+            function (callable, optional): Değeri okuma anında döndüren fonksiyon
+            
+        Returns:
+            MetricFamily: Aile
+        """
+        return self._register(name, help_text, GAUGE, labelnames, function=function)
+    
+    def histogram(self, name, help_text, labelnames=(), buckets=DEFAULT_BUCKETS):
+        """
+        Süre histogramı ailesi kaydet
+        
+        Args:
+            name (str): Ölçüm adı ('_seconds' ile bitmesi önerilir)
+            help_text (str): Açıklama
+            labelnames (tuple): Etiket adları
+            buckets (tuple): Kova üst sınırları (saniye)
+            
+        Returns:
+            MetricFamily: Aile
+        """
+        return self._register(name, help_text, HISTOGRAM, labelnames, buckets)
+    
+    def unregister(self, name):
+        """Aileyi kayıttan çıkar"""
+        with self._lock:
+            self._families.pop(name, None)
+    
+    def render(self):
+        """
+        Tüm ölçümleri Prometheus metin biçiminde döndür
+        
+        Returns:
+            str: Dışa aktarım metni
+        """
+        with self._lock:
+            families = sorted(self._families.values(), key=lambda family: family.name)
+            
+        lines = []
+        for family in families:
+            samples = family.samples()
+            if not samples and family.labelnames:
+                continue
+            lines.append(f"# HELP {family.name} {_escape_help(family.help)}")
+            lines.append(f"# TYPE {family.name} {family.type}")
+            for labels, metric in sorted(samples, key=lambda sample: sample[0]):
+                pairs = list(zip(family.labelnames, labels))
+                if family.type == HISTOGRAM and not isinstance(metric, (int, float)):
+                    lines.extend(_render_histogram(family.name, pairs, metric))
+                else:
+                    value = metric if isinstance(metric, (int, float)) else metric.value
+                    lines.append(f"{family.name}{_format_labels(pairs)} {_format_value(value)}")
+        lines.append('')
+        return '\n'.join(lines)
+
+
+def _render_histogram(name, pairs, histogram):
+    """Histogramın kümülatif kova, toplam ve sayı satırları"""
+    lines = []
+    counts = list(histogram.counts)  # Okuma sırasında gelen gözlemlerden etkilenmemek için kopya
+    cumulative = 0
+    for bound, count in zip(histogram.bounds, counts):
+        cumulative += count
+        lines.append(f"{name}_bucket{_format_labels(pairs + [('le', _format_value(bound))])} {cumulative}")
+    cumulative += counts[-1]
+    lines.append(f"{name}_bucket{_format_labels(pairs + [('le', '+Inf')])} {cumulative}")
+    lines.append(f"{name}_sum{_format_labels(pairs)} {_format_value(histogram.sum_ns / 1e9)}")
+    lines.append(f"{name}_count{_format_labels(pairs)} {cumulative}")
+    return lines
+
+
+def _format_labels(pairs):
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape_label(value)}"' for name, value in pairs) + '}'
+
+
+def _format_value(value):
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if isinstance(value, int):
+        return str(value)
+    if value != value:
+        return 'NaN'
+    if value in (float('inf'), float('-inf')):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(float(value))
+
+
+def _escape_label(value):
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _escape_help(value):
+    return value.replace('\\', '\\\\').replace('\n', '\\n')
+
+
+def timed(histogram, errors=None):
+    """
+    Fonksiyonun süresini histograma yazan dekoratör
+    
+    Args:
+        histogram (Histogram): Süre histogramı
+        errors (Counter, optional): Hata fırlatan çağrıların sayacı
+        
+    Returns:
+        callable: Dekoratör
+    """
+    def decorator(function):
+        clock = time.perf_counter_ns
+        observe = histogram.observe_ns
+        
+        @wraps(function)
+        def measured(*args, **kwargs):
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            except Exception:
+                if errors is not None:
+                    errors.inc()
+                raise
+            finally:
+                observe(clock() - start)
+        return measured
+    return decorator
+
+
+def _handler_class(registry):
+    """
+    /metrics isteğine kayıt içeriğiyle yanıt veren işleyici sınıfını oluştur
+    
+    http.server (~100 ms) yalnızca HTTP dışa aktarımı açıldığında yüklenir;
+    ölçüm kaydını kullanan her modül (ör. komut satırı) bunu ödemez.
+    
+    Args:
+        registry (MetricsRegistry): Sunulacak kayıt
+        
+    Returns:
+        type: BaseHTTPRequestHandler alt sınıfı
+    """
+    from http.server import BaseHTTPRequestHandler
+    
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?', 1)[0] not in ('/', '/metrics'):
+                self.send_error(404)
+                return
+            body = registry.render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, format, *args):
+            # Her kazıma isteği standart hataya yazılmaz
+            pass
+            
+    return MetricsHandler
+
+
+class MetricsExporter:
+    """
+    Kaydı yerel HTTP uç noktasından ve/veya periyodik olarak yenilenen
+    dosyadan sunan dışa aktarıcı
+    
+    Her ikisi de ayrı arka plan iş parçacıklarında çalışır.
+    """
+    
+    def __init__(self, registry, port=None, path=None, host=DEFAULT_HOST, interval=DEFAULT_INTERVAL):
+        """
+        Inicializasyon
+        
+        Args:
+            registry (MetricsRegistry): Dışa aktarılacak kayıt
+            port (int, optional): HTTP portu (0: boş bir port seçilir)
+            path (str, optional): Periyodik olarak yazılacak dosya
+            host (str): HTTP adresi
+            interval (float): Dosya yenileme aralığı (saniye)
+        """
+        self.registry = registry
+        self.port = port
+        self.path = path
+        self.host = host
+        self.interval = interval
+        self.server = None
+        self._stop = threading.Event()
+        self._threads = []
+    
+    @property
+    def address(self):
+        """HTTP uç noktasının adresi (HTTP kapalıysa None)"""
+        if self.server is None:
+            return None
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+    
+    def start(self):
+        """HTTP sunucusunu ve dosya yazıcısını başlat"""
+        if self.port is not None:
+            from http.server import ThreadingHTTPServer
+            self.server = ThreadingHTTPServer((self.host, self.port), _handler_class(self.registry))
+            self.server.daemon_threads = True
+            self._startThread(self.server.serve_forever, 'ölçüm-http')
+        if self.path is not None:
+            self.write()
+            self._startThread(self._writeLoop, 'ölçüm-dosya')
+    
+    def _startThread(self, target, name):
+        thread = threading.Thread(target=target, name=name, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+    
+    def write(self):
+        """Dosyayı yeniden yaz (yarım dosya okunmaması için önce geçici dosyaya)"""
+        temporary = f"{self.path}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as f:
+            f.write(self.registry.render())
+        os.replace(temporary, self.path)
+    
+    def _writeLoop(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.write()
+            except OSError as e:
+                sys.stderr.write(f"Ölçüm dosyası yazılamadı: {e}\n")
+    
+    def stop(self):
+        """Dışa aktarımı durdur (dosya son değerlerle bir kez daha yazılır)"""
+        self._stop.set()
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+        for thread in self._threads:
+            thread.join(timeout=1.0)
+        self._threads = []
+        if self.path is not None:
+            try:
+                self.write()
+            except OSError:
+                pass
+
+
+# Süreç genelindeki kayıt
+REGISTRY = MetricsRegistry()
\ No newline at end of file
@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+İsteğe bağlı çalışma profili (cProfile ve tracemalloc)
+
+Açıldığında model tahminleri, matris analizi, geçmiş kayıt işlemleri ve Qt
+güncelleme işleyicileri sınıf düzeyinde sarmalanır. Her sarmalanan çağrının
+süresi histogramda tutulur; her N çağrıdan biri cProfile ile örneklenir.
+Bellek modu açıksa tracemalloc çalıştırılır ve raporda en çok bellek ayıran
+satırlar ile çalışma boyunca en çok büyüyen ayırımlar listelenir.
+
+Kapalıyken hiçbir metod sarmalanmaz ve bu modül yüklenmez; main.py yalnızca
+--profile verildiğinde veya BACCARAT_PROFILE ortam değişkeni ayarlıyken
+kullanır.
+
+Örnekler:
+    python main.py --profile cpu
+    BACCARAT_PROFILE=all BACCARAT_PROFILE_EVERY=1 python main.py
+"""
+
+import io
+import os
+import json
+import time
+import inspect
+import pstats
+import cProfile
+import importlib
+import threading
+import tracemalloc
+from datetime import datetime
+
+from core.latency import LatencyHistogram
+
+PROFILE_ENV = 'BACCARAT_PROFILE'
+PROFILE_EVERY_ENV = 'BACCARAT_PROFILE_EVERY'
+
+CPU = 'cpu'
+MEMORY = 'memory'
+ALL = 'all'
+MODES = (CPU, MEMORY, ALL)
+
+DEFAULT_SAMPLE_EVERY = 5  # Her etikette bu kadar çağrıdan biri cProfile ile örneklenir
+TRACE_FRAMES = 8          # tracemalloc'un ayırım başına sakladığı çerçeve sayısı
+TOP_FUNCTIONS = 30
+TOP_ALLOCATIONS = 25
+
+# Sarmalanan çağrılar: (grup, 'modül:Sınıf', metodlar)
+DEFAULT_TARGETS = [
+    ('model', 'models.base_model:BaseModel', ['add_result']),
+    ('model', 'models.pattern_ai:PatternAI', ['predict']),
+    ('model', 'models.deep_baccarat:DeepBaccarat', ['predict']),
+    ('model', 'models.markov_chain:MarkovChain', ['predict', 'observe']),
+    ('model', 'models.shoe_model:ShoeModel', ['predict']),
+    ('model', 'models.online_logistic:OnlineLogistic', ['predict', 'observe']),
+    ('model', 'models.ensemble:Ensemble', ['predict', 'add_result', 'observe']),
+    ('analiz', 'core.game:MatrixAnalyzer', ['matrix_from_history', 'extract_patterns',
+                                            'count_sequences']),
+    ('analiz', 'core.game:GameAnalyzer', ['analyze_trends']),
+    ('kayıt', 'core.history:History', ['save_session', 'load_session', 'export_to_csv']),
+    ('kayıt', 'core.snapshot:Snapshot', ['save', 'load']),
+]
+
+UI_TARGETS = [
+    ('arayüz', 'ui.main_window:MainWindow', ['flushPending', 'applyCells', 'onPredictionsReady',
+                                             'onGameStatsChanged', 'requestPrediction',
+                                             'updateRoads', 'pollIngest', 'saveSnapshot']),
+    ('arayüz', 'ui.matrix_widget:MatrixWidget', ['paintEvent']),
+    ('arayüz', 'ui.chart_widget:AccuracyChart', ['appendSample', 'paintEvent']),
+    ('arayüz', 'ui.roads_widget:RoadsWidget', ['refresh', 'paintEvent']),
+    ('arayüz', 'ui.stats_widget:ModelStatsWidget', ['updateModel']),
+    ('arayüz', 'ui.stats_widget:GameStatsWidget', ['updateStats']),
+    ('arayüz', 'ui.stats_widget:HistoryView', ['paintEvent']),
+    ('arayüz', 'ui.dashboard:DashboardWindow', ['pollIngest', 'onPredictionReady', 'refreshTiles']),
+    ('arayüz', 'ui.dashboard:TableTile', ['paintEvent']),
+]
+
+
+def mode_from_env(environ=None):
+    """
+    Ortam değişkeninden profil modunu oku
+    
+    Args:
+        environ (dict, optional): Ortam değişkenleri (varsayılan: os.environ)
+        
+    Returns:
+        str: 'cpu', 'memory', 'all' veya kapalıysa None
+        
+    Raises:
+        ValueError: Değer tanınmıyorsa
+    """
+    environ = os.environ if environ is None else environ
+    value = environ.get(PROFILE_ENV, '').strip().lower()
+    if value in ('', '0', 'false', 'no', 'off'):
+        return None
+    if value in ('1', 'true', 'yes', 'on'):
+        return ALL
+    if value not in MODES:
+        raise ValueError(f"{PROFILE_ENV} değeri geçersiz: {value} (seçenekler: {', '.join(MODES)})")
+    return value
+
+
+def sample_every_from_env(environ=None, default=DEFAULT_SAMPLE_EVERY):
+    """Ortam değişkeninden örnekleme aralığını oku"""
+    environ = os.environ if environ is None else environ
+    value = environ.get(PROFILE_EVERY_ENV)
+    if not value:
+        return default
+    try:
+        every = int(value)
+    except ValueError:
+        raise ValueError(f"{PROFILE_EVERY_ENV} bir tam sayı olmalı: {value}")
+    if every < 1:
+        raise ValueError(f"{PROFILE_EVERY_ENV} pozitif olmalı: {value}")
+    return every
+
+
+class _Target:
+    """Sarmalanan tek bir metodun ölçümleri"""
+    
+    __slots__ = ('label', 'timing', 'calls', 'sampled', 'profiles')
+    
+    def __init__(self, label):
+        self.label = label
+        self.timing = LatencyHistogram()
+        self.calls = 0
+        self.sampled = 0
+        self.profiles = {}  # İş parçacığı kimliği -> cProfile.Profile
+
+
+class RunProfiler:
+    """
+    Seçilen metodları sarmalayıp çalışma sonunda rapor yazan profilleyici
+    
+    cProfile aynı anda yalnızca bir çağrıyı örnekler; iç içe sarmalanan
+    çağrılar (ör. model içinden matris analizi) dıştaki örneğin içinde görünür,
+    başka bir iş parçacığındaki çağrı o sırada örneklenmez.
+    """
+    
+    def __init__(self, cpu=True, memory=True, sample_every=DEFAULT_SAMPLE_EVERY):
+        """
+        Inicializasyon
+        
+        Args:
+            cpu (bool): Çağrıları cProfile ile örnekle
+            memory (bool): tracemalloc ile bellek ayırımlarını izle
+            sample_every (int): Etiket başına kaç çağrıdan birinin örnekleneceği
+        """
+        self.cpu = cpu
+        self.memory = memory
+        self.sample_every = max(1, sample_every)
+        self.targets = {}      # Etiket -> _Target
+        self.started = None
+        self._wrapped = []     # (sınıf, metod adı, özgün öznitelik)
+        self._sampling = threading.Lock()
+        self._start_snapshot = None
+    
+    @classmethod
+    def from_mode(cls, mode, sample_every=DEFAULT_SAMPLE_EVERY):
+        """
+        Mod adından profilleyici oluştur
+        
+        Args:
+            mode (str): 'cpu', 'memory' veya 'all'
+            sample_every (int): Örnekleme aralığı
+            
+        Returns:
+            RunProfiler: Profilleyici
+        """
+        if mode not in MODES:
+            raise ValueError(f"Geçersiz profil modu: {mode}")
+        return cls(cpu=mode in (CPU, ALL), memory=mode in (MEMORY, ALL), sample_every=sample_every)
+    
+    def start(self):
+        """Ölçümü başlat (bellek modunda tracemalloc açılır)"""
+        self.started = time.time()
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACE_FRAMES)
+            self._start_snapshot = tracemalloc.take_snapshot()
+    
+    def install(self, targets=DEFAULT_TARGETS):
+        """
+        Hedef listesindeki metodları sarmala
+        
+        Yüklenemeyen modüller ve bulunamayan sınıflar atlanır (ör. PyQt5
+        yokken arayüz hedefleri).
+        
+        Args:
+            targets (list): (grup, 'modül:Sınıf', metodlar) listesi
+            
+        Returns:
+            int: Sarmalanan metod sayısı
+        """
+        count = 0
+        for group, path, names in targets:
+            module_name, _, class_name = path.partition(':')
+            try:
+                owner = getattr(importlib.import_module(module_name), class_name)
+            except (ImportError, AttributeError):
+                continue
+            for name in names:
+                if self.wrap(owner, name, f"{group}:{class_name}.{name}"):
+                    count += 1
+        return count
+    
+    def wrap(self, owner, name, label=None):
+        """
+        Sınıf metodunu sarmala (sınıfın tüm örneklerini etkiler)
+        
+        Sarmalama sınıf düzeyinde yapıldığından pencere oluşturulmadan önce
+        çağrılmalıdır; sinyallere ve olay yoluna bağlanan metodlar bağlanma
+        anındaki fonksiyonu tutar.
+        
+        Args:
+            owner (type): Sınıf
+            name (str): Metod adı
+            label (str, optional): Rapordaki ad
+            
+        Returns:
+            bool: Sarmalandıysa True
+        """
+        if name not in owner.__dict__:
+            # Üst sınıftan gelen metod: bu sınıfa ait değil, atlanır
+            return False
+        original = inspect.getattr_static(owner, name)
+        if isinstance(original, staticmethod):
+            wrapped = staticmethod(self._wrapFunction(original.__func__, label or name))
+        elif isinstance(original, classmethod):
+            wrapped = classmethod(self._wrapFunction(original.__func__, label or name))
+        elif inspect.isfunction(original):
+            wrapped = self._wrapFunction(original, label or name)
+        else:
+            return False
+            
+        setattr(owner, name, wrapped)
+        self._wrapped.append((owner, name, original))
+        return True
+    
+    def uninstall(self):
+        """Sarmalanan metodları özgün hallerine döndür"""
+        for owner, name, original in reversed(self._wrapped):
+            setattr(owner, name, original)
+        self._wrapped = []
+    
+    def _wrapFunction(self, function, label):
+        """Fonksiyonu süre ölçen ve örnekleyen sarmalayıcıyla döndür"""
+        target = self.targets.get(label)
+        if target is None:
+            target = self.targets[label] = _Target(label)
+        record = target.timing.record
+        clock = time.perf_counter_ns
+        sampling = self._sampling
+        every = self.sample_every
+        cpu = self.cpu
+        
+        def profiled(*args, **kwargs):
+            target.calls += 1
+            profile = None
+            if cpu and (target.calls - 1) % every == 0 and sampling.acquire(blocking=False):
+                profile = target.profiles.get(threading.get_ident())
+                if profile is None:
+                    profile = target.profiles[threading.get_ident()] = cProfile.Profile()
+                target.sampled += 1
+                
+            start = clock()
+            try:
+                if profile is None:
+                    return function(*args, **kwargs)
+                return profile.runcall(function, *args, **kwargs)
+            finally:
+                record(clock() - start)
+                if profile is not None:
+                    sampling.release()
+                    
+        profiled.__name__ = function.__name__
+        profiled.__qualname__ = function.__qualname__
+        profiled.__doc__ = function.__doc__
+        profiled.__wrapped__ = function
+        return profiled
+    
+    def get_stats(self):
+        """
+        Etiket başına çağrı ve süre istatistiklerini döndür
+        
+        Returns:
+            list: Toplam süreye göre azalan sırada etiket istatistikleri
+        """
+        stats = []
+        for target in self.targets.values():
+            if not target.calls:
+                continue
+            entry = target.timing.get_stats()
+            entry['label'] = target.label
+            entry['calls'] = target.calls
+            entry['sampled'] = target.sampled
+            entry['total_ms'] = target.timing.total_ns / 1e6
+            stats.append(entry)
+        stats.sort(key=lambda entry: entry['total_ms'], reverse=True)
+        return stats
+    
+    def write_report(self, directory='history', extra=None):
+        """
+        Raporu geçmiş dizinine yaz
+        
+        Metin raporunda etiket süreleri, örneklenen çağrılarda en çok zaman
+        alan fonksiyonlar ve bellek ayırım yerleri bulunur. cProfile verisi
+        ayrıca .prof dosyasına (pstats / snakeviz ile açılabilir) yazılır.
+        
+        Args:
+            directory (str): Rapor dizini
+            extra (dict, optional): Rapora eklenecek bölümler (başlık -> JSON'a uygun liste)
+            
+        Returns:
+            list: Yazılan dosya yolları
+        """
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, f"profil_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        paths = []
+        
+        # Örnekleme sürerken profiller okunmaz
+        with self._sampling:
+            stats = self._collectProfiles()
+            if stats is not None:
+                stats.dump_stats(base + '.prof')
+                paths.append(base + '.prof')
+            text = self._formatReport(stats, extra)
+            
+        with open(base + '.txt', 'w', encoding='utf-8') as f:
+            f.write(text)
+        paths.insert(0, base + '.txt')
+        return paths
+    
+    def _collectProfiles(self):
+        """Tüm örnekleri tek bir pstats.Stats içinde birleştir"""
+        stats = None
+        for target in self.targets.values():
+            for profile in target.profiles.values():
+                profile.create_stats()
+                if not profile.stats:
+                    continue
+                if stats is None:
+                    stats = pstats.Stats(profile, stream=io.StringIO())
+                else:
+                    stats.add(profile)
+        return stats
+    
+    def _formatReport(self, stats, extra):
+        """Metin raporunu oluştur"""
+        out = io.StringIO()
+        elapsed = time.time() - self.started if self.started else 0.0
+        modes = '+'.join(mode for mode, enabled in ((CPU, self.cpu), (MEMORY, self.memory)) if enabled)
+        out.write(f"Profil raporu - {datetime.now().isoformat(timespec='seconds')}\n")
+        out.write(f"Süre: {elapsed:.1f} sn, mod: {modes}, "
+                  f"örnekleme: her {self.sample_every} çağrıdan biri\n\n")
+                  
+        out.write("Sarmalanan çağrılar (süreler ms)\n")
+        out.write(f"{'etiket':<48} {'çağrı':>8} {'örnek':>7} {'ort':>9} {'p50':>9} "
+                  f"{'p95':>9} {'p99':>9} {'en fazla':>9} {'toplam':>10}\n")
+        for entry in self.get_stats():
+            out.write(f"{entry['label']:<48} {entry['calls']:>8} {entry['sampled']:>7} "
+                      f"{entry['mean_us'] / 1000:>9.3f} {entry['p50_us'] / 1000:>9.3f} "
+                      f"{entry['p95_us'] / 1000:>9.3f} {entry['p99_us'] / 1000:>9.3f} "
+                      f"{entry['max_us'] / 1000:>9.3f} {entry['total_ms']:>10.1f}\n")
+                      
+        if stats is not None:
+            out.write(f"\nEn çok zaman alan fonksiyonlar (örneklenen çağrılar, kümülatif, ilk {TOP_FUNCTIONS})\n")
+            stats.stream = out
+            stats.sort_stats('cumulative').print_stats(TOP_FUNCTIONS)
+            out.write(f"\nEn çok iç süre alan fonksiyonlar (ilk {TOP_FUNCTIONS})\n")
+            stats.sort_stats('tottime').print_stats(TOP_FUNCTIONS)
+            
+        if self.memory and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            out.write(f"\nBellek: şu an {current / 1024:.1f} KB, en yüksek {peak / 1024:.1f} KB\n")
+            snapshot = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+                tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+            ))
+            out.write(f"\nEn çok bellek ayıran satırlar (ilk {TOP_ALLOCATIONS})\n")
+            for stat in snapshot.statistics('lineno')[:TOP_ALLOCATIONS]:
+                out.write(f"  {stat}\n")
+            if self._start_snapshot is not None:
+                out.write(f"\nBaşlangıçtan bu yana en çok büyüyen ayırımlar (ilk {TOP_ALLOCATIONS})\n")
+                for stat in snapshot.compare_to(self._start_snapshot, 'lineno')[:TOP_ALLOCATIONS]:
+                    out.write(f"  {stat}\n")
+                top = snapshot.statistics('traceback')[:1]
+                if top:
+                    out.write("\nEn büyük ayırımın çağrı yığını\n")
+                    for line in top[0].traceback.format():
+                        out.write(f"  {line}\n")
+                        
+        for title, entries in (extra or {}).items():
+            out.write(f"\n{title}\n")
+            for entry in entries:
+                out.write(f"  {json.dumps(entry, ensure_ascii=False, default=str)}\n")
+                
+        return out.getvalue()
+    
+    def stop(self):
+        """Sarmalamaları kaldır ve tracemalloc'u kapat"""
+        self.uninstall()
+        if self.memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
\ No newline at end of file
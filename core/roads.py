@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Skor tablosu yolları: Big Road ve türetilmiş yollar (Big Eye Boy, Small Road, Cockroach Pig)
+
+Her yeni el sabit (amortize) sürede işlenir; yollar baştan oluşturulmaz.
+"""
+
+from array import array
+
+# Hücre kodları (0: boş). Big Road'da kırmızı Banker, mavi Player'dır;
+# türetilmiş yollarda kırmızı düzenli, mavi düzensiz anlamına gelir.
+EMPTY = 0
+RED = 1
+BLUE = 2
+
+# Tablo yüksekliği (satır)
+ROAD_ROWS = 6
+
+# Türetilmiş yollar: (ad, karşılaştırılan sütun uzaklığı)
+DERIVED_ROADS = (
+    ('BIG EYE BOY', 1),
+    ('SMALL ROAD', 2),
+    ('COCKROACH PIG', 3)
+)
+
+
+class RoadGrid:
+    """
+    Aynı işaretleri sütun sütun dizen ve tabloya sığmayanları sağa kıvıran
+    (dragon tail) ızgara
+    """
+    
+    def __init__(self, rows=ROAD_ROWS):
+        """
+        Inicializasyon
+        
+        Args:
+            rows (int): Izgara yüksekliği
+        """
+        self.rows = rows
+        self.clear()
+    
+    def clear(self):
+        """Izgarayı boşalt"""
+        self.cells = bytearray()   # Sütun öncelikli hücre kodları
+        self.columns = 0           # Fiziksel sütun sayısı
+        self.column_start = 0      # Mevcut mantıksal sütunun başladığı fiziksel sütun
+        self.x = -1                # Son yerleştirilen hücre
+        self.y = -1
+        self.last = EMPTY          # Son yerleştirilen kod
+        self.turned = False        # Mevcut sütun sağa kıvrıldı mı
+        self.count = 0
+    
+    def get(self, x, y):
+        """
+        Hücre kodunu döndür
+        
+        Args:
+            x (int): Fiziksel sütun
+            y (int): Satır
+            
+        Returns:
+            int: Hücre kodu (EMPTY, RED veya BLUE)
+        """
+        if 0 <= x < self.columns and 0 <= y < self.rows:
+            return self.cells[x * self.rows + y]
+        return EMPTY
+    
+    def column(self, x):
+        """
+        Bir sütunun hücre kodlarını döndür
+        
+        Args:
+            x (int): Fiziksel sütun
+            
+        Returns:
+            bytes: Yukarıdan aşağıya hücre kodları
+        """
+        start = x * self.rows
+        return bytes(self.cells[start:start + self.rows])
+    
+    def is_final(self, x):
+        """
+        Sütunun bir daha değişmeyeceğini döndür
+        
+        Yeni hücreler yalnızca mevcut mantıksal sütunun başladığı fiziksel
+        sütunda veya sağında yer alabilir.
+        """
+        return x < self.column_start
+    
+    def _grow(self, x):
+        """Izgarayı x sütununu içerecek şekilde genişlet"""
+        if x >= self.columns:
+            self.cells.extend(bytes((x + 1 - self.columns) * self.rows))
+            self.columns = x + 1
+    
+    def append(self, code):
+        """
+        Yeni bir işaret yerleştir
+        
+        Args:
+            code (int): RED veya BLUE
+            
+        Returns:
+            tuple: Yerleştirilen hücre (x, y)
+        """
+        if self.count == 0:
+            x, y = 0, 0
+            self.column_start = 0
+            self.turned = False
+        elif code == self.last:
+            x, y = self.x, self.y
+            if not self.turned and y + 1 < self.rows and self.get(x, y + 1) == EMPTY:
+                y += 1
+            else:
+                # Aşağısı dolu veya tablonun sonu: sağa kıvrıl
+                x += 1
+                self.turned = True
+        else:
+            # Yeni mantıksal sütun ilk satırı boş olan sonraki fiziksel sütunda başlar
+            x = self.column_start + 1
+            while self.get(x, 0) != EMPTY:
+                x += 1
+            y = 0
+            self.column_start = x
+            self.turned = False
+            
+        self._grow(x)
+        self.cells[x * self.rows + y] = code
+        self.x, self.y = x, y
+        self.last = code
+        self.count += 1
+        return x, y
+
+
+class BigRoad:
+    """Player/Banker sonuçlarını dizen Big Road (Tie'lar son hücreye işlenir)"""
+    
+    def __init__(self, rows=ROAD_ROWS):
+        """
+        Inicializasyon
+        
+        Args:
+            rows (int): Tablo yüksekliği
+        """
+        self.grid = RoadGrid(rows)
+        self.column_lengths = array('L')  # Mantıksal sütun uzunlukları
+        self.ties = {}                    # (x, y) -> hücredeki Tie sayısı
+        self.pending_ties = 0             # İlk P/B sonucundan önceki Tie'lar
+    
+    def clear(self):
+        """Yolu boşalt"""
+        self.grid.clear()
+        self.column_lengths = array('L')
+        self.ties = {}
+        self.pending_ties = 0
+    
+    def add(self, result):
+        """
+        Sonuç ekle
+        
+        Args:
+            result (str): 'P', 'B' veya 'T'
+            
+        Returns:
+            tuple: P/B sonuçları için (mantıksal sütun, sütundaki sıra), Tie için None
+        """
+        if result == 'T':
+            if self.grid.count == 0:
+                self.pending_ties += 1
+            else:
+                cell = (self.grid.x, self.grid.y)
+                self.ties[cell] = self.ties.get(cell, 0) + 1
+            return None
+            
+        if result not in ('P', 'B'):
+            raise ValueError("Geçersiz sonuç: 'P', 'B' veya 'T' olmalı")
+            
+        code = RED if result == 'B' else BLUE
+        if code == self.grid.last:
+            self.column_lengths[-1] += 1
+        else:
+            self.column_lengths.append(1)
+        cell = self.grid.append(code)
+        
+        if self.pending_ties:
+            self.ties[cell] = self.pending_ties
+            self.pending_ties = 0
+            
+        return len(self.column_lengths) - 1, self.column_lengths[-1] - 1
+
+
+class DerivedRoad:
+    """Big Road sütunlarının düzenini k sütun geriyle karşılaştıran türetilmiş yol"""
+    
+    def __init__(self, name, offset, rows=ROAD_ROWS):
+        """
+        Inicializasyon
+        
+        Args:
+            name (str): Yol adı
+            offset (int): Karşılaştırılan sütun uzaklığı (1, 2 veya 3)
+            rows (int): Tablo yüksekliği
+        """
+        self.name = name
+        self.offset = offset
+        self.grid = RoadGrid(rows)
+    
+    def clear(self):
+        """Yolu boşalt"""
+        self.grid.clear()
+    
+    def observe(self, column_lengths, column, row):
+        """
+        Big Road'a eklenen hücre için işaret üret
+        
+        Args:
+            column_lengths (array): Big Road mantıksal sütun uzunlukları
+            column (int): Eklenen hücrenin mantıksal sütunu
+            row (int): Eklenen hücrenin sütundaki sırası
+            
+        Returns:
+            int: Eklenen işaret (RED veya BLUE), yol henüz başlamadıysa None
+        """
+        k = self.offset
+        if row == 0:
+            # Yeni sütun: önceki iki karşılaştırılan sütunun boyu eşitse düzenli
+            if column < k + 1:
+                return None
+            code = RED if column_lengths[column - 1] == column_lengths[column - 1 - k] else BLUE
+        else:
+            if column < k:
+                return None
+            # k sütun gerideki sütunda aynı satırın hemen altı ilk boşluksa düzensiz
+            code = BLUE if column_lengths[column - k] == row else RED
+            
+        self.grid.append(code)
+        return code
+
+
+class Roads:
+    """Big Road ve üç türetilmiş yolu birlikte güncelleyen motor"""
+    
+    def __init__(self, rows=ROAD_ROWS):
+        """
+        Inicializasyon
+        
+        Args:
+            rows (int): Tablo yüksekliği
+        """
+        self.big_road = BigRoad(rows)
+        self.derived = [DerivedRoad(name, offset, rows) for name, offset in DERIVED_ROADS]
+        self.processed = 0    # İşlenen sonuç sayısı
+        self.generation = 0   # Yollar baştan oluşturulduğunda artar
+    
+    def add_result(self, result):
+        """
+        Yeni bir el sonucunu tüm yollara işle
+        
+        Args:
+            result (str): 'P', 'B' veya 'T'
+        """
+        placed = self.big_road.add(result)
+        self.processed += 1
+        if placed is None:
+            return
+            
+        column, row = placed
+        column_lengths = self.big_road.column_lengths
+        for road in self.derived:
+            road.observe(column_lengths, column, row)
+    
+    def extend(self, results):
+        """
+        Birden fazla sonucu sırayla işle
+        
+        Args:
+            results (iterable): 'P', 'B' veya 'T' sonuçları
+        """
+        for result in results:
+            self.add_result(result)
+    
+    def sync(self, history):
+        """
+        Yolları verilen geçmişle eşitle
+        
+        Geçmişin yalnızca sonuna ekleme yapılarak büyüdüğü varsayılır; işlenen
+        sonuç sayısından sonraki sonuçlar eklenir. Geçmiş değiştirildiğinde
+        (geri yükleme, sıfırlama) önce reset() çağrılmalıdır. Geçmiş
+        kısaldıysa yollar baştan oluşturulur.
+        
+        Args:
+            history (list): Oyun sonuçları geçmişi (ör. Game.history)
+            
+        Returns:
+            bool: Yollar baştan oluşturulduysa True
+        """
+        if len(history) < self.processed:
+            self.reset()
+            self.extend(history)
+            return True
+            
+        if len(history) > self.processed:
+            self.extend(history[self.processed:])
+        return False
+    
+    def reset(self):
+        """Tüm yolları boşalt"""
+        self.big_road.clear()
+        for road in self.derived:
+            road.clear()
+        self.processed = 0
+        self.generation += 1
+    
+    def get_roads(self):
+        """
+        Çizim için yol ızgaralarını döndür
+        
+        Returns:
+            list: (yol adı, RoadGrid) listesi (Big Road ilk sırada)
+        """
+        return [('BIG ROAD', self.big_road.grid)] + [(road.name, road.grid) for road in self.derived]
\ No newline at end of file
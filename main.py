@@ -1,15 +1,178 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-import sys
-from PyQt5.QtWidgets import QApplication
-from ui.main_window import MainWindow
-
-def main():
-    app = QApplication(sys.argv)
-    window = MainWindow()
-    window.show()
-    sys.exit(app.exec_())
-
-if __name__ == "__main__":
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import argparse
+
+from core.startup import StartupProfiler
+from core.metrics import DEFAULT_INTERVAL
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Baccarat Tahmin Uygulaması")
+    parser.add_argument('--profile-startup', action='store_true',
+                        help="açılış aşamalarının sürelerini yaz")
+    parser.add_argument('--startup-budget', type=float, metavar='MS',
+                        help="ilk çizime kadar geçen süre bu bütçeyi aşarsa 1 ile çık "
+                             "(ilk çizimden sonra uygulama kapanır)")
+    parser.add_argument('--tables', type=int, metavar='N',
+                        help="N masayı aynı anda izleyen pano modunda başlat")
+    parser.add_argument('--workers', type=int, default=None, metavar='N',
+                        help="pano modunda tahminleri çalıştıran iş parçacığı sayısı")
+    parser.add_argument('--ingest', action='append', metavar='KAYNAK',
+                        help="sonuçları akıştan oku: '-' (standart girdi), dosya yolu, "
+                             "tcp:[HOST:]PORT veya unix:YOL (birden fazla verilebilir)")
+    parser.add_argument('--ingest-from-start', action='store_true',
+                        help="izlenen dosyalardaki mevcut satırları da oku")
+    parser.add_argument('--profile', choices=('cpu', 'memory', 'all'), default=None,
+                        help="model, analiz, kayıt ve arayüz çağrılarını profille; rapor "
+                             "kapanışta geçmiş dizinine yazılır (ortam: BACCARAT_PROFILE)")
+    parser.add_argument('--profile-every', type=int, default=None, metavar='N',
+                        help="her N çağrıdan birini cProfile ile örnekle "
+                             "(varsayılan: 5, ortam: BACCARAT_PROFILE_EVERY)")
+    parser.add_argument('--metrics-port', type=int, metavar='PORT',
+                        help="ölçümleri Prometheus biçiminde http://127.0.0.1:PORT/metrics "
+                             "adresinden sun")
+    parser.add_argument('--metrics-file', metavar='DOSYA',
+                        help="ölçümleri Prometheus biçiminde bu dosyaya periyodik olarak yaz")
+    parser.add_argument('--metrics-interval', type=float, default=DEFAULT_INTERVAL, metavar='SN',
+                        help=f"ölçüm dosyası yenileme aralığı (varsayılan: {DEFAULT_INTERVAL:g} sn)")
+    return parser.parse_known_args(argv)
+
+def main():
+    args, qt_args = parse_args(sys.argv[1:])
+    exporter = createMetricsExporter(args.metrics_port, args.metrics_file, args.metrics_interval)
+    ingestor = None
+    if args.ingest:
+        ingestor = createIngestor(args.ingest, args.ingest_from_start)
+        
+    profiler = StartupProfiler() if args.profile_startup or args.startup_budget is not None else None
+    run_profiler = createRunProfiler(args.profile, args.profile_every)
+    
+    # PyQt5 ve arayüz modülleri ancak gerektiğinde yüklenir
+    from PyQt5.QtWidgets import QApplication
+    if profiler:
+        profiler.mark("PyQt5 yükleme")
+        
+    app = QApplication(sys.argv[:1] + qt_args)
+    if profiler:
+        profiler.mark("QApplication")
+        
+    # Sınıflar pencere oluşturulmadan önce sarmalanır
+    if run_profiler:
+        from core.profiling import UI_TARGETS
+        run_profiler.install(UI_TARGETS)
+        
+    if args.tables:
+        window = createDashboard(args.tables, args.workers, ingestor)
+    else:
+        from ui.main_window import MainWindow
+        if profiler:
+            profiler.mark("arayüz modülleri yükleme")
+            
+        window = MainWindow(profiler=profiler, ingestor=ingestor)
+        
+    if profiler:
+        from ui.startup import FirstPaintWatcher
+        watcher = FirstPaintWatcher(app)
+        watcher.firstPaint.connect(lambda: onFirstPaint(app, profiler, args.startup_budget))
+        
+    window.show()
+    code = app.exec_()
+    if run_profiler:
+        writeProfileReport(run_profiler, window)
+    if exporter:
+        exporter.stop()
+    sys.exit(code)
+
+def createDashboard(table_count, workers=None, ingestor=None):
+    """Pano penceresini oluştur"""
+    from ui.dashboard import DashboardWindow
+    from ui.inference import DEFAULT_POOL_WORKERS
+    
+    names = [f"Masa {number}" for number in range(1, table_count + 1)]
+    return DashboardWindow(names, max_workers=workers or DEFAULT_POOL_WORKERS, ingestor=ingestor)
+
+def createIngestor(specs, from_start=False):
+    """Kaynak tanımlarından sonuç akışı alıcısını oluştur (soketler hemen dinlemeye başlar)"""
+    from core.ingest import Ingestor, SocketSource, IngestError, open_source
+    
+    try:
+        sources = [open_source(spec, from_start) for spec in specs]
+        for source in sources:
+            if isinstance(source, SocketSource):
+                source.listen()
+    except (IngestError, OSError) as e:
+        sys.stderr.write(f"Akış kaynağı açılamadı: {e}\n")
+        sys.exit(2)
+    return Ingestor(sources)
+
+def createMetricsExporter(port=None, path=None, interval=DEFAULT_INTERVAL):
+    """İstendiyse ölçüm dışa aktarımını (HTTP uç noktası ve/veya dosya) başlat"""
+    if port is None and path is None:
+        return None
+        
+    from core.metrics import REGISTRY, MetricsExporter
+    
+    exporter = MetricsExporter(REGISTRY, port=port, path=path, interval=interval)
+    try:
+        exporter.start()
+    except OSError as e:
+        sys.stderr.write(f"Ölçüm dışa aktarımı başlatılamadı: {e}\n")
+        sys.exit(2)
+    if exporter.address:
+        sys.stderr.write(f"Ölçümler: {exporter.address}\n")
+    return exporter
+
+def createRunProfiler(mode=None, sample_every=None):
+    """Komut satırı veya ortam değişkeni istediyse çalışma profilini başlat"""
+    if mode is None and not os.environ.get('BACCARAT_PROFILE'):
+        return None
+        
+    from core.profiling import RunProfiler, mode_from_env, sample_every_from_env
+    try:
+        mode = mode or mode_from_env()
+        sample_every = sample_every or sample_every_from_env()
+    except ValueError as e:
+        sys.stderr.write(f"Profil ayarı geçersiz: {e}\n")
+        sys.exit(2)
+    if mode is None:
+        return None
+        
+    run_profiler = RunProfiler.from_mode(mode, sample_every)
+    run_profiler.start()
+    run_profiler.install()
+    return run_profiler
+
+def writeProfileReport(run_profiler, window, directory='history'):
+    """Çalışma profili raporunu geçmiş dizinine yaz"""
+    extra = {}
+    events = getattr(window, 'events', None)
+    if events is not None:
+        extra["Olay yolu aboneleri"] = events.get_stats()
+        
+    try:
+        paths = run_profiler.write_report(directory, extra)
+    except OSError as e:
+        sys.stderr.write(f"Profil raporu yazılamadı: {e}\n")
+        return
+    sys.stderr.write(f"Profil raporu: {', '.join(paths)}\n")
+
+def onFirstPaint(app, profiler, budget_ms):
+    """İlk çizimde açılış raporunu yaz ve bütçe verildiyse kontrol et"""
+    profiler.mark("ilk çizim")
+    profiler.report()
+    
+    if budget_ms is None:
+        return
+        
+    elapsed = profiler.elapsed_ms("ilk çizim")
+    if elapsed > budget_ms:
+        sys.stderr.write(f"İlk çizim süresi bütçeyi aştı: {elapsed:.1f} ms > {budget_ms:.1f} ms\n")
+        app.exit(1)
+    else:
+        sys.stderr.write(f"İlk çizim süresi bütçe içinde: {elapsed:.1f} ms <= {budget_ms:.1f} ms\n")
+        app.exit(0)
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,92 +1,272 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-"""
-Baccarat tahmin modellerinin temel sınıfı
-"""
-
-from abc import ABC, abstractmethod
-
-class BaseModel(ABC):
-    """Tüm tahmin modellerinin temel sınıfı"""
-    
-    def __init__(self, name="BaseModel"):
-        """
-        Inicializasyon
-        
-        Args:
-            name (str): Model adı
-        """
-        self.name = name
-        self.predictions = []  # Yapılan tahminler
-        self.results = []      # Gerçek sonuçlar
-        self.accuracy = 0.0    # Başarı oranı
-    
-    @abstractmethod
-    def predict(self, matrix, history=None):
-        """
-        Tahmin yap (alt sınıflar tarafından uygulanmalı)
-        
-        Args:
-            matrix (list): 5x5 matris (2D liste)
-            history (list, optional): Oyun sonuçları geçmişi
-            
-        Returns:
-            tuple: (tahmin, güven skoru)
-        """
-        pass
-    
-    def add_result(self, prediction, result):
-        """
-        Tahmin ve sonuç ekle
-        
-        Args:
-            prediction (str): Yapılan tahmin ('P' veya 'B')
-            result (str): Gerçek sonuç ('P', 'B' veya 'T')
-        """
-        self.predictions.append(prediction)
-        self.results.append(result)
-        self._update_accuracy()
-    
-    def _update_accuracy(self):
-        """Başarı oranını güncelle"""
-        if not self.predictions:
-            self.accuracy = 0.0
-            return
-        
-        # Tie sonuçları tahmin doğruluğunu etkilemez (tie olmayan sonuçlara bak)
-        valid_predictions = [i for i, res in enumerate(self.results) if res != 'T']
-        
-        if not valid_predictions:
-            self.accuracy = 0.0
-            return
-        
-        correct = sum(1 for i in valid_predictions if self.predictions[i] == self.results[i])
-        self.accuracy = (correct / len(valid_predictions)) * 100
-    
-    def get_stats(self):
-        """
-        Model istatistiklerini döndür
-        
-        Returns:
-            dict: Model istatistikleri
-        """
-        total = len(self.predictions)
-        tie_count = self.results.count('T')
-        valid_predictions = total - tie_count
-        
-        return {
-            'name': self.name,
-            'total_predictions': total,
-            'valid_predictions': valid_predictions,
-            'accuracy': self.accuracy,
-            'player_predictions': self.predictions.count('P'),
-            'banker_predictions': self.predictions.count('B'),
-            'last_prediction': self.predictions[-1] if self.predictions else None
-        }
-    
-    def reset(self):
-        """Model verilerini sıfırla"""
-        self.predictions = []
-        self.results = []
-        self.accuracy = 0.0
\ No newline at end of file
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Baccarat tahmin modellerinin temel sınıfı
+"""
+
+from abc import ABC, abstractmethod
+import time
+
+from core.latency import LatencyHistogram
+from models.prediction_log import PredictionLog
+
+# Süresi ölçülen model metodları
+INSTRUMENTED_METHODS = ('predict', 'add_result', 'observe')
+
+# Bellekte tutulan son tahmin sayısı (varsayılan)
+DEFAULT_LOG_CAPACITY = 10000
+
+class BaseModel(ABC):
+    """Tüm tahmin modellerinin temel sınıfı"""
+    
+    def __init__(self, name="BaseModel", log_capacity=DEFAULT_LOG_CAPACITY, journal_path=None):
+        """
+        Inicializasyon
+        
+        Args:
+            name (str): Model adı
+            log_capacity (int): Bellekte tutulacak son tahmin sayısı
+            journal_path (str, optional): Bellekten taşan tahminlerin eklendiği dosya
+        """
+        self.name = name
+        self.log = PredictionLog(log_capacity, journal_path)  # Tahmin ve sonuç kaydı
+        self.accuracy = 0.0    # Başarı oranı
+        self._latency = None     # Metod adı -> LatencyHistogram (ölçüm kapalıyken None)
+        self._latency_by_history = None  # Geçmiş boyu kovası -> predict histogramı
+    
+    @abstractmethod
+    def predict(self, matrix, history=None):
+        """
+        Tahmin yap (alt sınıflar tarafından uygulanmalı)
+        
+        Args:
+            matrix (list): 5x5 matris (2D liste)
+            history (list, optional): Oyun sonuçları geçmişi
+            
+        Returns:
+            tuple: (tahmin, güven skoru)
+        """
+        pass
+    
+    def add_result(self, prediction, result):
+        """
+        Tahmin ve sonuç ekle (yalnızca değerlendirme; öğrenme observe() ile yapılır)
+        
+        Args:
+            prediction (str): Yapılan tahmin ('P' veya 'B')
+            result (str): Gerçek sonuç ('P', 'B' veya 'T')
+        """
+        self.log.append(prediction, result)
+        self.accuracy = self.log.accuracy()
+    
+    def observe(self, result, history=None):
+        """
+        Sonucu modele öğret
+        
+        Tahmin yapılmış olsun ya da olmasın her el için sırayla bir kez
+        çağrılır. Geçmişten öğrenmeyen modeller için bir şey yapmaz.
+        
+        Args:
+            result (str): Gerçek sonuç ('P', 'B' veya 'T')
+            history (list, optional): Bu sonuçtan önceki oyun geçmişi (son kısmı yeterlidir)
+        """
+        pass
+    
+    @property
+    def predictions(self):
+        """Bellekteki son tahminler (eskiden yeniye)"""
+        return self.log.recent_predictions()
+    
+    @property
+    def results(self):
+        """Bellekteki son sonuçlar (eskiden yeniye)"""
+        return self.log.recent_results()
+    
+    def configure_log(self, capacity=None, journal_path=None):
+        """
+        Tahmin kaydının kapasitesini ve günlük dosyasını değiştir
+        
+        Bellekteki en yeni kayıtlar ve ömür boyu sayaçlar korunur.
+        
+        Args:
+            capacity (int, optional): Yeni kapasite (varsayılan: mevcut kapasite)
+            journal_path (str, optional): Taşan kayıtların eklendiği dosya
+        """
+        state = self.log.get_state()
+        self.log = PredictionLog(capacity or self.log.capacity, journal_path)
+        self.log.set_state(state)
+    
+    def get_stats(self, window=None):
+        """
+        Model istatistiklerini döndür
+        
+        Args:
+            window (int, optional): Pencere istatistikleri için son tahmin sayısı
+                                    (varsayılan: bellekteki tüm kayıtlar)
+                                    
+        Returns:
+            dict: Model istatistikleri
+        """
+        log = self.log
+        
+        stats = {
+            'name': self.name,
+            'total_predictions': log.total,
+            'valid_predictions': log.valid,
+            'accuracy': self.accuracy,
+            'player_predictions': log.player_predictions,
+            'banker_predictions': log.banker_predictions,
+            'last_prediction': log.last_prediction(),
+            'window': log.window_stats(window)
+        }
+        
+        if self._latency is not None:
+            stats['latency'] = self.get_latency_stats()
+            
+        return stats
+    
+    def enable_instrumentation(self):
+        """
+        predict ve add_result çağrılarının süre ölçümünü aç
+        
+        Ölçüm, metodların örnek (instance) üzerinde sarmalanmasıyla yapılır;
+        kapalıyken sınıf metodları doğrudan çağrılır ve ek maliyet yoktur.
+        """
+        if self._latency is not None:
+            return
+            
+        self._latency = {name: LatencyHistogram() for name in INSTRUMENTED_METHODS}
+        self._latency_by_history = {}
+        
+        for name in INSTRUMENTED_METHODS:
+            setattr(self, name, self._timed(name))
+    
+    def disable_instrumentation(self):
+        """Süre ölçümünü kapat ve toplanan histogramları bırak"""
+        if self._latency is None:
+            return
+            
+        for name in INSTRUMENTED_METHODS:
+            self.__dict__.pop(name, None)
+            
+        self._latency = None
+        self._latency_by_history = None
+    
+    def is_instrumented(self):
+        """
+        Süre ölçümünün açık olup olmadığını döndür
+        
+        Returns:
+            bool: Ölçüm açıksa True
+        """
+        return self._latency is not None
+    
+    def _timed(self, name):
+        """
+        Metodu monotonik saatle süresini ölçen bir sarmalayıcıyla döndür
+        
+        Args:
+            name (str): Metod adı
+            
+        Returns:
+            function: Sarmalanmış metod
+        """
+        method = getattr(type(self), name).__get__(self, type(self))
+        record = self._latency[name].record
+        by_history = self._latency_by_history
+        clock = time.perf_counter_ns
+        
+        if name == 'predict':
+            def timed_predict(matrix, history=None):
+                start = clock()
+                try:
+                    return method(matrix, history)
+                finally:
+                    elapsed = clock() - start
+                    record(elapsed)
+                    
+                    # Geçmiş boyunun ikinin kuvveti kovasına göre de kaydet
+                    size_bucket = len(history).bit_length() if history else 0
+                    histogram = by_history.get(size_bucket)
+                    if histogram is None:
+                        histogram = by_history[size_bucket] = LatencyHistogram()
+                    histogram.record(elapsed)
+            return timed_predict
+        
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                record(clock() - start)
+        return timed
+    
+    def get_latency_stats(self):
+        """
+        Süre ölçümü özetini döndür
+        
+        Returns:
+            dict: Metod başına çağrı sayısı, p50/p95/p99 ve saniyedeki çağrı
+                  kapasitesi; predict için geçmiş boyuna göre dağılım.
+                  Ölçüm kapalıysa None
+        """
+        if self._latency is None:
+            return None
+            
+        stats = {}
+        for name, histogram in self._latency.items():
+            method_stats = histogram.get_stats()
+            method_stats['calls_per_sec'] = (
+                histogram.count / (histogram.total_ns / 1e9) if histogram.total_ns else 0.0
+            )
+            stats[name] = method_stats
+            
+        stats['predict_by_history'] = {
+            _history_range_label(bucket): histogram.get_stats()
+            for bucket, histogram in sorted(self._latency_by_history.items())
+        }
+        return stats
+    
+    def get_state(self):
+        """
+        Modelin iç durumunu anlık görüntü için döndür
+        
+        Alt sınıflar kendi öğrenilmiş durumlarını eklemek için genişletebilir.
+        
+        Returns:
+            dict: Yalnızca temel tiplerden oluşan model durumu
+        """
+        return {
+            'name': self.name,
+            'log': self.log.get_state()
+        }
+    
+    def set_state(self, state):
+        """
+        Anlık görüntüden model durumunu geri yükle
+        
+        Args:
+            state (dict): get_state() ile alınmış model durumu
+            
+        Raises:
+            ValueError: Durum bu modele ait değilse
+        """
+        if state.get('name') != self.name:
+            raise ValueError(f"Model durumu uyumsuz: {state.get('name')} != {self.name}")
+            
+        self.reset()
+        self.log.set_state(state['log'])
+        self.accuracy = self.log.accuracy()
+    
+    def reset(self):
+        """Model verilerini sıfırla"""
+        self.log.clear()
+        self.accuracy = 0.0
+
+
+def _history_range_label(bucket):
+    """Geçmiş boyu kovasının etiketini döndür: 0, 1, 2-3, 4-7, ..."""
+    if bucket <= 1:
+        return str(bucket)
+    return f"{1 << (bucket - 1)}-{(1 << bucket) - 1}"
\ No newline at end of file
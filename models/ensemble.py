@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Birden fazla modelin tahminlerini birleştiren topluluk (ensemble)
+"""
+
+import time
+
+from core.metrics import REGISTRY
+
+# Kayan başarı oranı için varsayılan pencere (son tahmin sayısı)
+ACCURACY_WINDOW = 50
+
+# observe() ile her sonuçla birlikte verilen önceki sonuç sayısı
+# (matris için son 25 P/B sonuç ve trend penceresi yeterlidir)
+CONTEXT_SIZE = 50
+
+# Model başına predict() süresi (tüm modeller tahminlerini topluluk üzerinden yapar)
+PREDICT_SECONDS = REGISTRY.histogram('baccarat_model_predict_seconds',
+                                     "Model predict() çağrılarının süresi", ('model',))
+
+
+class Ensemble:
+    """Modelleri aynı matris ve geçmişle çalıştırıp tahminleri birleştiren sınıf"""
+    
+    def __init__(self, models):
+        """
+        Inicializasyon
+        
+        Args:
+            models (list): BaseModel örnekleri
+        """
+        self.models = list(models)
+        self._last_predictions = None  # Model başına son tahmin
+    
+    def add_result(self, result):
+        """
+        Son tahminleri gerçek sonuçla değerlendir
+        
+        Yalnızca tahminin yapıldığı elin sonucuyla çağrılmalıdır; modellerin
+        öğrenmesi observe() ile yapılır.
+        
+        Args:
+            result (str): Gerçek sonuç ('P', 'B' veya 'T')
+            
+        Returns:
+            bool: Değerlendirilecek tahmin varsa True
+        """
+        if self._last_predictions is None:
+            return False
+            
+        for model, prediction in zip(self.models, self._last_predictions):
+            model.add_result(prediction, result)
+            
+        self._last_predictions = None
+        return True
+    
+    def observe(self, history, start=0, end=None):
+        """
+        Geçmişin start:end aralığındaki sonuçları sırayla tüm modellere öğret
+        
+        Tahmin yapılmamış eller dahil her sonuç bir kez verilmelidir; her
+        sonuç kendisinden önceki son CONTEXT_SIZE sonuçla birlikte verilir.
+        
+        Args:
+            history (list): Oyun sonuçları geçmişi
+            start (int): İlk öğretilecek sonucun sırası
+            end (int, optional): Son sonuçtan sonraki sıra (varsayılan: geçmişin sonu)
+            
+        Returns:
+            int: Öğretilen sonuç sayısı
+        """
+        if end is None:
+            end = len(history)
+            
+        for index in range(start, end):
+            result = history[index]
+            context = history[max(0, index - CONTEXT_SIZE):index]
+            for model in self.models:
+                model.observe(result, context)
+        return max(0, end - start)
+    
+    def predict(self, matrix, history=None):
+        """
+        Tüm modellerle tahmin yap ve sonuçları birleştir
+        
+        Her modelin güven skoru Banker olasılığına çevrilir ve ortalaması
+        alınır.
+        
+        Args:
+            matrix (list): 5x5 matris (2D liste)
+            history (list, optional): Oyun sonuçları geçmişi
+            
+        Returns:
+            dict: Birleşik tahmin, güven skoru, Banker olasılığı ve model
+                  başına (ad, tahmin, güven, başarı oranı) listesi
+        """
+        history = list(history or [])
+        model_results = []
+        predictions = []
+        banker_probability = 0.0
+        
+        clock = time.perf_counter_ns
+        for model in self.models:
+            start = clock()
+            prediction, confidence = model.predict(matrix, history)
+            PREDICT_SECONDS.labels(model.name).observe_ns(clock() - start)
+            predictions.append(prediction)
+            model_results.append((model.name, prediction, confidence, model.accuracy))
+            
+            probability = confidence / 100.0
+            banker_probability += probability if prediction == 'B' else 1.0 - probability
+            
+        if self.models:
+            banker_probability /= len(self.models)
+        else:
+            banker_probability = 0.5
+            
+        self._last_predictions = predictions
+        
+        prediction = 'B' if banker_probability >= 0.5 else 'P'
+        
+        # Güven skorunu hesapla (yüzde olarak)
+        confidence = max(banker_probability, 1.0 - banker_probability) * 100
+        confidence = min(99.9, max(50.0, confidence))  # 50-99.9 arasına sınırla
+        
+        return {
+            'prediction': prediction,
+            'confidence': confidence,
+            'banker_probability': banker_probability,
+            'models': model_results
+        }
+    
+    def get_window_accuracy(self, window=ACCURACY_WINDOW):
+        """
+        Modellerin son tahminler üzerinden kayan başarı oranlarını döndür
+        
+        Args:
+            window (int): Pencere boyu (son tahmin sayısı)
+            
+        Returns:
+            list: Model başına başarı oranı (yüzde)
+        """
+        return [model.log.window_stats(window)['accuracy'] for model in self.models]
+    
+    def reset(self):
+        """Tüm modelleri ve son tahmin bilgisini sıfırla"""
+        for model in self.models:
+            model.reset()
+        self._last_predictions = None
\ No newline at end of file
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Çok dereceli Markov zinciri tabanlı Baccarat tahmin modeli
+"""
+
+from array import array
+
+from models.base_model import BaseModel
+
+# Sonuçların taban-3 kodları
+RESULT_CODES = {'P': 0, 'B': 1, 'T': 2}
+
+
+class MarkovChain(BaseModel):
+    """Son k sonuçtan sonra gelen sonucun koşullu frekanslarıyla tahmin yapan model"""
+    
+    def __init__(self, max_order=5, min_count=8):
+        """
+        Inicializasyon
+        
+        Args:
+            max_order (int): Kullanılacak en uzun bağlam (son k sonuç)
+            min_count (int): Bir bağlamın kullanılması için gereken en az P+B gözlemi
+        """
+        super().__init__(name="MARKOV CHAIN")
+        if max_order < 1:
+            raise ValueError("max_order en az 1 olmalı")
+            
+        self.max_order = max_order
+        self.min_count = min_count
+        
+        # Her derece için taban-3 bağlam sayısı (3^k)
+        self._context_sizes = [3 ** k for k in range(max_order + 1)]
+        self._reset_counts()
+    
+    def _reset_counts(self):
+        """Sayaç dizilerini ve bağlamı sıfırla"""
+        # counts[k][bağlam * 3 + sonuç]: k. dereceden bağlamdan sonra gelen sonuç sayısı
+        # (0. derece bağlamsız genel frekanslardır)
+        self._counts = [array('Q', bytes(8 * size * 3)) for size in self._context_sizes]
+        self._context = 0   # Son max_order sonucun taban-3 kodu (son sonuç en düşük basamakta)
+        self._length = 0    # Bağlamdaki geçerli sonuç sayısı (en fazla max_order)
+    
+    def observe(self, result, history=None):
+        """
+        Yeni bir oyun sonucunu tüm derecelerin sayaçlarına işle
+        
+        Args:
+            result (str): 'P' (Player), 'B' (Banker) veya 'T' (Tie)
+            history (list, optional): Bu sonuçtan önceki geçmiş (model kendi
+                                      bağlamını tuttuğu için kullanılmaz)
+        """
+        code = RESULT_CODES.get(result)
+        if code is None:
+            raise ValueError("Geçersiz sonuç: 'P', 'B' veya 'T' olmalı")
+            
+        counts = self._counts
+        context = self._context
+        sizes = self._context_sizes
+        
+        # Mevcut bağlamın son k basamağı k. dereceden bağlamdır
+        for k in range(self._length + 1):
+            counts[k][(context % sizes[k]) * 3 + code] += 1
+            
+        # Bağlamı kaydır
+        self._context = (context * 3 + code) % sizes[self.max_order]
+        if self._length < self.max_order:
+            self._length += 1
+    
+    def train(self, history):
+        """
+        Bir sonuç dizisini sırayla modele öğret
+        
+        Args:
+            history (list): Oyun sonuçları listesi ('P', 'B', 'T')
+        """
+        for result in history:
+            self.observe(result)
+    
+    def _encode_context(self, history):
+        """
+        Geçmişin son max_order sonucunu taban-3 bağlama çevir
+        
+        Args:
+            history (list): Oyun sonuçları listesi ('P', 'B', 'T')
+            
+        Returns:
+            tuple: (bağlam kodu, bağlamdaki sonuç sayısı)
+        """
+        recent = history[-self.max_order:]
+        context = 0
+        for result in recent:
+            code = RESULT_CODES.get(result)
+            if code is None:
+                raise ValueError("Geçersiz sonuç: 'P', 'B' veya 'T' olmalı")
+            context = context * 3 + code
+        return context, len(recent)
+    
+    def get_probabilities(self, history=None):
+        """
+        Bağlama göre sonraki sonucun olasılıklarını hesapla
+        
+        Yeterli gözlemi olan en uzun bağlam kullanılır, yoksa daha kısa
+        bağlamlara geri çekilinir.
+        
+        Args:
+            history (list, optional): Bağlamın alınacağı oyun geçmişi
+                                      (varsayılan: gözlemlenen son sonuçlar)
+                                      
+        Returns:
+            tuple: (p_olasılığı, b_olasılığı, t_olasılığı, kullanılan_derece)
+                   Hiç gözlem yoksa None
+        """
+        if history is None:
+            context, length = self._context, self._length
+        else:
+            context, length = self._encode_context(history)
+        sizes = self._context_sizes
+        
+        for k in range(length, -1, -1):
+            offset = (context % sizes[k]) * 3
+            row = self._counts[k]
+            p_count = row[offset]
+            b_count = row[offset + 1]
+            
+            if p_count + b_count >= self.min_count or (k == 0 and p_count + b_count > 0):
+                t_count = row[offset + 2]
+                total = p_count + b_count + t_count
+                return p_count / total, b_count / total, t_count / total, k
+                
+        return None
+    
+    def predict(self, matrix, history=None):
+        """
+        Markov zinciri frekanslarıyla tahmin yap
+        
+        Args:
+            matrix (list): 5x5 matris (2D liste)
+            history (list, optional): Oyun sonuçları geçmişi; verilirse bağlam
+                                      son max_order sonucundan alınır
+                                      
+        Returns:
+            tuple: (tahmin, güven skoru)
+        """
+        probabilities = self.get_probabilities(history)
+        
+        if probabilities is None:
+            # Veri yoksa gerçek Baccarat olasılıklarına göre Banker
+            p_score, b_score = 0.4462, 0.4585
+        else:
+            p_score, b_score = probabilities[0], probabilities[1]
+            
+        prediction = 'P' if p_score > b_score else 'B'
+        
+        # Güven skorunu hesapla (P ve B arasında, yüzde olarak)
+        confidence = max(p_score, b_score) / (p_score + b_score) * 100
+        confidence = min(99.9, max(50.0, confidence))  # 50-99.9 arasına sınırla
+        
+        return prediction, confidence
+    
+    def get_stats(self, window=None):
+        """
+        Model istatistiklerini döndür
+        
+        Args:
+            window (int, optional): Pencere istatistikleri için son tahmin sayısı
+            
+        Returns:
+            dict: Model istatistikleri
+        """
+        stats = super().get_stats(window)
+        stats['max_order'] = self.max_order
+        stats['observations'] = sum(self._counts[0])
+        return stats
+    
+    def get_state(self):
+        """
+        Model durumunu sayaç dizileriyle birlikte döndür
+        
+        Returns:
+            dict: Model durumu
+        """
+        state = super().get_state()
+        state['max_order'] = self.max_order
+        state['counts'] = [row.tobytes() for row in self._counts]
+        state['context'] = self._context
+        state['length'] = self._length
+        return state
+    
+    def set_state(self, state):
+        """
+        Model durumunu ve sayaç dizilerini geri yükle
+        
+        Args:
+            state (dict): get_state() ile alınmış model durumu
+        """
+        if state.get('max_order') != self.max_order:
+            raise ValueError("Markov derecesi uyumsuz")
+            
+        super().set_state(state)
+        for row, data in zip(self._counts, state['counts']):
+            row[:] = array('Q', data)
+        self._context = state['context']
+        self._length = state['length']
+    
+    def reset(self):
+        """Model verilerini ve sayaçları sıfırla"""
+        super().reset()
+        self._reset_counts()
\ No newline at end of file
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Akış halinde SGD ile eğitilen lojistik regresyon tahmin modeli
+"""
+
+import numpy as np
+
+from models.base_model import BaseModel
+from core.game import MatrixAnalyzer, GameAnalyzer
+
+# Matris dizi sayıları (MatrixAnalyzer.count_sequences anahtarları)
+SEQUENCE_KEYS = ('P', 'B', 'PP', 'BB', 'PB', 'BP', 'PPP', 'BBB', 'PPB', 'PBB', 'BPP', 'BBP')
+
+# Öznitelik vektörünün yerleşimi
+# [0]       sabit terim (bias)
+# [1:13]    matris dizi sayıları (dolu hücre sayısına bölünmüş)
+# [13]      trend analizi var mı
+# [14:17]   son penceredeki P/B/T dağılımı
+# [17:21]   mevcut ve en uzun P/B dizileri (pencere boyuna bölünmüş)
+# [21]      alternans oranı
+# [22:25]   son sonuç (P/B/T tek-sıcak kodlama)
+N_FEATURES = 25
+
+
+class OnlineLogistic(BaseModel):
+    """Matris ve trend özniteliklerinden Banker olasılığını öğrenen çevrimiçi model"""
+    
+    def __init__(self, learning_rate=0.05, l2=1e-4, window_size=10, weights=None):
+        """
+        Inicializasyon
+        
+        Args:
+            learning_rate (float): SGD öğrenme oranı
+            l2 (float): L2 düzenlileştirme katsayısı
+            window_size (int): Trend analizi pencere boyutu
+            weights (array-like, optional): Sıcak başlangıç için ağırlıklar
+        """
+        super().__init__(name="ONLINE LOGISTIC")
+        self.analyzer = MatrixAnalyzer()
+        self.game_analyzer = GameAnalyzer()
+        
+        self.learning_rate = learning_rate
+        self.l2 = l2
+        self.window_size = window_size
+        self.updates = 0  # Yapılan SGD güncellemesi sayısı
+        
+        # Önceden ayrılmış tamponlar
+        self.weights = np.zeros(N_FEATURES)
+        self._features = np.zeros(N_FEATURES)  # Son tahminin öznitelikleri
+        self._observed = np.zeros(N_FEATURES)  # Öğretilen sonucun öznitelikleri
+        self._gradient = np.zeros(N_FEATURES)
+        self._scratch = np.zeros(N_FEATURES)
+        
+        if weights is not None:
+            self.set_weights(weights)
+    
+    def extract_features(self, matrix, history=None, out=None):
+        """
+        Matris ve geçmişten sabit uzunluklu öznitelik vektörü oluştur
+        
+        Args:
+            matrix (list): 5x5 matris (2D liste)
+            history (list, optional): Oyun sonuçları geçmişi
+            out (numpy.ndarray, optional): Sonucun yazılacağı tampon
+            
+        Returns:
+            numpy.ndarray: N_FEATURES uzunluğunda öznitelik vektörü
+        """
+        if out is None:
+            out = np.zeros(N_FEATURES)
+        else:
+            out.fill(0.0)
+            
+        out[0] = 1.0
+        
+        # Matris dizi sayıları
+        if matrix is not None:
+            sequences = self.analyzer.count_sequences(matrix)
+            filled = max(1, sequences['P'] + sequences['B'])
+            for i, key in enumerate(SEQUENCE_KEYS):
+                out[1 + i] = sequences[key] / filled
+                
+        # Trend analizi
+        trend_analysis = None
+        if history and len(history) >= self.window_size:
+            trend_analysis = self.game_analyzer.analyze_trends(history, self.window_size)
+            
+        if trend_analysis:
+            distribution = trend_analysis['distribution']
+            streaks = trend_analysis['streaks']
+            
+            out[13] = 1.0
+            out[14] = distribution['P']
+            out[15] = distribution['B']
+            out[16] = distribution['T']
+            out[17] = streaks['P'] / self.window_size
+            out[18] = streaks['B'] / self.window_size
+            out[19] = streaks['max_P'] / self.window_size
+            out[20] = streaks['max_B'] / self.window_size
+            out[21] = trend_analysis['alternation_rate']
+            out[22 + 'PBT'.index(trend_analysis['last_result'])] = 1.0
+            
+        return out
+    
+    def predict(self, matrix, history=None):
+        """
+        Öğrenilmiş ağırlıklarla tahmin yap
+        
+        Args:
+            matrix (list): 5x5 matris (2D liste)
+            history (list, optional): Oyun sonuçları geçmişi
+            
+        Returns:
+            tuple: (tahmin, güven skoru)
+        """
+        self.extract_features(matrix, history, out=self._features)
+        
+        banker_probability = _sigmoid(float(self.weights @ self._features))
+        
+        prediction = 'B' if banker_probability >= 0.5 else 'P'
+        
+        # Güven skorunu hesapla (yüzde olarak)
+        confidence = max(banker_probability, 1.0 - banker_probability) * 100
+        confidence = min(99.9, max(50.0, confidence))  # 50-99.9 arasına sınırla
+        
+        return prediction, confidence
+    
+    def observe(self, result, history=None):
+        """
+        Sonuçtan önceki geçmişin öznitelikleriyle bir SGD adımı at
+        
+        Öznitelikler fit() ile aynı şekilde geçmişten oluşturulan matris ve
+        trend analiziyle çıkarılır; tahmin yapılmamış eller de öğrenilir.
+        
+        Args:
+            result (str): Gerçek sonuç ('P', 'B' veya 'T')
+            history (list, optional): Bu sonuçtan önceki oyun geçmişi (son kısmı yeterlidir)
+        """
+        # Tie sonuçları ve trend penceresi dolmadan gelen sonuçlar öğrenmeyi etkilemez
+        if result == 'T' or not history or len(history) < self.window_size:
+            return
+            
+        matrix = self.analyzer.matrix_from_history(history)
+        self.extract_features(matrix, history, out=self._observed)
+        self._sgd_step(self._observed, 1.0 if result == 'B' else 0.0)
+    
+    def _sgd_step(self, features, label):
+        """
+        Tek örnekle ağırlıkları güncelle (ek bellek ayırmadan)
+        
+        Args:
+            features (numpy.ndarray): Öznitelik vektörü
+            label (float): 1.0 (Banker) veya 0.0 (Player)
+        """
+        error = _sigmoid(float(self.weights @ features)) - label
+        
+        # gradyan = hata * x + l2 * w
+        np.multiply(self.weights, self.l2, out=self._gradient)
+        np.multiply(features, error, out=self._scratch)
+        self._gradient += self._scratch
+        
+        self._gradient *= self.learning_rate
+        self.weights -= self._gradient
+        self.updates += 1
+    
+    def fit(self, sessions, epochs=1, batch_size=64):
+        """
+        Arşivlenmiş oturumlarla mini-batch olarak çevrimdışı eğit
+        
+        Her oturumdaki her el için, o ana kadarki geçmişten oluşturulan matris
+        ve trend öznitelikleriyle bir sonraki sonuç öğrenilir. Tampon boyutu
+        batch_size ile sabittir, oturum uzunluğuna bağlı değildir.
+        
+        Args:
+            sessions (list): Oturumların listesi (her biri 'P'/'B'/'T' sonuç listesi,
+                             ör. History.get_results())
+            epochs (int): Veri üzerinden geçiş sayısı
+            batch_size (int): Mini-batch boyutu
+            
+        Returns:
+            int: İşlenen örnek sayısı
+        """
+        batch = np.zeros((batch_size, N_FEATURES))
+        labels = np.zeros(batch_size)
+        scores = np.zeros(batch_size)
+        samples = 0
+        
+        # Matris için son 25 P/B sonuç ve trend penceresi yeterlidir
+        # (araya giren Tie'lar için pay bırakılır)
+        context_size = max(25, self.window_size) * 2
+        
+        for _ in range(epochs):
+            filled = 0
+            for session in sessions:
+                recent = []
+                for result in session:
+                    if result in ('P', 'B') and len(recent) >= self.window_size:
+                        matrix = self.analyzer.matrix_from_history(recent)
+                        self.extract_features(matrix, recent, out=batch[filled])
+                        labels[filled] = 1.0 if result == 'B' else 0.0
+                        filled += 1
+                        samples += 1
+                        
+                        if filled == batch_size:
+                            self._batch_step(batch, labels, scores, filled)
+                            filled = 0
+                            
+                    recent.append(result)
+                    if len(recent) > context_size * 2:
+                        del recent[:-context_size]
+                        
+            if filled:
+                self._batch_step(batch, labels, scores, filled)
+                
+        return samples
+    
+    def _batch_step(self, batch, labels, scores, size):
+        """
+        Mini-batch ile ağırlıkları güncelle
+        
+        Args:
+            batch (numpy.ndarray): Öznitelik matrisi tamponu
+            labels (numpy.ndarray): Etiket tamponu
+            scores (numpy.ndarray): Ara skor tamponu
+            size (int): Tampondaki geçerli örnek sayısı
+        """
+        x = batch[:size]
+        error = scores[:size]
+        
+        np.dot(x, self.weights, out=error)
+        _sigmoid_inplace(error)
+        error -= labels[:size]
+        
+        # gradyan = X^T * hata / n + l2 * w
+        np.dot(error, x, out=self._scratch)
+        self._scratch /= size
+        np.multiply(self.weights, self.l2, out=self._gradient)
+        self._gradient += self._scratch
+        
+        self._gradient *= self.learning_rate
+        self.weights -= self._gradient
+        self.updates += 1
+    
+    def get_weights(self):
+        """
+        Ağırlıkların bir kopyasını döndür
+        
+        Returns:
+            numpy.ndarray: Ağırlık vektörü
+        """
+        return self.weights.copy()
+    
+    def set_weights(self, weights):
+        """
+        Ağırlıkları ayarla (sıcak başlangıç)
+        
+        Args:
+            weights (array-like): N_FEATURES uzunluğunda ağırlık vektörü
+        """
+        weights = np.asarray(weights, dtype=float)
+        if weights.shape != (N_FEATURES,):
+            raise ValueError(f"Ağırlık vektörü {N_FEATURES} uzunluğunda olmalı")
+        self.weights[:] = weights
+    
+    def save_weights(self, filepath):
+        """
+        Ağırlıkları dosyaya kaydet
+        
+        Args:
+            filepath (str): Kaydedilecek .npy dosyasının yolu
+            
+        Returns:
+            str: Kaydedilen dosyanın yolu
+        """
+        np.save(filepath, self.weights)
+        return filepath
+    
+    def load_weights(self, filepath):
+        """
+        Kaydedilmiş ağırlıkları yükle
+        
+        Args:
+            filepath (str): Yüklenecek .npy dosyasının yolu
+        """
+        self.set_weights(np.load(filepath))
+    
+    def get_stats(self, window=None):
+        """
+        Model istatistiklerini döndür
+        
+        Args:
+            window (int, optional): Pencere istatistikleri için son tahmin sayısı
+            
+        Returns:
+            dict: Model istatistikleri
+        """
+        stats = super().get_stats(window)
+        stats['updates'] = self.updates
+        return stats
+    
+    def get_state(self):
+        """
+        Model durumunu ağırlıklarla birlikte döndür
+        
+        Returns:
+            dict: Model durumu
+        """
+        state = super().get_state()
+        state['weights'] = self.weights.tobytes()
+        state['updates'] = self.updates
+        return state
+    
+    def set_state(self, state):
+        """
+        Model durumunu ve ağırlıkları geri yükle
+        
+        Args:
+            state (dict): get_state() ile alınmış model durumu
+        """
+        weights = np.frombuffer(state['weights'], dtype=self.weights.dtype)
+        if weights.shape != (N_FEATURES,):
+            raise ValueError("Ağırlık vektörü uyumsuz")
+            
+        super().set_state(state)
+        self.weights[:] = weights
+        self.updates = state['updates']
+    
+    def reset(self):
+        """Model verilerini ve ağırlıkları sıfırla"""
+        super().reset()
+        self.weights.fill(0.0)
+        self.updates = 0
+
+
+def _sigmoid(z):
+    """Sayısal olarak kararlı lojistik fonksiyon"""
+    if z >= 0:
+        return 1.0 / (1.0 + np.exp(-z))
+    e = np.exp(z)
+    return e / (1.0 + e)
+
+
+def _sigmoid_inplace(z):
+    """Lojistik fonksiyonu dizi üzerinde yerinde uygula"""
+    np.clip(z, -500.0, 500.0, out=z)
+    np.negative(z, out=z)
+    np.exp(z, out=z)
+    z += 1.0
+    np.reciprocal(z, out=z)
\ No newline at end of file
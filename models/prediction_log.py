@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Model tahminleri için sabit bellekli halka tampon kaydı
+"""
+
+import os
+from array import array
+
+# Tahmin/sonuç kodları (None: tahmin yapılmamış)
+CODES = {'P': 0, 'B': 1, 'T': 2, None: 3}
+SYMBOLS = ('P', 'B', 'T', None)
+
+# Günlüğe taşan kayıtlar bu kadar biriktiğinde diske yazılır
+JOURNAL_FLUSH_SIZE = 4096
+
+
+class PredictionLog:
+    """Son tahminleri halka tamponda, ömür boyu toplamları sayaçlarda tutan kayıt"""
+    
+    def __init__(self, capacity=10000, journal_path=None):
+        """
+        Inicializasyon
+        
+        Args:
+            capacity (int): Bellekte tutulacak en fazla tahmin sayısı
+            journal_path (str, optional): Tampondan taşan kayıtların eklendiği dosya
+        """
+        if capacity < 1:
+            raise ValueError("Kapasite en az 1 olmalı")
+            
+        self.capacity = capacity
+        self.journal_path = journal_path
+        self._predictions = array('b', bytes(capacity))
+        self._results = array('b', bytes(capacity))
+        self._journal_buffer = bytearray()
+        self.clear()
+    
+    def clear(self):
+        """Kaydı ve ömür boyu sayaçları sıfırla (bekleyen günlük kayıtları önce yazılır)"""
+        self.flush()
+        self.total = 0                # Ömür boyu tahmin sayısı
+        self._size = 0                # Bellekteki kayıt sayısı
+        self.valid = 0                # Tie olmayan sonuç sayısı
+        self.correct = 0              # Doğru tahmin sayısı
+        self.player_predictions = 0
+        self.banker_predictions = 0
+        self.tie_results = 0
+        self._journal_buffer.clear()
+    
+    def __len__(self):
+        """Bellekteki kayıt sayısı"""
+        return self._size
+    
+    def append(self, prediction, result):
+        """
+        Yeni bir tahmin ve sonucu kaydet
+        
+        Tampon doluysa en eski kayıt ezilir; günlük dosyası tanımlıysa
+        ezilen kayıt önce günlüğe aktarılır.
+        
+        Args:
+            prediction (str): Yapılan tahmin ('P' veya 'B')
+            result (str): Gerçek sonuç ('P', 'B' veya 'T')
+        """
+        prediction_code = CODES[prediction]
+        result_code = CODES[result]
+        index = self.total % self.capacity
+        
+        if self._size == self.capacity and self.journal_path is not None:
+            self._journal_buffer.append(self._predictions[index])
+            self._journal_buffer.append(self._results[index])
+            if len(self._journal_buffer) >= JOURNAL_FLUSH_SIZE * 2:
+                self.flush()
+                
+        self._predictions[index] = prediction_code
+        self._results[index] = result_code
+        self.total += 1
+        if self._size < self.capacity:
+            self._size += 1
+            
+        if prediction_code == 0:
+            self.player_predictions += 1
+        elif prediction_code == 1:
+            self.banker_predictions += 1
+            
+        # Tie sonuçları tahmin doğruluğunu etkilemez
+        if result_code == 2:
+            self.tie_results += 1
+        else:
+            self.valid += 1
+            if prediction_code == result_code:
+                self.correct += 1
+    
+    def accuracy(self):
+        """
+        Ömür boyu başarı oranını döndür
+        
+        Returns:
+            float: Başarı oranı (yüzde)
+        """
+        return (self.correct / self.valid * 100) if self.valid else 0.0
+    
+    def _recent_codes(self, codes, limit=None):
+        """Bellekteki son kodları eskiden yeniye sırayla döndür"""
+        size = len(self)
+        if limit is not None:
+            size = min(size, limit)
+            
+        end = self.total % self.capacity
+        start = end - size
+        if start >= 0:
+            return codes[start:end]
+        return codes[start:] + codes[:end]
+    
+    def recent_predictions(self, limit=None):
+        """
+        Bellekteki son tahminleri döndür
+        
+        Args:
+            limit (int, optional): Döndürülecek en fazla kayıt sayısı
+            
+        Returns:
+            list: Tahminler ('P' veya 'B'), eskiden yeniye
+        """
+        return [SYMBOLS[code] for code in self._recent_codes(self._predictions, limit)]
+    
+    def recent_results(self, limit=None):
+        """
+        Bellekteki son sonuçları döndür
+        
+        Args:
+            limit (int, optional): Döndürülecek en fazla kayıt sayısı
+            
+        Returns:
+            list: Sonuçlar ('P', 'B' veya 'T'), eskiden yeniye
+        """
+        return [SYMBOLS[code] for code in self._recent_codes(self._results, limit)]
+    
+    def last_prediction(self):
+        """
+        En son tahmini döndür
+        
+        Returns:
+            str: Son tahmin veya kayıt yoksa None
+        """
+        if self.total == 0:
+            return None
+        return SYMBOLS[self._predictions[(self.total - 1) % self.capacity]]
+    
+    def window_stats(self, window=None):
+        """
+        Son kayıtlar üzerinden pencere istatistiklerini hesapla
+        
+        Args:
+            window (int, optional): Pencere boyu (varsayılan: bellekteki tüm kayıtlar)
+            
+        Returns:
+            dict: Pencere boyu, geçerli tahmin sayısı ve başarı oranı
+        """
+        predictions = self._recent_codes(self._predictions, window)
+        results = self._recent_codes(self._results, window)
+        
+        valid = 0
+        correct = 0
+        for prediction_code, result_code in zip(predictions, results):
+            if result_code != 2:
+                valid += 1
+                if prediction_code == result_code:
+                    correct += 1
+                    
+        return {
+            'window': len(results),
+            'valid_predictions': valid,
+            'accuracy': (correct / valid * 100) if valid else 0.0
+        }
+    
+    def flush(self):
+        """Biriken taşma kayıtlarını günlük dosyasına yaz"""
+        if not self._journal_buffer or self.journal_path is None:
+            return
+            
+        directory = os.path.dirname(self.journal_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+            
+        # Her kayıt iki karakterlik bir satır olarak eklenir (tahmin, sonuç; '-' tahmin yok)
+        lines = bytearray()
+        buffer = self._journal_buffer
+        for i in range(0, len(buffer), 2):
+            lines += (SYMBOLS[buffer[i]] or '-').encode()
+            lines += SYMBOLS[buffer[i + 1]].encode()
+            lines += b'\n'
+            
+        with open(self.journal_path, 'ab') as f:
+            f.write(lines)
+        buffer.clear()
+    
+    def get_state(self):
+        """
+        Kayıt durumunu anlık görüntü için döndür
+        
+        Returns:
+            dict: Ömür boyu sayaçlar ve bellekteki kayıtlar (kod baytları olarak)
+        """
+        self.flush()
+        return {
+            'total': self.total,
+            'valid': self.valid,
+            'correct': self.correct,
+            'player_predictions': self.player_predictions,
+            'banker_predictions': self.banker_predictions,
+            'tie_results': self.tie_results,
+            'predictions': self._recent_codes(self._predictions).tobytes(),
+            'results': self._recent_codes(self._results).tobytes()
+        }
+    
+    def set_state(self, state):
+        """
+        Anlık görüntüden kayıt durumunu geri yükle
+        
+        Bellekteki kayıtlar kapasiteden fazlaysa yalnızca en yenileri tutulur.
+        
+        Args:
+            state (dict): get_state() ile alınmış kayıt durumu
+        """
+        predictions = array('b', state['predictions'])
+        results = array('b', state['results'])
+        if len(predictions) != len(results):
+            raise ValueError("Tahmin kaydı uyumsuz")
+            
+        self.clear()
+        self.total = state['total']
+        
+        # En yeni kayıt (total - 1) konumuna gelecek şekilde yerleştir
+        kept = min(len(results), self.capacity, self.total)
+        first = self.total - kept
+        for i in range(kept):
+            index = (first + i) % self.capacity
+            self._predictions[index] = predictions[len(results) - kept + i]
+            self._results[index] = results[len(results) - kept + i]
+        self._size = kept
+        
+        self.valid = state['valid']
+        self.correct = state['correct']
+        self.player_predictions = state['player_predictions']
+        self.banker_predictions = state['banker_predictions']
+        self.tie_results = state['tie_results']
\ No newline at end of file
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Model adlarından model örnekleri oluşturan kayıt (modüller ilk kullanımda yüklenir)
+"""
+
+import importlib
+
+# Kısa ad -> (modül, sınıf)
+MODEL_REGISTRY = {
+    'deep': ('models.deep_baccarat', 'DeepBaccarat'),
+    'pattern': ('models.pattern_ai', 'PatternAI'),
+    'markov': ('models.markov_chain', 'MarkovChain'),
+    'shoe': ('models.shoe_model', 'ShoeModel'),
+    'logistic': ('models.online_logistic', 'OnlineLogistic')
+}
+
+# Arayüzde ve komut satırında varsayılan olarak çalıştırılan modeller
+DEFAULT_MODELS = ('deep', 'pattern', 'markov')
+
+
+def available_models():
+    """
+    Kayıtlı model adlarını döndür
+    
+    Returns:
+        list: Model kısa adları
+    """
+    return list(MODEL_REGISTRY)
+
+
+def get_model_class(key):
+    """
+    Model sınıfını yükle
+    
+    Args:
+        key (str): Model kısa adı (ör. 'markov')
+        
+    Returns:
+        type: BaseModel alt sınıfı
+    """
+    try:
+        module_name, class_name = MODEL_REGISTRY[key]
+    except KeyError:
+        raise ValueError(f"Bilinmeyen model: {key} (seçenekler: {', '.join(MODEL_REGISTRY)})")
+        
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
+
+def create_model(key, **kwargs):
+    """
+    Model örneği oluştur
+    
+    Args:
+        key (str): Model kısa adı
+        **kwargs: Model yapıcısına iletilen argümanlar
+        
+    Returns:
+        BaseModel: Model örneği
+    """
+    return get_model_class(key)(**kwargs)
+
+
+def create_models(keys=DEFAULT_MODELS):
+    """
+    Birden fazla model örneği oluştur
+    
+    Args:
+        keys (iterable): Model kısa adları
+        
+    Returns:
+        list: Model örnekleri
+    """
+    return [create_model(key) for key in keys]
\ No newline at end of file
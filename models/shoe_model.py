@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Sabot kompozisyonuna dayalı kesin olasılıklı Baccarat tahmin modeli
+"""
+
+from models.base_model import BaseModel
+from core.shoe import Shoe
+
+
+class ShoeModel(BaseModel):
+    """Sabotta kalan kartlardan sonraki elin kesin olasılıklarını hesaplayan model"""
+    
+    def __init__(self, decks=8):
+        """
+        Inicializasyon
+        
+        Args:
+            decks (int): Sabottaki deste sayısı
+        """
+        super().__init__(name="SHOE ANALYZER")
+        self.shoe = Shoe(decks)
+    
+    def deal_hand(self, player_cards, banker_cards):
+        """
+        Oynanan elin kartlarını sabottan çıkar
+        
+        Args:
+            player_cards (list): Player kartları (rütbe veya değer)
+            banker_cards (list): Banker kartları (rütbe veya değer)
+        """
+        self.shoe.remove_cards(player_cards)
+        self.shoe.remove_cards(banker_cards)
+    
+    def remove_cards(self, cards):
+        """
+        Görülen (yakılan veya dağıtılan) kartları sabottan çıkar
+        
+        Args:
+            cards (list): Kart rütbeleri veya değerleri
+        """
+        self.shoe.remove_cards(cards)
+    
+    def new_shoe(self):
+        """Yeni karıştırılmış sabota geç"""
+        self.shoe.reset()
+    
+    def get_probabilities(self):
+        """
+        Sonraki elin kesin olasılıklarını döndür
+        
+        Returns:
+            tuple: (p_olasılığı, b_olasılığı, t_olasılığı)
+        """
+        return self.shoe.get_probabilities()
+    
+    def predict(self, matrix, history=None):
+        """
+        Sabot kompozisyonuna göre tahmin yap
+        
+        Args:
+            matrix (list): 5x5 matris (2D liste)
+            history (list, optional): Oyun sonuçları geçmişi
+            
+        Returns:
+            tuple: (tahmin, güven skoru)
+        """
+        p_probability, b_probability, _ = self.get_probabilities()
+        
+        prediction = 'P' if p_probability > b_probability else 'B'
+        
+        # Güven skoru: kazananın P+B içindeki payı (yüzde olarak)
+        confidence = max(p_probability, b_probability) / (p_probability + b_probability) * 100
+        confidence = min(99.9, max(50.0, confidence))  # 50-99.9 arasına sınırla
+        
+        return prediction, confidence
+    
+    def get_stats(self, window=None):
+        """
+        Model istatistiklerini döndür
+        
+        Args:
+            window (int, optional): Pencere istatistikleri için son tahmin sayısı
+            
+        Returns:
+            dict: Model istatistikleri
+        """
+        stats = super().get_stats(window)
+        stats['cards_remaining'] = self.shoe.remaining()
+        return stats
+    
+    def get_state(self):
+        """
+        Model durumunu sabot kompozisyonuyla birlikte döndür
+        
+        Returns:
+            dict: Model durumu
+        """
+        state = super().get_state()
+        state['decks'] = self.shoe.decks
+        state['counts'] = list(self.shoe.counts)
+        state['dealt'] = self.shoe.dealt
+        return state
+    
+    def set_state(self, state):
+        """
+        Model durumunu ve sabot kompozisyonunu geri yükle
+        
+        Args:
+            state (dict): get_state() ile alınmış model durumu
+        """
+        if state.get('decks') != self.shoe.decks or len(state['counts']) != 10:
+            raise ValueError("Sabot durumu uyumsuz")
+            
+        super().set_state(state)
+        self.shoe.counts = list(state['counts'])
+        self.shoe.dealt = state['dealt']
+    
+    def reset(self):
+        """Model verilerini sıfırla ve yeni sabota geç"""
+        super().reset()
+        self.shoe.reset()
\ No newline at end of file
@@ -0,0 +1,701 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tahmin modellerini yerel ağ üzerinden sunan asyncio servisi
+
+Protokol satır tabanlı JSON'dır: her istek ve her yanıt tek satırdır. Bir
+bağlantı üzerinden birden fazla istek beklemeden gönderilebilir; yanıtlar
+isteklerle aynı sırada döner ve isteğin 'id' alanını taşır.
+
+İstekler:
+    {"id": 1, "op": "add_result", "table": "masa1", "result": "B"}
+    {"id": 2, "op": "predict", "table": "masa1"}
+    {"id": 3, "op": "stats", "table": "masa1", "window": 50}
+    {"id": 4, "op": "status"}
+
+Yanıtlar:
+    {"id": 2, "ok": true, "result": {...}}
+    {"id": 9, "ok": false, "error": "..."}
+
+Örnekler:
+    python service.py --port 8765
+    python service.py --unix /tmp/baccarat.sock --models deep,markov
+    python service.py --shared-memory   # masa geçmişleri işçi süreçlerle paylaşılır
+"""
+
+import os
+import sys
+import json
+import signal
+import asyncio
+import argparse
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from core.game import Game, MatrixAnalyzer
+from core.history import History
+from core.ingest import Ingestor, SocketSource, IngestError, open_source
+from core.metrics import REGISTRY, MetricsExporter, DEFAULT_INTERVAL
+from core.shared_history import SharedHistory
+from models.ensemble import Ensemble
+from models.registry import DEFAULT_MODELS, create_models
+from cli import CONTEXT_SIZE, RESULTS, format_prediction, parse_model_list
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# Mikro toplama: ilk istekten sonra bu kadar beklenip gelen istekler tek seferde işlenir
+BATCH_WINDOW_MS = 2.0
+MAX_BATCH = 256
+
+# Geri basınç: kuyruk dolunca bağlantılardan okuma durur
+MAX_PENDING = 1024             # Servis genelinde işlenmeyi bekleyen istek sayısı
+MAX_INFLIGHT = 64              # Bağlantı başına yanıtı bekleyen istek sayısı
+MAX_LINE_BYTES = 64 * 1024     # Tek bir istek satırının en büyük boyu
+
+MAX_TABLES = 1000
+
+# Akıştan gelen, masa adı belirtilmemiş sonuçların eklendiği masa
+DEFAULT_TABLE = 'masa'
+INGEST_POLL_INTERVAL = 0.01  # Akış kuyruğu boşken bekleme (saniye)
+
+# Kapanışta bekleyen yanıtların yazılması için en uzun süre (saniye)
+SHUTDOWN_TIMEOUT = 5.0
+
+
+class ServiceError(Exception):
+    """İstek geçersiz olduğunda veya işlenemediğinde fırlatılan hata"""
+
+
+class Table:
+    """
+    Servisteki tek bir masanın oyun ve model durumu
+    
+    Yalnızca servisin model iş parçacığında kullanılır.
+    """
+    
+    def __init__(self, name, model_keys=DEFAULT_MODELS, history_dir=None, shared=False):
+        """
+        Inicializasyon
+        
+        Args:
+            name (str): Masa kimliği
+            model_keys (iterable): Masada çalıştırılacak modeller
+            history_dir (str, optional): Oturumun kapanışta kaydedileceği dizin
+            shared (bool): Geçmişi diğer süreçlerin okuyabileceği paylaşılan belleğe de yaz
+        """
+        self.name = name
+        self.game = Game()
+        self.history = History(history_dir) if history_dir else None
+        self.shared = SharedHistory.create() if shared else None
+        self.ensemble = Ensemble(create_models(model_keys))
+        self.predicted_at = None  # Son tahminin yapıldığı el sayısı
+        self.last_output = None   # Son tahmin (JSON'a uygun)
+        self.valid = 0            # Tie olmayan ve tahmini olan el sayısı
+        self.correct = 0          # Doğru tahmin sayısı
+    
+    def add_result(self, result):
+        """
+        Masaya yeni el sonucu ekle
+        
+        Sonuç her durumda modellere öğretilir; bu el için tahmin yapıldıysa
+        modeller ve masa başarı oranı ayrıca sonuçla değerlendirilir.
+        
+        Args:
+            result (str): 'P', 'B' veya 'T'
+            
+        Returns:
+            dict: El sayısı ve değerlendirilen tahmin
+        """
+        prediction = None
+        if self.predicted_at == len(self.game.history):
+            prediction = self.last_output['prediction']
+            self.ensemble.add_result(result)
+            if result != 'T':
+                self.valid += 1
+                if prediction == result:
+                    self.correct += 1
+                    
+        self.game.add_result(result)
+        self.ensemble.observe(self.game.history, len(self.game.history) - 1)
+        if self.shared is not None:
+            self.shared.append(result)
+        if self.history is not None:
+            self.history.add_result(result, prediction)
+            
+        return {'hands': len(self.game.history), 'prediction': prediction}
+    
+    def predict(self):
+        """
+        Sonraki el için tahmin yap
+        
+        Son tahminden bu yana sonuç eklenmediyse aynı tahmin döner; aynı elde
+        gelen tahmin istekleri modelleri yeniden çalıştırmaz.
+        
+        Returns:
+            dict: Birleşik tahmin (cli.format_prediction biçiminde) ve el sayısı
+        """
+        history = self.game.history
+        total = len(history)
+        if self.predicted_at != total:
+            context = history[-CONTEXT_SIZE:]
+            matrix = MatrixAnalyzer.matrix_from_history(context)
+            output = format_prediction(self.ensemble.predict(matrix, context))
+            output['hands'] = total
+            self.last_output = output
+            self.predicted_at = total
+        return self.last_output
+    
+    def get_stats(self, window=None):
+        """
+        Masa, oyun ve model istatistiklerini döndür
+        
+        Args:
+            window (int, optional): Model pencere istatistikleri için son tahmin sayısı
+            
+        Returns:
+            dict: İstatistikler
+        """
+        return {
+            'table': self.name,
+            'hands': len(self.game.history),
+            'valid_predictions': self.valid,
+            'accuracy': (self.correct / self.valid * 100) if self.valid else 0.0,
+            'shared_memory': self.shared.name if self.shared is not None else None,
+            'game': self.game.get_stats(),
+            'models': [model.get_stats(window) for model in self.ensemble.models]
+        }
+
+
+class _Request:
+    """Kuyruktaki tek bir istek ve yanıtının bekleneceği future"""
+    
+    __slots__ = ('op', 'table', 'params', 'future')
+    
+    def __init__(self, op, table, params, future):
+        self.op = op
+        self.table = table
+        self.params = params
+        self.future = future
+
+
+class PredictionService:
+    """
+    Masa kimliğine göre tahmin, sonuç ekleme ve istatistik sunan servis
+    
+    Bağlantılardan okunan istekler sınırlı bir kuyrukta toplanır. Toplama
+    döngüsü ilk istekten sonra kısa bir süre (BATCH_WINDOW_MS) bekler ve o ana
+    kadar biriken istekleri tek bir iş olarak model iş parçacığına gönderir;
+    model durumu yalnızca bu iş parçacığında değiştiği için kilit gerekmez ve
+    olay döngüsü model hesaplamaları sırasında da istek okumaya devam eder.
+    Aynı topluda aynı masa için gelen tahmin istekleri tek hesaplamayla
+    yanıtlanır.
+    
+    Kuyruk veya bir bağlantının bekleyen yanıtları dolduğunda o bağlantıdan
+    okuma durur; yük TCP akış denetimiyle istemciye geri yansır.
+    """
+    
+    def __init__(self, model_keys=DEFAULT_MODELS, batch_window_ms=BATCH_WINDOW_MS,
+                 max_batch=MAX_BATCH, max_pending=MAX_PENDING, max_tables=MAX_TABLES,
+                 history_dir=None, ingestor=None, shared_memory=False):
+        """
+        Inicializasyon
+        
+        Args:
+            model_keys (iterable): Her masada çalıştırılacak modeller
+            batch_window_ms (float): Toplama penceresi (milisaniye)
+            max_batch (int): Bir toplamdaki en fazla istek sayısı
+            max_pending (int): Kuyrukta bekleyebilecek en fazla istek sayısı
+            max_tables (int): En fazla masa sayısı
+            history_dir (str, optional): Masa oturumlarının kapanışta kaydedileceği dizin
+            ingestor (Ingestor, optional): Sonuçların okunacağı akış (servis kapanınca durdurulur)
+            shared_memory (bool): Masa geçmişlerini paylaşılan bellekte yayınla
+                (bölge adları 'stats' yanıtının 'shared_memory' alanında döner)
+        """
+        self.model_keys = tuple(model_keys)
+        self.batch_window = batch_window_ms / 1000.0
+        self.max_batch = max_batch
+        self.max_pending = max_pending
+        self.max_tables = max_tables
+        self.history_dir = history_dir
+        self.ingestor = ingestor
+        self.shared_memory = shared_memory
+        
+        self.tables = {}          # Masa kimliği -> Table (yalnızca model iş parçacığında)
+        self.servers = []
+        self.connections = {}     # Açık bağlantılar: StreamReader -> okuma görevi
+        self.closing = False
+        
+        # Sayaçlar (status isteğiyle döner)
+        self.batches = 0
+        self.requests = 0
+        self.largest_batch = 0
+        self.unrouted = 0  # Masası oluşturulamayan akış kaydı sayısı
+        
+        self._queue = None
+        self._batch_task = None
+        self._ingest_task = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tahmin')
+        
+        self._operations = {
+            'predict': self._opPredict,
+            'add_result': self._opAddResult,
+            'stats': self._opStats,
+            'status': self._opStatus
+        }
+    
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT, unix_path=None):
+        """
+        Dinlemeye ve toplama döngüsüne başla
+        
+        Args:
+            host (str): TCP adresi
+            port (int): TCP portu (0: boş bir port seçilir)
+            unix_path (str, optional): Verilirse TCP yerine Unix soketi
+            
+        Returns:
+            asyncio.AbstractServer: Dinleyen sunucu
+        """
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.max_pending)
+            self._batch_task = asyncio.ensure_future(self._batchLoop())
+            self._registerMetrics()
+            if self.ingestor is not None:
+                self.ingestor.start()
+                self._ingest_task = asyncio.ensure_future(self._ingestLoop())
+                
+        if unix_path:
+            server = await asyncio.start_unix_server(self._serveConnection, unix_path,
+                                                     limit=MAX_LINE_BYTES)
+        else:
+            server = await asyncio.start_server(self._serveConnection, host, port,
+                                                limit=MAX_LINE_BYTES)
+        self.servers.append(server)
+        return server
+    
+    def _registerMetrics(self):
+        """Servis sayaçlarını okuma anında hesaplanan ölçümler olarak kaydet"""
+        REGISTRY.gauge('baccarat_service_queue_depth', "Toplama kuyruğunda bekleyen istekler",
+                       function=self._queue.qsize)
+        REGISTRY.gauge('baccarat_service_connections', "Açık istemci bağlantıları",
+                       function=lambda: len(self.connections))
+        REGISTRY.gauge('baccarat_service_tables', "Açık masalar",
+                       function=lambda: len(self.tables))
+        REGISTRY.counter('baccarat_service_requests_total', "İşlenen istekler",
+                         function=lambda: self.requests)
+        REGISTRY.counter('baccarat_service_batches_total', "Model iş parçacığına verilen toplu işler",
+                         function=lambda: self.batches)
+    
+    async def submit(self, op, table=None, params=None):
+        """
+        İsteği kuyruğa ekle
+        
+        Kuyruk doluysa yer açılana kadar bekler.
+        
+        Args:
+            op (str): İşlem adı
+            table (str, optional): Masa kimliği
+            params (dict, optional): İşlem parametreleri
+            
+        Returns:
+            asyncio.Future: İşlem sonucunu veya ServiceError'ı taşıyan future
+        """
+        future = asyncio.get_running_loop().create_future()
+        if self.closing:
+            future.set_exception(ServiceError("servis kapanıyor"))
+            return future
+            
+        await self._queue.put(_Request(op, table, params or {}, future))
+        return future
+    
+    async def _batchLoop(self):
+        """Kuyruktaki istekleri toplayıp model iş parçacığında işle"""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        
+        while True:
+            request = await queue.get()
+            if request is None:
+                break
+                
+            # Toplama penceresi: aynı anda gelen istekler aynı toplamda işlenir
+            if queue.qsize() < self.max_batch - 1 and self.batch_window > 0:
+                await asyncio.sleep(self.batch_window)
+                
+            batch = [request]
+            stop = False
+            while len(batch) < self.max_batch and not queue.empty():
+                request = queue.get_nowait()
+                if request is None:
+                    stop = True
+                    break
+                batch.append(request)
+                
+            outcomes = await loop.run_in_executor(self._executor, self._execute, batch)
+            for request, (ok, value) in zip(batch, outcomes):
+                if request.future.done():
+                    continue
+                if ok:
+                    request.future.set_result(value)
+                else:
+                    request.future.set_exception(value)
+                    
+            self.batches += 1
+            self.requests += len(batch)
+            self.largest_batch = max(self.largest_batch, len(batch))
+            if stop:
+                break
+    
+    async def _ingestLoop(self):
+        """Akıştan gelen sonuçları toplu olarak masalara ekle"""
+        loop = asyncio.get_running_loop()
+        while not self.closing:
+            records = self.ingestor.poll()
+            if records:
+                await loop.run_in_executor(self._executor, self._applyRecords, records)
+            else:
+                await asyncio.sleep(INGEST_POLL_INTERVAL)
+    
+    def _applyRecords(self, records):
+        """
+        Akış kayıtlarını masalara ekle (model iş parçacığında çalışır)
+        
+        Sonuç alan her masa için toplamın sonunda bir kez tahmin yapılır; böylece
+        predict istekleri eller geldikçe hazır olan tahmini döndürür.
+        """
+        touched = {}
+        for record in records:
+            name = record.table or DEFAULT_TABLE
+            try:
+                table = self._getTable(name)
+            except ServiceError:
+                self.unrouted += 1
+                continue
+            for result in record.results:
+                table.add_result(result)
+            touched[name] = table
+            
+        for table in touched.values():
+            table.predict()
+    
+    def _execute(self, batch):
+        """
+        Toplamdaki istekleri sırayla işle (model iş parçacığında çalışır)
+        
+        Returns:
+            list: İstek başına (başarılı mı, sonuç veya hata)
+        """
+        outcomes = []
+        for request in batch:
+            try:
+                outcomes.append((True, self._operations[request.op](request.table, request.params)))
+            except ServiceError as e:
+                outcomes.append((False, e))
+            except Exception as e:
+                # Model hatası servisi durdurmaz; yalnızca bu istek başarısız olur
+                outcomes.append((False, ServiceError(f"{type(e).__name__}: {e}")))
+        return outcomes
+    
+    def _getTable(self, name, create=True):
+        """Masayı döndür (yoksa oluştur)"""
+        table = self.tables.get(name)
+        if table is None:
+            if not create:
+                raise ServiceError(f"bilinmeyen masa: {name}")
+            if len(self.tables) >= self.max_tables:
+                raise ServiceError(f"masa sınırına ulaşıldı ({self.max_tables})")
+            table = Table(name, self.model_keys, self.history_dir, self.shared_memory)
+            self.tables[name] = table
+        return table
+    
+    def _opPredict(self, name, params):
+        """Sonraki el için tahmin"""
+        return self._getTable(name).predict()
+    
+    def _opAddResult(self, name, params):
+        """El sonucu ekle"""
+        result = params.get('result')
+        if result not in RESULTS:
+            raise ServiceError(f"geçersiz sonuç: {result!r} ('P', 'B' veya 'T' olmalı)")
+        return self._getTable(name).add_result(result)
+    
+    def _opStats(self, name, params):
+        """Masa istatistikleri"""
+        window = params.get('window')
+        if window is not None and (not isinstance(window, int) or window < 1):
+            raise ServiceError("'window' pozitif bir tam sayı olmalı")
+        return self._getTable(name, create=False).get_stats(window)
+    
+    def _opStatus(self, name, params):
+        """Servis durumu"""
+        return {
+            'tables': len(self.tables),
+            'queued': self._queue.qsize(),
+            'connections': len(self.connections),
+            'requests': self.requests,
+            'batches': self.batches,
+            'mean_batch': (self.requests / self.batches) if self.batches else 0.0,
+            'largest_batch': self.largest_batch,
+            'ingest': self._ingestStatus()
+        }
+    
+    def _ingestStatus(self):
+        """Akış metrikleri (akış yoksa None)"""
+        if self.ingestor is None:
+            return None
+        metrics = self.ingestor.metrics()
+        metrics['unrouted'] = self.unrouted
+        return metrics
+    
+    def parseRequest(self, line):
+        """
+        İstek satırını çöz ve doğrula
+        
+        Args:
+            line (bytes): JSON istek satırı
+            
+        Returns:
+            tuple: (istek kimliği, işlem, masa kimliği, istek nesnesi, hata veya None)
+        """
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return None, None, None, None, ServiceError(f"JSON okunamadı: {e}")
+        if not isinstance(request, dict):
+            return None, None, None, None, ServiceError("istek bir JSON nesnesi olmalı")
+            
+        request_id = request.get('id')
+        op = request.get('op')
+        table = request.get('table')
+        error = None
+        if op not in self._operations:
+            error = ServiceError(f"bilinmeyen işlem: {op!r} (seçenekler: {', '.join(self._operations)})")
+        elif op != 'status' and (not isinstance(table, str) or not table):
+            error = ServiceError("'table' boş olmayan bir metin olmalı")
+        return request_id, op, table, request, error
+    
+    async def _serveConnection(self, reader, writer):
+        """Bir bağlantının isteklerini oku ve yanıtlarını sırayla yaz"""
+        pending = asyncio.Queue(MAX_INFLIGHT)  # Yanıt bekleyen istekler (gönderim sırasıyla)
+        writer_task = asyncio.ensure_future(self._writeResponses(pending, writer))
+        self.connections[reader] = asyncio.current_task()
+        
+        try:
+            while not self.closing:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Satır MAX_LINE_BYTES sınırını aştı; akış artık güvenilir değil
+                    await pending.put((None, _failed(ServiceError("istek satırı çok uzun"))))
+                    break
+                except ConnectionError:
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                    
+                request_id, op, table, params, error = self.parseRequest(line)
+                if error is not None:
+                    await pending.put((request_id, _failed(error)))
+                    continue
+                    
+                future = await self.submit(op, table, params)
+                await pending.put((request_id, future))
+        finally:
+            # Okuma bitti: kalan yanıtlar yazılıp bağlantı kapatılır
+            await pending.put(None)
+            await writer_task
+            del self.connections[reader]
+    
+    async def _writeResponses(self, pending, writer):
+        """Yanıtları istek sırasıyla bağlantıya yaz"""
+        try:
+            while True:
+                item = await pending.get()
+                if item is None:
+                    break
+                request_id, future = item
+                try:
+                    response = {'id': request_id, 'ok': True, 'result': await future}
+                except ServiceError as e:
+                    response = {'id': request_id, 'ok': False, 'error': str(e)}
+                    
+                writer.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            # İstemci yanıtları beklemeden gitti
+            pass
+        finally:
+            writer.close()
+    
+    async def close(self, timeout=SHUTDOWN_TIMEOUT):
+        """
+        Servisi düzgün kapat
+        
+        Yeni bağlantı ve istek kabul edilmez, okunmuş isteklerin yanıtları
+        yazılıp bağlantılar kapatılır, ardından masa oturumları kaydedilir.
+        
+        Args:
+            timeout (float): Bekleyen yanıtlar için en uzun süre (saniye)
+        """
+        if self.closing:
+            return
+        self.closing = True
+        
+        for server in self.servers:
+            server.close()
+            
+        # Okuma döngüleri akış sonu görüp biter; toplama döngüsü kuyruktaki
+        # istekleri işlemeye devam eder
+        for reader in list(self.connections):
+            reader.feed_eof()
+        if self.connections:
+            _, not_done = await asyncio.wait(list(self.connections.values()), timeout=timeout)
+            for task in not_done:
+                task.cancel()
+                
+        # Akış durdurulur; okunmuş kayıtlar oturumlara eklenir
+        loop = asyncio.get_running_loop()
+        if self._ingest_task is not None:
+            await self._ingest_task
+            await loop.run_in_executor(None, self.ingestor.stop)
+            records = self.ingestor.poll()
+            if records:
+                await loop.run_in_executor(self._executor, self._applyRecords, records)
+                
+        if self._batch_task is not None:
+            await self._queue.put(None)
+            await self._batch_task
+            
+        for server in self.servers:
+            await server.wait_closed()
+            
+        await loop.run_in_executor(self._executor, self._saveSessions)
+        self._executor.shutdown(wait=True)
+        
+        for table in self.tables.values():
+            if table.shared is not None:
+                table.shared.close()
+    
+    def _saveSessions(self):
+        """Masa oturumlarını geçmiş dizinine kaydet"""
+        for table in self.tables.values():
+            if table.history is not None and table.history.session_history:
+                try:
+                    table.history.save_session(_session_filename(table.name))
+                except OSError:
+                    # Kaydedilemeyen oturum kapanışı engellemez
+                    pass
+
+
+def _failed(error):
+    """Hatayla tamamlanmış future oluştur"""
+    future = asyncio.get_running_loop().create_future()
+    future.set_exception(error)
+    return future
+
+
+def _session_filename(name):
+    """Masa kimliğinden zaman damgalı oturum dosyası adı oluştur"""
+    safe = ''.join(char if char.isalnum() else '_' for char in name)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    return f"servis_{safe}_{timestamp}.json"
+
+
+def build_parser():
+    """Komut satırı ayrıştırıcısını oluştur"""
+    parser = argparse.ArgumentParser(
+        prog='service.py',
+        description="Baccarat tahmin modellerini satır tabanlı JSON protokolüyle sun")
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f"TCP adresi (varsayılan: {DEFAULT_HOST})")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT,
+                        help=f"TCP portu (varsayılan: {DEFAULT_PORT})")
+    parser.add_argument('--unix', metavar='YOL', help="TCP yerine bu Unix soketinden dinle")
+    parser.add_argument('--models', type=parse_model_list, default=list(DEFAULT_MODELS),
+                        help=f"virgülle ayrılmış modeller (varsayılan: {','.join(DEFAULT_MODELS)})")
+    parser.add_argument('--batch-window', type=float, default=BATCH_WINDOW_MS, metavar='MS',
+                        help=f"istek toplama penceresi (varsayılan: {BATCH_WINDOW_MS} ms)")
+    parser.add_argument('--max-pending', type=int, default=MAX_PENDING, metavar='N',
+                        help=f"kuyruktaki en fazla istek (varsayılan: {MAX_PENDING})")
+    parser.add_argument('--history-dir', metavar='DİZİN',
+                        help="masa oturumlarını kapanışta bu dizine kaydet")
+    parser.add_argument('--ingest', action='append', metavar='KAYNAK',
+                        help="sonuçları akıştan oku: '-' (standart girdi), dosya yolu, "
+                             "tcp:[HOST:]PORT veya unix:YOL (birden fazla verilebilir)")
+    parser.add_argument('--ingest-from-start', action='store_true',
+                        help="izlenen dosyalardaki mevcut satırları da oku")
+    parser.add_argument('--shared-memory', action='store_true',
+                        help="masa geçmişlerini işçi süreçlerin kopyasız okuyabileceği "
+                             "paylaşılan belleğe yaz (ad: stats yanıtında 'shared_memory')")
+    parser.add_argument('--metrics-port', type=int, metavar='PORT',
+                        help="ölçümleri Prometheus biçiminde http://127.0.0.1:PORT/metrics "
+                             "adresinden sun")
+    parser.add_argument('--metrics-file', metavar='DOSYA',
+                        help="ölçümleri Prometheus biçiminde bu dosyaya periyodik olarak yaz")
+    parser.add_argument('--metrics-interval', type=float, default=DEFAULT_INTERVAL, metavar='SN',
+                        help=f"ölçüm dosyası yenileme aralığı (varsayılan: {DEFAULT_INTERVAL:g} sn)")
+    return parser
+
+
+async def serve(args):
+    """Servisi başlat ve SIGINT/SIGTERM gelene kadar çalıştır"""
+    exporter = None
+    if args.metrics_port is not None or args.metrics_file:
+        exporter = MetricsExporter(REGISTRY, port=args.metrics_port, path=args.metrics_file,
+                                   interval=args.metrics_interval)
+        exporter.start()
+        if exporter.address:
+            sys.stderr.write(f"Ölçümler: {exporter.address}\n")
+            
+    ingestor = None
+    if args.ingest:
+        sources = [open_source(spec, args.ingest_from_start) for spec in args.ingest]
+        for source in sources:
+            if isinstance(source, SocketSource):
+                source.listen()
+        ingestor = Ingestor(sources)
+        
+    service = PredictionService(args.models, batch_window_ms=args.batch_window,
+                                max_pending=args.max_pending, history_dir=args.history_dir,
+                                ingestor=ingestor, shared_memory=args.shared_memory)
+    if args.unix and os.path.exists(args.unix):
+        os.unlink(args.unix)
+    server = await service.start(args.host, args.port, args.unix)
+    
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, stop.set)
+        except (NotImplementedError, RuntimeError):
+            # Windows: KeyboardInterrupt ile kapanır
+            pass
+            
+    address = args.unix or '{}:{}'.format(*server.sockets[0].getsockname()[:2])
+    sys.stderr.write(f"Dinleniyor: {address}\n")
+    try:
+        await stop.wait()
+    finally:
+        await service.close()
+        if exporter is not None:
+            exporter.stop()
+        if args.unix and os.path.exists(args.unix):
+            os.unlink(args.unix)
+    return 0
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        return 0
+    except (OSError, IngestError) as e:
+        sys.stderr.write(f"Hata: {e}\n")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
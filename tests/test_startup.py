@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Ana pencerenin ilk çizim süresi bütçesi
+
+Uygulama ekransız (QT_QPA_PLATFORM=offscreen) ayrı bir süreçte
+`main.py --startup-budget` ile açılır; ölçüm PyQt5 ve arayüz modüllerinin
+yüklenmesini de kapsar. Uygulama ilk çizimden sonra kapanır ve bütçe
+aşıldıysa 1 ile çıkar.
+"""
+
+import os
+import sys
+import subprocess
+
+import pytest
+
+pytest.importorskip('PyQt5.QtWidgets')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# İlk çizime kadar izin verilen süre (milisaniye); bu makinelerde ~350-450 ms
+FIRST_PAINT_BUDGET_MS = 1000
+
+# Sürecin en fazla çalışma süresi (saniye)
+PROCESS_TIMEOUT = 60
+
+
+def test_first_paint_within_budget(tmp_path):
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+    
+    # Anlık görüntü ve geçmiş dosyaları geçici dizine yazılır
+    completed = subprocess.run(
+        [sys.executable, os.path.join(ROOT, 'main.py'),
+         '--startup-budget', str(FIRST_PAINT_BUDGET_MS)],
+        cwd=str(tmp_path), env=env, capture_output=True, text=True, timeout=PROCESS_TIMEOUT)
+        
+    assert completed.returncode == 0, completed.stdout + completed.stderr
\ No newline at end of file
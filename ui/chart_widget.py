@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Model başına kayan başarı oranı ve güven grafiği
+"""
+
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QSizePolicy
+from PyQt5.QtGui import QColor, QPainter, QPen, QPainterPath, QFont
+from PyQt5.QtCore import Qt, QRectF, QPointF, QSize
+
+from core.downsample import IncrementalLTTB
+from ui.styles import BACKGROUND_DARKER, CELL_BORDER, TEXT_COLOR, SERIES_COLORS
+
+# Çizim alanı kenar boşlukları (piksel)
+PLOT_LEFT = 28
+PLOT_RIGHT = 8
+PLOT_TOP = 18
+PLOT_BOTTOM = 6
+
+
+class _Series:
+    """Bir modelin başarı ve güven serileri ile önbelleğe alınmış çizim yolları"""
+    
+    def __init__(self, name, color, threshold):
+        self.name = name
+        self.color = QColor(color)
+        self.accuracy = IncrementalLTTB(threshold)
+        self.confidence = IncrementalLTTB(threshold)
+        self.paths = None  # (başarı yolu, güven yolu), veri veya boyut değişince silinir
+
+
+class AccuracyChart(QWidget):
+    """
+    Model başına kayan başarı oranı (düz çizgi) ve güven (kesikli çizgi) grafiği
+    
+    Seriler LTTB ile yaklaşık çizim genişliği kadar noktaya azaltılır ve yeni
+    eller eklendikçe artımlı olarak güncellenir. Her çizgi tek bir QPainterPath
+    ile çizilir; yollar yalnızca veri veya boyut değiştiğinde yeniden oluşturulur.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.series = []       # _Series listesi (model sırasıyla)
+        self._by_name = {}     # Model adı -> _Series
+        
+        self._axis_pen = QPen(QColor(CELL_BORDER), 1)
+        self._guide_pen = QPen(QColor(CELL_BORDER), 1, Qt.DashLine)
+        self._text_pen = QPen(QColor(TEXT_COLOR))
+        self._font = QFont()
+        self._font.setPointSize(7)
+        
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        self.setMinimumHeight(70)
+    
+    def sizeHint(self):
+        """Tercih edilen boyut"""
+        return QSize(300, 90)
+    
+    def _plotRect(self):
+        """Çizim alanı"""
+        return QRectF(PLOT_LEFT, PLOT_TOP,
+                      max(1, self.width() - PLOT_LEFT - PLOT_RIGHT),
+                      max(1, self.height() - PLOT_TOP - PLOT_BOTTOM))
+    
+    def _threshold(self):
+        """Hedef nokta sayısı: çizim alanının piksel genişliği"""
+        return int(self._plotRect().width())
+    
+    def setModels(self, model_names):
+        """
+        Serileri verilen model adlarıyla sıfırla
+        
+        Args:
+            model_names (list): Model adları
+        """
+        threshold = self._threshold()
+        self.series = [_Series(name, SERIES_COLORS[i % len(SERIES_COLORS)], threshold)
+                       for i, name in enumerate(model_names)]
+        self._by_name = {series.name: series for series in self.series}
+        self.update()
+    
+    def appendSample(self, model_name, accuracy, confidence):
+        """
+        Bir modelin seri sonuna yeni el ekle
+        
+        Args:
+            model_name (str): Model adı
+            accuracy (float): Kayan başarı oranı (yüzde)
+            confidence (float): Tahmin güveni (yüzde)
+        """
+        series = self._by_name.get(model_name)
+        if series is None:
+            series = _Series(model_name, SERIES_COLORS[len(self.series) % len(SERIES_COLORS)],
+                             self._threshold())
+            self.series.append(series)
+            self._by_name[model_name] = series
+            
+        series.accuracy.append(accuracy)
+        series.confidence.append(confidence)
+        series.paths = None
+        self.update()
+    
+    def clear(self):
+        """Tüm serileri boşalt (modeller korunur)"""
+        for series in self.series:
+            series.accuracy.clear()
+            series.confidence.clear()
+            series.paths = None
+        self.update()
+    
+    def resizeEvent(self, event):
+        """Genişlik değişince hedef nokta sayısını güncelle"""
+        threshold = self._threshold()
+        for series in self.series:
+            series.accuracy.set_threshold(threshold)
+            series.confidence.set_threshold(threshold)
+            series.paths = None
+        super().resizeEvent(event)
+    
+    @staticmethod
+    def _buildPath(samples, rect):
+        """Azaltılmış seriden tek bir çizim yolu oluştur"""
+        path = QPainterPath()
+        points = samples.points()
+        if not points:
+            return path
+            
+        last = max(1, len(samples) - 1)
+        x_scale = rect.width() / last
+        y_scale = rect.height() / 100.0
+        left = rect.left()
+        bottom = rect.bottom()
+        
+        index, value = points[0]
+        path.moveTo(left + index * x_scale, bottom - value * y_scale)
+        for index, value in points[1:]:
+            path.lineTo(left + index * x_scale, bottom - value * y_scale)
+        return path
+    
+    def paintEvent(self, event):
+        """Eksenleri, serileri ve açıklamaları çiz"""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(self._font)
+        rect = self._plotRect()
+        
+        # Eksenler ve %50 kılavuz çizgisi
+        painter.setPen(self._axis_pen)
+        painter.drawRect(rect)
+        painter.setPen(self._guide_pen)
+        middle = rect.top() + rect.height() / 2
+        painter.drawLine(QPointF(rect.left(), middle), QPointF(rect.right(), middle))
+        
+        painter.setPen(self._text_pen)
+        for value, y in ((100, rect.top()), (50, middle), (0, rect.bottom())):
+            painter.drawText(QRectF(0, y - 6, PLOT_LEFT - 4, 12),
+                             Qt.AlignRight | Qt.AlignVCenter, str(value))
+                             
+        # Seriler
+        painter.setBrush(Qt.NoBrush)
+        painter.setClipRect(rect.adjusted(-1, -1, 1, 1))
+        for series in self.series:
+            if series.paths is None:
+                series.paths = (self._buildPath(series.accuracy, rect),
+                                self._buildPath(series.confidence, rect))
+            accuracy_path, confidence_path = series.paths
+            painter.setPen(QPen(series.color, 1.5))
+            painter.drawPath(accuracy_path)
+            painter.setPen(QPen(series.color, 1, Qt.DashLine))
+            painter.drawPath(confidence_path)
+        painter.setClipping(False)
+        
+        # Açıklamalar (model adları)
+        x = rect.left()
+        metrics = painter.fontMetrics()
+        for series in self.series:
+            painter.fillRect(QRectF(x, 5, 8, 8), series.color)
+            painter.setPen(self._text_pen)
+            painter.drawText(QPointF(x + 11, 13), series.name)
+            x += 11 + metrics.horizontalAdvance(series.name) + 10
+
+
+class AccuracyChartWidget(QWidget):
+    """Başarı grafiğini başlığıyla gösteren widget"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.initUI()
+    
+    def initUI(self):
+        """Kullanıcı arayüzünü oluştur"""
+        layout = QVBoxLayout(self)
+        
+        # Başlık
+        title_label = QLabel("BAŞARI GRAFİĞİ")
+        title_label.setAlignment(Qt.AlignLeft)
+        title_label.setStyleSheet(f"color: {TEXT_COLOR}; font-weight: bold;")
+        layout.addWidget(title_label)
+        
+        self.chart = AccuracyChart()
+        layout.addWidget(self.chart, 1)
+        
+        self.setLayout(layout)
+        self.setStyleSheet(f"background-color: {BACKGROUND_DARKER}; border-radius: 8px;")
\ No newline at end of file
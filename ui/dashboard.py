@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Birden fazla masayı aynı anda izleyen pano
+"""
+
+import time
+from datetime import datetime
+
+from PyQt5.QtWidgets import (QMainWindow, QWidget, QGridLayout, QScrollArea, QShortcut,
+                            QSizePolicy)
+from PyQt5.QtCore import Qt, QTimer, QRectF, QSize, pyqtSignal
+from PyQt5.QtGui import QColor, QPainter, QPen, QBrush, QFont, QKeySequence
+
+from core.game import Game, MatrixAnalyzer
+from core.history import History
+from core.metrics import REGISTRY
+from models.ensemble import Ensemble
+from models.registry import DEFAULT_MODELS, create_models
+from ui.inference import SharedInferencePool, DEFAULT_POOL_WORKERS
+from ui.styles import (APP_STYLE, PLAYER_COLOR, BANKER_COLOR, TIE_MARK_COLOR, ACCENT_COLOR,
+                      BACKGROUND_DARKER, CELL_BORDER, TEXT_COLOR)
+
+# Modellere verilen son sonuç sayısı (matris için son 25 P/B sonuç yeterlidir)
+CONTEXT_SIZE = 50
+
+# Kirli kutucukların yeniden çizilme aralığı (milisaniye)
+REFRESH_INTERVAL_MS = 50
+
+# Sonuç akışından okuma ve durum satırını güncelleme aralıkları
+INGEST_POLL_MS = 16
+INGEST_STATUS_INTERVAL = 1.0  # saniye
+
+# Pano düzeni
+DASHBOARD_COLUMNS = 5
+TILE_WIDTH = 230
+TILE_HEIGHT = 112
+TILE_RESULTS = 24  # Kutucukta gösterilen son sonuç sayısı
+
+
+class TableSession:
+    """
+    Tek bir masanın oyun, geçmiş ve model durumu
+    
+    Sonuçlar arayüz iş parçacığında eklenir; modeller yalnızca paylaşılan
+    havuzun görevlerinde (masa başına aynı anda tek görev) kullanılır.
+    """
+    
+    def __init__(self, name, model_keys=DEFAULT_MODELS, history=None):
+        """
+        Inicializasyon
+        
+        Args:
+            name (str): Masa adı
+            model_keys (iterable): Masada çalıştırılacak modeller
+            history (History, optional): Tahmin ve sonuç kaydı
+        """
+        self.name = name
+        self.game = Game()
+        self.history = history if history is not None else History()
+        self.model_keys = tuple(model_keys)
+        self.ensemble = None      # İlk görevde oluşturulur
+        self.predicted_at = None  # Son tahminin yapıldığı el sayısı (işçi tarafı)
+        self.observed = 0         # Modellere öğretilen el sayısı (işçi tarafı)
+        self.last_result = None   # Arayüze iletilen son tahmin
+        self.valid = 0            # Tie olmayan ve tahmini olan el sayısı
+        self.correct = 0          # Doğru tahmin sayısı
+    
+    def add_result(self, result):
+        """
+        Masaya yeni el sonucu ekle ve gösterilen tahminle değerlendir
+        
+        Args:
+            result (str): 'P', 'B' veya 'T'
+        """
+        prediction = self.last_result['prediction'] if self.last_result else None
+        self.game.add_result(result)
+        self.history.add_result(result, prediction)
+        
+        if prediction is not None and result != 'T':
+            self.valid += 1
+            if prediction == result:
+                self.correct += 1
+    
+    def accuracy(self):
+        """
+        Masadaki topluluk tahminlerinin başarı oranı
+        
+        Returns:
+            float: Başarı oranı (yüzde)
+        """
+        return (self.correct / self.valid * 100) if self.valid else 0.0
+    
+    def createTask(self):
+        """
+        Mevcut el için tahmin görevi oluştur
+        
+        Returns:
+            callable: Paylaşılan havuzda çalıştırılacak görev
+        """
+        history = self.game.history
+        total = len(history)
+        context = history[-CONTEXT_SIZE:]
+        return lambda: self._predict(total, context)
+    
+    def _predict(self, total, context):
+        """Yeni sonuçları öğret, önceki tahmini değerlendir ve tahmin yap (işçide çalışır)"""
+        if self.ensemble is None:
+            self.ensemble = Ensemble(create_models(self.model_keys))
+            
+        # Aradaki eller atlanmış olsa da son tahmin, ardından gelen ilk sonuçla değerlendirilir
+        if self.predicted_at is not None and self.predicted_at < total:
+            self.ensemble.add_result(self.game.history[self.predicted_at])
+            
+        # Son görevden bu yana gelen tüm sonuçlar (toplu akış dahil) sırayla öğretilir
+        self.ensemble.observe(self.game.history, self.observed, total)
+        self.observed = total
+        
+        matrix = MatrixAnalyzer.matrix_from_history(context)
+        result = self.ensemble.predict(matrix, context)
+        self.predicted_at = total
+        result['hands'] = total
+        return result
+
+
+class TableTile(QWidget):
+    """Bir masanın özetini tek bir paintEvent ile çizen kompakt kutucuk"""
+    
+    clicked = pyqtSignal()
+    
+    def __init__(self, session, parent=None):
+        """
+        Inicializasyon
+        
+        Args:
+            session (TableSession): Gösterilen masa
+            parent (QWidget, optional): Üst widget
+        """
+        super().__init__(parent)
+        self.session = session
+        self.selected = False
+        
+        # Çizim nesneleri bir kez oluşturulur
+        self._colors = {'P': QColor(PLAYER_COLOR), 'B': QColor(BANKER_COLOR),
+                        'T': QColor(TIE_MARK_COLOR)}
+        self._background = QBrush(QColor(BACKGROUND_DARKER))
+        self._border_pen = QPen(QColor(CELL_BORDER), 1)
+        self._selected_pen = QPen(QColor(ACCENT_COLOR), 2)
+        self._text_pen = QPen(QColor(TEXT_COLOR))
+        self._title_font = QFont()
+        self._title_font.setBold(True)
+        self._small_font = QFont()
+        self._small_font.setPointSize(8)
+        self._prediction_font = QFont()
+        self._prediction_font.setPointSize(14)
+        self._prediction_font.setBold(True)
+        
+        self.setFixedSize(TILE_WIDTH, TILE_HEIGHT)
+        self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+    
+    def sizeHint(self):
+        """Tercih edilen boyut"""
+        return QSize(TILE_WIDTH, TILE_HEIGHT)
+    
+    def setSelected(self, selected):
+        """Kutucuğun seçili görünümünü ayarla"""
+        if self.selected != selected:
+            self.selected = selected
+            self.update()
+    
+    def mousePressEvent(self, event):
+        """Tıklanınca masayı seç"""
+        if event.button() == Qt.LeftButton:
+            self.clicked.emit()
+        super().mousePressEvent(event)
+    
+    def paintEvent(self, event):
+        """Masa adı, tahmin, sayaçlar ve son sonuçları çiz"""
+        session = self.session
+        game = session.game
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        rect = QRectF(self.rect()).adjusted(1, 1, -1, -1)
+        painter.setPen(self._selected_pen if self.selected else self._border_pen)
+        painter.setBrush(self._background)
+        painter.drawRoundedRect(rect, 6, 6)
+        
+        # Başlık: masa adı ve el sayısı
+        painter.setPen(self._text_pen)
+        painter.setFont(self._title_font)
+        painter.drawText(QRectF(10, 6, 140, 20), Qt.AlignLeft | Qt.AlignVCenter, session.name)
+        painter.setFont(self._small_font)
+        painter.drawText(QRectF(90, 6, TILE_WIDTH - 100, 20), Qt.AlignRight | Qt.AlignVCenter,
+                         f"{len(game.history)} el")
+                         
+        # Güncel tahmin ve güven
+        result = session.last_result
+        prediction_rect = QRectF(10, 26, 100, 24)
+        if result is not None:
+            painter.setPen(QPen(self._colors[result['prediction']]))
+            painter.setFont(self._prediction_font)
+            painter.drawText(prediction_rect, Qt.AlignLeft | Qt.AlignVCenter,
+                             "PLAYER" if result['prediction'] == 'P' else "BANKER")
+            painter.setPen(self._text_pen)
+            painter.setFont(self._small_font)
+            painter.drawText(QRectF(10, 50, 100, 14), Qt.AlignLeft | Qt.AlignVCenter,
+                             f"Güven {round(result['confidence'])}%")
+        else:
+            painter.setFont(self._prediction_font)
+            painter.drawText(prediction_rect, Qt.AlignLeft | Qt.AlignVCenter, "?")
+            
+        # Sayaçlar ve başarı oranı
+        painter.setPen(self._text_pen)
+        painter.setFont(self._small_font)
+        painter.drawText(QRectF(110, 28, TILE_WIDTH - 120, 17), Qt.AlignRight | Qt.AlignVCenter,
+                         f"P {game.player_count}  B {game.banker_count}  T {game.tie_count}")
+        painter.drawText(QRectF(110, 45, TILE_WIDTH - 120, 17), Qt.AlignRight | Qt.AlignVCenter,
+                         f"İsabet {session.accuracy():.1f}%")
+                         
+        # Son sonuçlar (en yeni sağda)
+        painter.setPen(Qt.NoPen)
+        size = 7
+        step = (TILE_WIDTH - 20) / TILE_RESULTS
+        recent = game.history[-TILE_RESULTS:]
+        x = 10 + (TILE_RESULTS - len(recent)) * step
+        y = TILE_HEIGHT - 30
+        for value in recent:
+            painter.setBrush(self._colors[value])
+            painter.drawEllipse(QRectF(x + (step - size) / 2, y, size, size))
+            x += step
+
+
+class DashboardWindow(QMainWindow):
+    """Masaları kutucuklar halinde gösteren ve tahminleri paylaşılan havuzda çalıştıran pano"""
+    
+    def __init__(self, table_names, model_keys=DEFAULT_MODELS, max_workers=DEFAULT_POOL_WORKERS,
+                 history_dir='history', ingestor=None):
+        """
+        Inicializasyon
+        
+        Args:
+            table_names (list): Masa adları
+            model_keys (iterable): Her masada çalıştırılacak modeller
+            max_workers (int): Paylaşılan havuzun iş parçacığı sayısı
+            history_dir (str): Masa geçmişlerinin kaydedileceği dizin
+            ingestor (Ingestor, optional): Sonuçların okunacağı akış (pencere kapanınca durdurulur)
+        """
+        super().__init__()
+        self.sessions = [TableSession(name, model_keys, History(history_dir))
+                         for name in table_names]
+        self.selected = None  # Klavye girişinin yapıldığı masa
+        self.dirty = set()    # Yeniden çizilecek masa sıraları
+        
+        # Tüm masaların tahminleri aynı sınırlı havuzda çalışır
+        self.pool = SharedInferencePool(max_workers, self)
+        self.pool.predictionReady.connect(self.onPredictionReady)
+        self.pool.predictionFailed.connect(self.onPredictionFailed)
+        REGISTRY.gauge('baccarat_inference_queue_depth', "Havuzda bekleyen tahmin istekleri",
+                       function=self.pool.queuedCount)
+                       
+        # Yeniden çizimler sonuç sıklığından bağımsız olarak toplu yapılır
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(REFRESH_INTERVAL_MS)
+        self.refresh_timer.timeout.connect(self.refreshTiles)
+        
+        # Akış kayıtları masa adıyla (veya 1'den başlayan sırayla) yönlendirilir
+        self.ingestor = ingestor
+        self.table_index = {session.name: index for index, session in enumerate(self.sessions)}
+        self.unrouted = 0  # Masası bulunamayan kayıt sayısı
+        self.ingest_status_at = 0.0
+        self.ingest_timer = QTimer(self)
+        self.ingest_timer.setInterval(INGEST_POLL_MS)
+        self.ingest_timer.timeout.connect(self.pollIngest)
+        if ingestor is not None:
+            ingestor.start()
+            self.ingest_timer.start()
+            
+        self._initUI()
+        self.setWindowTitle(f"Baccarat Tahmin Panosu ({len(self.sessions)} masa)")
+        self.setStyleSheet(APP_STYLE)
+    
+    def _initUI(self):
+        """Kullanıcı arayüzünü oluştur"""
+        grid_widget = QWidget()
+        grid_layout = QGridLayout(grid_widget)
+        grid_layout.setContentsMargins(10, 10, 10, 10)
+        grid_layout.setSpacing(8)
+        
+        self.tiles = []
+        for index, session in enumerate(self.sessions):
+            tile = TableTile(session)
+            tile.clicked.connect(lambda index=index: self.selectTable(index))
+            grid_layout.addWidget(tile, index // DASHBOARD_COLUMNS, index % DASHBOARD_COLUMNS)
+            self.tiles.append(tile)
+        grid_layout.setRowStretch(grid_layout.rowCount(), 1)
+        grid_layout.setColumnStretch(DASHBOARD_COLUMNS, 1)
+        
+        scroll_area = QScrollArea()
+        scroll_area.setWidget(grid_widget)
+        scroll_area.setWidgetResizable(True)
+        self.setCentralWidget(scroll_area)
+        
+        columns = min(DASHBOARD_COLUMNS, max(1, len(self.sessions)))
+        self.resize(columns * (TILE_WIDTH + 8) + 40, 600)
+        
+        # Seçili masaya P / B / T tuşlarıyla sonuç girişi
+        for key, result in ((Qt.Key_P, 'P'), (Qt.Key_B, 'B'), (Qt.Key_T, 'T')):
+            shortcut = QShortcut(QKeySequence(key), self)
+            shortcut.activated.connect(lambda result=result: self.onResultKey(result))
+            
+        self.statusBar().showMessage("Bir masa seçip P / B / T tuşlarıyla sonuç girin")
+    
+    def selectTable(self, index):
+        """
+        Klavye girişi için masa seç
+        
+        Args:
+            index (int): Masa sırası
+        """
+        if self.selected is not None:
+            self.tiles[self.selected].setSelected(False)
+        self.selected = index
+        self.tiles[index].setSelected(True)
+    
+    def onResultKey(self, result):
+        """Seçili masaya klavyeden sonuç gir"""
+        if self.selected is not None:
+            self.addResult(self.selected, result)
+    
+    def addResult(self, index, result):
+        """
+        Bir masaya yeni el sonucu ekle ve tahmin iste
+        
+        Args:
+            index (int): Masa sırası
+            result (str): 'P', 'B' veya 'T'
+        """
+        session = self.sessions[index]
+        session.add_result(result)
+        self.pool.submit(index, session.createTask())
+        self.markDirty(index)
+    
+    def routeRecord(self, record):
+        """
+        Akış kaydının masasını bul
+        
+        Masa adı verilmemiş kayıtlar tek masalı panoda o masaya, aksi halde
+        seçili masaya gider.
+        
+        Args:
+            record (Record): Akış kaydı
+            
+        Returns:
+            int: Masa sırası (bulunamazsa None)
+        """
+        if record.table is None:
+            return 0 if len(self.sessions) == 1 else self.selected
+            
+        index = self.table_index.get(record.table)
+        if index is None and record.table.isdigit() and 1 <= int(record.table) <= len(self.sessions):
+            index = int(record.table) - 1
+        return index
+    
+    def pollIngest(self):
+        """
+        Akışta biriken sonuçları masalara ekle
+        
+        Aynı toplamda sonuç alan her masa için tek bir tahmin isteği gönderilir.
+        """
+        touched = set()
+        for record in self.ingestor.poll():
+            index = self.routeRecord(record)
+            if index is None:
+                self.unrouted += 1
+                continue
+            session = self.sessions[index]
+            for result in record.results:
+                session.add_result(result)
+            touched.add(index)
+            
+        for index in touched:
+            self.pool.submit(index, self.sessions[index].createTask())
+            self.markDirty(index)
+            
+        now = time.monotonic()
+        if now - self.ingest_status_at >= INGEST_STATUS_INTERVAL:
+            self.ingest_status_at = now
+            metrics = self.ingestor.metrics()
+            text = (f"Akış: {metrics['received']} el, bekleyen {metrics['lag']}, "
+                    f"gecikme p95 {metrics['delivery']['p95_us'] / 1000:.1f} ms, "
+                    f"tahmin kuyruğu {self.pool.queuedCount()}")
+            if metrics['errors'] or self.unrouted:
+                text += f", hatalı kayıt {metrics['errors']}, masasız kayıt {self.unrouted}"
+            self.statusBar().showMessage(text)
+    
+    def onPredictionReady(self, index, result):
+        """Bir masanın tahmini geldiğinde"""
+        session = self.sessions[index]
+        
+        # Daha yeni bir el için sonuç zaten gösterildiyse eski sonuç atılır
+        if session.last_result is not None and session.last_result['hands'] > result['hands']:
+            return
+        session.last_result = result
+        self.markDirty(index)
+    
+    def onPredictionFailed(self, index, message):
+        """Bir masanın tahmini hata verdiğinde"""
+        self.statusBar().showMessage(f"{self.sessions[index].name}: {message}", 5000)
+    
+    def markDirty(self, index):
+        """Masa kutucuğunu bir sonraki yenilemede çizilmek üzere işaretle"""
+        self.dirty.add(index)
+        if not self.refresh_timer.isActive():
+            self.refresh_timer.start()
+    
+    def refreshTiles(self):
+        """Yalnızca değişen masaların kutucuklarını yeniden çiz"""
+        dirty, self.dirty = self.dirty, set()
+        for index in dirty:
+            self.tiles[index].update()
+    
+    def closeEvent(self, event):
+        """Pencere kapanırken havuzu durdur ve masa geçmişlerini kaydet"""
+        self.refresh_timer.stop()
+        if self.ingestor is not None:
+            # Okunmuş sonuçlar da masa geçmişlerine eklenip kaydedilir
+            self.ingest_timer.stop()
+            self.ingestor.stop()
+            self.pollIngest()
+        self.pool.shutdown()
+        
+        for session in self.sessions:
+            if session.history.session_history:
+                try:
+                    session.history.save_session(_session_filename(session.name))
+                except OSError:
+                    # Geçmiş yazılamazsa pano yine de kapanır
+                    pass
+        super().closeEvent(event)
+
+
+def _session_filename(name):
+    """Masa adından zaman damgalı oturum dosyası adı oluştur"""
+    safe = ''.join(char if char.isalnum() else '_' for char in name)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    return f"masa_{safe}_{timestamp}.json"
\ No newline at end of file
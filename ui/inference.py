@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Model tahminlerini arayüz iş parçacığı dışında çalıştıran çıkarım hattı
+"""
+
+from collections import deque
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QCoreApplication, pyqtSignal
+
+from core.snapshot import capture_models, restore_models
+from models.ensemble import Ensemble
+from models.registry import DEFAULT_MODELS, create_models
+
+# Paylaşılan havuzun varsayılan iş parçacığı sayısı (modeller saf Python olduğundan
+# daha fazlası GIL nedeniyle hızlandırmaz, yalnızca arayüzü yavaşlatır)
+DEFAULT_POOL_WORKERS = 2
+
+# Modellere verilen son sonuç sayısı (matris için son 25 P/B sonuç yeterlidir)
+CONTEXT_SIZE = 50
+
+
+class InferencePipeline(QObject):
+    """
+    Tahmin isteklerini bir QThreadPool işçisinde sırayla çalıştıran hat
+    
+    Her istek artan bir nesil (generation) numarası alır. İşçi, kendisinden
+    daha yeni bir istek varsa tahmini hiç çalıştırmaz; daha eski bir nesilden
+    gelen sonuçlar da arayüze iletilmeden atılır. Atlanan istekler olsa da son
+    tahmin, geçmişte ardından gelen ilk sonuçla değerlendirilir; aradaki tüm
+    sonuçlar ise tahmin yapılmamış olsa da sırayla modellere öğretilir. Model
+    modülleri ilk istekte işçi iş parçacığında yüklenir, böylece açılışı
+    yavaşlatmaz.
+    """
+    
+    predictionReady = pyqtSignal(dict)  # En yeni isteğin sonucu
+    predictionFailed = pyqtSignal(str)  # Hata mesajı
+    _finished = pyqtSignal(int, object, object)  # (nesil, sonuç, hata) - işçiden
+    
+    def __init__(self, model_keys=DEFAULT_MODELS, parent=None):
+        """
+        Inicializasyon
+        
+        Args:
+            model_keys (iterable): Çalıştırılacak modellerin kısa adları
+                                   (models.registry) veya hazır bir Ensemble
+            parent (QObject, optional): Üst nesne
+        """
+        super().__init__(parent)
+        if isinstance(model_keys, Ensemble):
+            self.ensemble = model_keys
+            self.model_keys = None
+        else:
+            self.ensemble = None  # İlk istekte oluşturulur
+            self.model_keys = tuple(model_keys)
+        self.generation = 0       # Son isteğin nesli
+        self.last_result = None   # Arayüze iletilen son sonuç
+        self.predicted_at = None  # Son tahminin yapıldığı (geçmiş, el sayısı) - işçi tarafı
+        self.observed_at = None   # Modellere öğretilen (geçmiş, el sayısı) - işçi tarafı
+        self.model_states = None  # Modeller yüklenince geri yüklenecek durumlar
+        
+        # Modeller yalnızca bu havuzun tek iş parçacığında kullanılır
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        
+        # İşçiden gelen sinyal arayüz iş parçacığında kuyruklu olarak işlenir
+        self._finished.connect(self._onFinished)
+        
+        # Uygulama kapanırken çalışan işçi beklenir
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+    
+    def submit(self, matrix, history):
+        """
+        Yeni bir tahmin isteği gönder
+        
+        Args:
+            matrix (list): 5x5 matris (2D liste)
+            history (list): Yalnızca sonuna ekleme yapılan oyun sonuçları geçmişi
+                            (ör. Game.history); modellere son CONTEXT_SIZE sonuç verilir
+            
+        Returns:
+            int: İsteğin nesli
+        """
+        self.generation += 1
+        matrix = [list(row) for row in matrix]
+        self.pool.start(_InferenceJob(self, self.generation, matrix, history))
+        return self.generation
+    
+    def getEnsemble(self):
+        """
+        Model topluluğunu döndür, henüz yoksa modelleri yükleyip oluştur
+        
+        Yalnızca işçi iş parçacığından çağrılmalıdır.
+        
+        Returns:
+            Ensemble: Model topluluğu
+        """
+        if self.ensemble is None:
+            ensemble = Ensemble(create_models(self.model_keys))
+            if self.model_states is not None:
+                restore_models(ensemble.models, self.model_states)
+                self.model_states = None
+            self.ensemble = ensemble
+        return self.ensemble
+    
+    def observeHistory(self, history, hands=None):
+        """
+        Son öğretilen sonuçtan bu yana geçmişe eklenen sonuçları modellere öğret
+        
+        Geçmiş (liste nesnesi) değiştiyse, ör. oturum yeniden yüklendiyse,
+        yeni geçmiş baştan öğretilir. Yalnızca işçi iş parçacığından veya
+        havuz boşken çağrılmalıdır.
+        
+        Args:
+            history (list): Yalnızca sonuna ekleme yapılan oyun sonuçları geçmişi
+            hands (int, optional): Öğretilecek el sayısı (varsayılan: geçmişin boyu)
+            
+        Returns:
+            int: Öğretilen sonuç sayısı
+        """
+        if hands is None:
+            hands = len(history)
+        observed_at = self.observed_at
+        start = observed_at[1] if observed_at is not None and observed_at[0] is history else 0
+        if start >= hands:
+            return 0
+            
+        count = self.getEnsemble().observe(history, start, hands)
+        self.observed_at = (history, hands)
+        return count
+    
+    def captureModels(self, timeout_ms=2000, history=None):
+        """
+        Model durumlarını anlık görüntü için topla
+        
+        Modeller işçide değişirken okunmasın diye çalışan ve bekleyen istekler
+        önce beklenir. Modeller henüz yüklenmediyse geri yüklenmeyi bekleyen
+        durumlar döndürülür.
+        
+        Args:
+            timeout_ms (int): En fazla bekleme süresi (milisaniye)
+            history (list, optional): Oyun geçmişi; henüz bir isteğe girmemiş
+                                      sonuçlar da önce modellere öğretilir
+            
+        Returns:
+            dict: Model adı -> model durumu (işçi zamanında bitmediyse None)
+        """
+        if not self.pool.waitForDone(timeout_ms):
+            return None
+        if self.ensemble is None:
+            return self.model_states
+        if history is not None:
+            self.observeHistory(history)
+        return capture_models(self.ensemble.models)
+    
+    def restoreModels(self, states, timeout_ms=2000, history=None):
+        """
+        Model durumlarını geri yükle (modeller henüz yüklenmediyse ilk istekte)
+        
+        Args:
+            states (dict): captureModels() ile alınmış durumlar
+            timeout_ms (int): Çalışan isteği en fazla bekleme süresi (milisaniye)
+            history (list, optional): Durumların karşılık geldiği oyun geçmişi;
+                                      modeller yalnızca bundan sonra eklenen
+                                      sonuçlarla beslenir
+            
+        Returns:
+            list: Geri yüklenemeyen model adları
+        """
+        if not isinstance(states, dict):
+            raise TypeError("Model durumları sözlük olmalı")
+            
+        self.pool.waitForDone(timeout_ms)
+        self.predicted_at = None
+        self.observed_at = (history, len(history)) if history is not None and states else None
+        if self.ensemble is None:
+            self.model_states = states
+            return []
+        return restore_models(self.ensemble.models, states)
+    
+    def isStale(self, generation):
+        """
+        Verilen neslin daha yeni bir istekle geçersiz kalıp kalmadığını döndür
+        
+        Args:
+            generation (int): İstek nesli
+            
+        Returns:
+            bool: Daha yeni bir istek varsa True
+        """
+        return generation != self.generation
+    
+    def _onFinished(self, generation, result, error):
+        """İşçi sonucunu yalnızca en yeni istek içinse ilet"""
+        if self.isStale(generation):
+            return
+            
+        if error is not None:
+            self.predictionFailed.emit(error)
+            return
+            
+        result['generation'] = generation
+        self.last_result = result
+        self.predictionReady.emit(result)
+    
+    def shutdown(self, timeout_ms=2000):
+        """
+        Bekleyen istekleri iptal et ve çalışan işçiyi bekle
+        
+        Args:
+            timeout_ms (int): En fazla bekleme süresi (milisaniye)
+            
+        Returns:
+            bool: İşçi zamanında bittiyse True
+        """
+        self.generation += 1
+        self.pool.clear()
+        return self.pool.waitForDone(timeout_ms)
+
+
+class _InferenceJob(QRunnable):
+    """Tek bir tahmin isteğini çalıştıran işçi görevi"""
+    
+    def __init__(self, pipeline, generation, matrix, history):
+        super().__init__()
+        self.pipeline = pipeline
+        self.generation = generation
+        self.matrix = matrix
+        self.history = history  # Arayüzdeki geçmiş (işçide yalnızca okunur)
+        self.hands = len(history)
+        self.context = history[-CONTEXT_SIZE:]
+    
+    def run(self):
+        """Modelleri değerlendir ve istek hâlâ güncelse tahmin yap"""
+        pipeline = self.pipeline
+        result = None
+        error = None
+        
+        try:
+            ensemble = pipeline.getEnsemble()
+            
+            # Aradaki istekler atlanmış olsa da son tahmin, ardından gelen ilk sonuçla
+            # değerlendirilir (geçmiş yeniden yüklendiyse değerlendirilmez)
+            evaluated = False
+            predicted_at = pipeline.predicted_at
+            if (predicted_at is not None and predicted_at[0] is self.history
+                    and predicted_at[1] < self.hands):
+                evaluated = ensemble.add_result(self.history[predicted_at[1]])
+                
+            # Son istekten bu yana gelen tüm sonuçlar (yalnızca ilki değerlendirilir)
+            # sırayla modellere öğretilir
+            pipeline.observeHistory(self.history, self.hands)
+            
+            # Daha yeni bir istek geldiyse tahmin yapmaya gerek yok
+            if pipeline.isStale(self.generation):
+                return
+                
+            result = ensemble.predict(self.matrix, self.context)
+            pipeline.predicted_at = (self.history, self.hands)
+            
+            # Yeni bir el değerlendirildiyse kayan başarı oranları da gönderilir
+            result['evaluated'] = evaluated
+            if evaluated:
+                result['window_accuracy'] = ensemble.get_window_accuracy()
+        except Exception as e:
+            error = f"Tahmin sırasında bir hata oluştu: {e}"
+            
+        pipeline._finished.emit(self.generation, result, error)
+
+
+class SharedInferencePool(QObject):
+    """
+    Birden fazla masanın tahmin isteklerini tek bir sınırlı iş parçacığı
+    havuzunda adil sırayla çalıştıran zamanlayıcı
+    
+    Her anahtar (masa) için aynı anda en fazla bir görev çalışır ve en fazla
+    bir görev bekler; yeni istek bekleyen görevin yerini alır, böylece eski
+    istekler hiç çalıştırılmaz ve kuyruk masa sayısıyla sınırlı kalır. Bekleyen
+    masalar geliş sırasına göre dönüşümlü (round-robin) çalıştırılır: işi biten
+    masa yeni isteği varsa kuyruğun sonuna geçer, yoğun bir masa diğerlerini
+    bekletemez.
+    """
+    
+    predictionReady = pyqtSignal(object, dict)  # (anahtar, sonuç)
+    predictionFailed = pyqtSignal(object, str)  # (anahtar, hata mesajı)
+    _finished = pyqtSignal(object, object, object)  # (anahtar, sonuç, hata) - işçiden
+    
+    def __init__(self, max_workers=DEFAULT_POOL_WORKERS, parent=None):
+        """
+        Inicializasyon
+        
+        Args:
+            max_workers (int): En fazla eşzamanlı görev (iş parçacığı) sayısı
+            parent (QObject, optional): Üst nesne
+        """
+        super().__init__(parent)
+        self.max_workers = max(1, max_workers)
+        self.pending = {}      # Anahtar -> bekleyen görev
+        self.queue = deque()   # Çalışmayı bekleyen anahtarlar (geliş sırasıyla)
+        self.running = set()   # Görevi çalışan anahtarlar
+        self.closed = False
+        
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(self.max_workers)
+        
+        # İşçiden gelen sinyal arayüz iş parçacığında kuyruklu olarak işlenir
+        self._finished.connect(self._onFinished)
+        
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+    
+    def submit(self, key, task):
+        """
+        Bir anahtar için yeni görev gönder
+        
+        Args:
+            key (hashable): Görev sahibi (ör. masa sırası)
+            task (callable): İşçide çalıştırılacak, sonuç sözlüğü döndüren fonksiyon
+        """
+        if self.closed:
+            return
+            
+        # Anahtar zaten bekliyorsa yalnızca görevi güncellenir (sırası korunur);
+        # çalışıyorsa görev bittiğinde kuyruğa alınır
+        if key not in self.pending and key not in self.running:
+            self.queue.append(key)
+        self.pending[key] = task
+        self._dispatch()
+    
+    def queuedCount(self):
+        """
+        Çalışmayı bekleyen görev sayısı
+        
+        Returns:
+            int: Bekleyen görev sayısı
+        """
+        return len(self.pending)
+    
+    def _dispatch(self):
+        """Boş iş parçacığı oldukça sıradaki anahtarların görevlerini başlat"""
+        while self.queue and len(self.running) < self.max_workers:
+            key = self.queue.popleft()
+            task = self.pending.pop(key)
+            self.running.add(key)
+            self.pool.start(_PoolJob(self, key, task))
+    
+    def _onFinished(self, key, result, error):
+        """Görev bittiğinde sonucu ilet ve sıradaki görevleri başlat"""
+        self.running.discard(key)
+        if self.closed:
+            return
+            
+        if key in self.pending:
+            self.queue.append(key)
+            
+        if error is not None:
+            self.predictionFailed.emit(key, error)
+        else:
+            self.predictionReady.emit(key, result)
+        self._dispatch()
+    
+    def shutdown(self, timeout_ms=2000):
+        """
+        Bekleyen görevleri iptal et ve çalışan görevleri bekle
+        
+        Args:
+            timeout_ms (int): En fazla bekleme süresi (milisaniye)
+            
+        Returns:
+            bool: Görevler zamanında bittiyse True
+        """
+        self.closed = True
+        self.pending.clear()
+        self.queue.clear()
+        self.pool.clear()
+        return self.pool.waitForDone(timeout_ms)
+
+
+class _PoolJob(QRunnable):
+    """Paylaşılan havuzda tek bir görevi çalıştıran işçi"""
+    
+    def __init__(self, owner, key, task):
+        super().__init__()
+        self.owner = owner
+        self.key = key
+        self.task = task
+    
+    def run(self):
+        """Görevi çalıştır ve sonucu arayüz iş parçacığına gönder"""
+        result = None
+        error = None
+        
+        try:
+            result = self.task()
+        except Exception as e:
+            error = f"Tahmin sırasında bir hata oluştu: {e}"
+            
+        self.owner._finished.emit(self.key, result, error)
\ No newline at end of file
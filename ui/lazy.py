@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+İlk gösterildiğinde oluşturulan paneller
+"""
+
+from PyQt5.QtWidgets import QWidget, QVBoxLayout
+from PyQt5.QtCore import pyqtSignal
+
+
+class LazyPanel(QWidget):
+    """İçeriğini yalnızca ilk gösterildiğinde fabrika fonksiyonuyla oluşturan kap"""
+    
+    created = pyqtSignal(QWidget)  # İçerik oluşturulduğunda
+    
+    def __init__(self, factory, parent=None):
+        """
+        Inicializasyon
+        
+        Args:
+            factory (callable): İçerik widget'ını döndüren fonksiyon
+            parent (QWidget, optional): Üst widget
+        """
+        super().__init__(parent)
+        self.factory = factory
+        self.widget = None  # İlk gösterimde oluşturulur
+        
+        self.content_layout = QVBoxLayout(self)
+        self.content_layout.setContentsMargins(0, 0, 0, 0)
+    
+    def ensureWidget(self):
+        """
+        İçeriği henüz yoksa oluştur
+        
+        Returns:
+            QWidget: İçerik widget'ı
+        """
+        if self.widget is None:
+            self.widget = self.factory()
+            self.content_layout.addWidget(self.widget)
+            self.created.emit(self.widget)
+        return self.widget
+    
+    def showEvent(self, event):
+        """Panel ilk kez gösterilirken içeriği oluştur"""
+        self.ensureWidget()
+        super().showEvent(event)
\ No newline at end of file
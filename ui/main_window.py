@@ -1,244 +1,706 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                            QPushButton, QLabel, QGroupBox, QSplitter, QFrame,
-                            QMessageBox, QFileDialog)
-from PyQt5.QtCore import Qt, QSize
-from PyQt5.QtGui import QIcon, QFont
-
-from ui.matrix_widget import MatrixWidget
-from ui.stats_widget import StatsWidget
-from ui.styles import (APP_STYLE, PLAYER_BTN_STYLE, BANKER_BTN_STYLE, 
-                      ACTION_BTN_STYLE, BACKGROUND_DARK)
-
-import os
-import json
-
-class MainWindow(QMainWindow):
-    """Baccarat tahmin uygulaması ana pencere sınıfı"""
-    
-    def __init__(self):
-        super().__init__()
-        self.history = []  # Matris durumu geçmişi
-        self.current_step = -1  # Geçerli adım
-        self.player_count = 0
-        self.banker_count = 0
-        self.tie_count = 0
-        
-        self._initUI()  # Metod ismi düzeltildi
-        self.setWindowTitle("Baccarat Tahmin Uygulaması")
-        self.setMinimumSize(800, 600)
-        self.setStyleSheet(APP_STYLE)
-    
-    def _initUI(self):
-        """Kullanıcı arayüzünü oluştur"""
-        # Ana widget
-        main_widget = QWidget()
-        main_layout = QHBoxLayout(main_widget)
-        main_layout.setContentsMargins(10, 10, 10, 10)
-        main_layout.setSpacing(10)
-        
-        # Sol Panel (Matris ve Butonlar)
-        left_panel = QWidget()
-        left_layout = QVBoxLayout(left_panel)
-        left_layout.setContentsMargins(0, 0, 0, 0)
-        left_layout.setSpacing(10)
-        
-        # Matris Grubu
-        matrix_group = QGroupBox("Tahmin Matrisi")
-        matrix_layout = QVBoxLayout(matrix_group)
-        
-        # Matris Widget'ı
-        self.matrix_widget = MatrixWidget()
-        self.matrix_widget.cellClicked.connect(self.onMatrixCellClicked)
-        matrix_layout.addWidget(self.matrix_widget)
-        
-        left_layout.addWidget(matrix_group, 5)  # 5 birim genişliğinde
-        
-        # Buton Paneli
-        button_panel = QWidget()
-        button_layout = QVBoxLayout(button_panel)
-        button_layout.setContentsMargins(0, 0, 0, 0)
-        button_layout.setSpacing(10)
-        
-        # İşlem Butonları
-        action_layout = QHBoxLayout()
-        
-        self.undo_btn = QPushButton("GERİ AL")
-        self.undo_btn.setStyleSheet(ACTION_BTN_STYLE)
-        self.undo_btn.clicked.connect(self.onUndoClicked)
-        self.undo_btn.setEnabled(False)
-        
-        self.clear_btn = QPushButton("TEMİZLE")
-        self.clear_btn.setStyleSheet(ACTION_BTN_STYLE)
-        self.clear_btn.clicked.connect(self.onClearClicked)
-        
-        self.save_btn = QPushButton("KAYDET")
-        self.save_btn.setStyleSheet(ACTION_BTN_STYLE)
-        self.save_btn.clicked.connect(self.onSaveClicked)
-        
-        action_layout.addWidget(self.undo_btn)
-        action_layout.addWidget(self.clear_btn)
-        action_layout.addWidget(self.save_btn)
-        
-        button_layout.addLayout(action_layout)
-        
-        # Tahmin Butonları
-        prediction_layout = QHBoxLayout()
-        
-        self.player_btn = QPushButton("PLAYER")
-        self.player_btn.setStyleSheet(PLAYER_BTN_STYLE)
-        self.player_btn.setFixedHeight(50)
-        self.player_btn.clicked.connect(lambda: self.onPredictionButtonClicked('P'))
-        
-        self.banker_btn = QPushButton("BANKER")
-        self.banker_btn.setStyleSheet(BANKER_BTN_STYLE)
-        self.banker_btn.setFixedHeight(50)
-        self.banker_btn.clicked.connect(lambda: self.onPredictionButtonClicked('B'))
-        
-        prediction_layout.addWidget(self.player_btn)
-        prediction_layout.addWidget(self.banker_btn)
-        
-        button_layout.addLayout(prediction_layout)
-        
-        left_layout.addWidget(button_panel, 1)  # 1 birim genişliğinde
-        
-        # Sağ Panel (İstatistikler)
-        self.stats_widget = StatsWidget()
-        
-        # Ana düzene panelleri ekle
-        main_layout.addWidget(left_panel, 1)  # 1 birim genişliğinde
-        main_layout.addWidget(self.stats_widget, 1)  # 1 birim genişliğinde
-        
-        self.setCentralWidget(main_widget)
-        
-        # Başlangıç istatistikleri
-        self.stats_widget.updateGameStats(self.player_count, self.banker_count, self.tie_count)
-    
-    def onMatrixCellClicked(self, row, col):
-        """Matris hücresine tıklandığında"""
-        current_value = self.matrix_widget.getCellValue(row, col)
-        
-        # Değeri döngüsel olarak değiştir: None -> P -> B -> None
-        if current_value is None:
-            new_value = 'P'
-            self.player_count += 1
-        elif current_value == 'P':
-            new_value = 'B'
-            self.player_count -= 1
-            self.banker_count += 1
-        else:  # 'B'
-            new_value = None
-            self.banker_count -= 1
-        
-        # Hücreyi güncelle
-        self.matrix_widget.setCellValue(row, col, new_value)
-        
-        # İstatistikleri güncelle
-        self.stats_widget.updateGameStats(self.player_count, self.banker_count, self.tie_count)
-        
-        # Geçmişe durumu kaydet
-        self.saveStateToHistory()
-    
-    def onPredictionButtonClicked(self, prediction):
-        """Prediction butonlarından birine tıklandığında"""
-        # Tahmini belirle
-        self.stats_widget.setPrediction(prediction, 85)  # Güven değeri şimdilik sabit
-        
-        # Geçmişe ekle
-        self.stats_widget.addToHistory(prediction)
-        
-        # Gerçek uygulamada, burada model tahmini ve güncellemesi yapılır
-        QMessageBox.information(self, "Tahmin", 
-            f"{'PLAYER' if prediction == 'P' else 'BANKER'} tahmini yapıldı!")
-    
-    def onUndoClicked(self):
-        """Geri al butonuna tıklandığında"""
-        if self.current_step > 0:
-            self.current_step -= 1
-            state = self.history[self.current_step]
-            
-            # Oyun sayılarını sıfırla ve yeni duruma göre hesapla
-            self.player_count = 0
-            self.banker_count = 0
-            
-            # Matrisi önceki duruma getir
-            self.matrix_widget.setMatrixState(state)
-            
-            # P ve B sayılarını tekrar say
-            for row in range(5):
-                for col in range(5):
-                    value = self.matrix_widget.getCellValue(row, col)
-                    if value == 'P':
-                        self.player_count += 1
-                    elif value == 'B':
-                        self.banker_count += 1
-            
-            # İstatistikleri güncelle
-            self.stats_widget.updateGameStats(self.player_count, self.banker_count, self.tie_count)
-            
-            # Buton durumunu güncelle
-            self.undo_btn.setEnabled(self.current_step > 0)
-    
-    def onClearClicked(self):
-        """Temizle butonuna tıklandığında"""
-        reply = QMessageBox.question(self, 'Temizle',
-            "Matrisi temizlemek istediğinize emin misiniz?",
-            QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
-        
-        if reply == QMessageBox.Yes:
-            # Matrisi temizle
-            self.matrix_widget.clearMatrix()
-            
-            # Sayaçları sıfırla
-            self.player_count = 0
-            self.banker_count = 0
-            
-            # İstatistikleri güncelle
-            self.stats_widget.updateGameStats(self.player_count, self.banker_count, self.tie_count)
-            
-            # Geçmişi temizle
-            self.history = []
-            self.current_step = -1
-            self.saveStateToHistory()  # Boş durumu kaydet
-            
-            # Buton durumunu güncelle
-            self.undo_btn.setEnabled(False)
-    
-    def onSaveClicked(self):
-        """Kaydet butonuna tıklandığında"""
-        filename, _ = QFileDialog.getSaveFileName(self, "Matrisi Kaydet", 
-                                                  os.path.expanduser("~/Desktop/baccarat_matrix.json"),
-                                                  "JSON Dosyaları (*.json)")
-        
-        if filename:
-            try:
-                # Mevcut durumu al
-                state = self.matrix_widget.getMatrixState()
-                
-                # JSON dosyasına kaydet
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(state, f)
-                
-                QMessageBox.information(self, "Kaydedildi", 
-                    f"Matris başarıyla kaydedildi:\n{filename}")
-            except Exception as e:
-                QMessageBox.warning(self, "Hata", 
-                    f"Kaydetme sırasında bir hata oluştu:\n{str(e)}")
-    
-    def saveStateToHistory(self):
-        """Mevcut matrisi geçmişe kaydet"""
-        current_state = self.matrix_widget.getMatrixState()
-        
-        # Eğer geri alınmış bir durumdan sonra değişiklik yapıldıysa
-        # o noktadan sonraki geçmişi sil
-        if self.current_step < len(self.history) - 1:
-            self.history = self.history[:self.current_step + 1]
-        
-        # Yeni durumu ekle
-        self.history.append(current_state)
-        self.current_step = len(self.history) - 1
-        
-        # Geri al butonunu etkinleştir
-        self.undo_btn.setEnabled(self.current_step > 0)
\ No newline at end of file
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
+                            QPushButton, QGroupBox, QMessageBox, QFileDialog,
+                            QShortcut, QTabWidget)
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QKeySequence
+
+from ui.matrix_widget import MatrixWidget
+from ui.stats_widget import StatsWidget
+from ui.inference import InferencePipeline
+from ui.startup import FirstPaintWatcher
+from ui.lazy import LazyPanel
+from ui.styles import (APP_STYLE, PLAYER_BTN_STYLE, BANKER_BTN_STYLE, 
+                      ACTION_BTN_STYLE)
+from core.snapshot import Snapshot, encode_matrix, decode_matrix
+from core.undo import UndoStack, DEFAULT_UNDO_DEPTH, apply_changes
+from core.roads import Roads
+from core.game import Game, MatrixAnalyzer
+from core.history import History
+from core.events import EventBus, QUEUED, ResultAdded, MatrixChanged, PredictionReady
+from core.metrics import REGISTRY
+from models.registry import DEFAULT_MODELS
+
+import os
+import json
+import time
+
+# Periyodik anlık görüntü kaydı aralığı (milisaniye)
+SNAPSHOT_INTERVAL_MS = 60 * 1000
+
+# Matris grubu başlığı (klavye giriş modunda mod bilgisi eklenir)
+MATRIX_TITLE = "Tahmin Matrisi"
+
+# Bekleyen girişlerin arayüze uygulanma aralığı (milisaniye, ~60 kare/sn)
+ENTRY_FLUSH_MS = 16
+
+# Sonuç akışından okuma ve durum satırını güncelleme aralıkları
+INGEST_POLL_MS = ENTRY_FLUSH_MS
+INGEST_STATUS_INTERVAL = 1.0  # saniye
+INGEST_STATUS_PREFIX = "Akış:"
+
+# Kuyruk boşaltma ve olay teslimi süreleri
+FLUSH_SECONDS = REGISTRY.histogram('baccarat_ui_flush_seconds',
+                                   "Bekleyen girişlerin arayüze uygulanma süresi").labels()
+DISPATCH_SECONDS = REGISTRY.histogram('baccarat_ui_event_dispatch_seconds',
+                                      "Biriken olayların teslim süresi").labels()
+
+class MainWindow(QMainWindow):
+    """Baccarat tahmin uygulaması ana pencere sınıfı"""
+    
+    def __init__(self, snapshot=None, undo_depth=DEFAULT_UNDO_DEPTH, model_keys=DEFAULT_MODELS,
+                 profiler=None, ingestor=None, history=None):
+        """
+        Inicializasyon
+        
+        Args:
+            snapshot (Snapshot, optional): Sıcak başlangıç için anlık görüntü dosyası
+            undo_depth (int): En fazla geri alınabilir işlem sayısı
+            model_keys (iterable): Çalıştırılacak modeller (models.registry kısa adları)
+            profiler (StartupProfiler, optional): Açılış aşamalarını ölçen profilleyici
+            ingestor (Ingestor, optional): Sonuçların okunacağı akış (pencere kapanınca durdurulur)
+            history (History, optional): Girilen sonuçların ve gösterilen tahminlerin kaydı
+        """
+        super().__init__()
+        self.profiler = profiler
+        self.started = False  # Anlık görüntü yüklendi mi
+        self.undo_stack = UndoStack(undo_depth)  # Hücre değişikliği (delta) geçmişi
+        self.game = Game()  # Girilen sonuçlar ve sayaçlar (elle düzenlemeler sayaçlara işlenir)
+        self.history = history if history is not None else History()
+        self.snapshot = snapshot if snapshot is not None else Snapshot()
+        self.roads = Roads()  # Skor tablosu yolları (matris geçmişinden)
+        self.roads_widget = None  # Yollar sekmesi ilk açıldığında oluşturulur
+        
+        # Hızlı girişler kuyrukta biriktirilir ve kare başına en fazla bir kez uygulanır
+        self.pending_cells = {}  # (satır, sütun) -> (yeni değer, elle düzenleme mi)
+        self.pending_results = 0  # Matrise henüz uygulanmamış girilen sonuçlar
+        self.keyboard_entry = False  # P/B/T tuşlarıyla giriş modu
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(ENTRY_FLUSH_MS)
+        self.flush_timer.timeout.connect(self.flushPending)
+        
+        # Akıştan gelen sonuçlar klavye girişiyle aynı kuyruktan geçer
+        self.ingestor = ingestor
+        self.ingest_status_at = 0.0
+        self.ingest_timer = QTimer(self)
+        self.ingest_timer.setInterval(INGEST_POLL_MS)
+        self.ingest_timer.timeout.connect(self.pollIngest)
+        
+        # Tahminler arayüz iş parçacığı dışında çalışır (modeller ilk istekte yüklenir)
+        self.inference = InferencePipeline(model_keys, self)
+        self.inference.predictionReady.connect(self.onPredictionReady)
+        self.inference.predictionFailed.connect(self.onPredictionFailed)
+        
+        # Giriş yolu yalnızca olay yayınlar; arayüz güncellemeleri olay döngüsünün
+        # bir sonraki turunda toplu olarak yapılır
+        self.event_timer = QTimer(self)
+        self.event_timer.setSingleShot(True)
+        self.event_timer.setInterval(0)
+        self.events = EventBus(wakeup=self.event_timer.start)
+        self.event_timer.timeout.connect(self.dispatchEvents)
+        self._registerMetrics()
+        
+        self._initUI()  # Metod ismi düzeltildi
+        self._subscribeEvents()
+        self.setWindowTitle("Baccarat Tahmin Uygulaması")
+        self.setMinimumSize(800, 600)
+        self.setStyleSheet(APP_STYLE)
+        self._markStartup("arayüz bileşenleri")
+        
+        # Önceki oturumun yüklenmesi ve ilk tahmin matrisin ilk çiziminden sonraya bırakılır
+        self.snapshot_timer = QTimer(self)
+        self.snapshot_timer.timeout.connect(self.saveSnapshot)
+        self.first_paint_watcher = FirstPaintWatcher(self.matrix_widget)
+        self.first_paint_watcher.firstPaint.connect(self._finishStartup)
+    
+    def _finishStartup(self):
+        """Açılışın ilk çizim için gerekmeyen kısmını tamamla"""
+        self.restoreSnapshot()
+        self.started = True
+        self._markStartup("anlık görüntü yükleme")
+        
+        self.requestPrediction()
+        self.updateRoads(self.game.history)
+        self.snapshot_timer.start(SNAPSHOT_INTERVAL_MS)
+        
+        # Akış, önceki oturum yüklendikten sonra okunmaya başlar
+        if self.ingestor is not None:
+            self.ingestor.start()
+            self.ingest_timer.start()
+    
+    def _markStartup(self, phase):
+        """Açılış profilleyicisi varsa aşamayı kaydet"""
+        if self.profiler is not None:
+            self.profiler.mark(phase)
+    
+    def _initUI(self):
+        """Kullanıcı arayüzünü oluştur"""
+        # Ana widget
+        main_widget = QWidget()
+        main_layout = QHBoxLayout(main_widget)
+        main_layout.setContentsMargins(10, 10, 10, 10)
+        main_layout.setSpacing(10)
+        
+        # Sol Panel (Matris ve Butonlar)
+        left_panel = QWidget()
+        left_layout = QVBoxLayout(left_panel)
+        left_layout.setContentsMargins(0, 0, 0, 0)
+        left_layout.setSpacing(10)
+        
+        # Matris Grubu
+        self.matrix_group = QGroupBox(MATRIX_TITLE)
+        matrix_layout = QVBoxLayout(self.matrix_group)
+        
+        # Matris Widget'ı
+        self.matrix_widget = MatrixWidget()
+        self.matrix_widget.cellClicked.connect(self.onMatrixCellClicked)
+        matrix_layout.addWidget(self.matrix_widget)
+        
+        # Yollar sekmesi ilk gösterildiğinde oluşturulur (açılışı yavaşlatmaz)
+        self.board_tabs = QTabWidget()
+        self.board_tabs.addTab(self.matrix_group, "Matris")
+        self.board_tabs.addTab(LazyPanel(self._createRoadsPanel), "Yollar")
+        
+        left_layout.addWidget(self.board_tabs, 5)  # 5 birim genişliğinde
+        
+        # Buton Paneli
+        button_panel = QWidget()
+        button_layout = QVBoxLayout(button_panel)
+        button_layout.setContentsMargins(0, 0, 0, 0)
+        button_layout.setSpacing(10)
+        
+        # İşlem Butonları
+        action_layout = QHBoxLayout()
+        
+        self.undo_btn = QPushButton("GERİ AL")
+        self.undo_btn.setStyleSheet(ACTION_BTN_STYLE)
+        self.undo_btn.clicked.connect(self.onUndoClicked)
+        self.undo_btn.setEnabled(False)
+        
+        self.redo_btn = QPushButton("YİNELE")
+        self.redo_btn.setStyleSheet(ACTION_BTN_STYLE)
+        self.redo_btn.clicked.connect(self.onRedoClicked)
+        self.redo_btn.setEnabled(False)
+        
+        # Klavye kısayolları (Ctrl+Z / Ctrl+Y)
+        QShortcut(QKeySequence.Undo, self, self.onUndoClicked)
+        QShortcut(QKeySequence.Redo, self, self.onRedoClicked)
+        
+        # Klavye giriş modu (F2 ile açılır): P / B / T sonuç girer
+        QShortcut(QKeySequence(Qt.Key_F2), self, self.toggleKeyboardEntry)
+        self.entry_shortcuts = []
+        for key, result in ((Qt.Key_P, 'P'), (Qt.Key_B, 'B'), (Qt.Key_T, 'T')):
+            shortcut = QShortcut(QKeySequence(key), self)
+            shortcut.activated.connect(lambda result=result: self.queueResult(result))
+            shortcut.setEnabled(False)
+            self.entry_shortcuts.append(shortcut)
+            
+        self.clear_btn = QPushButton("TEMİZLE")
+        self.clear_btn.setStyleSheet(ACTION_BTN_STYLE)
+        self.clear_btn.clicked.connect(self.onClearClicked)
+        
+        self.save_btn = QPushButton("KAYDET")
+        self.save_btn.setStyleSheet(ACTION_BTN_STYLE)
+        self.save_btn.clicked.connect(self.onSaveClicked)
+        
+        action_layout.addWidget(self.undo_btn)
+        action_layout.addWidget(self.redo_btn)
+        action_layout.addWidget(self.clear_btn)
+        action_layout.addWidget(self.save_btn)
+        
+        button_layout.addLayout(action_layout)
+        
+        # Tahmin Butonları
+        prediction_layout = QHBoxLayout()
+        
+        self.player_btn = QPushButton("PLAYER")
+        self.player_btn.setStyleSheet(PLAYER_BTN_STYLE)
+        self.player_btn.setFixedHeight(50)
+        self.player_btn.clicked.connect(lambda: self.onPredictionButtonClicked('P'))
+        
+        self.banker_btn = QPushButton("BANKER")
+        self.banker_btn.setStyleSheet(BANKER_BTN_STYLE)
+        self.banker_btn.setFixedHeight(50)
+        self.banker_btn.clicked.connect(lambda: self.onPredictionButtonClicked('B'))
+        
+        prediction_layout.addWidget(self.player_btn)
+        prediction_layout.addWidget(self.banker_btn)
+        
+        button_layout.addLayout(prediction_layout)
+        
+        left_layout.addWidget(button_panel, 1)  # 1 birim genişliğinde
+        
+        # Sağ Panel (İstatistikler)
+        self.stats_widget = StatsWidget()
+        
+        # Ana düzene panelleri ekle
+        main_layout.addWidget(left_panel, 1)  # 1 birim genişliğinde
+        main_layout.addWidget(self.stats_widget, 1)  # 1 birim genişliğinde
+        
+        self.setCentralWidget(main_widget)
+        
+        # Başlangıç istatistikleri
+        self.updateGameStats()
+    
+    def _subscribeEvents(self):
+        """Oyun durumunu ve arayüz bileşenlerini olay yoluna bağla"""
+        events = self.events
+        
+        # Girilen sonuçlar oyuna ve kayda, elle yapılan hücre düzenlemeleri sayaçlara
+        # hemen işlenir (ucuz, senkron)
+        events.subscribe(ResultAdded, self.onResultAdded, name="oyun")
+        events.subscribe(MatrixChanged, self.onMatrixCounts, name="sayaçlar")
+        
+        # Arayüz ve tahmin istekleri, aynı turda gelen değişiklikler için bir kez çalışır
+        events.subscribe(MatrixChanged, self.onGameStatsChanged, QUEUED, batch=True,
+                         name="oyun istatistikleri")
+        events.subscribe(MatrixChanged, lambda events: self.requestPrediction(), QUEUED,
+                         batch=True, name="tahmin isteği")
+        events.subscribe(MatrixChanged, lambda events: self.updateRoads(self.game.history),
+                         QUEUED, batch=True, name="yollar")
+        events.subscribe(PredictionReady, self.onPredictionsReady, QUEUED, batch=True,
+                         name="tahmin paneli")
+    
+    def _createRoadsPanel(self):
+        """Skor tablosu yollarını gösteren paneli oluştur"""
+        from ui.roads_widget import RoadsWidget
+        
+        roads_group = QGroupBox("Skor Tablosu")
+        roads_layout = QVBoxLayout(roads_group)
+        self.roads_widget = RoadsWidget(self.roads)
+        roads_layout.addWidget(self.roads_widget)
+        roads_layout.addStretch()
+        return roads_group
+    
+    def onMatrixCellClicked(self, row, col):
+        """Matris hücresine tıklandığında"""
+        current_value = self.pendingValue(row, col)
+        
+        # Değeri döngüsel olarak değiştir: None -> P -> B -> None
+        if current_value is None:
+            new_value = 'P'
+        elif current_value == 'P':
+            new_value = 'B'
+        else:  # 'B'
+            new_value = None
+        
+        # Değişiklik bir sonraki karede geçmişe kaydedilip uygulanır
+        self.queueCells([(row, col, new_value)])
+        
+    def toggleKeyboardEntry(self):
+        """P / B / T tuşlarıyla sonuç giriş modunu aç veya kapat"""
+        self.keyboard_entry = not self.keyboard_entry
+        for shortcut in self.entry_shortcuts:
+            shortcut.setEnabled(self.keyboard_entry)
+        
+        # Mod matris başlığında gösterilir
+        if self.keyboard_entry:
+            self.matrix_group.setTitle(f"{MATRIX_TITLE} - Klavye Girişi: P / B / T (F2: kapat)")
+        else:
+            self.matrix_group.setTitle(MATRIX_TITLE)
+    
+    def pendingValue(self, row, col):
+        """Bekleyen girişler dahil hücrenin güncel değeri"""
+        if (row, col) in self.pending_cells:
+            return self.pending_cells[(row, col)][0]
+        return self.matrix_widget.getCellValue(row, col)
+    
+    def queueResult(self, result, source='klavye'):
+        """
+        Klavyeden veya akıştan girilen sonucu kuyruğa ekle
+        
+        Sonuç ResultAdded olarak yayınlanır ve oyuna eklenir. P ve B sonuçları
+        son dolu hücreden sonraki hücreye yazılır; matris doluysa sonuçlar bir
+        hücre kaydırılarak son 25 sonuç tutulur. Tie sonuçları matrise girmez.
+        
+        Args:
+            result (str): 'P', 'B' veya 'T'
+            source (str): Sonucun geldiği giriş
+        """
+        self.events.publish(ResultAdded(result, source))
+        self.pending_results += 1
+        if result == 'T':
+            self.scheduleFlush()
+            return
+            
+        rows, cols = self.matrix_widget.rows, self.matrix_widget.cols
+        values = [self.pendingValue(row, col) for row in range(rows) for col in range(cols)]
+        filled = [index for index, value in enumerate(values) if value is not None]
+        next_index = filled[-1] + 1 if filled else 0
+        
+        if next_index < len(values):
+            self.queueCells([(next_index // cols, next_index % cols, result)], edit=False)
+            return
+            
+        # Matris dolu: son 25 sonucu sola kaydır
+        history = [values[index] for index in filled] + [result]
+        matrix = MatrixAnalyzer.matrix_from_history(history)
+        self.queueCells([(row, col, matrix[row][col])
+                         for row in range(rows) for col in range(cols)
+                         if matrix[row][col] != values[row * cols + col]], edit=False)
+    
+    def pollIngest(self):
+        """
+        Akışta biriken sonuçları kuyruğa ekle ve durum satırını güncelle
+        
+        Her sonuç klavye girişi gibi ResultAdded olarak yayınlanır; oyuna ve
+        kayda eklenir, tahminler Game geçmişinden yapılır.
+        """
+        for record in self.ingestor.poll():
+            for result in record.results:
+                self.queueResult(result, 'akış')
+                
+        now = time.monotonic()
+        if now - self.ingest_status_at >= INGEST_STATUS_INTERVAL:
+            self.ingest_status_at = now
+            self.showIngestStatus()
+    
+    def showIngestStatus(self):
+        """Akış sayaçlarını ve tüketici gecikmesini durum satırında göster"""
+        # Hata mesajları süreleri dolana kadar ezilmez
+        current = self.statusBar().currentMessage()
+        if current and not current.startswith(INGEST_STATUS_PREFIX):
+            return
+            
+        metrics = self.ingestor.metrics()
+        text = (f"{INGEST_STATUS_PREFIX} {metrics['received']} el, bekleyen {metrics['lag']}, "
+                f"gecikme p95 {metrics['delivery']['p95_us'] / 1000:.1f} ms")
+        if metrics['errors']:
+            text += f", hatalı kayıt {metrics['errors']}"
+        self.statusBar().showMessage(text)
+    
+    def queueCells(self, cells, edit=True):
+        """
+        Hücre değişikliklerini bir sonraki kare için kuyruğa ekle
+        
+        Args:
+            cells (list): (satır, sütun, yeni değer) listesi
+            edit (bool): Elle düzenleme mi (False: girilen sonucun matrise yazılması)
+        """
+        for row, col, value in cells:
+            self.pending_cells[(row, col)] = (value, edit)
+        self.scheduleFlush()
+    
+    def scheduleFlush(self):
+        """Bekleyen girişleri uygulamak için zamanlayıcıyı (çalışmıyorsa) başlat"""
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+    
+    def flushPending(self):
+        """
+        Kuyruktaki girişleri matrise uygula
+        
+        Elle yapılan düzenlemeler tek bir geri alınabilir işlem olarak kaydedilir;
+        girilen sonuçlar oyun geçmişine eklendiğinden geri alma yığınına girmez.
+        İstatistikler ve tahmin isteği kare başına bir kez güncellenir.
+        """
+        start = time.perf_counter_ns()
+        self.flush_timer.stop()
+        cells, self.pending_cells = self.pending_cells, {}
+        results, self.pending_results = self.pending_results, 0
+        
+        edits = []
+        entries = []
+        for (row, col), (value, edit) in cells.items():
+            current = self.matrix_widget.getCellValue(row, col)
+            if current != value:
+                (edits if edit else entries).append((row, col, current, value))
+                
+        if edits:
+            self.undo_stack.push(edits)
+            self.applyCells(apply_changes(edits))
+        if entries or results:
+            self.applyCells(apply_changes(entries), results)
+        FLUSH_SECONDS.observe_ns(time.perf_counter_ns() - start)
+    
+    def dispatchEvents(self):
+        """Biriken olayları teslim et ve teslim süresini ölç"""
+        start = time.perf_counter_ns()
+        self.events.dispatch()
+        DISPATCH_SECONDS.observe_ns(time.perf_counter_ns() - start)
+    
+    def _registerMetrics(self):
+        """Bekleyen giriş ve olay sayılarını okuma anında hesaplanan göstergeler olarak kaydet"""
+        REGISTRY.gauge('baccarat_ui_pending_entries', "Uygulanmayı bekleyen hızlı girişler",
+                       function=lambda: len(self.pending_cells) + self.pending_results)
+        REGISTRY.gauge('baccarat_ui_pending_events', "Teslim edilmeyi bekleyen olaylar",
+                       function=lambda: sum(len(subscription.pending)
+                                            for subscription in self.events.subscriptions))
+    
+    def onPredictionButtonClicked(self, prediction):
+        """Prediction butonlarından birine tıklandığında"""
+        # Güven değeri: modellerin bu taraf için son birleşik olasılığı
+        confidence = None
+        result = self.inference.last_result
+        if result is not None:
+            banker_probability = result['banker_probability']
+            probability = banker_probability if prediction == 'B' else 1.0 - banker_probability
+            confidence = round(probability * 100)
+            
+        self.stats_widget.setPrediction(prediction, confidence)
+        
+        # Geçmişe ekle
+        self.stats_widget.addToHistory(prediction)
+        
+    def requestPrediction(self):
+        """Mevcut matris ve oyun geçmişi için arka planda yeni bir tahmin iste"""
+        # Geçmiş yalnızca sonuna ekleme yapılarak büyür; modeller her yeni sonuçla
+        # değerlendirilir (matris en fazla son 25 P/B sonucu gösterir)
+        self.inference.submit(self.matrix_widget.getMatrixState(), self.game.history)
+    
+    def updateRoads(self, history):
+        """
+        Skor tablosu yollarını geçmişle eşitle
+        
+        Args:
+            history (list): Oyun sonuçları geçmişi
+        """
+        self.roads.sync(history)
+        if self.roads_widget is not None:
+            self.roads_widget.refresh()
+    
+    def onPredictionReady(self, result):
+        """En yeni tahmin isteğinin sonucu geldiğinde"""
+        self.events.publish(PredictionReady(result))
+    
+    def onPredictionsReady(self, events):
+        """
+        Biriken tahmin sonuçlarını panele uygula
+        
+        Tahmin ve model tablosu yalnızca en son sonuçla güncellenir; başarı
+        grafiğine değerlendirilen her el eklenir.
+        
+        Args:
+            events (list): PredictionReady olayları
+        """
+        for event in events:
+            result = event.result
+            if result.get('evaluated'):
+                self.stats_widget.addAccuracySample(result['models'], result['window_accuracy'])
+                
+        result = events[-1].result
+        self.stats_widget.setPrediction(result['prediction'], round(result['confidence']))
+        self.stats_widget.updateModelStats(result['models'])
+    
+    def onPredictionFailed(self, message):
+        """Tahmin isteği hata verdiğinde"""
+        self.stats_widget.setPrediction(None)
+        self.statusBar().showMessage(message, 5000)
+    
+    def onUndoClicked(self):
+        """Geri al butonuna tıklandığında"""
+        self.flushPending()
+        changes = self.undo_stack.undo()
+        if changes is not None:
+            self.applyCells(apply_changes(changes, reverse=True))
+            
+    def onRedoClicked(self):
+        """Yinele butonuna tıklandığında"""
+        self.flushPending()
+        changes = self.undo_stack.redo()
+        if changes is not None:
+            self.applyCells(apply_changes(changes))
+    
+    def onClearClicked(self):
+        """Temizle butonuna tıklandığında"""
+        reply = QMessageBox.question(self, 'Temizle',
+            "Matrisi temizlemek istediğinize emin misiniz?",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        
+        if reply == QMessageBox.Yes:
+            self.flushPending()
+            
+            # Dolu hücreleri tek bir geri alınabilir işlem olarak temizle
+            matrix = self.matrix_widget.getMatrixState()
+            changes = [(row, col, value, None)
+                       for row, row_values in enumerate(matrix)
+                       for col, value in enumerate(row_values) if value is not None]
+            self.undo_stack.push(changes)
+            self.applyCells(apply_changes(changes))
+    
+    def onSaveClicked(self):
+        """Kaydet butonuna tıklandığında"""
+        filename, _ = QFileDialog.getSaveFileName(self, "Matrisi Kaydet", 
+                                                  os.path.expanduser("~/Desktop/baccarat_matrix.json"),
+                                                  "JSON Dosyaları (*.json)")
+        
+        if filename:
+            try:
+                # Mevcut durumu al
+                self.flushPending()
+                state = self.matrix_widget.getMatrixState()
+                
+                # JSON dosyasına kaydet
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(state, f)
+                
+                QMessageBox.information(self, "Kaydedildi", 
+                    f"Matris başarıyla kaydedildi:\n{filename}")
+            except Exception as e:
+                QMessageBox.warning(self, "Hata", 
+                    f"Kaydetme sırasında bir hata oluştu:\n{str(e)}")
+    
+    def captureState(self):
+        """
+        Uygulama durumunu anlık görüntü için topla
+        
+        Returns:
+            dict: Matris, geri alma yığını, sayaçlar, oyun geçmişi, oturum kaydı
+                  ve model durumları
+        """
+        self.flushPending()
+        models = self.inference.captureModels(history=self.game.history)
+        return {
+            'matrix': encode_matrix(self.matrix_widget.getMatrixState()),
+            'undo_stack': self.undo_stack.get_state(),
+            'counters': (self.game.player_count, self.game.banker_count, self.game.tie_count),
+            'game': self.game.get_state(),
+            'history': self.history.get_state(),
+            'models': models if models is not None else {}
+        }
+        
+    def applyState(self, state):
+        """
+        Anlık görüntüden uygulama durumunu geri yükle
+        
+        Args:
+            state (dict): captureState() ile alınmış durum
+        """
+        matrix = decode_matrix(state['matrix'])
+        undo_stack = UndoStack(self.undo_stack.depth)
+        undo_stack.set_state(state['undo_stack'])
+        player_count, banker_count, tie_count = state['counters']
+        
+        rows, cols = self.matrix_widget.rows, self.matrix_widget.cols
+        for command in undo_stack.get_state().values():
+            for changes in command:
+                if any(row >= rows or col >= cols for row, col, _, _ in changes):
+                    raise ValueError("Geri alma kaydı matris dışında")
+                    
+        # Sayaçlar elle yapılan düzenlemeleri de içerdiğinden geçmişten ayrı saklanır
+        self.game.set_state(state['game'])
+        self.roads.reset()  # Yollar yeni geçmişten baştan oluşturulur
+        self.game.player_count = player_count
+        self.game.banker_count = banker_count
+        self.game.tie_count = tie_count
+        self.history.set_state(state['history'])
+        self.inference.restoreModels(state['models'], history=self.game.history)
+        
+        self.matrix_widget.setMatrixState(matrix)
+        self.undo_stack = undo_stack
+        self.updateGameStats()
+        self.updateUndoButtons()
+    
+    def restoreSnapshot(self):
+        """
+        Kayıtlı anlık görüntüyü yükle
+        
+        Returns:
+            bool: Durum yüklendiyse True, uyumsuz veya yoksa False
+        """
+        state = self.snapshot.load_or_none()
+        if state is None:
+            return False
+            
+        try:
+            self.applyState(state)
+        except (KeyError, TypeError, ValueError):
+            # Uyumsuz içerik: boş durumla başla
+            self.matrix_widget.clearMatrix()
+            self.undo_stack.clear()
+            self.game.reset()
+            self.roads.reset()
+            self.history.clear_session()
+            self.updateGameStats()
+            self.updateUndoButtons()
+            return False
+        return True
+    
+    def saveSnapshot(self):
+        """Mevcut durumu anlık görüntü dosyasına yaz"""
+        try:
+            self.snapshot.save(self.captureState())
+        except OSError:
+            # Anlık görüntü yazılamazsa uygulama çalışmaya devam eder
+            pass
+    
+    def closeEvent(self, event):
+        """Pencere kapanırken durumu kaydet"""
+        self.snapshot_timer.stop()
+        
+        # Akış durdurulur; okunmuş sonuçlar da kuyruğa alınıp kaydedilir
+        if self.ingestor is not None:
+            self.ingest_timer.stop()
+            self.ingestor.stop()
+            if self.started:
+                self.pollIngest()
+                
+        # Bekleyen girişler ve olaylar çıkarım hattı kapanmadan önce uygulanır
+        if self.started:
+            self.flushPending()
+        self.dispatchEvents()
+        self.inference.shutdown()
+        
+        # Açılış tamamlanmadan kapanırsa önceki anlık görüntü ezilmez
+        if self.started:
+            self.saveSnapshot()
+        super().closeEvent(event)
+    
+    def applyCells(self, cells, results=0):
+        """
+        Hücre değerlerini ayarla ve değişikliği olay olarak yayınla
+        
+        Sayaçlar, istatistikler, yollar ve tahmin isteği MatrixChanged
+        abonelerinde güncellenir.
+        
+        Args:
+            cells (list): (satır, sütun, yeni değer) listesi
+            results (int): Değişikliğe yol açan girilen sonuç sayısı (0: elle düzenleme)
+        """
+        changes = []
+        for row, col, value in cells:
+            changes.append((row, col, self.matrix_widget.getCellValue(row, col), value))
+            self.matrix_widget.setCellValue(row, col, value)
+            
+        self.events.publish(MatrixChanged(changes, results))
+    
+    def onResultAdded(self, event):
+        """Girilen sonucu oyuna ve gösterilen tahminle birlikte kayda ekle"""
+        last_result = self.inference.last_result
+        prediction = last_result['prediction'] if last_result else None
+        self.game.add_result(event.result)
+        self.history.add_result(event.result, prediction)
+    
+    def onMatrixCounts(self, event):
+        """
+        Elle yapılan hücre düzenlemelerini sayaçlara işle
+        
+        Girilen sonuçlar onResultAdded ile sayıldığından matrise yazılmaları
+        (kaydırma dahil) sayaçları değiştirmez.
+        """
+        if event.results:
+            return
+            
+        counts = {'P': 0, 'B': 0, None: 0}
+        for _, _, old, new in event.changes:
+            counts[old] -= 1
+            counts[new] += 1
+        self.game.adjust_counts(counts['P'], counts['B'])
+    
+    def onGameStatsChanged(self, events):
+        """Biriken matris değişikliklerinden sonra istatistikleri ve butonları güncelle"""
+        self.updateGameStats()
+        self.updateUndoButtons()
+    
+    def updateGameStats(self):
+        """Oyun istatistikleri panelini sayaçlarla güncelle"""
+        game = self.game
+        self.stats_widget.updateGameStats(game.player_count, game.banker_count, game.tie_count)
+    
+    def updateUndoButtons(self):
+        """Geri al / yinele butonlarının durumunu güncelle"""
+        self.undo_btn.setEnabled(self.undo_stack.can_undo())
+        self.redo_btn.setEnabled(self.undo_stack.can_redo())
\ No newline at end of file
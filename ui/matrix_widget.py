@@ -1,143 +1,211 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-from PyQt5.QtWidgets import QWidget, QGridLayout, QLabel, QSizePolicy
-from PyQt5.QtGui import QColor, QPainter, QPen, QBrush
-from PyQt5.QtCore import Qt, QRect, pyqtSignal, QSize
-
-from ui.styles import PLAYER_COLOR, BANKER_COLOR, EMPTY_CELL_BG, CELL_BORDER, TEXT_COLOR
-
-class MatrixCell(QWidget):
-    """5x5 Matrisin tek bir hücresini temsil eden widget"""
-    
-    clicked = pyqtSignal(int, int)  # Tıklama olayı için sinyal: (satır, sütun)
-    
-    def __init__(self, row, col, parent=None):
-        super().__init__(parent)
-        self.row = row
-        self.col = col
-        self.value = None  # None: boş, 'P': Player, 'B': Banker
-        self.setMinimumSize(50, 50)
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.setToolTip(f"Hücre ({row}, {col})")
-    
-    def setValue(self, value):
-        """Hücre değerini ayarla ('P', 'B' veya None)"""
-        self.value = value
-        self.update()  # Yeniden çizim için
-    
-    def getValue(self):
-        """Hücre değerini döndür"""
-        return self.value
-    
-    def paintEvent(self, event):
-        """Hücreyi çiz"""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Arka plan
-        rect = QRect(1, 1, self.width() - 2, self.height() - 2)
-        
-        if self.value == 'P':
-            bg_color = QColor(PLAYER_COLOR)
-            text = "P"
-        elif self.value == 'B':
-            bg_color = QColor(BANKER_COLOR)
-            text = "B"
-        else:
-            bg_color = QColor(EMPTY_CELL_BG)
-            text = ""
-        
-        # Hücre arka planını çiz
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(bg_color))
-        painter.drawRect(rect)
-        
-        # Hücre kenarlığını çiz
-        painter.setPen(QPen(QColor(CELL_BORDER), 1))
-        painter.drawRect(rect)
-        
-        # Metin çiz
-        if text:
-            painter.setPen(QColor(TEXT_COLOR))
-            painter.drawText(rect, Qt.AlignCenter, text)
-    
-    def mousePressEvent(self, event):
-        """Fare tıklama olayı"""
-        if event.button() == Qt.LeftButton:
-            self.clicked.emit(self.row, self.col)
-        super().mousePressEvent(event)
-    
-    def sizeHint(self):
-        """Tercih edilen boyut"""
-        return QSize(60, 60)
-
-
-class MatrixWidget(QWidget):
-    """5x5 Baccarat tahmin matrisini temsil eden widget"""
-    
-    cellClicked = pyqtSignal(int, int)  # Hücreye tıklama olayı
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.initUI()
-    
-    def initUI(self):
-        """Kullanıcı arayüzünü oluştur"""
-        grid_layout = QGridLayout(self)
-        grid_layout.setSpacing(2)
-        
-        # 5x5 matris oluştur
-        self.cells = []
-        for row in range(5):
-            row_cells = []
-            for col in range(5):
-                cell = MatrixCell(row, col)
-                cell.clicked.connect(self.onCellClicked)
-                grid_layout.addWidget(cell, row, col)
-                row_cells.append(cell)
-            self.cells.append(row_cells)
-        
-        self.setLayout(grid_layout)
-    
-    def onCellClicked(self, row, col):
-        """Hücre tıklama olayı"""
-        self.cellClicked.emit(row, col)
-    
-    def setCellValue(self, row, col, value):
-        """Belirtilen hücrenin değerini ayarla"""
-        if 0 <= row < 5 and 0 <= col < 5:
-            self.cells[row][col].setValue(value)
-    
-    def getCellValue(self, row, col):
-        """Belirtilen hücrenin değerini döndür"""
-        if 0 <= row < 5 and 0 <= col < 5:
-            return self.cells[row][col].getValue()
-        return None
-    
-    def clearMatrix(self):
-        """Tüm matrisi temizle"""
-        for row in range(5):
-            for col in range(5):
-                self.cells[row][col].setValue(None)
-    
-    def getMatrixState(self):
-        """Matrisin mevcut durumunu 2D dizi olarak döndür"""
-        state = []
-        for row in range(5):
-            row_values = []
-            for col in range(5):
-                row_values.append(self.cells[row][col].getValue())
-            state.append(row_values)
-        return state
-    
-    def setMatrixState(self, state):
-        """Matrisi verilen durum ile güncelle"""
-        if not state or len(state) != 5:
-            return
-            
-        for row in range(5):
-            if len(state[row]) != 5:
-                continue
-            for col in range(5):
-                self.cells[row][col].setValue(state[row][col])
\ No newline at end of file
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from bisect import bisect_right
+
+from PyQt5.QtWidgets import QWidget, QSizePolicy, QToolTip
+from PyQt5.QtGui import QColor, QPainter, QPen, QBrush
+from PyQt5.QtCore import Qt, QRect, QEvent, pyqtSignal, QSize
+
+from ui.styles import PLAYER_COLOR, BANKER_COLOR, EMPTY_CELL_BG, CELL_BORDER, TEXT_COLOR
+
+# Izgara yerleşimi (piksel)
+GRID_MARGIN = 9        # Kenar boşluğu
+CELL_SPACING = 2       # Hücreler arası boşluk
+MIN_CELL_SIZE = 50     # En küçük hücre boyutu
+PREFERRED_CELL_SIZE = 60
+
+
+class MatrixWidget(QWidget):
+    """Baccarat tahmin matrisini tek bir paintEvent ile çizen widget"""
+    
+    cellClicked = pyqtSignal(int, int)  # Hücreye tıklama olayı: (satır, sütun)
+    
+    def __init__(self, parent=None, rows=5, cols=5):
+        super().__init__(parent)
+        self.rows = rows
+        self.cols = cols
+        self.values = [[None] * cols for _ in range(rows)]  # None: boş, 'P': Player, 'B': Banker
+        self.initUI()
+    
+    def initUI(self):
+        """Kullanıcı arayüzünü oluştur"""
+        # Çizim nesneleri bir kez oluşturulur ve her çizimde yeniden kullanılır
+        self._brushes = {
+            'P': QBrush(QColor(PLAYER_COLOR)),
+            'B': QBrush(QColor(BANKER_COLOR)),
+            None: QBrush(QColor(EMPTY_CELL_BG))
+        }
+        self._border_pen = QPen(QColor(CELL_BORDER), 1)
+        self._text_pen = QPen(QColor(TEXT_COLOR))
+        
+        self._col_edges = []  # Her sütun için (x, genişlik)
+        self._row_edges = []  # Her satır için (y, yükseklik)
+        self._col_starts = []
+        self._row_starts = []
+        
+        self.setMinimumSize(self._gridExtent(self.cols, MIN_CELL_SIZE),
+                            self._gridExtent(self.rows, MIN_CELL_SIZE))
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self._layoutCells()
+    
+    @staticmethod
+    def _gridExtent(count, cell_size):
+        """Verilen hücre boyutuyla ızgaranın toplam uzunluğu"""
+        return 2 * GRID_MARGIN + count * cell_size + (count - 1) * CELL_SPACING
+    
+    @staticmethod
+    def _edges(length, count):
+        """Bir eksen boyunca hücrelerin (başlangıç, boyut) listesini hesapla"""
+        available = max(count, length - 2 * GRID_MARGIN - (count - 1) * CELL_SPACING)
+        edges = []
+        position = GRID_MARGIN
+        for i in range(count):
+            # Artık pikseller ilk hücrelere dağıtılır
+            size = available // count + (1 if i < available % count else 0)
+            edges.append((position, size))
+            position += size + CELL_SPACING
+        return edges
+    
+    def _layoutCells(self):
+        """Hücre konumlarını widget boyutuna göre yeniden hesapla"""
+        self._col_edges = self._edges(self.width(), self.cols)
+        self._row_edges = self._edges(self.height(), self.rows)
+        self._col_starts = [start for start, _ in self._col_edges]
+        self._row_starts = [start for start, _ in self._row_edges]
+    
+    def _cellRect(self, row, col):
+        """Hücrenin widget içindeki dikdörtgeni"""
+        x, width = self._col_edges[col]
+        y, height = self._row_edges[row]
+        return QRect(x, y, width, height)
+    
+    def cellAt(self, pos):
+        """
+        Verilen noktadaki hücreyi bul
+        
+        Args:
+            pos (QPoint): Widget koordinatları
+            
+        Returns:
+            tuple: (satır, sütun) veya hücre yoksa None
+        """
+        col = _findEdge(self._col_edges, self._col_starts, pos.x())
+        row = _findEdge(self._row_edges, self._row_starts, pos.y())
+        if row is None or col is None:
+            return None
+        return row, col
+    
+    def resizeEvent(self, event):
+        """Boyut değiştiğinde hücre konumlarını güncelle"""
+        self._layoutCells()
+        super().resizeEvent(event)
+    
+    def paintEvent(self, event):
+        """Yalnızca yeniden çizilmesi gereken bölgedeki hücreleri çiz"""
+        dirty = event.rect()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        # Kirli dikdörtgenle kesişen satır ve sütun aralığı
+        first_row = max(0, bisect_right(self._row_starts, dirty.top()) - 1)
+        last_row = bisect_right(self._row_starts, dirty.bottom())
+        first_col = max(0, bisect_right(self._col_starts, dirty.left()) - 1)
+        last_col = bisect_right(self._col_starts, dirty.right())
+        
+        for row in range(first_row, last_row):
+            y, height = self._row_edges[row]
+            for col in range(first_col, last_col):
+                x, width = self._col_edges[col]
+                value = self.values[row][col]
+                rect = QRect(x + 1, y + 1, width - 2, height - 2)
+                
+                # Hücre arka planı
+                painter.setPen(Qt.NoPen)
+                painter.setBrush(self._brushes.get(value, self._brushes[None]))
+                painter.drawRect(rect)
+                
+                # Hücre kenarlığı
+                painter.setPen(self._border_pen)
+                painter.drawRect(rect)
+                
+                # Metin
+                if value:
+                    painter.setPen(self._text_pen)
+                    painter.drawText(rect, Qt.AlignCenter, value)
+    
+    def mousePressEvent(self, event):
+        """Fare tıklama olayı: tıklanan hücreyi bul ve sinyal gönder"""
+        if event.button() == Qt.LeftButton:
+            cell = self.cellAt(event.pos())
+            if cell is not None:
+                self.cellClicked.emit(*cell)
+        super().mousePressEvent(event)
+    
+    def event(self, event):
+        """Hücre ipuçlarını (tooltip) göster"""
+        if event.type() == QEvent.ToolTip:
+            cell = self.cellAt(event.pos())
+            if cell is not None:
+                QToolTip.showText(event.globalPos(), f"Hücre ({cell[0]}, {cell[1]})", self,
+                                  self._cellRect(*cell))
+            else:
+                QToolTip.hideText()
+                event.ignore()
+            return True
+        return super().event(event)
+    
+    def sizeHint(self):
+        """Tercih edilen boyut"""
+        return QSize(self._gridExtent(self.cols, PREFERRED_CELL_SIZE),
+                     self._gridExtent(self.rows, PREFERRED_CELL_SIZE))
+    
+    def onCellClicked(self, row, col):
+        """Hücre tıklama olayı"""
+        self.cellClicked.emit(row, col)
+    
+    def setCellValue(self, row, col, value):
+        """Belirtilen hücrenin değerini ayarla ve yalnızca o hücreyi yeniden çiz"""
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            if self.values[row][col] != value:
+                self.values[row][col] = value
+                self.update(self._cellRect(row, col))
+    
+    def getCellValue(self, row, col):
+        """Belirtilen hücrenin değerini döndür"""
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return self.values[row][col]
+        return None
+    
+    def clearMatrix(self):
+        """Tüm matrisi temizle"""
+        for row in range(self.rows):
+            for col in range(self.cols):
+                self.setCellValue(row, col, None)
+    
+    def getMatrixState(self):
+        """Matrisin mevcut durumunu 2D dizi olarak döndür"""
+        return [list(row_values) for row_values in self.values]
+    
+    def setMatrixState(self, state):
+        """Matrisi verilen durum ile güncelle"""
+        if not state or len(state) != self.rows:
+            return
+            
+        for row in range(self.rows):
+            if len(state[row]) != self.cols:
+                continue
+            for col in range(self.cols):
+                self.setCellValue(row, col, state[row][col])
+
+
+def _findEdge(edges, starts, position):
+    """Konumu içeren hücre indeksini bul (boşluklarda None)"""
+    index = bisect_right(starts, position) - 1
+    if index < 0:
+        return None
+        
+    start, size = edges[index]
+    if position < start + size:
+        return index
+    return None
\ No newline at end of file
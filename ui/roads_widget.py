@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Big Road ve türetilmiş yolları çizen skor tablosu widget'ı
+"""
+
+from PyQt5.QtWidgets import QWidget, QSizePolicy
+from PyQt5.QtGui import QColor, QPainter, QPen, QBrush, QPixmap, QFont
+from PyQt5.QtCore import Qt, QRect, QRectF, QPointF, QSize
+
+from core.roads import RED, BLUE, EMPTY
+from ui.styles import (PLAYER_COLOR, BANKER_COLOR, TIE_MARK_COLOR, EMPTY_CELL_BG,
+                       CELL_BORDER, TEXT_COLOR)
+
+# Yerleşim (piksel)
+ROAD_MARGIN = 6
+BIG_CELL_SIZE = 18      # Big Road hücre boyutu
+DERIVED_CELL_SIZE = 9   # Türetilmiş yol hücre boyutu
+TITLE_HEIGHT = 14       # Yol adı satırı
+ROAD_SPACING = 4
+
+# Tamamlanmış sütunlar bu genişlikte parçalar halinde önbelleğe alınır
+TILE_COLUMNS = 16
+
+# İşaret biçimleri (yol sırasıyla)
+MARK_RING = 0   # Big Road: kalın halka
+MARK_CIRCLE = 1  # Big Eye Boy: ince halka
+MARK_DOT = 2    # Small Road: dolu daire
+MARK_SLASH = 3  # Cockroach Pig: eğik çizgi
+ROAD_MARKS = (MARK_RING, MARK_CIRCLE, MARK_DOT, MARK_SLASH)
+
+
+class RoadsWidget(QWidget):
+    """
+    Roads motorunun yollarını alt alta çizen widget
+    
+    Yalnızca en son sütunlar görünür. Tamamlanmış sütunlar (artık değişmeyecek
+    olanlar) TILE_COLUMNS genişliğinde QPixmap parçalarında saklanır; her
+    çizimde yalnızca açık sütunlar yeniden çizilir.
+    """
+    
+    def __init__(self, roads, parent=None):
+        """
+        Inicializasyon
+        
+        Args:
+            roads (Roads): Çizilecek yol motoru
+            parent (QWidget, optional): Üst widget
+        """
+        super().__init__(parent)
+        self.roads = roads
+        self._tiles = {}          # (yol sırası, parça no) -> QPixmap
+        self._generation = roads.generation
+        
+        # Çizim nesneleri bir kez oluşturulur
+        self._colors = {RED: QColor(BANKER_COLOR), BLUE: QColor(PLAYER_COLOR)}
+        self._background = QBrush(QColor(EMPTY_CELL_BG))
+        self._grid_pen = QPen(QColor(CELL_BORDER), 1)
+        self._tie_pen = QPen(QColor(TIE_MARK_COLOR), 2)
+        self._text_pen = QPen(QColor(TEXT_COLOR))
+        self._title_font = QFont()
+        self._title_font.setPointSize(7)
+        self._title_font.setBold(True)
+        self._count_font = QFont()
+        self._count_font.setPointSize(6)
+        
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.setFixedHeight(self._totalHeight())
+    
+    def _cellSize(self, index):
+        """Yol sırasına göre hücre boyutu"""
+        return BIG_CELL_SIZE if index == 0 else DERIVED_CELL_SIZE
+    
+    def _totalHeight(self):
+        """Tüm yolların toplam yüksekliği"""
+        height = 2 * ROAD_MARGIN
+        for index, (_, grid) in enumerate(self.roads.get_roads()):
+            height += TITLE_HEIGHT + grid.rows * self._cellSize(index) + ROAD_SPACING
+        return height - ROAD_SPACING
+    
+    def sizeHint(self):
+        """Tercih edilen boyut"""
+        return QSize(40 * BIG_CELL_SIZE + 2 * ROAD_MARGIN, self._totalHeight())
+    
+    def refresh(self):
+        """Yol motoru değiştiğinde yeniden çiz"""
+        if self.roads.generation != self._generation:
+            # Yollar baştan oluşturuldu: önbellekteki parçalar geçersiz
+            self._tiles.clear()
+            self._generation = self.roads.generation
+        self.update()
+    
+    def paintEvent(self, event):
+        """Yolları çiz"""
+        if self.roads.generation != self._generation:
+            self._tiles.clear()
+            self._generation = self.roads.generation
+            
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        width = self.width() - 2 * ROAD_MARGIN
+        top = ROAD_MARGIN
+        
+        for index, (name, grid) in enumerate(self.roads.get_roads()):
+            cell = self._cellSize(index)
+            painter.setPen(self._text_pen)
+            painter.setFont(self._title_font)
+            painter.drawText(QRect(ROAD_MARGIN, top, width, TITLE_HEIGHT),
+                             Qt.AlignLeft | Qt.AlignVCenter, name)
+            top += TITLE_HEIGHT
+            
+            self._paintRoad(painter, index, grid, QRect(ROAD_MARGIN, top, width, grid.rows * cell))
+            top += grid.rows * cell + ROAD_SPACING
+    
+    def _paintRoad(self, painter, index, grid, area):
+        """Bir yolun görünen sütunlarını çiz (en son sütun sağda)"""
+        cell = self._cellSize(index)
+        visible = max(1, area.width() // cell)
+        first = max(0, grid.columns - visible)
+        last = first + visible
+        
+        painter.save()
+        painter.setClipRect(area)
+        painter.fillRect(area, self._background)
+        
+        first_tile = first // TILE_COLUMNS
+        last_tile = (last - 1) // TILE_COLUMNS
+        for tile in range(first_tile, last_tile + 1):
+            tile_start = tile * TILE_COLUMNS
+            tile_end = tile_start + TILE_COLUMNS
+            x = area.left() + (tile_start - first) * cell
+            
+            if grid.is_final(tile_end - 1):
+                # Parçanın tüm sütunları tamamlandı: önbellekten çiz
+                pixmap = self._tiles.get((index, tile))
+                if pixmap is None:
+                    pixmap = self._renderTile(index, grid, tile_start)
+                    self._tiles[(index, tile)] = pixmap
+                painter.drawPixmap(x, area.top(), pixmap)
+            else:
+                painter.save()
+                painter.translate(x, area.top())
+                self._paintColumns(painter, index, grid, tile_start, tile_end)
+                painter.restore()
+                
+        painter.restore()
+        
+        # Görünmeyen parçaları bırak
+        for key in [key for key in self._tiles if key[0] == index and not first_tile <= key[1] <= last_tile]:
+            del self._tiles[key]
+    
+    def _renderTile(self, index, grid, start):
+        """Tamamlanmış bir sütun parçasını pixmap'e çiz"""
+        cell = self._cellSize(index)
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(TILE_COLUMNS * cell * ratio), int(grid.rows * cell * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(QColor(EMPTY_CELL_BG))
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        self._paintColumns(painter, index, grid, start, start + TILE_COLUMNS)
+        painter.end()
+        return pixmap
+    
+    def _paintColumns(self, painter, index, grid, start, end):
+        """Sütun aralığını (start sütunu x=0'da olacak şekilde) çiz"""
+        cell = self._cellSize(index)
+        mark = ROAD_MARKS[index]
+        ties = self.roads.big_road.ties if index == 0 else None
+        
+        painter.setPen(self._grid_pen)
+        painter.setBrush(Qt.NoBrush)
+        for column in range(end - start):
+            for row in range(grid.rows):
+                painter.drawRect(column * cell, row * cell, cell, cell)
+                
+        for x in range(start, min(end, grid.columns)):
+            for y in range(grid.rows):
+                code = grid.get(x, y)
+                if code == EMPTY:
+                    continue
+                rect = QRectF((x - start) * cell, y * cell, cell, cell)
+                self._paintMark(painter, mark, code, rect)
+                if ties and (x, y) in ties:
+                    self._paintTie(painter, rect, ties[(x, y)])
+    
+    def _paintMark(self, painter, mark, code, rect):
+        """Tek bir yol işaretini çiz"""
+        color = self._colors[code]
+        inner = rect.adjusted(2, 2, -2, -2)
+        
+        if mark == MARK_DOT:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(color)
+            painter.drawEllipse(inner)
+        elif mark == MARK_SLASH:
+            painter.setPen(QPen(color, 2))
+            painter.drawLine(inner.bottomLeft(), inner.topRight())
+        else:
+            painter.setPen(QPen(color, 3 if mark == MARK_RING else 1.5))
+            painter.setBrush(Qt.NoBrush)
+            painter.drawEllipse(inner.adjusted(1, 1, -1, -1) if mark == MARK_RING else inner)
+    
+    def _paintTie(self, painter, rect, count):
+        """Big Road hücresine Tie çizgisi ve birden fazlaysa sayısını çiz"""
+        painter.setPen(self._tie_pen)
+        painter.drawLine(rect.bottomLeft() + QPointF(3, -3), rect.topRight() + QPointF(-3, 3))
+        if count > 1:
+            painter.setPen(self._text_pen)
+            painter.setFont(self._count_font)
+            painter.drawText(rect, Qt.AlignCenter, str(count))
\ No newline at end of file
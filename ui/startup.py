@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Açılış ölçümü için ilk çizim izleyicisi
+"""
+
+from PyQt5.QtCore import QObject, QEvent, QTimer, pyqtSignal
+
+
+class FirstPaintWatcher(QObject):
+    """İzlenen nesnedeki ilk çizim olayı tamamlandığında sinyal gönderen olay filtresi"""
+    
+    firstPaint = pyqtSignal()
+    
+    def __init__(self, target):
+        """
+        Inicializasyon
+        
+        Args:
+            target (QObject): İzlenecek widget veya tüm widget'lar için QApplication
+        """
+        super().__init__(target)
+        self.target = target
+        target.installEventFilter(self)
+    
+    def eventFilter(self, obj, event):
+        """İlk çizim olayında filtreyi kaldır ve çizim bittikten sonra sinyal gönder"""
+        if event.type() == QEvent.Paint:
+            self.target.removeEventFilter(self)
+            # Sıfır gecikmeli zamanlayıcı mevcut çizim turu bittikten sonra çalışır
+            QTimer.singleShot(0, self.firstPaint.emit)
+        return False
\ No newline at end of file
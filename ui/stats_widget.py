@@ -1,406 +1,674 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                            QGroupBox, QGridLayout, QFrame)
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont
-
-from ui.styles import (PLAYER_COLOR, BANKER_COLOR, TIE_COLOR, 
-                      BACKGROUND_DARKER, TEXT_COLOR)
-
-class PredictionWidget(QWidget):
-    """Güncel tahmin bilgisini gösteren widget"""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.initUI()
-        
-    def initUI(self):
-        """Kullanıcı arayüzünü oluştur"""
-        layout = QVBoxLayout(self)
-        
-        # Başlık
-        title_label = QLabel("GÜNCEL TAHMİN")
-        title_label.setAlignment(Qt.AlignLeft)
-        title_label.setStyleSheet(f"color: {TEXT_COLOR}; font-weight: bold;")
-        
-        # Tahmin değeri
-        self.prediction_label = QLabel("?")
-        self.prediction_label.setAlignment(Qt.AlignCenter)
-        self.prediction_label.setStyleSheet(
-            f"color: {TEXT_COLOR}; font-size: 28px; font-weight: bold;"
-        )
-        
-        # Güven yüzdesi
-        self.confidence_frame = QFrame()
-        self.confidence_frame.setFixedSize(40, 40)
-        self.confidence_frame.setStyleSheet(
-            f"background-color: {BANKER_COLOR}; border-radius: 20px;"
-        )
-        
-        confidence_layout = QVBoxLayout(self.confidence_frame)
-        self.confidence_label = QLabel("?%")
-        self.confidence_label.setAlignment(Qt.AlignCenter)
-        self.confidence_label.setStyleSheet("color: white; font-weight: bold;")
-        confidence_layout.addWidget(self.confidence_label)
-        
-        # Üst kısım düzeni (başlık ve güven)
-        top_layout = QHBoxLayout()
-        top_layout.addWidget(title_label)
-        top_layout.addStretch()
-        top_layout.addWidget(self.confidence_frame)
-        
-        layout.addLayout(top_layout)
-        layout.addWidget(self.prediction_label)
-        layout.addStretch()
-        
-        self.setLayout(layout)
-        self.setStyleSheet(f"background-color: {BACKGROUND_DARKER}; border-radius: 8px;")
-        self.setMinimumHeight(100)
-    
-    def setPrediction(self, prediction, confidence=None):
-        """Tahmin ve güven değerini ayarla"""
-        if prediction == 'P':
-            self.prediction_label.setText("PLAYER")
-            self.prediction_label.setStyleSheet(
-                f"color: {PLAYER_COLOR}; font-size: 28px; font-weight: bold;"
-            )
-            self.confidence_frame.setStyleSheet(
-                f"background-color: {PLAYER_COLOR}; border-radius: 20px;"
-            )
-        elif prediction == 'B':
-            self.prediction_label.setText("BANKER")
-            self.prediction_label.setStyleSheet(
-                f"color: {BANKER_COLOR}; font-size: 28px; font-weight: bold;"
-            )
-            self.confidence_frame.setStyleSheet(
-                f"background-color: {BANKER_COLOR}; border-radius: 20px;"
-            )
-        else:
-            self.prediction_label.setText("?")
-            self.prediction_label.setStyleSheet(
-                f"color: {TEXT_COLOR}; font-size: 28px; font-weight: bold;"
-            )
-            self.confidence_frame.setStyleSheet(
-                f"background-color: {TIE_COLOR}; border-radius: 20px;"
-            )
-        
-        # Güven değeri
-        if confidence is not None:
-            self.confidence_label.setText(f"{confidence}%")
-        else:
-            self.confidence_label.setText("?%")
-
-
-class ModelStatsWidget(QWidget):
-    """Model istatistiklerini gösteren widget"""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.initUI()
-    
-    def initUI(self):
-        """Kullanıcı arayüzünü oluştur"""
-        layout = QVBoxLayout(self)
-        
-        # Başlık
-        title_label = QLabel("MODEL İSTATİSTİKLERİ")
-        title_label.setAlignment(Qt.AlignLeft)
-        title_label.setStyleSheet(f"color: {TEXT_COLOR}; font-weight: bold;")
-        layout.addWidget(title_label)
-        
-        # Tablo başlığı
-        header_layout = QHBoxLayout()
-        
-        model_header = QLabel("MODEL ADI")
-        model_header.setAlignment(Qt.AlignCenter)
-        model_header.setStyleSheet(f"color: {TEXT_COLOR}; font-weight: bold;")
-        
-        prediction_header = QLabel("TAHMİNİ")
-        prediction_header.setAlignment(Qt.AlignCenter)
-        prediction_header.setStyleSheet(f"color: {TEXT_COLOR}; font-weight: bold;")
-        
-        success_header = QLabel("BAŞARI")
-        success_header.setAlignment(Qt.AlignCenter)
-        success_header.setStyleSheet(f"color: {TEXT_COLOR}; font-weight: bold;")
-        
-        header_layout.addWidget(model_header)
-        header_layout.addWidget(prediction_header)
-        header_layout.addWidget(success_header)
-        
-        header_frame = QFrame()
-        header_frame.setLayout(header_layout)
-        header_frame.setStyleSheet(f"background-color: {BACKGROUND_DARKER}; border-radius: 5px;")
-        
-        layout.addWidget(header_frame)
-        
-        # Model satırları - şimdilik örnek veriler
-        self.models_layout = QVBoxLayout()
-        self.addModelRow("DEEP BACCARAT", "B", 92.5)
-        self.addModelRow("PATTERN AI", "P", 88.7)
-        
-        layout.addLayout(self.models_layout)
-        layout.addStretch()
-        
-        self.setLayout(layout)
-        self.setStyleSheet(f"background-color: {BACKGROUND_DARKER}; border-radius: 8px;")
-        self.setMinimumHeight(160)
-    
-    def addModelRow(self, model_name, prediction, success_rate):
-        """Model satırı ekle"""
-        row_layout = QHBoxLayout()
-        
-        model_label = QLabel(model_name)
-        model_label.setAlignment(Qt.AlignCenter)
-        model_label.setStyleSheet(f"color: {TEXT_COLOR};")
-        
-        pred_color = PLAYER_COLOR if prediction == 'P' else BANKER_COLOR
-        prediction_label = QLabel(prediction)
-        prediction_label.setAlignment(Qt.AlignCenter)
-        prediction_label.setStyleSheet(f"color: {pred_color}; font-weight: bold;")
-        
-        success_frame = QFrame()
-        success_layout = QHBoxLayout(success_frame)
-        success_label = QLabel(f"{success_rate}%")
-        success_label.setAlignment(Qt.AlignCenter)
-        success_label.setStyleSheet("color: white; font-weight: bold;")
-        success_layout.addWidget(success_label)
-        
-        success_frame.setStyleSheet(
-            f"background-color: {pred_color}; border-radius: 10px;"
-        )
-        
-        row_layout.addWidget(model_label)
-        row_layout.addWidget(prediction_label)
-        row_layout.addWidget(success_frame)
-        
-        row_frame = QFrame()
-        row_frame.setLayout(row_layout)
-        row_frame.setStyleSheet(f"background-color: {BACKGROUND_DARKER};")
-        
-        self.models_layout.addWidget(row_frame)
-    
-    def updateModel(self, model_index, model_name, prediction, success_rate):
-        """Varolan model bilgilerini güncelle"""
-        # Gerçek uygulamada burada model satırlarını güncelleyebilirsiniz
-        pass
-
-
-class GameStatsWidget(QWidget):
-    """Oyun istatistiklerini gösteren widget"""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.initUI()
-    
-    def initUI(self):
-        """Kullanıcı arayüzünü oluştur"""
-        layout = QVBoxLayout(self)
-        
-        # Başlık
-        title_label = QLabel("OYUN İSTATİSTİKLERİ")
-        title_label.setAlignment(Qt.AlignLeft)
-        title_label.setStyleSheet(f"color: {TEXT_COLOR}; font-weight: bold;")
-        layout.addWidget(title_label)
-        
-        # İstatistik kartları
-        cards_layout = QHBoxLayout()
-        
-        # Player kartı
-        self.player_card = self.createStatCard("PLAYER", "0", PLAYER_COLOR)
-        cards_layout.addWidget(self.player_card)
-        
-        # Banker kartı
-        self.banker_card = self.createStatCard("BANKER", "0", BANKER_COLOR)
-        cards_layout.addWidget(self.banker_card)
-        
-        # Tie kartı
-        self.tie_card = self.createStatCard("TIE", "0", TIE_COLOR)
-        cards_layout.addWidget(self.tie_card)
-        
-        layout.addLayout(cards_layout)
-        
-        # Toplam el sayısı
-        total_layout = QHBoxLayout()
-        
-        total_label = QLabel("TOPLAM EL:")
-        total_label.setAlignment(Qt.AlignCenter)
-        total_label.setStyleSheet(f"color: {TEXT_COLOR};")
-        
-        self.total_count = QLabel("0")
-        self.total_count.setAlignment(Qt.AlignCenter)
-        self.total_count.setStyleSheet(f"color: {TEXT_COLOR}; font-weight: bold;")
-        
-        total_layout.addStretch()
-        total_layout.addWidget(total_label)
-        total_layout.addWidget(self.total_count)
-        total_layout.addStretch()
-        
-        layout.addLayout(total_layout)
-        
-        self.setLayout(layout)
-        self.setStyleSheet(f"background-color: {BACKGROUND_DARKER}; border-radius: 8px;")
-        self.setMinimumHeight(140)
-    
-    def createStatCard(self, title, count, color):
-        """İstatistik kartı oluştur"""
-        card = QFrame()
-        card.setStyleSheet(
-            f"background-color: {BACKGROUND_DARKER}; border: 1px solid {color}; border-radius: 5px;"
-        )
-        
-        layout = QVBoxLayout(card)
-        
-        # Başlık çubuğu
-        title_bar = QFrame()
-        title_bar.setFixedHeight(5)
-        title_bar.setStyleSheet(f"background-color: {color}; border-radius: 2px;")
-        
-        # Başlık
-        title_label = QLabel(title)
-        title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet(f"color: {TEXT_COLOR}; border: none;")
-        
-        # Sayı
-        count_label = QLabel(count)
-        count_label.setAlignment(Qt.AlignCenter)
-        count_label.setStyleSheet(f"color: {color}; font-size: 22px; font-weight: bold; border: none;")
-        
-        layout.addWidget(title_bar)
-        layout.addWidget(title_label)
-        layout.addWidget(count_label)
-        
-        return card
-    
-    def updateStats(self, player_count, banker_count, tie_count):
-        """İstatistikleri güncelle"""
-        # Player sayısını güncelle
-        player_label = self.player_card.findChild(QLabel, "", Qt.FindChildrenRecursively)
-        if player_label:
-            player_label.setText(str(player_count))
-        
-        # Banker sayısını güncelle
-        banker_label = self.banker_card.findChild(QLabel, "", Qt.FindChildrenRecursively)
-        if banker_label:
-            banker_label.setText(str(banker_count))
-        
-        # Tie sayısını güncelle
-        tie_label = self.tie_card.findChild(QLabel, "", Qt.FindChildrenRecursively)
-        if tie_label:
-            tie_label.setText(str(tie_count))
-        
-        # Toplam el sayısını güncelle
-        total = player_count + banker_count + tie_count
-        self.total_count.setText(str(total))
-
-
-class HistoryWidget(QWidget):
-    """Son tahminleri gösteren widget"""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.history = []  # Tahmin geçmişi ['P', 'B', ...]
-        self.initUI()
-    
-    def initUI(self):
-        """Kullanıcı arayüzünü oluştur"""
-        layout = QVBoxLayout(self)
-        
-        # Başlık
-        title_label = QLabel("SON TAHMİNLER")
-        title_label.setAlignment(Qt.AlignLeft)
-        title_label.setStyleSheet(f"color: {TEXT_COLOR}; font-weight: bold;")
-        layout.addWidget(title_label)
-        
-        # Tahmin geçmişi alanı
-        self.history_frame = QFrame()
-        self.history_frame.setStyleSheet(f"background-color: {BACKGROUND_DARKER}; border-radius: 5px;")
-        self.history_layout = QHBoxLayout(self.history_frame)
-        self.history_layout.setSpacing(5)
-        self.history_layout.setContentsMargins(10, 5, 10, 5)
-        
-        layout.addWidget(self.history_frame)
-        
-        self.setLayout(layout)
-        self.setStyleSheet(f"background-color: {BACKGROUND_DARKER}; border-radius: 8px;")
-        self.setFixedHeight(80)
-    
-    def addPrediction(self, prediction):
-        """Yeni tahmin ekle"""
-        self.history.append(prediction)
-        
-        # Son 10 tahmini göster
-        self.updateHistoryDisplay()
-    
-    def updateHistoryDisplay(self):
-        """Tahmin geçmişi gösterimini güncelle"""
-        # Tüm öğeleri temizle
-        for i in reversed(range(self.history_layout.count())):
-            widget = self.history_layout.itemAt(i).widget()
-            if widget:
-                widget.deleteLater()
-        
-        # Son 10 tahmini ekle (en son sağda olacak şekilde)
-        for pred in self.history[-10:]:
-            label = QLabel(pred)
-            label.setAlignment(Qt.AlignCenter)
-            label.setFixedSize(30, 30)
-            
-            if pred == 'P':
-                label.setStyleSheet(
-                    f"background-color: {PLAYER_COLOR}; color: white; border-radius: 15px; font-weight: bold;"
-                )
-            else:  # 'B'
-                label.setStyleSheet(
-                    f"background-color: {BANKER_COLOR}; color: white; border-radius: 15px; font-weight: bold;"
-                )
-            
-            self.history_layout.addWidget(label)
-        
-        # Kalan boşluğu doldur
-        if len(self.history) < 10:
-            self.history_layout.addStretch()
-
-
-class StatsWidget(QWidget):
-    """Tüm istatistik widgetlerini içeren ana widget"""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.initUI()
-    
-    def initUI(self):
-        """Kullanıcı arayüzünü oluştur"""
-        layout = QVBoxLayout(self)
-        layout.setSpacing(10)
-        
-        # Tahmin widget'ı
-        self.prediction_widget = PredictionWidget()
-        layout.addWidget(self.prediction_widget)
-        
-        # Model istatistikleri
-        self.model_stats = ModelStatsWidget()
-        layout.addWidget(self.model_stats)
-        
-        # Oyun istatistikleri
-        self.game_stats = GameStatsWidget()
-        layout.addWidget(self.game_stats)
-        
-        # Tahmin geçmişi
-        self.history_widget = HistoryWidget()
-        layout.addWidget(self.history_widget)
-        
-        self.setLayout(layout)
-    
-    def setPrediction(self, prediction, confidence=None):
-        """Güncel tahmini ayarla"""
-        self.prediction_widget.setPrediction(prediction, confidence)
-    
-    def updateGameStats(self, player_count, banker_count, tie_count=0):
-        """Oyun istatistiklerini güncelle"""
-        self.game_stats.updateStats(player_count, banker_count, tie_count)
-    
-    def addToHistory(self, prediction):
-        """Tahmin geçmişine ekle"""
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame,
+                            QStyledItemDelegate, QAbstractItemView, QTabWidget)
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QSize
+from PyQt5.QtGui import QFont, QColor, QPainter, QPen, QBrush, QRegion
+
+from ui.styles import (PLAYER_COLOR, BANKER_COLOR, TIE_COLOR, 
+                      BACKGROUND_DARKER, TEXT_COLOR)
+from ui.chart_widget import AccuracyChartWidget
+
+
+def _setText(label, text):
+    """Etiket metnini yalnızca değiştiyse ayarla (gereksiz yeniden çizimi önler)"""
+    if label.text() != text:
+        label.setText(text)
+
+
+class PredictionWidget(QWidget):
+    """Güncel tahmin bilgisini gösteren widget"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.prediction = False  # Gösterilen tahmin (stiller yalnızca değişince yenilenir)
+        self.initUI()
+        
+    def initUI(self):
+        """Kullanıcı arayüzünü oluştur"""
+        layout = QVBoxLayout(self)
+        
+        # Başlık
+        title_label = QLabel("GÜNCEL TAHMİN")
+        title_label.setAlignment(Qt.AlignLeft)
+        title_label.setStyleSheet(f"color: {TEXT_COLOR}; font-weight: bold;")
+        
+        # Tahmin değeri
+        self.prediction_label = QLabel("?")
+        self.prediction_label.setAlignment(Qt.AlignCenter)
+        self.prediction_label.setStyleSheet(
+            f"color: {TEXT_COLOR}; font-size: 28px; font-weight: bold;"
+        )
+        
+        # Güven yüzdesi
+        self.confidence_frame = QFrame()
+        self.confidence_frame.setFixedSize(40, 40)
+        self.confidence_frame.setStyleSheet(
+            f"background-color: {BANKER_COLOR}; border-radius: 20px;"
+        )
+        
+        confidence_layout = QVBoxLayout(self.confidence_frame)
+        self.confidence_label = QLabel("?%")
+        self.confidence_label.setAlignment(Qt.AlignCenter)
+        self.confidence_label.setStyleSheet("color: white; font-weight: bold;")
+        confidence_layout.addWidget(self.confidence_label)
+        
+        # Üst kısım düzeni (başlık ve güven)
+        top_layout = QHBoxLayout()
+        top_layout.addWidget(title_label)
+        top_layout.addStretch()
+        top_layout.addWidget(self.confidence_frame)
+        
+        layout.addLayout(top_layout)
+        layout.addWidget(self.prediction_label)
+        layout.addStretch()
+        
+        self.setLayout(layout)
+        self.setStyleSheet(f"background-color: {BACKGROUND_DARKER}; border-radius: 8px;")
+        self.setMinimumHeight(100)
+    
+    def setPrediction(self, prediction, confidence=None):
+        """Tahmin ve güven değerini ayarla"""
+        # Güven değeri
+        _setText(self.confidence_label, f"{confidence}%" if confidence is not None else "?%")
+        
+        if prediction == self.prediction:
+            return
+        self.prediction = prediction
+        
+        if prediction == 'P':
+            self.prediction_label.setText("PLAYER")
+            self.prediction_label.setStyleSheet(
+                f"color: {PLAYER_COLOR}; font-size: 28px; font-weight: bold;"
+            )
+            self.confidence_frame.setStyleSheet(
+                f"background-color: {PLAYER_COLOR}; border-radius: 20px;"
+            )
+        elif prediction == 'B':
+            self.prediction_label.setText("BANKER")
+            self.prediction_label.setStyleSheet(
+                f"color: {BANKER_COLOR}; font-size: 28px; font-weight: bold;"
+            )
+            self.confidence_frame.setStyleSheet(
+                f"background-color: {BANKER_COLOR}; border-radius: 20px;"
+            )
+        else:
+            self.prediction_label.setText("?")
+            self.prediction_label.setStyleSheet(
+                f"color: {TEXT_COLOR}; font-size: 28px; font-weight: bold;"
+            )
+            self.confidence_frame.setStyleSheet(
+                f"background-color: {TIE_COLOR}; border-radius: 20px;"
+            )
+        
+
+class ModelStatsWidget(QWidget):
+    """Model istatistiklerini gösteren widget"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []  # Model satırı başına (ad, tahmin, başarı etiketleri, başarı çerçevesi)
+        self.row_predictions = []  # Satır başına gösterilen tahmin (renk değişimi için)
+        self.initUI()
+    
+    def initUI(self):
+        """Kullanıcı arayüzünü oluştur"""
+        layout = QVBoxLayout(self)
+        
+        # Başlık
+        title_label = QLabel("MODEL İSTATİSTİKLERİ")
+        title_label.setAlignment(Qt.AlignLeft)
+        title_label.setStyleSheet(f"color: {TEXT_COLOR}; font-weight: bold;")
+        layout.addWidget(title_label)
+        
+        # Tablo başlığı
+        header_layout = QHBoxLayout()
+        
+        model_header = QLabel("MODEL ADI")
+        model_header.setAlignment(Qt.AlignCenter)
+        model_header.setStyleSheet(f"color: {TEXT_COLOR}; font-weight: bold;")
+        
+        prediction_header = QLabel("TAHMİNİ")
+        prediction_header.setAlignment(Qt.AlignCenter)
+        prediction_header.setStyleSheet(f"color: {TEXT_COLOR}; font-weight: bold;")
+        
+        success_header = QLabel("BAŞARI")
+        success_header.setAlignment(Qt.AlignCenter)
+        success_header.setStyleSheet(f"color: {TEXT_COLOR}; font-weight: bold;")
+        
+        header_layout.addWidget(model_header)
+        header_layout.addWidget(prediction_header)
+        header_layout.addWidget(success_header)
+        
+        header_frame = QFrame()
+        header_frame.setLayout(header_layout)
+        header_frame.setStyleSheet(f"background-color: {BACKGROUND_DARKER}; border-radius: 5px;")
+        
+        layout.addWidget(header_frame)
+        
+        # Model satırları (setModels ile doldurulur)
+        self.models_layout = QVBoxLayout()
+        
+        layout.addLayout(self.models_layout)
+        layout.addStretch()
+        
+        self.setLayout(layout)
+        self.setStyleSheet(f"background-color: {BACKGROUND_DARKER}; border-radius: 8px;")
+        self.setMinimumHeight(200)
+    
+    def setModels(self, model_names):
+        """Model satırlarını verilen model adlarıyla yeniden oluştur"""
+        for i in reversed(range(self.models_layout.count())):
+            widget = self.models_layout.itemAt(i).widget()
+            if widget:
+                widget.deleteLater()
+        self.rows = []
+        self.row_predictions = []
+        
+        for model_name in model_names:
+            self.addModelRow(model_name, None, None)
+    
+    def addModelRow(self, model_name, prediction, success_rate):
+        """
+        Model satırı ekle
+        
+        Returns:
+            int: Satır indeksi
+        """
+        row_layout = QHBoxLayout()
+        
+        model_label = QLabel(model_name)
+        model_label.setAlignment(Qt.AlignCenter)
+        model_label.setStyleSheet(f"color: {TEXT_COLOR};")
+        
+        prediction_label = QLabel()
+        prediction_label.setAlignment(Qt.AlignCenter)
+        
+        success_frame = QFrame()
+        success_layout = QHBoxLayout(success_frame)
+        success_label = QLabel()
+        success_label.setAlignment(Qt.AlignCenter)
+        success_label.setStyleSheet("color: white; font-weight: bold;")
+        success_layout.addWidget(success_label)
+        
+        row_layout.addWidget(model_label)
+        row_layout.addWidget(prediction_label)
+        row_layout.addWidget(success_frame)
+        
+        row_frame = QFrame()
+        row_frame.setLayout(row_layout)
+        row_frame.setStyleSheet(f"background-color: {BACKGROUND_DARKER};")
+        
+        self.models_layout.addWidget(row_frame)
+    
+        self.rows.append((model_label, prediction_label, success_label, success_frame))
+        self.row_predictions.append(False)  # İlk güncellemede stil her durumda ayarlanır
+        self.updateModel(len(self.rows) - 1, model_name, prediction, success_rate)
+        return len(self.rows) - 1
+    
+    def updateModel(self, model_index, model_name, prediction, success_rate):
+        """Varolan model bilgilerini güncelle"""
+        if not 0 <= model_index < len(self.rows):
+            return
+            
+        model_label, prediction_label, success_label, success_frame = self.rows[model_index]
+        
+        _setText(model_label, model_name)
+        _setText(prediction_label, prediction or "?")
+        _setText(success_label, f"{success_rate:.1f}%" if success_rate is not None else "?%")
+        
+        # Stil sayfaları yalnızca tahmin rengi değiştiğinde yeniden uygulanır
+        if self.row_predictions[model_index] == prediction:
+            return
+        self.row_predictions[model_index] = prediction
+        
+        if prediction == 'P':
+            pred_color = PLAYER_COLOR
+        elif prediction == 'B':
+            pred_color = BANKER_COLOR
+        else:
+            pred_color = TIE_COLOR
+            
+        prediction_label.setStyleSheet(f"color: {pred_color}; font-weight: bold;")
+        success_frame.setStyleSheet(
+            f"background-color: {pred_color}; border-radius: 10px;"
+        )
+
+
+class GameStatsWidget(QWidget):
+    """Oyun istatistiklerini gösteren widget"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.initUI()
+    
+    def initUI(self):
+        """Kullanıcı arayüzünü oluştur"""
+        layout = QVBoxLayout(self)
+        
+        # Başlık
+        title_label = QLabel("OYUN İSTATİSTİKLERİ")
+        title_label.setAlignment(Qt.AlignLeft)
+        title_label.setStyleSheet(f"color: {TEXT_COLOR}; font-weight: bold;")
+        layout.addWidget(title_label)
+        
+        # İstatistik kartları
+        cards_layout = QHBoxLayout()
+        
+        # Player kartı
+        self.player_card, self.player_count_label = self.createStatCard("PLAYER", "0", PLAYER_COLOR)
+        cards_layout.addWidget(self.player_card)
+        
+        # Banker kartı
+        self.banker_card, self.banker_count_label = self.createStatCard("BANKER", "0", BANKER_COLOR)
+        cards_layout.addWidget(self.banker_card)
+        
+        # Tie kartı
+        self.tie_card, self.tie_count_label = self.createStatCard("TIE", "0", TIE_COLOR)
+        cards_layout.addWidget(self.tie_card)
+        
+        layout.addLayout(cards_layout)
+        
+        # Toplam el sayısı
+        total_layout = QHBoxLayout()
+        
+        total_label = QLabel("TOPLAM EL:")
+        total_label.setAlignment(Qt.AlignCenter)
+        total_label.setStyleSheet(f"color: {TEXT_COLOR};")
+        
+        self.total_count = QLabel("0")
+        self.total_count.setAlignment(Qt.AlignCenter)
+        self.total_count.setStyleSheet(f"color: {TEXT_COLOR}; font-weight: bold;")
+        
+        total_layout.addStretch()
+        total_layout.addWidget(total_label)
+        total_layout.addWidget(self.total_count)
+        total_layout.addStretch()
+        
+        layout.addLayout(total_layout)
+        
+        self.setLayout(layout)
+        self.setStyleSheet(f"background-color: {BACKGROUND_DARKER}; border-radius: 8px;")
+        self.setMinimumHeight(140)
+    
+    def createStatCard(self, title, count, color):
+        """
+        İstatistik kartı oluştur
+        
+        Returns:
+            tuple: (kart çerçevesi, sayı etiketi)
+        """
+        card = QFrame()
+        card.setStyleSheet(
+            f"background-color: {BACKGROUND_DARKER}; border: 1px solid {color}; border-radius: 5px;"
+        )
+        
+        layout = QVBoxLayout(card)
+        
+        # Başlık çubuğu
+        title_bar = QFrame()
+        title_bar.setFixedHeight(5)
+        title_bar.setStyleSheet(f"background-color: {color}; border-radius: 2px;")
+        
+        # Başlık
+        title_label = QLabel(title)
+        title_label.setAlignment(Qt.AlignCenter)
+        title_label.setStyleSheet(f"color: {TEXT_COLOR}; border: none;")
+        
+        # Sayı
+        count_label = QLabel(count)
+        count_label.setAlignment(Qt.AlignCenter)
+        count_label.setStyleSheet(f"color: {color}; font-size: 22px; font-weight: bold; border: none;")
+        
+        layout.addWidget(title_bar)
+        layout.addWidget(title_label)
+        layout.addWidget(count_label)
+        
+        return card, count_label
+    
+    def updateStats(self, player_count, banker_count, tie_count):
+        """İstatistikleri güncelle (yalnızca değişen etiketler yeniden çizilir)"""
+        _setText(self.player_count_label, str(player_count))
+        _setText(self.banker_count_label, str(banker_count))
+        _setText(self.tie_count_label, str(tie_count))
+        
+        # Toplam el sayısını güncelle
+        total = player_count + banker_count + tie_count
+        _setText(self.total_count, str(total))
+
+
+class HistoryModel(QAbstractListModel):
+    """Tahmin geçmişini tutan liste modeli (ekleme maliyeti geçmiş boyundan bağımsız)"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.predictions = []  # Tahmin geçmişi ['P', 'B', ...]
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Satır sayısı (liste modelinde yalnızca kök için)"""
+        if parent.isValid():
+            return 0
+        return len(self.predictions)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Görünümün istediği veriyi döndür"""
+        if not index.isValid():
+            return None
+            
+        prediction = self.predictions[index.row()]
+        if role == Qt.DisplayRole:
+            return prediction
+        if role == Qt.ToolTipRole:
+            return f"#{index.row() + 1}: {prediction}"
+        return None
+    
+    def append(self, prediction):
+        """Geçmişin sonuna tahmin ekle"""
+        row = len(self.predictions)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.predictions.append(prediction)
+        self.endInsertRows()
+    
+    def setPredictions(self, predictions):
+        """Tüm geçmişi tek seferde değiştir"""
+        self.beginResetModel()
+        self.predictions = list(predictions)
+        self.endResetModel()
+
+
+class HistoryDelegate(QStyledItemDelegate):
+    """Tahminleri renkli daireler olarak çizen delegate (widget oluşturmaz)"""
+    
+    ITEM_SIZE = 30
+    ITEM_SPACING = 5
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Çizim nesneleri bir kez oluşturulur ve tüm öğeler için kullanılır
+        self._brushes = {
+            'P': QBrush(QColor(PLAYER_COLOR)),
+            'B': QBrush(QColor(BANKER_COLOR)),
+            'T': QBrush(QColor(TIE_COLOR))
+        }
+        self._text_pen = QPen(QColor("white"))
+        self._font = QFont()
+        self._font.setBold(True)
+    
+    def paint(self, painter, option, index):
+        """Görünür bir öğeyi çiz"""
+        prediction = index.data(Qt.DisplayRole)
+        rect = option.rect
+        size = min(rect.width(), rect.height(), self.ITEM_SIZE)
+        circle = QRect(rect.x() + (rect.width() - size) // 2,
+                       rect.y() + (rect.height() - size) // 2, size, size)
+                       
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._brushes.get(prediction, self._brushes['B']))
+        painter.drawEllipse(circle)
+        
+        painter.setPen(self._text_pen)
+        painter.setFont(self._font)
+        painter.drawText(circle, Qt.AlignCenter, prediction)
+        painter.restore()
+    
+    def sizeHint(self, option, index):
+        """Tüm öğeler aynı boyuttadır"""
+        return QSize(self.ITEM_SIZE + self.ITEM_SPACING, self.ITEM_SIZE)
+
+
+class HistoryView(QAbstractItemView):
+    """
+    Sabit genişlikli öğeleri yatay çizen sanal liste görünümü
+    
+    Öğe konumları satır numarasından hesaplandığı için ekleme sonrası
+    yerleşim öğe sayısından bağımsızdır ve yalnızca görünür öğeler çizilir.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.item_width = HistoryDelegate.ITEM_SIZE + HistoryDelegate.ITEM_SPACING
+        self.item_height = HistoryDelegate.ITEM_SIZE
+        self.setItemDelegate(HistoryDelegate(self))
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setMinimumHeight(self.item_height + self.horizontalScrollBar().sizeHint().height() + 4)
+    
+    def _count(self):
+        """Modeldeki öğe sayısı"""
+        model = self.model()
+        return model.rowCount() if model is not None else 0
+    
+    def visualRect(self, index):
+        """Öğenin görünüm içindeki dikdörtgeni"""
+        if not index.isValid():
+            return QRect()
+        x = index.row() * self.item_width - self.horizontalOffset()
+        y = (self.viewport().height() - self.item_height) // 2
+        return QRect(x, y, self.item_width, self.item_height)
+    
+    def indexAt(self, point):
+        """Noktadaki öğeyi bul"""
+        row = (point.x() + self.horizontalOffset()) // self.item_width
+        if point.x() < 0 or row >= self._count():
+            return QModelIndex()
+        return self.model().index(row, 0)
+    
+    def scrollTo(self, index, hint=QAbstractItemView.EnsureVisible):
+        """Öğe görünür olacak şekilde kaydır"""
+        if not index.isValid():
+            return
+            
+        scrollbar = self.horizontalScrollBar()
+        left = index.row() * self.item_width
+        right = left + self.item_width - self.viewport().width()
+        if left < scrollbar.value():
+            scrollbar.setValue(left)
+        elif right > scrollbar.value():
+            scrollbar.setValue(right)
+    
+    def horizontalOffset(self):
+        """Yatay kaydırma konumu"""
+        return self.horizontalScrollBar().value()
+    
+    def verticalOffset(self):
+        """Dikey kaydırma yok"""
+        return 0
+    
+    def moveCursor(self, cursorAction, modifiers):
+        """Klavye ile gezinme desteklenmez"""
+        return QModelIndex()
+    
+    def isIndexHidden(self, index):
+        """Gizli öğe yok"""
+        return False
+    
+    def setSelection(self, rect, command):
+        """Seçim desteklenmez"""
+        pass
+    
+    def visualRegionForSelection(self, selection):
+        """Seçim bölgesi her zaman boş"""
+        return QRegion()
+    
+    def updateGeometries(self):
+        """Kaydırma aralığını öğe sayısından hesapla"""
+        scrollbar = self.horizontalScrollBar()
+        width = self.viewport().width()
+        scrollbar.setRange(0, max(0, self._count() * self.item_width - width))
+        scrollbar.setPageStep(width)
+        scrollbar.setSingleStep(self.item_width)
+        super().updateGeometries()
+    
+    def rowsInserted(self, parent, start, end):
+        """Eklenen öğeler yalnızca kaydırma aralığını değiştirir"""
+        super().rowsInserted(parent, start, end)
+        self.updateGeometries()
+        self.viewport().update()
+    
+    def reset(self):
+        """Model sıfırlandığında kaydırma aralığını hemen güncelle"""
+        super().reset()
+        self.updateGeometries()
+    
+    def paintEvent(self, event):
+        """Yalnızca görünür öğeleri çiz"""
+        count = self._count()
+        if count == 0:
+            return
+            
+        offset = self.horizontalOffset()
+        first = offset // self.item_width
+        last = min(count, (offset + self.viewport().width()) // self.item_width + 1)
+        
+        painter = QPainter(self.viewport())
+        option = self.viewOptions()
+        delegate = self.itemDelegate()
+        model = self.model()
+        for row in range(first, last):
+            index = model.index(row, 0)
+            option.rect = self.visualRect(index)
+            delegate.paint(painter, option, index)
+
+
+class HistoryWidget(QWidget):
+    """Tüm tahmin geçmişini kaydırılabilir liste olarak gösteren widget"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.model = HistoryModel(self)
+        self.initUI()
+    
+    @property
+    def history(self):
+        """Tahmin geçmişi ['P', 'B', ...]"""
+        return self.model.predictions
+    
+    def initUI(self):
+        """Kullanıcı arayüzünü oluştur"""
+        layout = QVBoxLayout(self)
+        
+        # Başlık
+        title_label = QLabel("SON TAHMİNLER")
+        title_label.setAlignment(Qt.AlignLeft)
+        title_label.setStyleSheet(f"color: {TEXT_COLOR}; font-weight: bold;")
+        layout.addWidget(title_label)
+        
+        # Tahmin geçmişi alanı: yalnızca görünür öğeler çizilir
+        self.history_view = HistoryView()
+        self.history_view.setModel(self.model)
+        self.history_view.setStyleSheet(
+            f"background-color: {BACKGROUND_DARKER}; border-radius: 5px;"
+        )
+        
+        layout.addWidget(self.history_view)
+        
+        self.setLayout(layout)
+        self.setStyleSheet(f"background-color: {BACKGROUND_DARKER}; border-radius: 8px;")
+        self.setFixedHeight(100)
+    
+    def addPrediction(self, prediction):
+        """Yeni tahmin ekle"""
+        scrollbar = self.history_view.horizontalScrollBar()
+        at_end = scrollbar.value() >= scrollbar.maximum()
+        
+        self.model.append(prediction)
+    
+        # Kullanıcı geçmişte geriye kaydırmadıysa en son tahmini göster
+        if at_end:
+            self.scrollToLatest()
+        
+    def setHistory(self, predictions):
+        """Tahmin geçmişini toplu olarak ayarla"""
+        self.model.setPredictions(predictions)
+        self.scrollToLatest()
+            
+    def clearHistory(self):
+        """Tahmin geçmişini temizle"""
+        self.model.setPredictions([])
+            
+    def scrollToLatest(self):
+        """En son tahmine kaydır"""
+        count = self.model.rowCount()
+        if count:
+            self.history_view.scrollTo(self.model.index(count - 1))
+
+
+class StatsWidget(QWidget):
+    """Tüm istatistik widgetlerini içeren ana widget"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.initUI()
+    
+    def initUI(self):
+        """Kullanıcı arayüzünü oluştur"""
+        layout = QVBoxLayout(self)
+        layout.setSpacing(10)
+        
+        # Tahmin widget'ı
+        self.prediction_widget = PredictionWidget()
+        layout.addWidget(self.prediction_widget)
+        
+        # Model istatistikleri ve başarı grafiği (aynı alanda sekmeler halinde)
+        self.model_stats = ModelStatsWidget()
+        self.accuracy_chart = AccuracyChartWidget()
+        self.model_tabs = QTabWidget()
+        self.model_tabs.addTab(self.model_stats, "Tablo")
+        self.model_tabs.addTab(self.accuracy_chart, "Grafik")
+        layout.addWidget(self.model_tabs)
+        
+        # Oyun istatistikleri
+        self.game_stats = GameStatsWidget()
+        layout.addWidget(self.game_stats)
+        
+        # Tahmin geçmişi
+        self.history_widget = HistoryWidget()
+        layout.addWidget(self.history_widget)
+        
+        self.setLayout(layout)
+    
+    def setPrediction(self, prediction, confidence=None):
+        """Güncel tahmini ayarla"""
+        self.prediction_widget.setPrediction(prediction, confidence)
+    
+    def setModels(self, model_names):
+        """Model istatistikleri tablosundaki ve grafikteki modelleri ayarla"""
+        self.model_stats.setModels(model_names)
+        self.accuracy_chart.chart.setModels(model_names)
+    
+    def updateModelStats(self, model_results):
+        """
+        Model istatistiklerini güncelle (satırlar ilk sonuçla oluşturulur)
+        
+        Args:
+            model_results (list): Model başına (ad, tahmin, güven, başarı oranı)
+        """
+        if len(self.model_stats.rows) != len(model_results):
+            self.model_stats.setModels([name for name, _, _, _ in model_results])
+            
+        for i, (name, prediction, _, accuracy) in enumerate(model_results):
+            self.model_stats.updateModel(i, name, prediction, accuracy)
+    
+    def addAccuracySample(self, model_results, window_accuracy):
+        """
+        Değerlendirilen el için başarı grafiğine model başına nokta ekle
+        
+        Args:
+            model_results (list): Model başına (ad, tahmin, güven, başarı oranı)
+            window_accuracy (list): Model başına kayan başarı oranı
+        """
+        chart = self.accuracy_chart.chart
+        for (name, _, confidence, _), accuracy in zip(model_results, window_accuracy):
+            chart.appendSample(name, accuracy, confidence)
+    
+    def updateGameStats(self, player_count, banker_count, tie_count=0):
+        """Oyun istatistiklerini güncelle"""
+        self.game_stats.updateStats(player_count, banker_count, tie_count)
+    
+    def addToHistory(self, prediction):
+        """Tahmin geçmişine ekle"""
         self.history_widget.addPrediction(prediction)
\ No newline at end of file